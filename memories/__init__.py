@@ -2,50 +2,46 @@
 Memories - A hierarchical memory management system for AI applications.
 """
 
+import importlib
 import logging
 
-# Safe imports with fallbacks
 logger = logging.getLogger(__name__)
 
-try:
-    from memories.core import memory_manager, MemoryManager
-except ImportError as e:
-    logger.warning(f"Core memory manager not available: {e}")
-    memory_manager = None
-    MemoryManager = None
-
-try:
-    from memories.models.load_model import LoadModel
-except ImportError as e:
-    logger.warning(f"Model loader not available: {e}")
-    LoadModel = None
-
-try:
-    from memories.utils.core.duckdb_utils import query_multiple_parquet
-except ImportError as e:
-    logger.warning(f"DuckDB utilities not available: {e}")
-    query_multiple_parquet = None
-
-try:
-    from memories.utils.core.system import system_check, SystemStatus
-except ImportError as e:
-    logger.warning(f"System utilities not available: {e}")
-    system_check = None
-    SystemStatus = None
-
-try:
-    from memories.core.config import Config
-except ImportError as e:
-    logger.warning(f"Config module not available: {e}")
-    Config = None
-
 # Always available - simple memory store without dependencies
 from memories.simple_memory import SimpleMemoryStore, SimpleConfig, create_memory_store, verify_ai_response
 
-logger = logging.getLogger(__name__)
-
 __version__ = "2.0.9"  # Match version in pyproject.toml
 
+# Heavy components are imported on first attribute access (PEP 562), so
+# ``import memories`` does not pull in torch, FAISS, DuckDB or the geo stack.
+# A component whose dependencies are missing resolves to None.
+_LAZY_ATTRIBUTES = {
+    "memory_manager": ("memories.core", "memory_manager", "Core memory manager"),
+    "MemoryManager": ("memories.core", "MemoryManager", "Core memory manager"),
+    "LoadModel": ("memories.models.load_model", "LoadModel", "Model loader"),
+    "query_multiple_parquet": ("memories.utils.core.duckdb_utils", "query_multiple_parquet", "DuckDB utilities"),
+    "system_check": ("memories.utils.core.system", "system_check", "System utilities"),
+    "SystemStatus": ("memories.utils.core.system", "SystemStatus", "System utilities"),
+    "Config": ("memories.core.config", "Config", "Config module"),
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute, label = _LAZY_ATTRIBUTES[name]
+    try:
+        value = getattr(importlib.import_module(module_name), attribute)
+    except ImportError as e:
+        logger.warning(f"{label} not available: {e}")
+        value = None
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 # Define lazy loading functions to avoid circular imports
 def get_memory_retrieval():
     """Lazy load MemoryRetrieval to avoid circular imports."""
@@ -2,26 +2,42 @@
 Core components of the memories system.
 """
 
+import importlib
+
 # Import only the main manager class to avoid circular imports
 from memories.core.memory_manager import MemoryManager
 
-# Other imports should be done directly by the modules that need them
-# to avoid circular dependencies
-# from memories.core.hot import HotMemory
-# from memories.core.warm import WarmMemory
-# from memories.core.cold import ColdMemory
-# from memories.core.glacier import GlacierMemory
-
-# Create a singleton instance of the memory manager
-memory_manager = MemoryManager()
-
-from .analyzers import (
-    TerrainAnalyzer,
-    ClimateAnalyzer,
-    WaterResourceAnalyzer,
-    EnvironmentalAnalyzer
-)
-from .analyzers.change_detector import ChangeDetector
+# ``memory_manager`` names the singleton instance, created on first access
+# below; drop the submodule binding the import above left behind.
+del memory_manager
+
+# The analyzers and their dependencies are imported on first attribute
+# access (PEP 562). Modules that need other components import them directly
+# to avoid circular dependencies.
+_LAZY_ATTRIBUTES = {
+    "TerrainAnalyzer": ("memories.core.analyzers", "TerrainAnalyzer"),
+    "ClimateAnalyzer": ("memories.core.analyzers", "ClimateAnalyzer"),
+    "WaterResourceAnalyzer": ("memories.core.analyzers", "WaterResourceAnalyzer"),
+    "EnvironmentalAnalyzer": ("memories.core.analyzers", "EnvironmentalAnalyzer"),
+    "ChangeDetector": ("memories.core.analyzers.change_detector", "ChangeDetector"),
+}
+
+
+def __getattr__(name):
+    if name == "memory_manager":
+        value = MemoryManager()
+    elif name in _LAZY_ATTRIBUTES:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+        value = getattr(importlib.import_module(module_name), attribute)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES) | {"memory_manager"})
+
 
 __all__ = [
     "MemoryManager",
@@ -22,6 +22,7 @@ import gzip
 import shutil
 import re
 import asyncio
+from io import StringIO
 
 # Initialize GPU support flags
 HAS_GPU_SUPPORT = False
@@ -253,9 +254,15 @@ class ColdMemory:
         # Set up raw data path
         self.raw_data_path = storage_config.get('raw_data_path', os.path.join(self.project_root, 'data', 'raw'))
         
+        # DataFrames are stored as Parquet datasets, one directory per item
+        self.parquet_path = storage_config.get('parquet_path', os.path.join(storage_path, 'parquet'))
+        self.compression = storage_config.get('compression', 'zstd')
+        self.row_group_size = storage_config.get('row_group_size', 122880)
+        
         # Create directories if they don't exist
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
         os.makedirs(self.raw_data_path, exist_ok=True)
+        os.makedirs(self.parquet_path, exist_ok=True)
         
         # Initialize DuckDB connection
         self.conn = duckdb.connect(self.db_path)
@@ -306,22 +313,155 @@ class ColdMemory:
             self.logger.error(f"Error registering external file: {e}")
             raise
 
+    # Comparison operators accepted in retrieve() filters
+    FILTER_OPERATORS = ('=', '==', '!=', '<', '<=', '>', '>=', 'in', 'not in')
+
+    @staticmethod
+    def _quote_identifier(name: str) -> str:
+        """Quote a column name for use in DuckDB SQL."""
+        return '"' + str(name).replace('"', '""') + '"'
+
+    @staticmethod
+    def _quote_literal(value: str) -> str:
+        """Quote a string literal (such as a path) for use in DuckDB SQL."""
+        return "'" + str(value).replace("'", "''") + "'"
+
+    def _is_parquet_dataset(self, location: Optional[str]) -> bool:
+        """Check whether a catalog location is a Parquet dataset written by store()."""
+        return bool(location) and os.path.isdir(location) and \
+            os.path.commonpath([os.path.abspath(location), os.path.abspath(self.parquet_path)]) == \
+            os.path.abspath(self.parquet_path)
+
+    def _parquet_source(self, location: str) -> str:
+        """DuckDB table function reading every file of a Parquet dataset."""
+        files = self._quote_literal(os.path.join(location, '**', '*.parquet'))
+        return f"read_parquet({files}, hive_partitioning = true)"
+
+    def _write_parquet(self, df: pd.DataFrame, location: str, partition_by: List[str]) -> int:
+        """Write a DataFrame as a compressed Parquet dataset.
+        
+        Args:
+            df: Data to write
+            location: Dataset directory
+            partition_by: Columns to partition the dataset by (hive layout)
+            
+        Returns:
+            int: Size of the dataset on disk in bytes
+        """
+        options = [
+            "FORMAT PARQUET",
+            f"COMPRESSION {self.compression.upper()}",
+            f"ROW_GROUP_SIZE {int(self.row_group_size)}"
+        ]
+        if partition_by:
+            options.append(f"PARTITION_BY ({', '.join(self._quote_identifier(c) for c in partition_by)})")
+            target = location
+        else:
+            os.makedirs(location, exist_ok=True)
+            target = os.path.join(location, 'part-0.parquet')
+            
+        self.conn.register('cold_store_frame', df)
+        try:
+            self.conn.execute(
+                f"COPY (SELECT * FROM cold_store_frame) TO {self._quote_literal(target)} ({', '.join(options)})"
+            )
+        finally:
+            self.conn.unregister('cold_store_frame')
+            
+        return sum(
+            f.stat().st_size for f in Path(location).rglob('*.parquet')
+        )
+
+    def write_dataset(self, df: pd.DataFrame, partition_by: Optional[List[str]] = None) -> Tuple[str, int]:
+        """Write a DataFrame as a new Parquet dataset without registering it.
+        
+        Used by store() and by the tiering daemon, which moves an existing
+        catalog entry and points it at the new dataset itself.
+        
+        Args:
+            df: Data to write
+            partition_by: Optional columns to partition the dataset by
+            
+        Returns:
+            Tuple[str, int]: Dataset directory and its size on disk in bytes
+        """
+        location = os.path.join(self.parquet_path, uuid.uuid4().hex)
+        try:
+            return location, self._write_parquet(df, location, list(partition_by or []))
+        except Exception:
+            shutil.rmtree(location, ignore_errors=True)
+            raise
+
+    def delete_dataset(self, location: str) -> bool:
+        """Remove a Parquet dataset written by write_dataset(), leaving the catalog as is.
+        
+        Args:
+            location: Dataset directory
+            
+        Returns:
+            bool: True if the dataset was removed, False if it is not a cold dataset
+        """
+        if not self._is_parquet_dataset(location):
+            return False
+        shutil.rmtree(location)
+        return True
+
+    def _filter_clause(self, filters: Any) -> Tuple[str, List[Any]]:
+        """Build a WHERE clause from retrieve() filters.
+        
+        Args:
+            filters: Either a dict of column -> value (equality) or a list of
+                (column, operator, value) tuples, combined with AND
+                
+        Returns:
+            Tuple[str, List[Any]]: The clause (empty if no filters) and its parameters
+        """
+        if not filters:
+            return "", []
+        if isinstance(filters, dict):
+            filters = [(column, '=', value) for column, value in filters.items()]
+            
+        conditions, params = [], []
+        for column, op, value in filters:
+            op = op.lower()
+            if op not in self.FILTER_OPERATORS:
+                raise ValueError(f"Unsupported filter operator: {op}")
+            column = self._quote_identifier(column)
+            if op in ('in', 'not in'):
+                values = list(value)
+                if not values:
+                    conditions.append("FALSE" if op == 'in' else "TRUE")
+                    continue
+                conditions.append(f"{column} {op.upper()} ({', '.join(['?'] * len(values))})")
+                params.extend(values)
+            else:
+                conditions.append(f"{column} {'=' if op == '==' else op} ?")
+                params.append(value)
+        return " WHERE " + " AND ".join(conditions), params
+
     async def store(
         self,
         data: Any,
         metadata: Optional[Dict[str, Any]] = None,
-        tags: Optional[List[str]] = None
+        tags: Optional[List[str]] = None,
+        partition_by: Optional[List[str]] = None
     ) -> bool:
         """Store data in cold storage.
         
+        The data is written as a compressed Parquet dataset under the cold
+        storage path and registered in the memory catalog with the dataset
+        directory as its location.
+        
         Args:
             data: Data to store (DataFrame or dictionary)
             metadata: Optional metadata about the data
             tags: Optional tags for categorizing the data
+            partition_by: Optional columns to partition the dataset by
             
         Returns:
             bool: True if storage was successful, False otherwise
         """
+        location = None
         try:
             # Convert data to DataFrame if needed
             if isinstance(data, dict):
@@ -331,38 +471,72 @@ class ColdMemory:
             else:
                 logger.error("Data must be a dictionary or DataFrame for cold storage")
                 return False
+                
+            partition_by = list(partition_by or [])
+            missing = [c for c in partition_by if c not in df.columns]
+            if missing:
+                logger.error(f"Partition columns not found in data: {missing}")
+                return False
 
-            # Generate unique ID
-            data_id = await self.memory_catalog.register_data(
+            # Write the dataset first so the catalog never points at missing files
+            location, size = self.write_dataset(df, partition_by)
+
+            await self.memory_catalog.register_data(
                 tier="cold",
-                location=f"cold_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
-                size=df.memory_usage(deep=True).sum(),
+                location=location,
+                size=size,
                 data_type="dataframe",
                 tags=tags,
                 metadata=metadata
             )
 
-            # Store data in DuckDB
-            self.conn.execute(
-                "INSERT INTO cold_data (id, data) VALUES (?, ?)",
-                [data_id, df.to_json()]
-            )
-
             return True
 
         except Exception as e:
             logger.error(f"Error storing in cold storage: {e}")
+            if location and os.path.isdir(location):
+                shutil.rmtree(location, ignore_errors=True)
             return False
 
     async def retrieve(self, query: Dict[str, Any]) -> Optional[Dict[str, Any]]:
-        """Retrieve data from cold storage."""
+        """Retrieve data from cold storage.
+        
+        Parquet datasets are read through DuckDB's ``read_parquet``, so only
+        the requested columns are read and filters skip partitions and row
+        groups that cannot match.
+        
+        Args:
+            query: Query parameters:
+                - data_id: ID of the data to retrieve (required)
+                - columns: Optional list of columns to return
+                - filters: Optional dict of column -> value, or list of
+                  (column, operator, value) tuples, combined with AND
+                - limit: Optional maximum number of rows
+                
+        Returns:
+            Dict with "data" (DataFrame) and "metadata", or None if not found
+        """
         try:
             # Get data info from catalog
             data_info = await self.memory_catalog.get_data_info(query.get('data_id'))
             if not data_info:
                 return None
+                
+            metadata = json.loads(data_info['additional_meta']) if data_info.get('additional_meta') else {}
+
+            if self._is_parquet_dataset(data_info.get('location')):
+                columns = query.get('columns')
+                select = ', '.join(self._quote_identifier(c) for c in columns) if columns else '*'
+                where, params = self._filter_clause(query.get('filters'))
+                sql = f"SELECT {select} FROM {self._parquet_source(data_info['location'])}{where}"
+                if query.get('limit') is not None:
+                    sql += f" LIMIT {int(query['limit'])}"
+                return {
+                    "data": self.conn.execute(sql, params).fetchdf(),
+                    "metadata": metadata
+                }
 
-            # Get data from cold storage
+            # Data stored as JSON by earlier versions
             result = self.conn.execute("""
                 SELECT data FROM cold_data
                 WHERE id = ?
@@ -370,10 +544,10 @@ class ColdMemory:
             """, [data_info['data_id']]).fetchone()
             
             if result:
-                data = pd.read_json(result[0])
+                data = pd.read_json(StringIO(result[0]))
                 return {
                     "data": data,
-                    "metadata": json.loads(data_info['additional_meta'])
+                    "metadata": metadata
                 }
             return None
             
@@ -392,7 +566,9 @@ class ColdMemory:
             
             # Remove files if they exist
             for item in cold_data:
-                if json.loads(item['additional_meta']).get('is_external', False):
+                if self._is_parquet_dataset(item.get('location')):
+                    shutil.rmtree(item['location'], ignore_errors=True)
+                elif json.loads(item['additional_meta']).get('is_external', False):
                     file_path = Path(item['location'])
                     if file_path.exists():
                         file_path.unlink()
@@ -418,6 +594,8 @@ class ColdMemory:
                 
             # Remove data if exists
             self.conn.execute("DELETE FROM cold_data WHERE id = ?", [file_id])
+            if self._is_parquet_dataset(file_info.get('location')):
+                shutil.rmtree(file_info['location'], ignore_errors=True)
             
             # Remove file if it's external
             if json.loads(file_info['additional_meta']).get('is_external', False):
@@ -524,6 +702,19 @@ class ColdMemory:
             Returns None if data not found or schema cannot be determined
         """
         try:
+            # Parquet datasets expose their schema without reading any rows
+            data_info = await self.memory_catalog.get_data_info(data_id)
+            if data_info and self._is_parquet_dataset(data_info.get('location')):
+                schema_df = self.conn.execute(
+                    f"DESCRIBE SELECT * FROM {self._parquet_source(data_info['location'])}"
+                ).fetchdf()
+                return {
+                    'columns': list(schema_df['column_name']),
+                    'dtypes': dict(zip(schema_df['column_name'], schema_df['column_type'])),
+                    'type': 'dataframe',
+                    'source': 'parquet'
+                }
+            
             # Get data from cold storage
             result = self.conn.execute("""
                 SELECT data FROM cold_data
@@ -535,7 +726,7 @@ class ColdMemory:
                 return None
                 
             # Convert JSON to DataFrame
-            df = pd.read_json(result[0])
+            df = pd.read_json(StringIO(result[0]))
             
             schema = {
                 'columns': list(df.columns),
@@ -560,6 +751,16 @@ class ColdMemory:
             bool: True if deletion was successful, False otherwise
         """
         try:
+            # Parquet datasets are looked up by their catalog ID
+            data_info = await self.memory_catalog.get_data_info(key)
+            if data_info and self._is_parquet_dataset(data_info.get('location')):
+                shutil.rmtree(data_info['location'])
+                self.logger.info(f"Parquet dataset for key '{key}' deleted")
+                if not await self.memory_catalog.delete_data(key):
+                    self.logger.warning(f"Catalog entry for key '{key}' could not be removed")
+                    return False
+                return True
+            
             # Get the file path for the key
             file_path = self._get_file_path(key)
             
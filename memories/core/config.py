@@ -146,7 +146,7 @@ class Config:
                 print("No configuration file found. Using default configuration.")
         
         # Convert relative paths to absolute
-        for section in ['database', 'data']:
+        for section in ['database', 'data', 'memory']:
             if section in config:
                 for key, value in config[section].items():
                     if isinstance(value, str) and value.startswith('./'):
@@ -204,7 +204,7 @@ class Config:
         
     def _setup_directories(self):
         """Create necessary directories if they don't exist."""
-        for section in ['database', 'data']:
+        for section in ['database', 'data', 'memory']:
             if section in self.config:
                 for path in self.config[section].values():
                     if isinstance(path, str) and not path.endswith('.db'):
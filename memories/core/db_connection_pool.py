@@ -1,26 +1,59 @@
 """
 DuckDB connection pool manager to prevent memory leaks and improve performance.
+
+Each database is opened once; threads check out their own cursor
+(``connection.cursor()``) on that database from a bounded pool, so concurrent
+callers run queries in parallel instead of sharing one connection.
 """
 
 import duckdb
 import threading
-import weakref
-from typing import Dict, Optional, Any
+import time
+from collections import deque
+from typing import Deque, Dict, Optional, Any, Tuple
 from contextlib import contextmanager
 from pathlib import Path
 import logging
 
 logger = logging.getLogger(__name__)
 
+
+class _DatabasePool:
+    """Cursors on one DuckDB database, bounded by ``max_size``."""
+
+    def __init__(self, db_name: str, root: duckdb.DuckDBPyConnection, max_size: int):
+        self.db_name = db_name
+        self.root = root
+        self.max_size = max_size
+        self.idle: Deque[Tuple[duckdb.DuckDBPyConnection, float]] = deque()
+        self.queue: Deque[object] = deque()
+        self.size = 0
+        self.in_use = 0
+        self.condition = threading.Condition()
+        self.stats = {
+            "checkouts": 0,
+            "waits": 0,
+            "timeouts": 0,
+            "created": 0,
+            "discarded": 0,
+            "total_wait_time": 0.0,
+            "max_wait_time": 0.0
+        }
+
+
 class DuckDBConnectionPool:
-    """Thread-safe connection pool for DuckDB connections."""
-    
+    """Thread-safe connection pool for DuckDB connections.
+
+    Every ``db_name`` maps to one database connection. Callers get cursors on
+    it: a thread holds at most one cursor per database, reused by nested
+    ``get_connection`` calls, and at most ``max_size`` cursors per database
+    are open at once. Further checkouts wait up to ``timeout`` seconds.
+    """
+
     _instance = None
     _lock = threading.Lock()
-    _connections: Dict[str, duckdb.DuckDBPyConnection] = {}
-    _connection_refs: Dict[str, weakref.ref] = {}
-    
-    def __new__(cls):
+
+    def __new__(cls, *args, **kwargs):
         """Singleton pattern to ensure only one pool instance."""
         if cls._instance is None:
             with cls._lock:
@@ -28,85 +61,196 @@ class DuckDBConnectionPool:
                     cls._instance = super(DuckDBConnectionPool, cls).__new__(cls)
                     cls._instance._initialized = False
         return cls._instance
-    
-    def __init__(self):
-        """Initialize the connection pool."""
+
+    def __init__(self, max_size: int = 16, timeout: float = 30.0, health_check_interval: float = 30.0):
+        """Initialize the connection pool.
+
+        Args:
+            max_size: Maximum cursors open per database
+            timeout: Seconds to wait for a free cursor before raising TimeoutError
+            health_check_interval: Cursors idle for longer than this are checked
+                with ``SELECT 1`` before being handed out
+        """
         if self._initialized:
             return
-            
-        self._connections = {}
-        self._connection_refs = {}
+
+        self.max_size = max_size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self._pools: Dict[str, _DatabasePool] = {}
+        self._local = threading.local()
         self._lock = threading.Lock()
         self._initialized = True
         logger.info("Initialized DuckDB connection pool")
-    
+
     @contextmanager
-    def get_connection(self, 
+    def get_connection(self,
                        db_name: str = ":memory:",
                        config: Optional[Dict[str, Any]] = None) -> duckdb.DuckDBPyConnection:
-        """Get a connection from the pool with automatic cleanup.
-        
+        """Check out this thread's cursor on a database and check it back in on exit.
+
         Args:
             db_name: Database name or path (':memory:' for in-memory)
-            config: Optional DuckDB configuration parameters
-            
+            config: Optional DuckDB configuration, applied when the database is opened
+
         Yields:
-            DuckDB connection
+            DuckDB cursor for use by the calling thread only
         """
-        conn = None
+        cursor = self.checkout(db_name, config)
+        failed = False
         try:
-            conn = self._get_or_create_connection(db_name, config)
-            yield conn
+            yield cursor
         except Exception as e:
             logger.error(f"Error using DuckDB connection: {e}")
-            # Mark connection as dirty for recreation on next use
-            with self._lock:
-                if db_name in self._connections:
-                    try:
-                        self._connections[db_name].close()
-                    except Exception:
-                        pass
-                    del self._connections[db_name]
-                    if db_name in self._connection_refs:
-                        del self._connection_refs[db_name]
+            failed = True
             raise
         finally:
-            # Don't close the connection - keep it in the pool
-            pass
-    
-    def _get_or_create_connection(self,
-                                 db_name: str,
-                                 config: Optional[Dict[str, Any]] = None) -> duckdb.DuckDBPyConnection:
-        """Get existing connection or create new one.
-        
+            # A failed cursor may hold an aborted transaction; don't reuse it
+            self.checkin(db_name, cursor, discard=failed)
+
+    def checkout(self, db_name: str = ":memory:", config: Optional[Dict[str, Any]] = None) -> duckdb.DuckDBPyConnection:
+        """Take a cursor on a database for the calling thread.
+
+        A thread that already holds a cursor on ``db_name`` gets the same one
+        back. Every checkout must be paired with a ``checkin``.
+
+        Args:
+            db_name: Database name or path (':memory:' for in-memory)
+            config: Optional DuckDB configuration, applied when the database is opened
+
+        Returns:
+            DuckDB cursor
+
+        Raises:
+            TimeoutError: If no cursor became free within the pool timeout
+        """
+        held = self._held()
+        if db_name in held:
+            cursor, depth = held[db_name]
+            held[db_name] = (cursor, depth + 1)
+            return cursor
+
+        pool = self._get_or_create_pool(db_name, config)
+        start = time.monotonic()
+        with pool.condition:
+            # Serve waiters in arrival order so returning threads can't starve them
+            ticket = object()
+            pool.queue.append(ticket)
+            waited = False
+            try:
+                while pool.queue[0] is not ticket or (not pool.idle and pool.size >= pool.max_size):
+                    waited = True
+                    remaining = self.timeout - (time.monotonic() - start)
+                    if remaining <= 0:
+                        pool.stats["timeouts"] += 1
+                        raise TimeoutError(
+                            f"No DuckDB connection for {db_name} became free within {self.timeout}s"
+                        )
+                    pool.condition.wait(remaining)
+                if pool.idle:
+                    cursor, idle_since = pool.idle.pop()
+                else:
+                    cursor, idle_since = None, None
+                    pool.size += 1
+                pool.in_use += 1
+            finally:
+                pool.queue.remove(ticket)
+                pool.condition.notify_all()
+
+            wait_time = time.monotonic() - start
+            pool.stats["checkouts"] += 1
+            if waited:
+                pool.stats["waits"] += 1
+                pool.stats["total_wait_time"] += wait_time
+                pool.stats["max_wait_time"] = max(pool.stats["max_wait_time"], wait_time)
+
+        try:
+            if cursor is not None and time.monotonic() - idle_since > self.health_check_interval:
+                cursor = self._check_health(pool, cursor)
+            if cursor is None:
+                cursor = self._new_cursor(pool)
+        except Exception:
+            self._release_slot(pool)
+            raise
+
+        held[db_name] = (cursor, 1)
+        return cursor
+
+    def checkin(self, db_name: str, cursor: duckdb.DuckDBPyConnection, discard: bool = False) -> None:
+        """Return a cursor taken with ``checkout``.
+
+        Args:
+            db_name: Database the cursor belongs to
+            cursor: Cursor to return
+            discard: Close the cursor instead of reusing it
+        """
+        held = self._held()
+        if db_name in held:
+            held_cursor, depth = held[db_name]
+            if held_cursor is cursor and depth > 1:
+                held[db_name] = (cursor, depth - 1)
+                return
+            del held[db_name]
+
+        with self._lock:
+            pool = self._pools.get(db_name)
+        if pool is None or pool.root is None:
+            # The database was closed while the cursor was out
+            self._close_quietly(cursor)
+            return
+
+        if discard:
+            self._close_quietly(cursor)
+            with pool.condition:
+                pool.stats["discarded"] += 1
+            self._release_slot(pool)
+            return
+
+        with pool.condition:
+            pool.in_use -= 1
+            pool.idle.append((cursor, time.monotonic()))
+            pool.condition.notify_all()
+
+    def connection(self, db_name: str = ":memory:", config: Optional[Dict[str, Any]] = None) -> duckdb.DuckDBPyConnection:
+        """Get the database connection itself, which every thread shares.
+
+        Kept for callers that hold on to a connection; concurrent code should
+        use ``get_connection`` instead.
+
         Args:
             db_name: Database name or path
             config: Optional DuckDB configuration
-            
+
         Returns:
             DuckDB connection
         """
+        return self._get_or_create_pool(db_name, config).root
+
+    def _held(self) -> Dict[str, Tuple[duckdb.DuckDBPyConnection, int]]:
+        """Cursors held by the calling thread with their checkout depth."""
+        if not hasattr(self._local, "held"):
+            self._local.held = {}
+        return self._local.held
+
+    def _get_or_create_pool(self,
+                            db_name: str,
+                            config: Optional[Dict[str, Any]] = None) -> _DatabasePool:
+        """Get the pool of a database, opening the database on first use.
+
+        Args:
+            db_name: Database name or path
+            config: Optional DuckDB configuration
+
+        Returns:
+            Pool of cursors on the database
+        """
         with self._lock:
-            # Clean up dead connections
-            self._cleanup_dead_connections()
-            
-            # Check if connection exists and is valid
-            if db_name in self._connections:
-                conn = self._connections[db_name]
-                try:
-                    # Test if connection is still valid
-                    conn.execute("SELECT 1").fetchone()
-                    return conn
-                except Exception:
-                    # Connection is dead, remove it
-                    logger.debug(f"Removing dead connection for {db_name}")
-                    del self._connections[db_name]
-                    if db_name in self._connection_refs:
-                        del self._connection_refs[db_name]
-            
-            # Create new connection
+            pool = self._pools.get(db_name)
+            if pool is not None:
+                return pool
+
             logger.debug(f"Creating new DuckDB connection for {db_name}")
-            
+
             if db_name == ":memory:":
                 conn = duckdb.connect(database=":memory:", read_only=False)
             else:
@@ -115,7 +259,7 @@ class DuckDBConnectionPool:
                 if not db_path.parent.exists():
                     db_path.parent.mkdir(parents=True, exist_ok=True)
                 conn = duckdb.connect(database=str(db_path), read_only=False)
-            
+
             # Apply configuration
             if config:
                 for key, value in config.items():
@@ -127,77 +271,106 @@ class DuckDBConnectionPool:
                         conn.execute(f"SET enable_progress_bar={value}")
                     elif key == "enable_object_cache":
                         conn.execute(f"SET enable_object_cache={value}")
-            
-            # Store connection and weak reference
-            self._connections[db_name] = conn
-            self._connection_refs[db_name] = weakref.ref(conn, 
-                lambda ref, name=db_name: self._connection_died(name))
-            
-            return conn
-    
-    def _connection_died(self, db_name: str):
-        """Callback when a connection is garbage collected."""
-        logger.debug(f"Connection {db_name} was garbage collected")
-        with self._lock:
-            if db_name in self._connections:
-                del self._connections[db_name]
-            if db_name in self._connection_refs:
-                del self._connection_refs[db_name]
-    
-    def _cleanup_dead_connections(self):
-        """Remove dead connections from the pool."""
-        dead_connections = []
-        for db_name, ref in self._connection_refs.items():
-            if ref() is None:
-                dead_connections.append(db_name)
-        
-        for db_name in dead_connections:
-            logger.debug(f"Cleaning up dead connection: {db_name}")
-            if db_name in self._connections:
-                del self._connections[db_name]
-            del self._connection_refs[db_name]
-    
+
+            pool = _DatabasePool(db_name, conn, self.max_size)
+            self._pools[db_name] = pool
+            return pool
+
+    def _new_cursor(self, pool: _DatabasePool) -> duckdb.DuckDBPyConnection:
+        cursor = pool.root.cursor()
+        with pool.condition:
+            pool.stats["created"] += 1
+        return cursor
+
+    def _check_health(self, pool: _DatabasePool, cursor: duckdb.DuckDBPyConnection) -> Optional[duckdb.DuckDBPyConnection]:
+        """Return the cursor if it still answers queries, otherwise close it and return None."""
+        try:
+            cursor.execute("SELECT 1").fetchone()
+            return cursor
+        except Exception:
+            logger.debug(f"Removing dead cursor for {pool.db_name}")
+            self._close_quietly(cursor)
+            with pool.condition:
+                pool.stats["discarded"] += 1
+            return None
+
+    def _release_slot(self, pool: _DatabasePool) -> None:
+        """Give back the capacity of a cursor that was closed."""
+        with pool.condition:
+            pool.in_use -= 1
+            pool.size -= 1
+            pool.condition.notify_all()
+
+    @staticmethod
+    def _close_quietly(conn: duckdb.DuckDBPyConnection) -> None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+
     def close_connection(self, db_name: str):
-        """Explicitly close and remove a connection from the pool.
-        
+        """Explicitly close a database and its idle cursors.
+
+        Cursors still checked out are closed when they are checked in.
+
         Args:
             db_name: Database name to close
         """
         with self._lock:
-            if db_name in self._connections:
-                try:
-                    self._connections[db_name].close()
-                    logger.debug(f"Closed connection: {db_name}")
-                except Exception as e:
-                    logger.error(f"Error closing connection {db_name}: {e}")
-                finally:
-                    del self._connections[db_name]
-                    if db_name in self._connection_refs:
-                        del self._connection_refs[db_name]
-    
+            pool = self._pools.pop(db_name, None)
+        if pool is None:
+            return
+        with pool.condition:
+            while pool.idle:
+                self._close_quietly(pool.idle.pop()[0])
+            try:
+                pool.root.close()
+                logger.debug(f"Closed connection: {db_name}")
+            except Exception as e:
+                logger.error(f"Error closing connection {db_name}: {e}")
+            pool.root = None
+            pool.condition.notify_all()
+
     def close_all(self):
         """Close all connections in the pool."""
         with self._lock:
-            for db_name, conn in list(self._connections.items()):
-                try:
-                    conn.close()
-                    logger.debug(f"Closed connection: {db_name}")
-                except Exception as e:
-                    logger.error(f"Error closing connection {db_name}: {e}")
-            
-            self._connections.clear()
-            self._connection_refs.clear()
-            logger.info("Closed all DuckDB connections")
-    
+            db_names = list(self._pools)
+        for db_name in db_names:
+            self.close_connection(db_name)
+        logger.info("Closed all DuckDB connections")
+
     def get_pool_size(self) -> int:
-        """Get the current number of connections in the pool.
-        
+        """Get the current number of open databases in the pool.
+
         Returns:
-            Number of active connections
+            Number of active database connections
         """
         with self._lock:
-            return len(self._connections)
-    
+            return len(self._pools)
+
+    def get_stats(self, db_name: str = ":memory:") -> Dict[str, Any]:
+        """Get cursor counts and checkout wait metrics for a database.
+
+        Args:
+            db_name: Database name or path
+
+        Returns:
+            Dictionary with ``size``, ``in_use``, ``idle``, ``max_size``,
+            ``checkouts``, ``waits``, ``timeouts``, ``created``, ``discarded``,
+            ``total_wait_time``, ``max_wait_time`` and ``avg_wait_time``
+            (seconds, over checkouts that had to wait); empty if the database
+            is not open
+        """
+        with self._lock:
+            pool = self._pools.get(db_name)
+        if pool is None:
+            return {}
+        with pool.condition:
+            stats = dict(pool.stats)
+            stats.update(size=pool.size, in_use=pool.in_use, idle=len(pool.idle), max_size=pool.max_size)
+        stats["avg_wait_time"] = stats["total_wait_time"] / stats["waits"] if stats["waits"] else 0.0
+        return stats
+
     def __del__(self):
         """Cleanup when pool is destroyed."""
         try:
@@ -210,11 +383,11 @@ _connection_pool = None
 
 def get_connection_pool() -> DuckDBConnectionPool:
     """Get the global connection pool instance.
-    
+
     Returns:
         DuckDBConnectionPool instance
     """
     global _connection_pool
     if _connection_pool is None:
         _connection_pool = DuckDBConnectionPool()
-    return _connection_pool
\ No newline at end of file
+    return _connection_pool
@@ -0,0 +1,163 @@
+"""
+Process-wide embedding model registry and text embedding cache.
+
+Loading a SentenceTransformer takes seconds and hundreds of MB, so models are
+loaded once per process and shared. Embeddings are cached by a hash of the
+model name and text, so repeated texts such as common column names are only
+encoded once.
+"""
+
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = 'all-MiniLM-L6-v2'
+
+_models: Dict[Tuple[str, Optional[str]], Any] = {}
+_models_lock = threading.Lock()
+
+
+def get_model(model_name: str = DEFAULT_MODEL, cache_dir: Optional[str] = None) -> Any:
+    """Get the shared SentenceTransformer for a model, loading it on first use.
+
+    Args:
+        model_name: Name of the sentence transformer model
+        cache_dir: Optional directory to cache the model files
+
+    Returns:
+        The loaded SentenceTransformer
+    """
+    key = (model_name, str(cache_dir) if cache_dir else None)
+    model = _models.get(key)
+    if model is not None:
+        return model
+
+    with _models_lock:
+        model = _models.get(key)
+        if model is None:
+            from sentence_transformers import SentenceTransformer
+            if cache_dir:
+                model = SentenceTransformer(model_name, cache_folder=str(cache_dir))
+            else:
+                model = SentenceTransformer(model_name)
+            _models[key] = model
+            logger.info(f"Loaded embedding model: {model_name}")
+        return model
+
+
+def clear_models() -> None:
+    """Drop all loaded models from the registry."""
+    with _models_lock:
+        _models.clear()
+
+
+class EmbeddingCache:
+    """Thread-safe LRU cache of embeddings keyed by a hash of model and text."""
+
+    def __init__(self, max_entries: int = 100000):
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of embeddings kept before the least
+                recently used ones are evicted
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(model_name: str, text: str, normalize: bool = False) -> bytes:
+        """Cache key for a text embedded by a model."""
+        return hashlib.sha1(f"{model_name}\0{int(normalize)}\0{text}".encode("utf-8")).digest()
+
+    def get_many(self, keys: Sequence[bytes]) -> Dict[bytes, np.ndarray]:
+        """Look up several keys, returning the cached embeddings found."""
+        found = {}
+        with self._lock:
+            for key in keys:
+                vector = self._entries.get(key)
+                if vector is not None:
+                    self._entries.move_to_end(key)
+                    found[key] = vector
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, items: Dict[bytes, np.ndarray]) -> None:
+        """Store several embeddings, evicting the least recently used."""
+        with self._lock:
+            self._entries.update(items)
+            for key in items:
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached embeddings."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+embedding_cache = EmbeddingCache()
+
+
+def encode_texts(
+    texts: List[str],
+    model_name: str = DEFAULT_MODEL,
+    model: Any = None,
+    batch_size: int = 32,
+    normalize: bool = False,
+    cache: Optional[EmbeddingCache] = None
+) -> np.ndarray:
+    """Encode texts with a shared model, encoding only texts not already cached.
+
+    Args:
+        texts: Texts to encode
+        model_name: Model to use; also part of the cache key
+        model: Optional model instance to use instead of the registry's
+        batch_size: Batch size passed to the model
+        normalize: Whether to L2-normalize the embeddings
+        cache: Embedding cache to use (defaults to the process-wide cache)
+
+    Returns:
+        float32 array of shape (len(texts), dimension)
+    """
+    cache = cache if cache is not None else embedding_cache
+    keys = [cache.key(model_name, text, normalize) for text in texts]
+    vectors = cache.get_many(keys)
+
+    missing = {}
+    for key, text in zip(keys, texts):
+        if key not in vectors and key not in missing:
+            missing[key] = text
+
+    if missing:
+        model = model if model is not None else get_model(model_name)
+        encoded = model.encode(
+            list(missing.values()),
+            batch_size=batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=normalize,
+            show_progress_bar=False
+        )
+        encoded = np.asarray(encoded, dtype=np.float32).reshape(len(missing), -1)
+        new_vectors = dict(zip(missing.keys(), encoded))
+        cache.put_many(new_vectors)
+        vectors.update(new_vectors)
+
+    if not texts:
+        return np.zeros((0, 0), dtype=np.float32)
+    return np.stack([vectors[key] for key in keys])
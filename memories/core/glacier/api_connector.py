@@ -1,8 +1,8 @@
 """Base API connector for glacier data sources."""
 
 from typing import Dict, Any, Optional
-import aiohttp
 import logging
+from memories.core.http_session import get_http_manager
 from .base import GlacierConnector
 
 class APIConnector(GlacierConnector):
@@ -22,6 +22,8 @@ class APIConnector(GlacierConnector):
         self.timeout = config.get('timeout', 30)
         self.headers = config.get('headers', {})
         self.logger = logging.getLogger(self.__class__.__name__)
+        # Requests share the process-wide pooled session
+        self.http = get_http_manager()
     
     async def _make_request(
         self,
@@ -42,20 +44,21 @@ class APIConnector(GlacierConnector):
         url = f"{self.base_url.rstrip('/')}/{endpoint.lstrip('/')}"
         
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.request(
-                    method,
-                    url,
-                    timeout=self.timeout,
-                    **kwargs
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        self.logger.error(
-                            f"API request failed: {response.status} - {await response.text()}"
-                        )
-                        return None
+            headers = {**self.headers, **kwargs.pop('headers', {})}
+            response = await self.http.request(
+                method,
+                url,
+                headers=headers,
+                timeout=self.timeout,
+                **kwargs
+            )
+            if response.status == 200:
+                return await response.json()
+            else:
+                self.logger.error(
+                    f"API request failed: {response.status} - {await response.text()}"
+                )
+                return None
         except Exception as e:
             self.logger.error(f"Request error: {str(e)}")
             return None
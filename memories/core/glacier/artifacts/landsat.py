@@ -7,16 +7,16 @@ import logging
 import asyncio
 import planetary_computer
 import pystac_client
-import rasterio
 import numpy as np
 import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from shapely.geometry import box
-from rasterio.windows import Window, from_bounds
 from typing import Dict, Any, Optional, List, Union
 import json
 from memories.core.cold import ColdMemory
+from memories.core.glacier.artifacts.raster import read_band_window
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -25,19 +25,27 @@ logger = logging.getLogger(__name__)
 class LandsatConnector:
     """Interface for accessing Landsat data using Planetary Computer."""
     
-    def __init__(self, data_dir: Union[str, Path] = None, keep_files: bool = False, store_in_cold: bool = True):
+    def __init__(
+        self,
+        data_dir: Union[str, Path] = None,
+        keep_files: bool = False,
+        store_in_cold: bool = True,
+        max_workers: int = 4
+    ):
         """Initialize the Landsat interface.
         
         Args:
             data_dir: Directory to store downloaded data. If None, uses cold storage
             keep_files: Whether to keep downloaded files (default: False)
             store_in_cold: Whether to store files in cold memory (default: True)
+            max_workers: Band reads running at once (default: 4)
         """
         self.keep_files = keep_files
         self.store_in_cold = store_in_cold
         self.logger = logging.getLogger(__name__)
         self.client = None
         self._downloaded_files = []
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="landsat-band")
         
         # Initialize cold memory if enabled
         self.cold_memory = ColdMemory() if store_in_cold else None
@@ -79,61 +87,35 @@ class LandsatConnector:
         url: str,
         bbox: Dict[str, float],
         band_name: str,
-        metadata: Dict[str, Any] = None
+        metadata: Dict[str, Any] = None,
+        output_file: Optional[Path] = None
     ) -> bool:
-        """Download a specific band from a Landsat scene for a given bounding box."""
-        try:
-            # Create output directory structure
-            band_dir = self.data_dir / band_name
-            band_dir.mkdir(parents=True, exist_ok=True)
-            output_file = band_dir / f"{band_name}.tif"
+        """Download a specific band from a Landsat scene for a given bounding box.
 
-            logger.info(f"Downloading band {band_name} from {url}")
+        The WGS84 bbox is projected into the scene CRS and the read covers
+        whole internal tiles of the COG on the connector's thread pool; a
+        failed read is reported rather than retried as a full-scene read.
 
-            # Open source
-            with rasterio.open(url) as src:
-                # Try windowed read
-                try:
-                    window = from_bounds(
-                        bbox["xmin"], bbox["ymin"],
-                        bbox["xmax"], bbox["ymax"],
-                        src.transform
-                    )
-                    logger.info(f"Calculated window pixels: rows={window.height}, cols={window.width}")
-                    if window.height < 1 or window.width < 1:
-                        raise ValueError(f"Invalid window dimensions: {window}")
-                    data = src.read(1, window=window)
-                    mask = src.read_masks(1, window=window)
-
-                    profile = src.profile.copy()
-                    profile.update({
-                        "driver": "GTiff",
-                        "height": int(window.height),
-                        "width": int(window.width),
-                        "transform": src.window_transform(window),
-                        "compress": "LZW",
-                        "tiled": True,
-                        "blockxsize": 256,
-                        "blockysize": 256,
-                    })
+        Args:
+            url: URL of the band image
+            bbox: Dictionary containing xmin, ymin, xmax, ymax in WGS84 coordinates
+            band_name: Name of the band to download
+            metadata: Optional metadata about the scene
+            output_file: Where to write the band (default: <data_dir>/<band>/<band>.tif)
 
-                except Exception as window_error:
-                    logger.warning(
-                        f"Windowed reading failed ({window_error}); falling back to full read."
-                    )
-                    data = src.read(1)
-                    mask = src.read_masks(1)
-                    profile = src.profile.copy()
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            output_file = Path(output_file) if output_file else self.data_dir / band_name / f"{band_name}.tif"
+            logger.info(f"Downloading band {band_name} from {url}")
 
-            # Write out
-            logger.info(f"Saving band {band_name} to {output_file}")
-            with rasterio.open(output_file, "w", **profile) as dst:
-                dst.write(data, 1)
-                dst.write_mask(mask)
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, read_band_window, url, bbox, output_file)
 
             # Verify and (optionally) store in cold memory
             if output_file.exists() and output_file.stat().st_size > 0:
-                logger.info(f"Successfully saved band {band_name} ({profile['height']}×{profile['width']})")
+                logger.info(f"Successfully saved band {band_name} ({result['height']}×{result['width']})")
                 if getattr(self, "store_in_cold", False) and metadata and hasattr(self, "store_in_cold_memory"):
                     await self.store_in_cold_memory(band_name, output_file, metadata)
                 return True
@@ -153,9 +135,16 @@ class LandsatConnector:
         end_date: datetime,
         collection: str = "landsat-c2-l2",
         bands: Optional[List[str]] = None,
-        cloud_cover: float = 30.0
+        cloud_cover: float = 30.0,
+        max_items: Optional[int] = 1
     ) -> Dict[str, Any]:
-        """Download Landsat data for a given bounding box and time range."""
+        """Download Landsat data for a given bounding box and time range.
+
+        Matching scenes are ranked by cloud cover and the bands of the best
+        ``max_items`` (None for all) are read concurrently into
+        ``<data_dir>/<band>/<scene_id>.tif``. On success the clearest scene's
+        fields are at the top level and ``scenes`` lists every downloaded scene.
+        """
         # Ensure client is initialized
         if self.client is None:
             if not await self.initialize():
@@ -188,43 +177,55 @@ class LandsatConnector:
             if not items:
                 return {"status": "error", "message": "No scenes found matching criteria"}
 
-            item = items[0]
-            logger.info(f"Processing scene: {item.id}")
-
-            # Download each requested band
-            downloaded = []
-            for band in bands:
-                if band not in item.assets:
-                    return {
-                        "status": "error",
-                        "message": f"Band '{band}' not available in scene {item.id}"
-                    }
+            # Rank scenes by cloud cover and keep those carrying every band
+            items.sort(key=lambda item: item.properties.get("eo:cloud_cover", 0))
+            usable = [item for item in items if all(band in item.assets for band in bands)]
+            if not usable:
+                missing = next(band for band in bands if band not in items[0].assets)
+                return {
+                    "status": "error",
+                    "message": f"Band '{missing}' not available in scene {items[0].id}"
+                }
+            selected = usable[:max_items] if max_items else usable
+            logger.info(f"Processing scenes: {[item.id for item in selected]}")
 
-                href = item.assets[band].href
-                signed_href = planetary_computer.sign(href)
+            # Read every band of every scene concurrently on the thread pool
+            jobs = [(item, band, self.data_dir / band / f"{item.id}.tif") for item in selected for band in bands]
+            results = await asyncio.gather(*(
+                self.fetch_windowed_band(
+                    planetary_computer.sign(item.assets[band].href), bbox, band, item.properties, output_file
+                )
+                for item, band, output_file in jobs
+            ))
 
-                success = await self.fetch_windowed_band(signed_href, bbox, band, item.properties)
-                if not success:
-                    return {
-                        "status": "error",
-                        "message": f"Failed to download band '{band}'"
+            failed = {item.id: band for (item, band, _), success in zip(jobs, results) if not success}
+            scenes = []
+            for item in selected:
+                if item.id in failed:
+                    logger.error(f"Failed to download band '{failed[item.id]}' of scene {item.id}")
+                    continue
+                scenes.append({
+                    "scene_id": item.id,
+                    "cloud_cover": item.properties.get("eo:cloud_cover", 0),
+                    "bands": list(bands),
+                    "files": {band: str(self.data_dir / band / f"{item.id}.tif") for band in bands},
+                    "metadata": {
+                        "datetime": item.datetime.isoformat(),
+                        "platform": item.properties.get("platform"),
+                        "instrument": item.properties.get("instruments", []),
+                        "processing:level": item.properties.get("processing:level"),
+                        "collection": item.collection_id
                     }
-                downloaded.append(band)
+                })
 
-            # If we get here, all bands succeeded
-            return {
-                "status": "success",
-                "scene_id": item.id,
-                "cloud_cover": item.properties.get("eo:cloud_cover", 0),
-                "bands": downloaded,
-                "metadata": {
-                    "datetime": item.datetime.isoformat(),
-                    "platform": item.properties.get("platform"),
-                    "instrument": item.properties.get("instruments", []),
-                    "processing:level": item.properties.get("processing:level"),
-                    "collection": item.collection_id
+            if not scenes:
+                return {
+                    "status": "error",
+                    "message": f"Failed to download band '{failed[selected[0].id]}'"
                 }
-            }
+
+            # The clearest scene stays at the top level for single-scene callers
+            return {"status": "success", **scenes[0], "scenes": scenes}
 
         except Exception as e:
             logger.error(f"Error downloading Landsat data: {e}")
@@ -4,10 +4,8 @@ import osmnx as ox
 import geopandas as gpd
 from typing import Dict, List, Union, Optional, Any, Tuple
 from shapely.geometry import box
-import requests
 from urllib.parse import quote
 import logging
-import aiohttp
 from pathlib import Path
 
 from memories.core.glacier.api_connector import APIConnector
@@ -27,6 +25,12 @@ class OSMConnector(APIConnector, DataSource):
             'base_url': 'https://nominatim.openstreetmap.org',
             'overpass_url': 'https://overpass-api.de/api/interpreter',
             'timeout': 25,
+            # Requests per second and burst per endpoint; both services ask
+            # clients to stay around one request per second
+            'rate_limits': {
+                'https://nominatim.openstreetmap.org': {'rate': 1.0, 'burst': 1},
+                'https://overpass-api.de/api/interpreter': {'rate': 1.0, 'burst': 2}
+            },
             'feature_types': {
                 'buildings': ['building'],
                 'highways': ['highway'],
@@ -39,18 +43,18 @@ class OSMConnector(APIConnector, DataSource):
         DataSource.__init__(self, cache_dir)
         
         self.config = default_config
-        self._session = None
+        for url_prefix, limit in self.config['rate_limits'].items():
+            self.http.set_rate_limit(url_prefix, limit['rate'], limit.get('burst', 1))
 
     async def connect(self) -> None:
         """Establish connection to the API."""
-        if not self._session:
-            self._session = aiohttp.ClientSession()
+        await self.http.get_session()
 
     async def cleanup(self) -> None:
-        """Clean up resources."""
-        if self._session:
-            await self._session.close()
-            self._session = None
+        """Clean up resources.
+        
+        The pooled HTTP session is shared by all connectors and stays open.
+        """
 
     async def list_objects(self, prefix: str = "") -> List[str]:
         """List available objects (not applicable for OSM)."""
@@ -147,12 +151,12 @@ class OSMConnector(APIConnector, DataSource):
             }
             
             # Make request to Nominatim API using reverse geocoding
-            url = f"https://nominatim.openstreetmap.org/reverse?lat={lat}&lon={lon}&format=json&addressdetails=1"
-            response = requests.get(url, headers=headers)
+            url = f"{self.config['base_url'].rstrip('/')}/reverse?lat={lat}&lon={lon}&format=json&addressdetails=1"
+            response = await self.http.request("GET", url, headers=headers, timeout=self.config['timeout'])
             response.raise_for_status()
             
             # Parse response
-            result = response.json()
+            result = await response.json()
             
             if not result or "error" in result:
                 return {
@@ -207,12 +211,12 @@ class OSMConnector(APIConnector, DataSource):
             }
             
             # Make request to Nominatim API
-            url = f"https://nominatim.openstreetmap.org/search?q={encoded_address}&format=json&polygon_geojson=1"
-            response = requests.get(url, headers=headers)
+            url = f"{self.config['base_url'].rstrip('/')}/search?q={encoded_address}&format=json&polygon_geojson=1"
+            response = await self.http.request("GET", url, headers=headers, timeout=self.config['timeout'])
             response.raise_for_status()
             
             # Parse response
-            results = response.json()
+            results = await response.json()
             
             if not results:
                 return {
@@ -323,21 +327,21 @@ class OSMConnector(APIConnector, DataSource):
             
             logger.debug(f"Executing Overpass query: {query.strip()}")
             
-            # Make request to Overpass API
-            async with aiohttp.ClientSession() as session:
-                timeout = aiohttp.ClientTimeout(total=self.config['timeout'])
-                async with session.post(
-                    self.config['overpass_url'],
-                    data=query.strip(),
-                    headers={'Content-Type': 'text/plain'},
-                    timeout=timeout
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        response_text = await response.text()
-                        logger.error(f"Error from Overpass API: {response.status}, Response: {response_text}")
-                        return None
+            # Make request to Overpass API; queries are read-only, so retrying is safe
+            response = await self.http.request(
+                "POST",
+                self.config['overpass_url'],
+                idempotent=True,
+                data=query.strip(),
+                headers={'Content-Type': 'text/plain'},
+                timeout=self.config['timeout']
+            )
+            if response.status == 200:
+                return await response.json()
+            else:
+                response_text = await response.text()
+                logger.error(f"Error from Overpass API: {response.status}, Response: {response_text}")
+                return None
                         
         except Exception as e:
             logger.error(f"Error querying OSM data: {str(e)}")
@@ -3,10 +3,16 @@ Overture Maps data source using DuckDB for direct S3 access and filtering.
 """
 
 import os
+import math
+import uuid
+import shutil
 import logging
+import threading
 import duckdb
+import pyarrow as pa
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Union, Any, Optional
+from typing import Dict, Iterator, List, Union, Any, Optional, Set, Tuple
 import json
 from memories.core.memory_manager import MemoryManager
 from memories.core.cold import ColdMemory
@@ -20,6 +26,9 @@ class OvertureConnector:
     # Latest Overture release
     OVERTURE_RELEASE = "2024-09-18.0"
     
+    # Root of the public Overture releases
+    RELEASE_PATH = "s3://overturemaps-us-west-2/release"
+    
     # Theme configurations with exact type paths
     THEMES = {
         "buildings": ["building", "building_part"],      # theme=buildings/type=building/*
@@ -32,14 +41,36 @@ class OvertureConnector:
     
     
     
-    def __init__(self, data_dir: str = None):
+    def __init__(
+        self,
+        data_dir: str = None,
+        release_path: Optional[str] = None,
+        max_workers: int = 4,
+        tile_size: float = 0.25,
+        min_tile_coverage: float = 0.1
+    ):
         """Initialize the Overture Maps interface.
         
         Args:
             data_dir: Directory for storing downloaded data
+            release_path: Root of the Overture releases, defaults to the public
+                S3 bucket. A local directory with the same ``<release>/theme=*/type=*``
+                layout can be used instead.
+            max_workers: Maximum number of theme/type downloads run concurrently
+            tile_size: Size in degrees of the bbox tiles downloads are cached by
+            min_tile_coverage: Smallest fraction of its tiles' area a bbox must
+                cover to go through the tile cache. Caching fetches whole tiles,
+                so smaller bboxes are read from the release directly instead:
+                they download only their own features but are not reused by
+                later, overlapping requests.
         """
         self.data_dir = Path(data_dir) if data_dir else Path("data/overture")
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self.release_path = (release_path or self.RELEASE_PATH).rstrip("/")
+        self.max_workers = max(1, max_workers)
+        self.tile_size = tile_size
+        self.min_tile_coverage = min_tile_coverage
+        self._manifest_lock = threading.Lock()
         
         try:
             # Initialize DuckDB connection
@@ -47,20 +78,12 @@ class OvertureConnector:
             
             # Try to load extensions if already installed
             try:
-                self.con.execute("LOAD spatial;")
-                self.con.execute("LOAD httpfs;")
-            except duckdb.Error:
-                # If loading fails, install and then load
-                logger.info("Installing required DuckDB extensions...")
-                self.con.execute("INSTALL spatial;")
-                self.con.execute("INSTALL httpfs;")
-                self.con.execute("LOAD spatial;")
-                self.con.execute("LOAD httpfs;")
-            
-            # Configure S3 access
-            self.con.execute("SET s3_region='us-west-2';")
-            self.con.execute("SET enable_http_metadata_cache=true;")
-            self.con.execute("SET enable_object_cache=true;")
+                self._load_extensions()
+            except duckdb.Error as e:
+                # Extensions are only required to read the release from S3
+                if "://" in self.release_path:
+                    raise
+                logger.warning(f"DuckDB extensions unavailable, reading local release only: {e}")
             
             # Test the connection by running a simple query
             test_query = "SELECT 1;"
@@ -71,6 +94,24 @@ class OvertureConnector:
             logger.error(f"Error initializing DuckDB: {e}")
             raise RuntimeError(f"Failed to initialize DuckDB: {e}")
     
+    def _load_extensions(self) -> None:
+        """Load the spatial and httpfs extensions and configure S3 access."""
+        try:
+            self.con.execute("LOAD spatial;")
+            self.con.execute("LOAD httpfs;")
+        except duckdb.Error:
+            # If loading fails, install and then load
+            logger.info("Installing required DuckDB extensions...")
+            self.con.execute("INSTALL spatial;")
+            self.con.execute("INSTALL httpfs;")
+            self.con.execute("LOAD spatial;")
+            self.con.execute("LOAD httpfs;")
+        
+        # Configure S3 access
+        self.con.execute("SET s3_region='us-west-2';")
+        self.con.execute("SET enable_http_metadata_cache=true;")
+        self.con.execute("SET enable_object_cache=true;")
+    
     def get_s3_path(self, theme: str, type_name: str) -> str:
         """Get the S3 path for a theme and type.
         
@@ -81,7 +122,192 @@ class OvertureConnector:
         Returns:
             S3 path string
         """
-        return f"s3://overturemaps-us-west-2/release/{self.OVERTURE_RELEASE}/theme={theme}/type={type_name}/*"
+        return f"{self.release_path}/{self.OVERTURE_RELEASE}/theme={theme}/type={type_name}/*"
+    
+    def _bbox_tiles(self, bbox: Dict[str, float]) -> List[Tuple[int, int]]:
+        """Tiles of the cache grid that can hold features inside a bbox.
+        
+        Features are cached in the tile containing their bbox minimum corner,
+        so every feature inside ``bbox`` lives in one of the returned tiles.
+        """
+        x0, x1 = math.floor(bbox['xmin'] / self.tile_size), math.floor(bbox['xmax'] / self.tile_size)
+        y0, y1 = math.floor(bbox['ymin'] / self.tile_size), math.floor(bbox['ymax'] / self.tile_size)
+        return [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+    
+    def _use_tile_cache(self, bbox: Dict[str, float], tiles: List[Tuple[int, int]]) -> bool:
+        """Whether a bbox covers enough of its tiles to be worth caching them."""
+        area = (bbox['xmax'] - bbox['xmin']) * (bbox['ymax'] - bbox['ymin'])
+        return area >= self.min_tile_coverage * len(tiles) * self.tile_size ** 2
+    
+    def _tile_dir(self, theme: str, type_name: str) -> Path:
+        """Cache directory for the tiles of one release/theme/type."""
+        return self.data_dir / "tiles" / self.OVERTURE_RELEASE / theme / type_name
+    
+    def _cached_tiles(self, tile_dir: Path) -> Set[str]:
+        """Tiles recorded as downloaded in a tile directory's manifest."""
+        manifest = tile_dir / "tiles.json"
+        if not manifest.exists():
+            return set()
+        with open(manifest) as f:
+            return set(json.load(f))
+    
+    def _fetch_tiles(
+        self,
+        con: duckdb.DuckDBPyConnection,
+        theme: str,
+        type_name: str,
+        tiles: List[Tuple[int, int]]
+    ) -> None:
+        """Download missing cache tiles with a single scan of the release.
+        
+        The scan is bounded by the tiles' extent so DuckDB can skip row groups
+        by their bbox statistics, and written partitioned by tile. Tiles are
+        added to the manifest only once their files are in place, so an
+        interrupted download resumes with the tiles still missing.
+        """
+        tile_dir = self._tile_dir(theme, type_name)
+        tile_dir.mkdir(parents=True, exist_ok=True)
+        keys = [f"{x}_{y}" for x, y in tiles]
+        size = self.tile_size
+        tmp_dir = tile_dir / f".tmp-{uuid.uuid4().hex}"
+        
+        query = f"""
+        COPY (
+            SELECT * FROM (
+                SELECT 
+                    *,
+                    CAST(floor(bbox.xmin / {size}) AS BIGINT) AS tile_x,
+                    CAST(floor(bbox.ymin / {size}) AS BIGINT) AS tile_y
+                FROM 
+                    read_parquet('{self.get_s3_path(theme, type_name)}', filename=true, hive_partitioning=1)
+                WHERE 
+                    bbox.xmin >= {min(x for x, _ in tiles) * size}
+                    AND bbox.xmin < {(max(x for x, _ in tiles) + 1) * size}
+                    AND bbox.ymin >= {min(y for _, y in tiles) * size}
+                    AND bbox.ymin < {(max(y for _, y in tiles) + 1) * size}
+            )
+            WHERE tile_x || '_' || tile_y IN ({', '.join(f"'{key}'" for key in keys)})
+        ) TO '{tmp_dir}' (FORMAT 'parquet', PARTITION_BY (tile_x, tile_y));
+        """
+        try:
+            con.execute(query)
+            for x, y in tiles:
+                target = tile_dir / f"{x}_{y}"
+                if target.exists():
+                    shutil.rmtree(target)
+                source = tmp_dir / f"tile_x={x}" / f"tile_y={y}"
+                if source.exists():
+                    source.rename(target)
+            
+            with self._manifest_lock:
+                cached = self._cached_tiles(tile_dir) | set(keys)
+                manifest = tile_dir / "tiles.json"
+                tmp_manifest = tile_dir / f".tiles-{uuid.uuid4().hex}.json"
+                with open(tmp_manifest, 'w') as f:
+                    json.dump(sorted(cached), f)
+                os.replace(tmp_manifest, manifest)
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    
+    def _download_type(
+        self,
+        theme: str,
+        type_name: str,
+        bbox: Dict[str, float],
+        output_file: Path,
+        geometry_sql: str = "geometry"
+    ) -> bool:
+        """Write the features of one theme/type inside a bbox to a Parquet file.
+        
+        Runs on its own DuckDB cursor so several types can download at once.
+        Tiles already in the cache from earlier, overlapping requests are
+        reused; only missing tiles are read from the release. Bboxes covering
+        less than ``min_tile_coverage`` of their tiles bypass the cache and
+        are read from the release directly.
+        
+        Args:
+            theme: Theme name
+            type_name: Type name within theme
+            bbox: Bounding box dictionary with xmin, ymin, xmax, ymax
+            output_file: Parquet file to write
+            geometry_sql: SQL expression for the output geometry column
+            
+        Returns:
+            bool: True if download successful
+        """
+        con = self.con.cursor()
+        try:
+            tile_dir = self._tile_dir(theme, type_name)
+            tiles = self._bbox_tiles(bbox)
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+            if self._use_tile_cache(bbox, tiles):
+                cached = self._cached_tiles(tile_dir)
+                missing = [tile for tile in tiles if f"{tile[0]}_{tile[1]}" not in cached]
+                if missing:
+                    logger.info(f"Downloading {len(missing)} of {len(tiles)} tiles for {theme}/{type_name}...")
+                    self._fetch_tiles(con, theme, type_name, missing)
+                else:
+                    logger.info(f"Using {len(tiles)} cached tiles for {theme}/{type_name}")
+                
+                files = [
+                    str(path) for x, y in tiles
+                    for path in sorted((tile_dir / f"{x}_{y}").glob("*.parquet"))
+                ]
+                if not files:
+                    output_file.unlink(missing_ok=True)
+                    logger.warning(f"No features found for {theme}/{type_name}")
+                    return True
+                source = "read_parquet([" + ", ".join(f"'{f}'" for f in files) + "])"
+            else:
+                logger.info(f"Downloading {theme}/{type_name} for a bbox too small to cache by tile...")
+                source = f"read_parquet('{self.get_s3_path(theme, type_name)}', filename=true, hive_partitioning=1)"
+            
+            query = f"""
+            COPY (
+                SELECT 
+                    id, 
+                    names.primary AS primary_name,
+                    {geometry_sql} as geometry,
+                    *
+                FROM 
+                    {source}
+                WHERE 
+                    bbox.xmin >= {bbox['xmin']}
+                    AND bbox.xmax <= {bbox['xmax']}
+                    AND bbox.ymin >= {bbox['ymin']}
+                    AND bbox.ymax <= {bbox['ymax']}
+            ) TO '{output_file}' (FORMAT 'parquet');
+            """
+            con.execute(query)
+            
+            # Verify the written file from its footer instead of rescanning it
+            count = con.execute(
+                f"SELECT COALESCE(SUM(num_rows), 0) FROM parquet_file_metadata('{output_file}')"
+            ).fetchone()[0]
+            logger.info(f"Saved {count} features for {theme}/{type_name}")
+            return True
+        except Exception as e:
+            logger.error(f"Error downloading {theme}/{type_name}: {e}")
+            return False
+        finally:
+            con.close()
+    
+    def _download_many(self, jobs: List[Tuple[str, str, Path, str]], bbox: Dict[str, float]) -> List[bool]:
+        """Run theme/type downloads on a bounded worker pool.
+        
+        Args:
+            jobs: (theme, type_name, output_file, geometry_sql) per download
+            bbox: Bounding box dictionary with xmin, ymin, xmax, ymax
+            
+        Returns:
+            Download status per job, in order
+        """
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(jobs) or 1)) as pool:
+            futures = [
+                pool.submit(self._download_type, theme, type_name, bbox, output_file, geometry_sql)
+                for theme, type_name, output_file, geometry_sql in jobs
+            ]
+            return [future.result() for future in futures]
     
     def download_theme(self, theme: str, bbox: Dict[str, float]) -> bool:
         """Download theme data directly from S3 with bbox filtering.
@@ -102,61 +328,11 @@ class OvertureConnector:
             theme_dir = self.data_dir / theme
             theme_dir.mkdir(parents=True, exist_ok=True)
             
-            results = []
-            for type_name in self.THEMES[theme]:
-                s3_path = self.get_s3_path(theme, type_name)
-                output_file = theme_dir / f"{type_name}_filtered.parquet"
-                
-                # Test S3 access
-                test_query = f"""
-                SELECT COUNT(*) 
-                FROM read_parquet('{s3_path}', filename=true, hive_partitioning=1)
-                LIMIT 1
-                """
-                
-                try:
-                    logger.info(f"Testing S3 access for {theme}/{type_name}...")
-                    self.con.execute(test_query)
-                except Exception as e:
-                    logger.error(f"Failed to access S3 path for {theme}/{type_name}: {e}")
-                    continue
-                
-                # Query to filter and download data
-                query = f"""
-                COPY (
-                    SELECT 
-                        id, 
-                        names.primary AS primary_name,
-                        ST_AsText(geometry) as geometry,
-                        *
-                    FROM 
-                        read_parquet('{s3_path}', filename=true, hive_partitioning=1)
-                    WHERE 
-                        bbox.xmin >= {bbox['xmin']}
-                        AND bbox.xmax <= {bbox['xmax']}
-                        AND bbox.ymin >= {bbox['ymin']}
-                        AND bbox.ymax <= {bbox['ymax']}
-                ) TO '{output_file}' (FORMAT 'parquet');
-                """
-                
-                logger.info(f"Downloading filtered data for {theme}/{type_name}...")
-                try:
-                    self.con.execute(query)
-                    
-                    # Verify the file was created and has content
-                    if output_file.exists() and output_file.stat().st_size > 0:
-                        count_query = f"SELECT COUNT(*) as count FROM read_parquet('{output_file}')"
-                        count = self.con.execute(count_query).fetchone()[0]
-                        logger.info(f"Saved {count} features for {theme}/{type_name}")
-                        results.append(True)
-                    else:
-                        logger.warning(f"No features found for {theme}/{type_name}")
-                        results.append(False)
-                except Exception as e:
-                    logger.error(f"Error downloading {theme}/{type_name}: {e}")
-                    results.append(False)
-            
-            return any(results)  # Return True if any type was downloaded successfully
+            jobs = [
+                (theme, type_name, theme_dir / f"{type_name}_filtered.parquet", "ST_AsText(geometry)")
+                for type_name in dict.fromkeys(self.THEMES[theme])
+            ]
+            return any(self._download_many(jobs, bbox))  # True if any type was downloaded successfully
                 
         except Exception as e:
             logger.error(f"Error downloading {theme} data: {e}")
@@ -172,17 +348,139 @@ class OvertureConnector:
             Dictionary with download status for each theme
         """
         try:
-            results = {}
-            for theme in self.THEMES:
-                logger.info(f"\nDownloading {theme} data...")
-                results[theme] = self.download_theme(theme, bbox)
+            jobs = [
+                (theme, type_name, self.data_dir / theme / f"{type_name}_filtered.parquet", "ST_AsText(geometry)")
+                for theme, types in self.THEMES.items()
+                for type_name in dict.fromkeys(types)
+            ]
+            logger.info(f"Downloading {len(jobs)} theme types with {self.max_workers} workers...")
+            statuses = self._download_many(jobs, bbox)
+            
+            results = {theme: False for theme in self.THEMES}
+            for (theme, _, _, _), status in zip(jobs, statuses):
+                results[theme] = results[theme] or status
             return results
             
         except Exception as e:
             logger.error(f"Error during data download: {str(e)}")
             return {theme: False for theme in self.THEMES}
     
-    async def search(self, bbox: Union[List[float], Dict[str, float]]) -> Dict[str, Any]:
+    @staticmethod
+    def _bbox_dict(bbox: Union[List[float], Dict[str, float]]) -> Dict[str, float]:
+        """Convert a [min_lon, min_lat, max_lon, max_lat] list to bbox dictionary format."""
+        if isinstance(bbox, (list, tuple)):
+            return {
+                "xmin": bbox[0],
+                "ymin": bbox[1],
+                "xmax": bbox[2],
+                "ymax": bbox[3]
+            }
+        return bbox
+    
+    def _downloaded_files(self, theme: str, type_name: str) -> List[Path]:
+        """Downloaded Parquet files for a theme/type, from any download method."""
+        candidates = [
+            self.data_dir / theme / type_name / f"{type_name}_filtered.parquet",
+            self.data_dir / theme / f"{type_name}_filtered.parquet"
+        ]
+        return [path for path in candidates if path.exists()]
+    
+    def _feature_query(
+        self,
+        con: duckdb.DuckDBPyConnection,
+        parquet_file: Path,
+        bbox: Dict[str, float],
+        columns: Optional[List[str]] = None,
+        condition: str = "",
+        params: Optional[List[Any]] = None
+    ) -> Tuple[str, List[Any]]:
+        """Build a query for the features of a Parquet file intersecting a bbox.
+        
+        The bbox test is written on the ``bbox`` struct fields, with the
+        bounds cast to the fields' own type, so DuckDB can push it into the
+        Parquet scan and skip row groups by their min/max statistics. Only
+        the requested columns are read.
+        
+        Args:
+            con: Connection used to validate the requested columns
+            parquet_file: Parquet file to query
+            bbox: Bounding box dictionary with xmin, ymin, xmax, ymax
+            columns: Columns to return, all when None
+            condition: Optional extra SQL condition, with ``?`` placeholders
+            params: Parameters for ``condition``
+            
+        Returns:
+            Tuple of SQL and its parameters
+        """
+        source = f"read_parquet('{str(parquet_file).replace(chr(39), chr(39) * 2)}')"
+        if columns:
+            available = {row[0] for row in con.execute(f"DESCRIBE SELECT * FROM {source}").fetchall()}
+            unknown = [c for c in columns if c not in available]
+            if unknown:
+                raise ValueError(f"Unknown columns {unknown} in {parquet_file.name}")
+            projection = ", ".join('"' + c.replace('"', '""') + '"' for c in columns)
+        else:
+            projection = "*"
+        # Untyped parameters would make DuckDB cast the column instead, which
+        # disables row group pruning
+        xmin, xmax, ymin, ymax = (row[1] for row in con.execute(
+            f"DESCRIBE SELECT bbox.xmin, bbox.xmax, bbox.ymin, bbox.ymax FROM {source}"
+        ).fetchall())
+        query = f"""
+        SELECT {projection}
+        FROM {source}
+        WHERE 
+            bbox.xmax >= CAST(? AS {xmax})
+            AND bbox.xmin <= CAST(? AS {xmin})
+            AND bbox.ymax >= CAST(? AS {ymax})
+            AND bbox.ymin <= CAST(? AS {ymin})
+            {f"AND ({condition})" if condition else ""}
+        """
+        return query, [bbox['xmin'], bbox['xmax'], bbox['ymin'], bbox['ymax']] + list(params or [])
+    
+    def search_batches(
+        self,
+        bbox: Union[List[float], Dict[str, float]],
+        themes: Optional[List[str]] = None,
+        columns: Optional[List[str]] = None,
+        batch_size: int = 100_000
+    ) -> Iterator[Tuple[str, str, pa.RecordBatch]]:
+        """Stream downloaded features intersecting a bounding box.
+        
+        Results are produced as Arrow record batches straight from DuckDB, so
+        memory use is bounded by ``batch_size`` rather than by file or result
+        size.
+        
+        Args:
+            bbox: Bounding box as either:
+                 - List [min_lon, min_lat, max_lon, max_lat]
+                 - Dict with keys 'xmin', 'ymin', 'xmax', 'ymax'
+            themes: Themes to search, all when None
+            columns: Columns to return, all when None
+            batch_size: Maximum number of rows per record batch
+            
+        Yields:
+            Tuples of theme, type name and a record batch of matching features
+        """
+        bbox_dict = self._bbox_dict(bbox)
+        con = self.con.cursor()
+        try:
+            for theme in themes or self.THEMES:
+                for type_name in dict.fromkeys(self.THEMES.get(theme, [])):
+                    for parquet_file in self._downloaded_files(theme, type_name):
+                        query, params = self._feature_query(con, parquet_file, bbox_dict, columns)
+                        reader = con.execute(query, params).fetch_record_batch(batch_size)
+                        for batch in reader:
+                            if batch.num_rows:
+                                yield theme, type_name, batch
+        finally:
+            con.close()
+    
+    async def search(
+        self,
+        bbox: Union[List[float], Dict[str, float]],
+        columns: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
         """
         Search downloaded data within the given bounding box.
         
@@ -190,58 +488,19 @@ class OvertureConnector:
             bbox: Bounding box as either:
                  - List [min_lon, min_lat, max_lon, max_lat]
                  - Dict with keys 'xmin', 'ymin', 'xmax', 'ymax'
+            columns: Optional columns to return, all when None
             
         Returns:
-            Dictionary containing features by theme
+            Dictionary containing features intersecting the bbox by theme
         """
         try:
-            # Convert bbox to dictionary format if it's a list
-            if isinstance(bbox, (list, tuple)):
-                bbox_dict = {
-                    "xmin": bbox[0],
-                    "ymin": bbox[1],
-                    "xmax": bbox[2],
-                    "ymax": bbox[3]
-                }
-            else:
-                bbox_dict = bbox
-            
-            results = {}
+            results = {theme: [] for theme in self.THEMES}
+            for theme, type_name, batch in self.search_batches(bbox, columns=columns):
+                results[theme].extend(batch.to_pylist())
             
-            for theme in self.THEMES:
-                theme_dir = self.data_dir / theme
-                if not theme_dir.exists():
-                    logger.warning(f"No data directory found for theme {theme}")
-                    results[theme] = []
-                    continue
-                
-                theme_results = []
-                for type_name in self.THEMES[theme]:
-                    parquet_file = theme_dir / type_name / f"{type_name}_filtered.parquet"
-                    if not parquet_file.exists():
-                        logger.warning(f"No data file found for {theme}/{type_name}")
-                        continue
-                        
-                    try:
-                        query = f"""
-                        SELECT 
-                            id,
-                            names.primary AS primary_name,
-                            geometry,
-                            *
-                        FROM read_parquet('{parquet_file}')
-                        """
-                        
-                        df = self.con.execute(query).fetchdf()
-                        if not df.empty:
-                            theme_results.extend(df.to_dict('records'))
-                            logger.info(f"Found {len(df)} features in {parquet_file.name}")
-                    except Exception as e:
-                        logger.warning(f"Error reading {parquet_file}: {str(e)}")
-                
-                results[theme] = theme_results
-                if theme_results:
-                    logger.info(f"Found total {len(theme_results)} features for theme {theme}")
+            for theme, features in results.items():
+                if features:
+                    logger.info(f"Found total {len(features)} features for theme {theme}")
                 else:
                     logger.warning(f"No features found for theme {theme}")
             
@@ -497,8 +756,7 @@ api = OvertureConnector()
             
         try:
             logger.info(f"Starting download for {theme}/{type_name}")
-            s3_path = self.get_s3_path(theme, type_name)
-            logger.info(f"Using S3 path: {s3_path}")
+            logger.info(f"Using S3 path: {self.get_s3_path(theme, type_name)}")
             
             # Create output directory
             storage_dir = self.data_dir / theme / type_name
@@ -506,54 +764,8 @@ api = OvertureConnector()
             output_file = storage_dir / f"{type_name}_filtered.parquet"
             logger.info(f"Output will be saved to: {output_file}")
             
-            # Test S3 access
-            test_query = f"""
-            SELECT COUNT(*) 
-            FROM read_parquet('{s3_path}', filename=true, hive_partitioning=1)
-            LIMIT 1
-            """
-            
-            try:
-                logger.info(f"Testing S3 access for {theme}/{type_name}...")
-                self.con.execute(test_query)
-            except Exception as e:
-                logger.error(f"Failed to access S3 path for {theme}/{type_name}: {e}")
-                return False
-            
-            # Query to filter and download data
-            query = f"""
-            COPY (
-                SELECT 
-                    id, 
-                    names.primary AS primary_name,
-                    geometry,
-                    *
-                FROM 
-                    read_parquet('{s3_path}', filename=true, hive_partitioning=1)
-                WHERE 
-                    bbox.xmin >= {bbox['xmin']}
-                    AND bbox.xmax <= {bbox['xmax']}
-                    AND bbox.ymin >= {bbox['ymin']}
-                    AND bbox.ymax <= {bbox['ymax']}
-            ) TO '{output_file}' (FORMAT 'parquet');
-            """
-            
-            logger.info(f"Downloading filtered data for {theme}/{type_name}...")
-            try:
-                self.con.execute(query)
-                
-                # Verify the file was created and has content
-                if output_file.exists() and output_file.stat().st_size > 0:
-                    count_query = f"SELECT COUNT(*) as count FROM read_parquet('{output_file}')"
-                    count = self.con.execute(count_query).fetchone()[0]
-                    logger.info(f"Successfully saved {count} features for {theme}/{type_name}")
-                    return True
-                else:
-                    logger.warning(f"No features found for {theme}/{type_name}")
-                    return True  # Still return True as the operation completed successfully
-            except Exception as e:
-                logger.error(f"Error downloading {theme}/{type_name}: {e}")
-                return False
+            # Access errors surface from the download itself, no separate probe scan
+            return self._download_type(theme, type_name, bbox, output_file)
                 
         except Exception as e:
             logger.error(f"Error downloading {theme}/{type_name} data: {e}")
@@ -573,16 +785,7 @@ api = OvertureConnector()
             Dictionary containing matching features
         """
         try:
-            # Convert bbox to dictionary format if it's a list
-            if isinstance(bbox, (list, tuple)):
-                bbox_dict = {
-                    "xmin": bbox[0],
-                    "ymin": bbox[1],
-                    "xmax": bbox[2],
-                    "ymax": bbox[3]
-                }
-            else:
-                bbox_dict = bbox
+            bbox_dict = self._bbox_dict(bbox)
             
             # Map common feature types to Overture themes and tags
             feature_mapping = {
@@ -619,27 +822,18 @@ api = OvertureConnector()
                         continue
                 
                 try:
-                    # Build query with filters if any
-                    filter_conditions = ""
+                    # Match any filter on class or subclass, bound as parameters
+                    condition, params = "", []
                     if filters:
-                        filter_conditions = " AND (" + " OR ".join([
-                            f"class LIKE '%{f}%' OR subclass LIKE '%{f}%'"
-                            for f in filters
-                        ]) + ")"
+                        condition = " OR ".join(["contains(class, ?) OR contains(subclass, ?)"] * len(filters))
+                        params = [value for f in filters for value in (f, f)]
                     
-                    query = f"""
-                    SELECT 
-                        id,
-                        names.primary AS name,
-                        geometry,
-                        class,
-                        subclass,
-                        *
-                    FROM read_parquet('{parquet_file}')
-                    WHERE 1=1 {filter_conditions}
-                    """
-                    
-                    df = self.con.execute(query).fetchdf()
+                    con = self.con.cursor()
+                    try:
+                        query, params = self._feature_query(con, parquet_file, bbox_dict, None, condition, params)
+                        df = con.execute(query, params).fetchdf()
+                    finally:
+                        con.close()
                     if not df.empty:
                         results.extend(df.to_dict('records'))
                         logger.info(f"Found {len(df)} {feature_type} features in {tag}")
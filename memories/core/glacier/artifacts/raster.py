@@ -0,0 +1,92 @@
+"""
+Windowed band reads from Cloud Optimized GeoTIFFs shared by the Sentinel and
+Landsat connectors.
+"""
+
+import math
+import logging
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+
+import rasterio
+from rasterio.warp import transform_bounds
+from rasterio.windows import Window, from_bounds
+
+logger = logging.getLogger(__name__)
+
+
+def tile_aligned_window(src: rasterio.io.DatasetReader, bounds: Tuple[float, float, float, float]) -> Window:
+    """Pixel window covering ``bounds``, expanded to the source's internal tiles.
+
+    A read whose edges fall on block boundaries touches each internal tile
+    once and never needs to decode partial tiles, which is what keeps range
+    requests on a COG minimal.
+
+    Args:
+        src: Open dataset
+        bounds: (left, bottom, right, top) in the dataset CRS
+
+    Returns:
+        Window clipped to the dataset extent
+
+    Raises:
+        ValueError: If the bounds do not intersect the dataset
+    """
+    left, bottom, right, top = bounds
+    if (right <= src.bounds.left or left >= src.bounds.right
+            or top <= src.bounds.bottom or bottom >= src.bounds.top):
+        raise ValueError(f"Bounds {bounds} do not intersect the dataset bounds {tuple(src.bounds)}")
+
+    window = from_bounds(left, bottom, right, top, transform=src.transform)
+    block_height, block_width = src.block_shapes[0]
+    row_start = max(0, math.floor(window.row_off / block_height) * block_height)
+    col_start = max(0, math.floor(window.col_off / block_width) * block_width)
+    row_stop = min(src.height, math.ceil((window.row_off + window.height) / block_height) * block_height)
+    col_stop = min(src.width, math.ceil((window.col_off + window.width) / block_width) * block_width)
+    return Window(col_start, row_start, col_stop - col_start, row_stop - row_start)
+
+
+def read_band_window(url: str, bbox: Dict[str, float], output_file: Union[str, Path]) -> Dict[str, Any]:
+    """Read the tiles of band 1 covering a WGS84 bbox and write them as a GeoTIFF.
+
+    Blocking; connectors run it on a worker thread.
+
+    Args:
+        url: Local path or signed URL of the COG
+        bbox: Dictionary containing xmin, ymin, xmax, ymax in WGS84 coordinates
+        output_file: Path of the GeoTIFF to write
+
+    Returns:
+        Dictionary with the source ``window`` and output ``height`` and ``width``
+
+    Raises:
+        ValueError: If the bbox does not intersect the image
+        rasterio.errors.RasterioError: If the source cannot be read
+    """
+    with rasterio.Env(GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR"):
+        with rasterio.open(url) as src:
+            bounds = transform_bounds("EPSG:4326", src.crs, bbox["xmin"], bbox["ymin"], bbox["xmax"], bbox["ymax"])
+            window = tile_aligned_window(src, bounds)
+            data = src.read(1, window=window)
+            mask = src.read_masks(1, window=window)
+
+            profile = src.profile.copy()
+            profile.update({
+                "driver": "GTiff",
+                "height": int(window.height),
+                "width": int(window.width),
+                "transform": src.window_transform(window),
+                "compress": "LZW",
+                "tiled": True,
+                "blockxsize": 256,
+                "blockysize": 256
+            })
+
+    output_file = Path(output_file)
+    output_file.parent.mkdir(parents=True, exist_ok=True)
+    with rasterio.open(output_file, "w", **profile) as dst:
+        dst.write(data, 1)
+        dst.write_mask(mask)
+
+    logger.info(f"Read window {window} from {url} into {output_file}")
+    return {"window": window, "height": profile["height"], "width": profile["width"]}
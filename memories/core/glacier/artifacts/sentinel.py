@@ -7,33 +7,41 @@ import logging
 import asyncio
 import planetary_computer
 import pystac_client
-import rasterio
 import numpy as np
 import shutil
 from datetime import datetime, timedelta
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from shapely.geometry import box
-from rasterio.windows import Window
 from typing import Dict, Any, Optional, List, Union
 import json
 from memories.core.cold import ColdMemory
+from memories.core.glacier.artifacts.raster import read_band_window
 
 class SentinelConnector:
     """Interface for accessing Sentinel-2 data using Planetary Computer."""
 
-    def __init__(self, data_dir: Union[str, Path] = None, keep_files: bool = False, store_in_cold: bool = True):
+    def __init__(
+        self,
+        data_dir: Union[str, Path] = None,
+        keep_files: bool = False,
+        store_in_cold: bool = True,
+        max_workers: int = 4
+    ):
         """Initialize the Sentinel-2 interface.
         
         Args:
             data_dir (Union[str, Path], optional): Directory to store downloaded data. If None, uses cold storage
             keep_files (bool): Whether to keep downloaded files (default: False)
             store_in_cold (bool): Whether to store files in cold memory (default: True)
+            max_workers (int): Band reads running at once (default: 4)
         """
         self.keep_files = keep_files
         self.store_in_cold = store_in_cold
         self.logger = logging.getLogger(__name__)
         self.client = None
         self._downloaded_files = []
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="sentinel-band")
         
         # Initialize cold memory first if enabled
         self.cold_memory = ColdMemory() if store_in_cold else None
@@ -108,113 +116,50 @@ class SentinelConnector:
             logging.error(f"Error storing {band_name} in cold memory: {str(e)}")
             return False
 
-    async def fetch_windowed_band(self, url: str, bbox: Dict[str, float], band_name: str, metadata: Dict[str, Any] = None) -> bool:
+    async def fetch_windowed_band(
+        self,
+        url: str,
+        bbox: Dict[str, float],
+        band_name: str,
+        metadata: Dict[str, Any] = None,
+        output_file: Optional[Path] = None
+    ) -> bool:
         """Download a specific band from a Sentinel scene for a given bounding box.
+
+        The read runs on the connector's thread pool and covers whole internal
+        tiles of the COG around the bbox, so it never falls back to reading the
+        full scene.
         
         Args:
             url: URL of the band image
             bbox: Dictionary containing xmin, ymin, xmax, ymax in WGS84 coordinates
             band_name: Name of the band to download
             metadata: Optional metadata about the scene
+            output_file: Where to write the band (default: <data_dir>/<band>/<band>.tif)
             
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            # Create output directory structure
-            band_dir = self.data_dir / band_name
-            band_dir.mkdir(parents=True, exist_ok=True)
-            output_file = band_dir / f"{band_name}.tif"
-            
+            output_file = Path(output_file) if output_file else self.data_dir / band_name / f"{band_name}.tif"
             logging.info(f"Downloading band {band_name} from {url}")
-            
-            with rasterio.Env():
-                with rasterio.open(url) as src:
-                    # Get bounds and CRS of the source image
-                    src_bounds = src.bounds
-                    src_crs = src.crs
-                    logging.info(f"Source image CRS: {src_crs}")
-                    logging.info(f"Source image bounds: {src_bounds}")
-                    logging.info(f"Input WGS84 bbox: {bbox}")
-
-                    # Create a polygon from the input bbox (in WGS84)
-                    from shapely.geometry import box as shbox
-                    from rasterio.warp import transform_bounds
-                    
-                    # Transform bbox from WGS84 to image CRS
-                    transformed_bounds = transform_bounds(
-                        'EPSG:4326',  # WGS84
-                        src_crs,
-                        bbox['xmin'], bbox['ymin'],
-                        bbox['xmax'], bbox['ymax']
-                    )
-                    logging.info(f"Transformed bounds in image CRS: {transformed_bounds}")
-
-                    # Check if transformed bbox intersects with source bounds
-                    if not (src_bounds.left <= transformed_bounds[2] and
-                           transformed_bounds[0] <= src_bounds.right and
-                           src_bounds.bottom <= transformed_bounds[3] and
-                           transformed_bounds[1] <= src_bounds.top):
-                        logging.error(f"Transformed bbox does not intersect with source bounds")
-                        return False
-
-                    # Get the window in pixel coordinates
-                    window = rasterio.windows.from_bounds(
-                        *transformed_bounds,
-                        transform=src.transform
-                    )
-                    
-                    # Round window to integer pixels
-                    window = window.round_lengths()
-                    
-                    logging.info(f"Calculated window pixels: rows={window.height}, cols={window.width}")
-                    
-                    # Ensure window has valid dimensions
-                    if window.height < 1 or window.width < 1:
-                        raise ValueError(f"Invalid window dimensions: height={window.height}, width={window.width}")
-                    
-                    # Get the transform for the window
-                    window_transform = src.window_transform(window)
-                    
-                    # Read the data for the window
-                    data = src.read(1, window=window)
-                    
-                    # Get the mask (nodata values)
-                    mask = src.read_masks(1, window=window)
-                    
-                    # Create output profile
-                    profile = src.profile.copy()
-                    profile.update({
-                        'driver': 'GTiff',
-                        'height': int(window.height),
-                        'width': int(window.width),
-                        'transform': window_transform,
-                        'compress': 'LZW',
-                        'tiled': True,
-                        'blockxsize': 256,
-                        'blockysize': 256
-                    })
-                    
-                    logging.info(f"Saving band {band_name} to {output_file}")
-                    logging.info(f"Output dimensions: {profile['height']}x{profile['width']}")
-                    
-                    # Write the output file
-                    with rasterio.open(output_file, 'w', **profile) as dst:
-                        dst.write(data, 1)
-                        dst.write_mask(mask)
-                    
-                    # Verify the output file
-                    if output_file.exists() and output_file.stat().st_size > 0:
-                        logging.info(f"Successfully saved band {band_name}")
-                        
-                        # Store in cold memory if enabled
-                        if self.store_in_cold and metadata:
-                            await self.store_in_cold_memory(band_name, output_file, metadata)
-                        
-                        return True
-                    else:
-                        logging.error(f"Failed to save band {band_name}")
-                        return False
+
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(self._executor, read_band_window, url, bbox, output_file)
+            logging.info(f"Output dimensions: {result['height']}x{result['width']}")
+
+            # Verify the output file
+            if output_file.exists() and output_file.stat().st_size > 0:
+                logging.info(f"Successfully saved band {band_name} to {output_file}")
+
+                # Store in cold memory if enabled
+                if self.store_in_cold and metadata:
+                    await self.store_in_cold_memory(band_name, output_file, metadata)
+
+                return True
+            else:
+                logging.error(f"Failed to save band {band_name}")
+                return False
             
         except Exception as e:
             logging.error(f"Error downloading band {band_name}: {str(e)}")
@@ -233,6 +178,8 @@ class SentinelConnector:
 
     def __del__(self):
         """Cleanup on object destruction."""
+        if hasattr(self, "_executor"):
+            self._executor.shutdown(wait=False)
         self.cleanup()
 
     async def initialize(self) -> bool:
@@ -258,19 +205,27 @@ class SentinelConnector:
         start_date: datetime,
         end_date: datetime,
         bands: Optional[List[str]] = None,
-        cloud_cover: float = 20.0
+        cloud_cover: float = 20.0,
+        max_items: Optional[int] = 1
     ) -> Dict[str, Any]:
         """Download Sentinel-2 data for a given bounding box and time range.
 
+        Matching scenes are ranked by cloud cover and the bands of the best
+        ``max_items`` are read concurrently. Each band is written to
+        ``<data_dir>/<band>/<scene_id>.tif``.
+
         Args:
             bbox: Bounding box as a dictionary with xmin, ymin, xmax, ymax
             start_date: Start date for the search
             end_date: End date for the search
             bands: List of bands to download (default: ["B04", "B08"])
             cloud_cover: Maximum cloud cover percentage (default: 20.0)
+            max_items: Number of scenes to download, None for every match (default: 1)
 
         Returns:
-            Dict containing status, message (if error), and data (if success)
+            Dict containing status, message (if error), and data (if success).
+            On success the clearest scene's fields are at the top level and
+            ``scenes`` lists every downloaded scene.
         """
         if self.client is None:
             if not await self.initialize():
@@ -359,53 +314,52 @@ class SentinelConnector:
                     "message": "No suitable imagery found"
                 }
 
-            # Get the first item (scene)
-            item = items[0]
-            scene_id = item.id
-            cloud_cover = item.properties.get("eo:cloud_cover", 0)
-
-            # Print available assets/bands
-            logging.info(f"Available bands in scene {scene_id}:")
-            for asset_key, asset in item.assets.items():
-                logging.info(f"- {asset_key}: {asset.href}")
-
-            # Download each requested band
-            downloaded_bands = []
-            for band in bands:
-                if band not in item.assets:
-                    return {
-                        "status": "error",
-                        "message": f"Band {band} not available in scene {scene_id}"
-                    }
+            # Rank scenes by cloud cover and keep those carrying every band
+            items.sort(key=lambda item: item.properties.get("eo:cloud_cover", 0))
+            usable = [item for item in items if all(band in item.assets for band in bands)]
+            if not usable:
+                missing = next(band for band in bands if band not in items[0].assets)
+                return {
+                    "status": "error",
+                    "message": f"Band {missing} not available in scene {items[0].id}"
+                }
+            selected = usable[:max_items] if max_items else usable
+            logging.info(f"Downloading {len(bands)} bands from {len(selected)} scenes")
 
-                try:
-                    url = item.assets[band].href
-                    logging.info(f"Downloading band {band} from URL: {url}")
-                    success = await self.fetch_windowed_band(url, bbox, band, item.properties)
-                    if not success:
-                        return {
-                            "status": "error",
-                            "message": f"Failed to download band {band}"
-                        }
-                    downloaded_bands.append(band)
-                except Exception as e:
-                    return {
-                        "status": "error",
-                        "message": f"Failed to download band {band}: {str(e)}"
+            # Read every band of every scene concurrently on the thread pool
+            jobs = [(item, band, self.data_dir / band / f"{item.id}.tif") for item in selected for band in bands]
+            results = await asyncio.gather(*(
+                self.fetch_windowed_band(item.assets[band].href, bbox, band, item.properties, output_file)
+                for item, band, output_file in jobs
+            ))
+
+            failed = {item.id: band for (item, band, _), success in zip(jobs, results) if not success}
+            scenes = []
+            for item in selected:
+                if item.id in failed:
+                    logging.error(f"Failed to download band {failed[item.id]} of scene {item.id}")
+                    continue
+                scenes.append({
+                    "scene_id": item.id,
+                    "cloud_cover": item.properties.get("eo:cloud_cover", 0),
+                    "bands": list(bands),
+                    "files": {band: str(self.data_dir / band / f"{item.id}.tif") for band in bands},
+                    "metadata": {
+                        "acquisition_date": item.properties.get("datetime"),
+                        "platform": item.properties.get("platform"),
+                        "processing_level": item.properties.get("processing:level"),
+                        "bbox": item.bbox
                     }
+                })
 
-            return {
-                "status": "success",
-                "scene_id": scene_id,
-                "cloud_cover": cloud_cover,
-                "bands": downloaded_bands,
-                "metadata": {
-                    "acquisition_date": item.properties.get("datetime"),
-                    "platform": item.properties.get("platform"),
-                    "processing_level": item.properties.get("processing:level"),
-                    "bbox": item.bbox
+            if not scenes:
+                return {
+                    "status": "error",
+                    "message": f"Failed to download band {failed[selected[0].id]}"
                 }
-            }
+
+            # The clearest scene stays at the top level for single-scene callers
+            return {"status": "success", **scenes[0], "scenes": scenes}
 
         except Exception as e:
             logging.error(f"Error during data acquisition: {str(e)}")
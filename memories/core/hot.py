@@ -14,6 +14,12 @@ from memories.core.db_connection_pool import get_connection_pool
 
 logger = logging.getLogger(__name__)
 
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+    import pandas as pd
+
 class HotMemory:
     """Hot memory layer using DuckDB for fast in-memory storage."""
     
@@ -41,12 +47,12 @@ class HotMemory:
 
     @property
     def con(self):
-        """Get a connection from the pool for backward compatibility.
+        """Get the shared database connection for backward compatibility.
 
         Returns:
-            A connection context manager
+            DuckDB connection; concurrent code should use ``_get_connection()``
         """
-        return self._get_connection().__enter__()
+        return self.connection_pool.connection(self.db_name)
     
     def _init_duckdb(self) -> None:
         """Initialize in-memory DuckDB connection in the pool."""
@@ -117,6 +123,15 @@ class HotMemory:
     def _get_connection(self):
         """Get a connection from the pool."""
         return self.connection_pool.get_connection(self.db_name)
+
+    @staticmethod
+    def _to_json(data: Any) -> str:
+        """Serialize data the way it is stored in the ``hot_data.data`` column."""
+        if isinstance(data, (dict, list)):
+            return json.dumps(data)
+        elif isinstance(data, np.ndarray):
+            return json.dumps(data.tolist())
+        return json.dumps(str(data))
     
     async def store(
         self,
@@ -143,12 +158,7 @@ class HotMemory:
             tags_list = tags or []
             
             # Convert data to JSON if needed
-            if isinstance(data, (dict, list)):
-                data_json = json.dumps(data)
-            elif isinstance(data, np.ndarray):
-                data_json = json.dumps(data.tolist())
-            else:
-                data_json = json.dumps(str(data))
+            data_json = self._to_json(data)
             
             # Store in hot_data table
             with self._get_connection() as con:
@@ -182,6 +192,82 @@ class HotMemory:
         except Exception as e:
             self.logger.error(f"Failed to store in hot memory: {e}")
             return False
+
+    async def store_many(self, items: List[Dict[str, Any]]) -> List[str]:
+        """Store many items in hot memory with one bulk insert per table.
+        
+        Rows and their exploded tags are built as Arrow tables (pandas frames
+        when pyarrow is unavailable), registered with DuckDB and written with
+        a single ``INSERT INTO ... SELECT`` per table inside one transaction,
+        avoiding per-row statement overhead.
+        
+        Args:
+            items: Items to store, each a dict with a ``data`` key and optional
+                ``metadata`` and ``tags`` keys
+            
+        Returns:
+            List of IDs assigned to the stored items, empty on failure
+        """
+        if not items:
+            return []
+        try:
+            stored_at = datetime.now()
+            rows = {'id': [], 'data': [], 'metadata': [], 'tags': [], 'stored_at': []}
+            tag_rows = {'tag': [], 'data_id': []}
+            for item in items:
+                data_id = str(uuid.uuid4())
+                tags_list = list(dict.fromkeys(item.get('tags') or []))
+                rows['id'].append(data_id)
+                rows['data'].append(self._to_json(item.get('data')))
+                rows['metadata'].append(json.dumps(item.get('metadata') or {}))
+                rows['tags'].append(json.dumps(tags_list))
+                rows['stored_at'].append(stored_at)
+                tag_rows['tag'].extend(tags_list)
+                tag_rows['data_id'].extend([data_id] * len(tags_list))
+            
+            if pa is not None:
+                batch = pa.table(rows)
+                tag_batch = pa.table({
+                    'tag': pa.array(tag_rows['tag'], type=pa.string()),
+                    'data_id': pa.array(tag_rows['data_id'], type=pa.string())
+                })
+            else:
+                batch = pd.DataFrame(rows)
+                tag_batch = pd.DataFrame(tag_rows, dtype=object)
+            
+            error = None
+            with self._get_connection() as con:
+                con.register('hot_data_batch', batch)
+                con.register('hot_tags_batch', tag_batch)
+                try:
+                    con.execute("BEGIN TRANSACTION")
+                    con.execute("""
+                        INSERT INTO hot_data (id, data, metadata, tags, stored_at)
+                        SELECT id, data::JSON, metadata::JSON, tags::JSON, stored_at
+                        FROM hot_data_batch
+                    """)
+                    con.execute("""
+                        INSERT INTO hot_tags (tag, data_id)
+                        SELECT tag, data_id FROM hot_tags_batch
+                    """)
+                    con.execute("COMMIT")
+                except Exception as e:
+                    # Roll back and raise outside the pooled connection context:
+                    # the pool discards connections that raise, which would drop
+                    # the whole in-memory database
+                    con.execute("ROLLBACK")
+                    error = e
+                finally:
+                    con.unregister('hot_data_batch')
+                    con.unregister('hot_tags_batch')
+            if error is not None:
+                raise error
+            
+            return rows['id']
+            
+        except Exception as e:
+            self.logger.error(f"Failed to bulk store in hot memory: {e}")
+            return []
     
     async def retrieve(
         self,
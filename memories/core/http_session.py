@@ -0,0 +1,329 @@
+"""
+Process-wide pooled HTTP sessions for API connectors.
+
+Opening a new ``aiohttp.ClientSession`` per request throws away keep-alive
+connections, the DNS cache and TLS sessions. Connectors share one session per
+event loop instead, with per-host connection limits, configurable timeouts,
+retries with jittered exponential backoff on 429/5xx responses and optional
+token-bucket rate limits per endpoint. Synchronous connectors share a pooled
+``requests.Session`` with the same retry behaviour.
+
+Non-idempotent requests (POST, PATCH) are only retried on 429 and on failures
+to connect, since repeating one the server may already have processed, such
+as a billed chat completion, could duplicate its effect.
+"""
+
+import asyncio
+import logging
+import random
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+IDEMPOTENT_METHODS = frozenset(Retry.DEFAULT_ALLOWED_METHODS)
+
+
+@dataclass
+class RetryPolicy:
+    """Retry settings for transient HTTP failures.
+
+    Attributes:
+        max_retries: Retries after the first attempt
+        backoff_base: Delay cap in seconds for the first retry, doubled per retry
+        backoff_max: Upper bound on any single delay in seconds
+        statuses: Response statuses that are retried
+        non_idempotent_statuses: Response statuses that are retried for
+            non-idempotent methods such as POST
+    """
+    max_retries: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    statuses: Tuple[int, ...] = RETRY_STATUSES
+    non_idempotent_statuses: Tuple[int, ...] = (429,)
+
+    def statuses_for(self, idempotent: bool) -> Tuple[int, ...]:
+        """Response statuses retried for an idempotent or non-idempotent request."""
+        if idempotent:
+            return self.statuses
+        return tuple(s for s in self.statuses if s in self.non_idempotent_statuses)
+
+    def delay(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        """Seconds to wait before retry number ``attempt`` (0-based).
+
+        Uses full jitter, a uniform delay up to the exponential cap, so
+        clients retrying together spread out. A numeric ``Retry-After``
+        header takes precedence.
+        """
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+
+class TokenBucket:
+    """Token-bucket rate limiter.
+
+    Tokens refill at ``rate`` per second up to ``capacity``. Each request
+    reserves a token and sleeps until it is available, so concurrent callers
+    are spaced out in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size
+        """
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token, returning how many seconds to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self) -> None:
+        """Wait until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class HTTPSessionManager:
+    """Shares pooled ``aiohttp`` sessions and applies retries and rate limits.
+
+    aiohttp sessions are bound to an event loop, so one session is kept per
+    running loop and created on first use.
+    """
+
+    def __init__(
+        self,
+        limit: int = 100,
+        limit_per_host: int = 8,
+        timeout: float = 30.0,
+        connect_timeout: Optional[float] = 10.0,
+        dns_cache_ttl: int = 300,
+        retry: Optional[RetryPolicy] = None
+    ):
+        """Initialize the manager.
+
+        Args:
+            limit: Maximum open connections in total
+            limit_per_host: Maximum open connections per host
+            timeout: Default total request timeout in seconds
+            connect_timeout: Default connection timeout in seconds
+            dns_cache_ttl: Seconds to cache DNS lookups
+            retry: Retry policy, defaults to RetryPolicy()
+        """
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.timeout = aiohttp.ClientTimeout(total=timeout, connect=connect_timeout)
+        self.dns_cache_ttl = dns_cache_ttl
+        self.retry = retry or RetryPolicy()
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, aiohttp.ClientSession]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._rate_limits: Dict[str, TokenBucket] = {}
+
+    def set_rate_limit(self, url_prefix: str, rate: float, burst: float = 1.0) -> None:
+        """Rate limit requests to URLs starting with ``url_prefix``.
+
+        Args:
+            url_prefix: Endpoint URL or prefix; the longest matching prefix applies
+            rate: Requests per second
+            burst: Requests allowed at once before limiting starts
+        """
+        bucket = self._rate_limits.get(url_prefix)
+        if bucket is None or (bucket.rate, bucket.capacity) != (rate, burst):
+            self._rate_limits[url_prefix] = TokenBucket(rate, burst)
+
+    def _rate_limit_for(self, url: str) -> Optional[TokenBucket]:
+        matches = [prefix for prefix in self._rate_limits if url.startswith(prefix)]
+        return self._rate_limits[max(matches, key=len)] if matches else None
+
+    async def get_session(self) -> aiohttp.ClientSession:
+        """Get the shared session for the running event loop."""
+        loop = asyncio.get_running_loop()
+        session = self._sessions.get(loop)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.dns_cache_ttl
+            )
+            session = aiohttp.ClientSession(connector=connector, timeout=self.timeout)
+            self._sessions[loop] = session
+        return session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        idempotent: Optional[bool] = None,
+        **kwargs
+    ) -> aiohttp.ClientResponse:
+        """Send a request on the shared session.
+
+        Responses with a retryable status and connection errors are retried
+        per the retry policy. Non-idempotent requests are only retried on
+        the policy's ``non_idempotent_statuses`` and on failures to connect.
+        The body is read before returning, so ``json()``/``text()`` work
+        after the connection is released to the pool.
+
+        Args:
+            method: HTTP method ('GET', 'POST', etc.)
+            url: Request URL
+            idempotent: Whether repeating the request is safe, e.g. True for
+                a read-only query sent as POST. Defaults to True for GET,
+                HEAD, PUT, DELETE, OPTIONS and TRACE.
+            **kwargs: Additional ``aiohttp`` request parameters
+
+        Returns:
+            The final response, which may still have an error status
+
+        Raises:
+            aiohttp.ClientError: If the last attempt failed to connect
+            asyncio.TimeoutError: If the last attempt timed out
+        """
+        session = await self.get_session()
+        bucket = self._rate_limit_for(url)
+        if idempotent is None:
+            idempotent = method.upper() in IDEMPOTENT_METHODS
+        statuses = self.retry.statuses_for(idempotent)
+        # A request that reached the server may have been processed
+        retry_errors = (
+            (aiohttp.ClientConnectionError, asyncio.TimeoutError) if idempotent
+            else aiohttp.ClientConnectorError
+        )
+        if isinstance(kwargs.get('timeout'), (int, float)):
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=kwargs['timeout'])
+
+        for attempt in range(self.retry.max_retries + 1):
+            last_attempt = attempt == self.retry.max_retries
+            if bucket:
+                await bucket.acquire()
+            try:
+                async with session.request(method, url, **kwargs) as response:
+                    if response.status in statuses and not last_attempt:
+                        delay = self.retry.delay(attempt, response.headers.get('Retry-After'))
+                        logger.warning(
+                            f"{method} {url} returned {response.status}, retrying in {delay:.2f}s"
+                        )
+                    else:
+                        await response.read()
+                        return response
+            except retry_errors as e:
+                if last_attempt:
+                    raise
+                delay = self.retry.delay(attempt)
+                logger.warning(f"{method} {url} failed ({e!r}), retrying in {delay:.2f}s")
+            await asyncio.sleep(delay)
+
+    async def close(self) -> None:
+        """Close the session of the running event loop."""
+        session = self._sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None and not session.closed:
+            await session.close()
+
+
+class _MethodAwareRetry(Retry):
+    """urllib3 retry that repeats non-idempotent requests only on some statuses.
+
+    urllib3 retries failures to connect for every method and read errors only
+    for ``allowed_methods``; this also limits status retries of the other
+    methods to ``non_idempotent_statuses``.
+    """
+
+    def __init__(self, *args, non_idempotent_statuses: Tuple[int, ...] = (429,), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.non_idempotent_statuses = non_idempotent_statuses
+
+    def new(self, **kwargs) -> "_MethodAwareRetry":
+        retry = super().new(**kwargs)
+        retry.non_idempotent_statuses = self.non_idempotent_statuses
+        return retry
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if self._is_method_retryable(method):
+            return super().is_retry(method, status_code, has_retry_after)
+        return status_code in (self.status_forcelist or ()) and status_code in self.non_idempotent_statuses
+
+
+_manager: Optional[HTTPSessionManager] = None
+_requests_session: Optional[requests.Session] = None
+_lock = threading.Lock()
+
+
+def get_http_manager() -> HTTPSessionManager:
+    """Get the process-wide HTTP session manager."""
+    global _manager
+    if _manager is None:
+        with _lock:
+            if _manager is None:
+                _manager = HTTPSessionManager()
+    return _manager
+
+
+def get_requests_session(pool_size: int = 16, retry: Optional[RetryPolicy] = None) -> requests.Session:
+    """Get the process-wide pooled ``requests`` session for synchronous clients.
+
+    Idempotent methods are retried on the retry statuses, POST and PATCH
+    only on the policy's ``non_idempotent_statuses`` and on failures to
+    connect, with jittered exponential backoff honouring ``Retry-After``.
+
+    Args:
+        pool_size: Connections kept per host; only used on first call
+        retry: Retry policy; only used on first call
+
+    Returns:
+        The shared session
+    """
+    global _requests_session
+    if _requests_session is None:
+        with _lock:
+            if _requests_session is None:
+                policy = retry or RetryPolicy()
+                options = dict(
+                    total=policy.max_retries,
+                    backoff_factor=policy.backoff_base,
+                    status_forcelist=policy.statuses,
+                    allowed_methods=IDEMPOTENT_METHODS,
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                    non_idempotent_statuses=policy.non_idempotent_statuses
+                )
+                try:
+                    retries = _MethodAwareRetry(
+                        **options, backoff_max=policy.backoff_max, backoff_jitter=policy.backoff_base
+                    )
+                except TypeError:
+                    # urllib3 < 2 has neither option
+                    retries = _MethodAwareRetry(**options)
+                adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+                session = requests.Session()
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _requests_session = session
+    return _requests_session
@@ -1,12 +1,16 @@
 """Memory catalog for tracking data across all memory tiers."""
 
 import logging
+import threading
+import time
+from contextlib import contextmanager
 from typing import Dict, Any, Optional, List, Union
 from datetime import datetime
 import duckdb
 import json
 import uuid
 import numpy as np
+import pandas as pd
 # Remove direct import to avoid circular dependency
 # from memories.core.memory_manager import MemoryManager
 
@@ -17,6 +21,10 @@ class MemoryCatalog:
     
     _instance = None
     
+    COLUMNS = ['data_id', 'primary_tier', 'location', 'created_at',
+               'last_accessed', 'access_count', 'size', 'tags',
+               'data_type', 'table_name', 'additional_meta']
+    
     def __new__(cls):
         """Create singleton instance."""
         if cls._instance is None:
@@ -39,6 +47,14 @@ class MemoryCatalog:
             self.logger.info(f"Connecting to memory catalog database at: {db_path}")
             self.con = duckdb.connect(str(db_path))
             self._initialize_schema()
+            
+            # Access statistics are buffered and written in batches
+            self.access_flush_interval = 5.0  # seconds
+            self.access_flush_size = 10000  # distinct data items
+            self._access_buffer: Dict[str, List[Any]] = {}
+            self._access_lock = threading.Lock()
+            self._last_flush = time.monotonic()
+            self._write_lock = threading.Lock()
             self.initialized = True
 
     def _initialize_schema(self):
@@ -60,11 +76,52 @@ class MemoryCatalog:
                     additional_meta JSON
                 )
             """)
+            
+            # Tags normalized to one row per (tag, data_id) for exact tag matching
+            has_tag_table = self.con.execute("""
+                SELECT COUNT(*) FROM information_schema.tables
+                WHERE table_name = 'catalog_tags'
+            """).fetchone()[0] > 0
+            self.con.execute("""
+                CREATE TABLE IF NOT EXISTS catalog_tags (
+                    tag VARCHAR NOT NULL,
+                    data_id VARCHAR NOT NULL
+                )
+            """)
+            if not has_tag_table:
+                # Backfill from the comma-separated tags column of older catalogs
+                self.con.execute("""
+                    INSERT INTO catalog_tags (tag, data_id)
+                    SELECT DISTINCT trim(tag), data_id
+                    FROM (
+                        SELECT data_id, unnest(string_split(tags, ',')) AS tag
+                        FROM memory_catalog
+                        WHERE tags IS NOT NULL AND tags <> ''
+                    )
+                    WHERE trim(tag) <> ''
+                """)
+                self.compact_tags()
+            self.con.execute("CREATE INDEX IF NOT EXISTS idx_catalog_tags_tag ON catalog_tags (tag)")
             self.logger.info("Initialized memory catalog schema")
         except Exception as e:
             self.logger.error(f"Failed to initialize catalog schema: {e}")
             raise
 
+    @contextmanager
+    def _writer(self):
+        """Yield a cursor for a catalog write, one writer at a time.
+        
+        Transactions belong to a connection, so writes run on a cursor of their
+        own instead of opening a transaction on the shared ``self.con``; the
+        lock keeps concurrent writers from conflicting on the same rows.
+        """
+        with self._write_lock:
+            cursor = self.con.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+
     def _validate_inputs(
         self,
         tier: str,
@@ -143,16 +200,28 @@ class MemoryCatalog:
             # Use table_name if provided, otherwise use location
             actual_table_name = table_name if table_name else location
             
-            # Insert into catalog
-            self.con.execute("""
-                INSERT INTO memory_catalog (
-                    data_id, primary_tier, location, created_at, last_accessed,
-                    access_count, size, tags, data_type, table_name, additional_meta
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, [
-                data_id, tier, location, now, now,
-                0, size, tags_str, data_type, actual_table_name, meta_json
-            ])
+            # Insert into catalog and tag table together
+            with self._writer() as cursor:
+                cursor.execute("BEGIN TRANSACTION")
+                try:
+                    cursor.execute("""
+                        INSERT INTO memory_catalog (
+                            data_id, primary_tier, location, created_at, last_accessed,
+                            access_count, size, tags, data_type, table_name, additional_meta
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, [
+                        data_id, tier, location, now, now,
+                        0, size, tags_str, data_type, actual_table_name, meta_json
+                    ])
+                    if tags:
+                        cursor.executemany(
+                            "INSERT INTO catalog_tags (tag, data_id) VALUES (?, ?)",
+                            [[tag, data_id] for tag in dict.fromkeys(tags)]
+                        )
+                    cursor.execute("COMMIT")
+                except Exception:
+                    cursor.execute("ROLLBACK")
+                    raise
             
             self.logger.info(f"Registered data {data_id} in {tier} tier")
             return data_id
@@ -162,20 +231,112 @@ class MemoryCatalog:
             raise
 
     async def update_access(self, data_id: str) -> None:
-        """Update last access time and count for data.
+        """Record an access to data.
+        
+        Accesses are buffered in memory and written by :meth:`flush_access`
+        once ``access_flush_interval`` seconds have passed or
+        ``access_flush_size`` distinct items are pending, so the read path
+        does not pay for an UPDATE per access.
         
         Args:
             data_id: ID of the data to update
         """
+        with self._access_lock:
+            entry = self._access_buffer.get(data_id)
+            if entry is None:
+                self._access_buffer[data_id] = [datetime.now(), 1]
+            else:
+                entry[0] = datetime.now()
+                entry[1] += 1
+            due = (
+                len(self._access_buffer) >= self.access_flush_size
+                or time.monotonic() - self._last_flush >= self.access_flush_interval
+            )
+        if due:
+            self.flush_access()
+
+    def flush_access(self) -> int:
+        """Write buffered access statistics with a single batched UPDATE.
+        
+        Returns:
+            int: Number of data items updated
+        """
+        with self._access_lock:
+            pending = self._access_buffer
+            self._access_buffer = {}
+            self._last_flush = time.monotonic()
+        if not pending:
+            return 0
+            
+        batch = pd.DataFrame({
+            'data_id': list(pending.keys()),
+            'last_accessed': [entry[0] for entry in pending.values()],
+            'hits': [entry[1] for entry in pending.values()]
+        })
         try:
-            self.con.execute("""
-                UPDATE memory_catalog
-                SET last_accessed = ?,
-                    access_count = access_count + 1
-                WHERE data_id = ?
-            """, [datetime.now(), data_id])
+            with self._writer() as cursor:
+                cursor.register('catalog_access_batch', batch)
+                cursor.execute("""
+                    UPDATE memory_catalog
+                    SET last_accessed = greatest(memory_catalog.last_accessed, b.last_accessed),
+                        access_count = memory_catalog.access_count + b.hits
+                    FROM catalog_access_batch b
+                    WHERE memory_catalog.data_id = b.data_id
+                """)
+            return len(pending)
         except Exception as e:
-            self.logger.error(f"Failed to update access for {data_id}: {e}")
+            self.logger.error(f"Failed to flush access statistics for {len(pending)} items: {e}")
+            # Keep the counts for the next flush
+            with self._access_lock:
+                for data_id, (accessed, hits) in pending.items():
+                    entry = self._access_buffer.setdefault(data_id, [accessed, 0])
+                    entry[0] = max(entry[0], accessed)
+                    entry[1] += hits
+            return 0
+
+    def compact_tags(self) -> bool:
+        """Rewrite the tag table sorted by tag.
+        
+        DuckDB skips row groups whose tag range cannot match, so tag lookups
+        on a sorted table read a few row groups instead of the whole table.
+        Tags registered afterwards are appended unsorted; call this
+        periodically after large ingests.
+        
+        Returns:
+            bool: True if the table was rewritten, False otherwise
+        """
+        try:
+            with self._writer() as cursor:
+                cursor.execute("BEGIN TRANSACTION")
+                try:
+                    cursor.execute("""
+                        CREATE TEMP TABLE catalog_tags_sorted AS
+                        SELECT tag, data_id FROM catalog_tags ORDER BY tag, data_id
+                    """)
+                    cursor.execute("DELETE FROM catalog_tags")
+                    cursor.execute("INSERT INTO catalog_tags SELECT tag, data_id FROM catalog_tags_sorted")
+                    cursor.execute("DROP TABLE catalog_tags_sorted")
+                    cursor.execute("COMMIT")
+                except Exception:
+                    cursor.execute("ROLLBACK")
+                    raise
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to compact catalog tags: {e}")
+            return False
+
+    def _row_to_dict(self, row) -> Dict[str, Any]:
+        """Convert a catalog row to a dict, including buffered access statistics."""
+        info = dict(zip(self.COLUMNS, row))
+        with self._access_lock:
+            # Copy the entry, update_access mutates it in place
+            pending = tuple(self._access_buffer.get(info['data_id']) or ())
+        if pending:
+            accessed, hits = pending
+            if info['last_accessed'] is None or accessed > info['last_accessed']:
+                info['last_accessed'] = accessed
+            info['access_count'] = (info['access_count'] or 0) + hits
+        return info
 
     async def get_data_info(self, data_id: str) -> Optional[Dict[str, Any]]:
         """Get information about data item.
@@ -194,43 +355,42 @@ class MemoryCatalog:
             
             if result:
                 # Convert row to dictionary
-                columns = ['data_id', 'primary_tier', 'location', 'created_at',
-                          'last_accessed', 'access_count', 'size', 'tags',
-                          'data_type', 'table_name', 'additional_meta']
-                return dict(zip(columns, result))
+                return self._row_to_dict(result)
             return None
             
         except Exception as e:
             self.logger.error(f"Failed to get data info for {data_id}: {e}")
             return None
 
-    async def search_by_tags(self, tags: List[str]) -> List[Dict[str, Any]]:
+    async def search_by_tags(self, tags: List[str], match: str = "any") -> List[Dict[str, Any]]:
         """Search for data items by tags.
         
         Args:
             tags: List of tags to search for
+            match: "any" for items with at least one of the tags (OR),
+                "all" for items with every tag (AND)
             
         Returns:
             List of matching data items
         """
         try:
-            # Create conditions for each tag
-            conditions = []
-            for tag in tags:
-                conditions.append(f"tags LIKE '%{tag}%'")
-            
-            query = f"""
+            if match not in ("any", "all"):
+                raise ValueError(f"Invalid match mode: {match}. Must be 'any' or 'all'")
+            tags = list(dict.fromkeys(tags or []))
+            if not tags:
+                return []
+                
+            # One equality lookup per tag, combined as a set operation, so
+            # each lookup can skip row groups of a compacted tag table
+            combine = " INTERSECT " if match == "all" else " UNION "
+            matching = combine.join(["SELECT data_id FROM catalog_tags WHERE tag = ?"] * len(tags))
+            results = self.con.execute(f"""
                 SELECT * FROM memory_catalog
-                WHERE {' OR '.join(conditions)}
-            """
-            
-            results = self.con.execute(query).fetchall()
+                WHERE data_id IN ({matching})
+            """, tags).fetchall()
             
             # Convert rows to dictionaries
-            columns = ['data_id', 'primary_tier', 'location', 'created_at',
-                      'last_accessed', 'access_count', 'size', 'tags',
-                      'data_type', 'table_name', 'additional_meta']
-            return [dict(zip(columns, row)) for row in results]
+            return [self._row_to_dict(row) for row in results]
             
         except Exception as e:
             self.logger.error(f"Failed to search by tags: {e}")
@@ -262,19 +422,150 @@ class MemoryCatalog:
             """, [tier]).fetchall()
             
             # Convert rows to dictionaries
-            columns = ['data_id', 'primary_tier', 'location', 'created_at',
-                      'last_accessed', 'access_count', 'size', 'tags',
-                      'data_type', 'table_name', 'additional_meta']
-            return [dict(zip(columns, row)) for row in results]
+            return [self._row_to_dict(row) for row in results]
             
         except Exception as e:
             self.logger.error(f"Failed to get data for tier {tier}: {e}")
             raise
 
+    async def get_access_stats(self, tiers: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """Get the access statistics used for tier placement.
+
+        Args:
+            tiers: Optional tiers to restrict the result to
+
+        Buffered accesses are flushed first, so a burst that went idle before
+        the flush interval elapsed is still counted.
+
+        Returns:
+            List of dicts with data_id, primary_tier, size, created_at,
+            last_accessed and access_count, including buffered accesses
+        """
+        try:
+            self.flush_access()
+            query = """
+                SELECT data_id, primary_tier, size, created_at, last_accessed, access_count
+                FROM memory_catalog
+            """
+            params = []
+            if tiers:
+                query += f" WHERE primary_tier IN ({', '.join(['?'] * len(tiers))})"
+                params = list(tiers)
+            results = self.con.execute(query, params).fetchall()
+
+            stats = []
+            with self._access_lock:
+                for data_id, tier, size, created_at, last_accessed, access_count in results:
+                    item = {
+                        'data_id': data_id, 'primary_tier': tier, 'size': size,
+                        'created_at': created_at, 'last_accessed': last_accessed,
+                        'access_count': access_count or 0
+                    }
+                    pending = self._access_buffer.get(data_id)
+                    if pending:
+                        accessed, hits = pending
+                        if last_accessed is None or accessed > last_accessed:
+                            item['last_accessed'] = accessed
+                        item['access_count'] += hits
+                    stats.append(item)
+            return stats
+
+        except Exception as e:
+            self.logger.error(f"Failed to get access statistics: {e}")
+            return []
+
+    async def update_tiers(self, placements: Dict[str, str]) -> int:
+        """Record new primary tiers for data items with a single batched UPDATE.
+
+        Args:
+            placements: Mapping of data_id to its new primary tier
+
+        Returns:
+            int: Number of data items submitted for update
+        """
+        if not placements:
+            return 0
+        batch = pd.DataFrame({
+            'data_id': list(placements.keys()),
+            'primary_tier': list(placements.values())
+        })
+        try:
+            with self._writer() as cursor:
+                cursor.register('catalog_tier_batch', batch)
+                cursor.execute("""
+                    UPDATE memory_catalog
+                    SET primary_tier = b.primary_tier
+                    FROM catalog_tier_batch b
+                    WHERE memory_catalog.data_id = b.data_id
+                """)
+            return len(placements)
+        except Exception as e:
+            self.logger.error(f"Failed to update tiers for {len(placements)} items: {e}")
+            return 0
+
+    async def update_location(
+        self,
+        data_id: str,
+        tier: str,
+        location: str,
+        table_name: Optional[str] = None
+    ) -> bool:
+        """Record where a data item lives after it was moved to another tier.
+
+        Args:
+            data_id: ID of the data item
+            tier: New primary tier
+            location: Location of the data in that tier
+            table_name: Optional table holding the data, defaults to the location
+
+        Returns:
+            bool: True if the entry was updated, False otherwise
+        """
+        try:
+            with self._writer() as cursor:
+                updated = cursor.execute("""
+                    UPDATE memory_catalog
+                    SET primary_tier = ?, location = ?, table_name = ?
+                    WHERE data_id = ?
+                    RETURNING data_id
+                """, [tier, location, table_name or location, data_id]).fetchall()
+            return bool(updated)
+        except Exception as e:
+            self.logger.error(f"Failed to update location of {data_id}: {e}")
+            return False
+
+    async def delete_data(self, data_id: str) -> bool:
+        """Remove a data item and its tags from the catalog.
+
+        Args:
+            data_id: ID of the data to remove
+
+        Returns:
+            bool: True if the entries were removed, False otherwise
+        """
+        try:
+            with self._access_lock:
+                self._access_buffer.pop(data_id, None)
+            with self._writer() as cursor:
+                cursor.execute("BEGIN TRANSACTION")
+                try:
+                    cursor.execute("DELETE FROM catalog_tags WHERE data_id = ?", [data_id])
+                    cursor.execute("DELETE FROM memory_catalog WHERE data_id = ?", [data_id])
+                    cursor.execute("COMMIT")
+                except Exception:
+                    cursor.execute("ROLLBACK")
+                    raise
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to delete data {data_id} from catalog: {e}")
+            return False
+
     def cleanup(self) -> None:
         """Clean up resources."""
         try:
             if hasattr(self, 'con') and self.con:
+                if getattr(self, '_access_buffer', None):
+                    self.flush_access()
                 self.con.close()
                 self.logger.info("Closed DuckDB connection")
         except Exception as e:
@@ -6,12 +6,20 @@ import faiss
 import numpy as np
 from pathlib import Path
 import json
+import hashlib
 from datetime import datetime
-from sentence_transformers import SentenceTransformer
 import os
 from unittest.mock import MagicMock, AsyncMock
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
 from memories.core.memory_catalog import memory_catalog
+from memories.core.embedding_registry import DEFAULT_MODEL, get_model, encode_texts
 # Remove direct imports to avoid circular dependencies
 # from memories.core.hot import HotMemory
 # from memories.core.warm import WarmMemory
@@ -27,6 +35,12 @@ class MemoryIndex:
     
     _instance = None
     
+    # Per-column metadata fields, persisted as columns of the Parquet sidecar
+    COLUMN_FIELDS = (
+        'data_id', 'column_name', 'column_type', 'query_path',
+        'sql_reference', 'dot_notation', 'bracket_notation'
+    )
+    
     def __new__(cls):
         """Create singleton instance."""
         if cls._instance is None:
@@ -42,8 +56,9 @@ class MemoryIndex:
             # Initialize memory manager
             self._memory_manager = MemoryManager()
             
-            # Initialize model for vectorizing schema
-            self.model = SentenceTransformer('all-MiniLM-L6-v2')
+            # Shared model for vectorizing schema
+            self.model_name = DEFAULT_MODEL
+            self.model = get_model(self.model_name)
             
             # Initialize FAISS index
             self.dimension = 384  # Output dimension of the model
@@ -68,14 +83,30 @@ class MemoryIndex:
                 self._glacier_memory = MagicMock()
                 self._glacier_memory.cleanup = AsyncMock()
             
+            # Number of texts encoded per model call
+            self.batch_size = 256
+            
             # Initialize FAISS indexes for each tier
             self._indexes = {}
-            self.metadata = {}
+            self.metadata = {}  # tier -> vector id -> column metadata
+            self.items = {}  # tier -> data_id -> item metadata and vector ids
+            self._next_id = {}
             
             # Create indexes for each tier
             for tier in ["hot", "warm", "cold", "red_hot", "glacier"]:
-                self._indexes[tier] = faiss.IndexFlatL2(self.dimension)
-                self.metadata[tier] = []  # Changed to list for better indexing
+                self._indexes[tier] = self._new_index()
+                self.metadata[tier] = {}
+                self.items[tier] = {}
+                self._next_id[tier] = 0
+            self._dirty = set()
+            
+            # Persisted indexes are reloaded instead of re-encoded
+            try:
+                self.storage_path = Path(self._memory_manager.config.get_path('index_path', 'index'))
+            except Exception as e:
+                self.logger.warning(f"Error getting index path from memory manager: {e}")
+                self.storage_path = Path(os.getcwd()) / 'data' / 'memory' / 'index'
+            self.load()
             
             self.logger.info("Successfully initialized memory index")
 
@@ -109,6 +140,46 @@ class MemoryIndex:
             from memories.core.glacier import GlacierMemory
             self._glacier_memory = GlacierMemory()
 
+    def _new_index(self) -> faiss.Index:
+        """Create an empty index whose vectors are addressed by stable ids."""
+        return faiss.IndexIDMap2(faiss.IndexFlatL2(self.dimension))
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """Encode texts into normalized float32 vectors in batches.
+        
+        Texts already embedded by this model anywhere in the process are
+        served from the shared embedding cache.
+        
+        Args:
+            texts: Texts to encode
+            
+        Returns:
+            Array of shape (len(texts), dimension)
+        """
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        try:
+            return encode_texts(
+                texts,
+                model_name=self.model_name,
+                model=self.model,
+                batch_size=self.batch_size,
+                normalize=True
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to encode {len(texts)} texts: {e}")
+            # Return zero vectors as fallback
+            return np.zeros((len(texts), self.dimension), dtype=np.float32)
+
+    @staticmethod
+    def _column_text(column_name: str, table_name: str = "", db_name: str = "") -> str:
+        """Text representation of a column that is embedded for search."""
+        if table_name and db_name:
+            return f"{db_name}.{table_name}.{column_name}"
+        elif table_name:
+            return f"{table_name}.{column_name}"
+        return column_name
+
     def _vectorize_column(self, column_name: str, table_name: str = "", db_name: str = "") -> np.ndarray:
         """Convert a single column name to vector representation.
         
@@ -120,27 +191,7 @@ class MemoryIndex:
         Returns:
             Vector representation of the column
         """
-        # Create a text representation of the column
-        if table_name and db_name:
-            text = f"{db_name}.{table_name}.{column_name}"
-        elif table_name:
-            text = f"{table_name}.{column_name}"
-        else:
-            text = column_name
-            
-        try:
-            # Convert to vector and ensure it has shape (384,)
-            vector = self.model.encode(text)
-            
-            # If the vector has shape (1, 384), reshape it to (384,)
-            if len(vector.shape) > 1:
-                vector = vector.reshape(-1)
-                
-            return vector
-        except Exception as e:
-            self.logger.error(f"Failed to vectorize column {column_name}: {e}")
-            # Return zero vector as fallback
-            return np.zeros(self.dimension)
+        return self._encode([self._column_text(column_name, table_name, db_name)])[0]
 
     def _vectorize_schema(self, schema: Dict[str, Any]) -> np.ndarray:
         """Convert a schema dictionary to vector representation.
@@ -170,19 +221,7 @@ class MemoryIndex:
         # Join all parts
         schema_text = ", ".join(text_parts)
         
-        try:
-            # Convert to vector and ensure it has shape (384,)
-            vector = self.model.encode(schema_text)
-            
-            # If the vector has shape (1, 384), reshape it to (384,)
-            if len(vector.shape) > 1:
-                vector = vector.reshape(-1)
-                
-            return vector
-        except Exception as e:
-            self.logger.error(f"Failed to vectorize schema: {e}")
-            # Return zero vector as fallback
-            return np.zeros(self.dimension)
+        return self._encode([schema_text])[0]
 
     def _extract_location_parts(self, location: str) -> Tuple[str, str]:
         """Extract database and table names from location string.
@@ -198,6 +237,95 @@ class MemoryIndex:
             return parts[0], parts[1]
         return "", location
 
+    def _column_entries(self, data_id: str, location: str, schema: Dict[str, Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        """Build the text to embed and the per-column metadata for each column.
+        
+        Item-level fields (schema, tags, ...) are kept once per item in
+        ``self.items`` rather than copied into every column entry.
+        
+        Args:
+            data_id: Unique identifier for the data
+            location: Location of the data (e.g., "db_name/table_name")
+            schema: Schema dictionary
+            
+        Returns:
+            List of (text, column metadata) pairs
+        """
+        db_name, table_name = self._extract_location_parts(location)
+        
+        columns = schema.get('columns') or schema.get('fields') or []
+        if not columns:
+            self.logger.warning(f"No columns found in schema for {data_id}")
+            # Add a placeholder vector for the entire schema
+            columns = ["unknown_column"]
+            
+        entries = []
+        for column in columns:
+            column_type = schema.get('column_types', {}).get(column, "unknown")
+            entries.append((self._column_text(column, table_name, db_name), {
+                'data_id': data_id,
+                'column_name': column,
+                'column_type': column_type,
+                # Include query paths for different query formats
+                'query_path': f"{db_name}.{table_name}.{column}" if db_name else f"{table_name}.{column}",
+                'sql_reference': f'"{db_name}"."{table_name}"."{column}"' if db_name else f'"{table_name}"."{column}"',
+                'dot_notation': f"{db_name}.{table_name}.{column}" if db_name else f"{table_name}.{column}",
+                'bracket_notation': f'["{db_name}"]["{table_name}"]["{column}"]' if db_name else f'["{table_name}"]["{column}"]'
+            }))
+        return entries
+
+    def _add_items(self, tier: str, items: List[Tuple[str, Dict[str, Any], Any, List[Tuple[str, Dict[str, Any]]]]]) -> int:
+        """Embed and index the columns of several items with batched encoding.
+        
+        Args:
+            tier: Memory tier to add to
+            items: (data_id, item info, fingerprint, column entries) tuples
+            
+        Returns:
+            Number of vectors added
+        """
+        pending = []
+        for data_id, info, fingerprint, entries in items:
+            ids = []
+            for text, entry in entries:
+                vector_id = self._next_id[tier]
+                self._next_id[tier] += 1
+                self.metadata[tier][vector_id] = entry
+                ids.append(vector_id)
+                pending.append((vector_id, text))
+            self.items[tier][data_id] = {'info': info, 'fingerprint': fingerprint, 'ids': ids}
+            
+        for start in range(0, len(pending), self.batch_size):
+            chunk = pending[start:start + self.batch_size]
+            vectors = self._encode([text for _, text in chunk])
+            ids = np.array([vector_id for vector_id, _ in chunk], dtype=np.int64)
+            self._indexes[tier].add_with_ids(vectors, ids)
+        return len(pending)
+
+    def _remove_items(self, tier: str, data_ids: List[str]) -> None:
+        """Drop the vectors and metadata of items from a tier's index."""
+        ids = []
+        for data_id in data_ids:
+            item = self.items[tier].pop(data_id, None)
+            if item:
+                ids.extend(item['ids'])
+        for vector_id in ids:
+            self.metadata[tier].pop(vector_id, None)
+        if ids:
+            self._indexes[tier].remove_ids(np.array(ids, dtype=np.int64))
+
+    @staticmethod
+    def _fingerprint(item: Dict[str, Any]) -> Tuple:
+        """Catalog fields that change when an item's indexed content changes.
+        
+        Access statistics are left out so reading an item does not trigger
+        re-embedding it.
+        """
+        return tuple(
+            str(item.get(field))
+            for field in ('location', 'created_at', 'size', 'tags', 'data_type', 'table_name', 'additional_meta')
+        )
+
     async def add_to_index(
         self,
         tier: str,
@@ -210,6 +338,8 @@ class MemoryIndex:
     ) -> None:
         """Add a schema to the index, vectorizing each column separately.
         
+        Re-adding a data_id replaces its previous vectors.
+        
         Args:
             tier: Memory tier ("hot", "warm", "cold", "red_hot", "glacier")
             data_id: Unique identifier for the data
@@ -220,77 +350,55 @@ class MemoryIndex:
             tags: Optional list of tags
         """
         try:
-            # Extract database and table names from location
             db_name, table_name = self._extract_location_parts(location)
+            entries = self._column_entries(data_id, location, schema)
+            info = {
+                'location': location,
+                'database_name': db_name,
+                'table_name': table_name,
+                'schema': schema,
+                'data_type': data_type,
+                'schema_type': schema_type,
+                'tags': tags or []
+            }
             
-            # Get columns from schema
-            columns = []
-            if 'columns' in schema:
-                columns = schema['columns']
-            elif 'fields' in schema:
-                columns = schema['fields']
+            self._remove_items(tier, [data_id])
+            self._add_items(tier, [(data_id, info, None, entries)])
+            self._dirty.add(tier)
                 
-            if not columns:
-                self.logger.warning(f"No columns found in schema for {data_id}")
-                # Add a placeholder vector for the entire schema
-                vector = self._vectorize_column("unknown_column", table_name, db_name)
-                self._indexes[tier].add(vector.reshape(1, -1))
-                
-                # Store metadata
-                self.metadata[tier].append({
-                    'data_id': data_id,
-                    'location': location,
-                    'database_name': db_name,
-                    'table_name': table_name,
-                    'column_name': "unknown_column",
-                    'schema': schema,
-                    'data_type': data_type,
-                    'schema_type': schema_type,
-                    'tags': tags or [],
-                    'query_path': f"{db_name}.{table_name}.unknown_column" if db_name else f"{table_name}.unknown_column"
-                })
-                return
-                
-            # Add each column as a separate vector
-            for column in columns:
-                # Vectorize column name with context
-                vector = self._vectorize_column(column, table_name, db_name)
-                
-                # Add to FAISS index
-                self._indexes[tier].add(vector.reshape(1, -1))
-                
-                # Determine column data type if available
-                column_type = "unknown"
-                if 'column_types' in schema and column in schema['column_types']:
-                    column_type = schema['column_types'][column]
-                
-                # Store comprehensive metadata for this column
-                self.metadata[tier].append({
-                    'data_id': data_id,
-                    'location': location,
-                    'database_name': db_name,
-                    'table_name': table_name,
-                    'column_name': column,
-                    'column_type': column_type,
-                    'schema': schema,  # Store full schema for reference
-                    'data_type': data_type,
-                    'schema_type': schema_type,
-                    'tags': tags or [],
-                    # Include query paths for different query formats
-                    'query_path': f"{db_name}.{table_name}.{column}" if db_name else f"{table_name}.{column}",
-                    'sql_reference': f'"{db_name}"."{table_name}"."{column}"' if db_name else f'"{table_name}"."{column}"',
-                    'dot_notation': f"{db_name}.{table_name}.{column}" if db_name else f"{table_name}.{column}",
-                    'bracket_notation': f'["{db_name}"]["{table_name}"]["{column}"]' if db_name else f'["{table_name}"]["{column}"]'
-                })
-                
-            self.logger.info(f"Added {len(columns)} columns from {location} to {tier} index")
+            self.logger.info(f"Added {len(entries)} columns from {location} to {tier} index")
             
         except Exception as e:
             self.logger.error(f"Failed to add schema to index: {e}")
             raise
 
+    async def _get_item_schema(self, tier: str, item: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Get the schema of a catalog item from its memory tier."""
+        if tier == "hot" and self._hot_memory:
+            return await self._hot_memory.get_schema(item['data_id'])
+        elif tier == "warm" and self._warm_memory:
+            return await self._warm_memory.get_schema(item['location'])
+        elif tier == "cold" and self._cold_memory:
+            return await self._cold_memory.get_schema(item['data_id'])
+        elif tier == "red_hot" and self._red_hot_memory:
+            return await self._red_hot_memory.get_schema(item['data_id'])
+        elif tier == "glacier" and self._glacier_memory:
+            # For glacier, we need spatial input from metadata
+            meta = json.loads(item['additional_meta'])
+            if 'spatial_input' in meta and 'source' in meta:
+                return await self._glacier_memory.get_schema(
+                    meta['source'],
+                    meta['spatial_input'],
+                    meta.get('spatial_input_type', 'bbox')
+                )
+        return None
+
     async def update_index(self, tier: str) -> None:
-        """Update index for a specific memory tier.
+        """Bring the index for a memory tier up to date with the catalog.
+        
+        Only items that are new or whose catalog entry changed since the last
+        update are fetched and embedded, in batches of ``batch_size`` texts;
+        items no longer in the catalog are removed.
         
         Args:
             tier: Memory tier to update ("hot", "warm", "cold", "red_hot", "glacier")
@@ -313,132 +421,205 @@ class MemoryIndex:
             # Get all data for the tier from catalog
             tier_data = await memory_catalog.get_tier_data(tier)
             self.logger.debug(f"Retrieved {len(tier_data)} items for {tier} tier")
-            self.logger.debug(f"Tier data: {tier_data}")
             
-            # Create new index and metadata
-            index = faiss.IndexFlatL2(self.dimension)
-            metadata = []
+            if tier not in self._indexes:
+                self._indexes[tier] = self._new_index()
+                self.metadata[tier] = {}
+                self.items[tier] = {}
+                self._next_id.setdefault(tier, 0)
+            indexed = self.items[tier]
             
-            # Process each data item
+            seen = set()
+            stale = []
+            new_items = []
             for item in tier_data:
                 try:
-                    # Get schema from appropriate memory tier
-                    schema = None
-                    if tier == "hot" and self._hot_memory:
-                        self.logger.debug(f"Getting schema for hot tier item: {item['data_id']}")
-                        schema = await self._hot_memory.get_schema(item['data_id'])
-                    elif tier == "warm" and self._warm_memory:
-                        self.logger.debug(f"Getting schema for warm tier item: {item['location']}")
-                        schema = await self._warm_memory.get_schema(item['location'])
-                    elif tier == "cold" and self._cold_memory:
-                        self.logger.debug(f"Getting schema for cold tier item: {item['data_id']}")
-                        schema = await self._cold_memory.get_schema(item['data_id'])
-                    elif tier == "red_hot" and self._red_hot_memory:
-                        self.logger.debug(f"Getting schema for red_hot tier item: {item['data_id']}")
-                        schema = await self._red_hot_memory.get_schema(item['data_id'])
-                    elif tier == "glacier" and self._glacier_memory:
-                        # For glacier, we need spatial input from metadata
-                        meta = json.loads(item['additional_meta'])
-                        if 'spatial_input' in meta and 'source' in meta:
-                            self.logger.debug(f"Getting schema for glacier tier item: {meta['source']}")
-                            schema = await self._glacier_memory.get_schema(
-                                meta['source'],
-                                meta['spatial_input'],
-                                meta.get('spatial_input_type', 'bbox')
-                            )
-                    
-                    self.logger.debug(f"Retrieved schema for {item['data_id']}: {schema}")
+                    data_id = item['data_id']
+                    seen.add(data_id)
+                    fingerprint = self._fingerprint(item)
+                    previous = indexed.get(data_id)
+                    if previous and previous['fingerprint'] == fingerprint:
+                        # Unchanged: refresh access statistics only
+                        previous['info'].update(
+                            last_accessed=item['last_accessed'],
+                            access_count=item['access_count']
+                        )
+                        continue
+                    if previous:
+                        stale.append(data_id)
                     
                     # Use empty schema if none is returned
+                    schema = await self._get_item_schema(tier, item)
                     if not schema:
                         schema = {'type': 'unknown', 'source': tier}
                     
-                    # Extract database and table names from location
                     db_name, table_name = self._extract_location_parts(item['location'])
-                    
-                    # Get columns from schema
-                    columns = []
-                    if 'columns' in schema:
-                        columns = schema['columns']
-                    elif 'fields' in schema:
-                        columns = schema['fields']
-                        
-                    if not columns:
-                        # Add a placeholder vector for the entire schema
-                        vector = self._vectorize_column("unknown_column", table_name, db_name)
-                        index.add(vector.reshape(1, -1))
-                        
-                        # Store metadata
-                        metadata.append({
-                            'data_id': item['data_id'],
-                            'location': item['location'],
-                            'database_name': db_name,
-                            'table_name': table_name,
-                            'column_name': "unknown_column",
-                            'schema': schema,
-                            'data_type': item['data_type'],
-                            'schema_type': schema.get('type', 'unknown'),
-                            'tags': item['tags'].split(',') if item['tags'] else [],
-                            'created_at': item['created_at'],
-                            'last_accessed': item['last_accessed'],
-                            'access_count': item['access_count'],
-                            'size': item['size'],
-                            'additional_meta': json.loads(item['additional_meta']) if item['additional_meta'] else {},
-                            'query_path': f"{db_name}.{table_name}.unknown_column" if db_name else f"{table_name}.unknown_column"
-                        })
-                        continue
-                        
-                    # Add each column as a separate vector
-                    for column in columns:
-                        # Vectorize column name with context
-                        vector = self._vectorize_column(column, table_name, db_name)
-                        
-                        # Add to FAISS index
-                        index.add(vector.reshape(1, -1))
-                        
-                        # Determine column data type if available
-                        column_type = "unknown"
-                        if 'column_types' in schema and column in schema['column_types']:
-                            column_type = schema['column_types'][column]
-                        
-                        # Store comprehensive metadata for this column
-                        metadata.append({
-                            'data_id': item['data_id'],
-                            'location': item['location'],
-                            'database_name': db_name,
-                            'table_name': table_name,
-                            'column_name': column,
-                            'column_type': column_type,
-                            'schema': schema,  # Store full schema for reference
-                            'data_type': item['data_type'],
-                            'schema_type': schema.get('type', 'unknown'),
-                            'tags': item['tags'].split(',') if item['tags'] else [],
-                            'created_at': item['created_at'],
-                            'last_accessed': item['last_accessed'],
-                            'access_count': item['access_count'],
-                            'size': item['size'],
-                            'additional_meta': json.loads(item['additional_meta']) if item['additional_meta'] else {},
-                            # Include query paths for different query formats
-                            'query_path': f"{db_name}.{table_name}.{column}" if db_name else f"{table_name}.{column}",
-                            'sql_reference': f'"{db_name}"."{table_name}"."{column}"' if db_name else f'"{table_name}"."{column}"',
-                            'dot_notation': f"{db_name}.{table_name}.{column}" if db_name else f"{table_name}.{column}",
-                            'bracket_notation': f'["{db_name}"]["{table_name}"]["{column}"]' if db_name else f'["{table_name}"]["{column}"]'
-                        })
+                    info = {
+                        'location': item['location'],
+                        'database_name': db_name,
+                        'table_name': table_name,
+                        'schema': schema,
+                        'data_type': item['data_type'],
+                        'schema_type': schema.get('type', 'unknown'),
+                        'tags': item['tags'].split(',') if item['tags'] else [],
+                        'created_at': item['created_at'],
+                        'last_accessed': item['last_accessed'],
+                        'access_count': item['access_count'],
+                        'size': item['size'],
+                        'additional_meta': json.loads(item['additional_meta']) if item['additional_meta'] else {}
+                    }
+                    new_items.append((data_id, info, fingerprint, self._column_entries(data_id, item['location'], schema)))
                     
                 except Exception as e:
-                    self.logger.error(f"Failed to process item {item['data_id']} in {tier} tier: {e}")
+                    self.logger.error(f"Failed to process item {item.get('data_id')} in {tier} tier: {e}")
                     continue
             
-            # Update index and metadata
-            self._indexes[tier] = index
-            self.metadata[tier] = metadata
+            stale.extend(data_id for data_id in indexed if data_id not in seen)
+            self._remove_items(tier, stale)
+            added = self._add_items(tier, new_items)
+            if stale or new_items:
+                self._dirty.add(tier)
+            if tier in self._dirty:
+                self.save([tier])
                     
-            self.logger.info(f"Updated index for {tier} tier with {self._indexes[tier].ntotal} entries")
+            self.logger.info(
+                f"Updated index for {tier} tier: {len(new_items)} items ({added} vectors) embedded, "
+                f"{len(stale)} removed, {self._indexes[tier].ntotal} entries total"
+            )
             
         except Exception as e:
             self.logger.error(f"Failed to update index for {tier} tier: {e}")
             raise
 
+    def _tier_files(self, tier: str) -> Dict[str, Path]:
+        """Paths of the files a tier is persisted to."""
+        return {
+            'index': self.storage_path / f"{tier}.faiss",
+            'columns': self.storage_path / f"{tier}.columns.parquet",
+            'items': self.storage_path / f"{tier}.items.parquet",
+            'manifest': self.storage_path / f"{tier}.manifest.json"
+        }
+
+    @staticmethod
+    def _content_hash(paths: List[Path]) -> str:
+        """SHA-256 over the contents of the given files."""
+        digest = hashlib.sha256()
+        for path in paths:
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    def save(self, tiers: Optional[List[str]] = None) -> None:
+        """Persist tier indexes as a FAISS file plus Parquet metadata sidecars.
+        
+        A manifest with a content hash of the files is written last, so a
+        partially written tier is detected and ignored on load.
+        
+        Args:
+            tiers: Tiers to save (defaults to all modified tiers)
+        """
+        if pa is None:
+            self.logger.warning("pyarrow is not installed; memory index will not be persisted")
+            return
+            
+        for tier in list(tiers if tiers is not None else self._dirty):
+            if tier not in self._indexes:
+                continue
+            try:
+                self.storage_path.mkdir(parents=True, exist_ok=True)
+                files = self._tier_files(tier)
+                tmp = {name: path.with_name(path.name + ".tmp") for name, path in files.items()}
+                
+                faiss.write_index(self._indexes[tier], str(tmp['index']))
+                
+                entries = self.metadata[tier]
+                columns = {'vector_id': pa.array(list(entries.keys()), type=pa.int64())}
+                for field in self.COLUMN_FIELDS:
+                    columns[field] = pa.array([entry.get(field) for entry in entries.values()], type=pa.string())
+                pq.write_table(pa.table(columns), tmp['columns'])
+                
+                items = self.items[tier]
+                pq.write_table(pa.table({
+                    'data_id': pa.array(list(items.keys()), type=pa.string()),
+                    'info': pa.array([json.dumps(item['info'], default=str) for item in items.values()], type=pa.string()),
+                    'fingerprint': pa.array([list(item['fingerprint']) if item['fingerprint'] else None for item in items.values()], type=pa.list_(pa.string())),
+                    'ids': pa.array([item['ids'] for item in items.values()], type=pa.list_(pa.int64()))
+                }), tmp['items'])
+                
+                for name in ('index', 'columns', 'items'):
+                    os.replace(tmp[name], files[name])
+                manifest = {
+                    'model': self.model_name,
+                    'dimension': self.dimension,
+                    'next_id': self._next_id[tier],
+                    'sha256': self._content_hash([files['index'], files['columns'], files['items']])
+                }
+                with open(tmp['manifest'], 'w') as f:
+                    json.dump(manifest, f)
+                os.replace(tmp['manifest'], files['manifest'])
+                
+                self._dirty.discard(tier)
+                self.logger.info(f"Saved {tier} index with {self._indexes[tier].ntotal} entries to {self.storage_path}")
+                
+            except Exception as e:
+                self.logger.error(f"Failed to save {tier} index: {e}")
+
+    def load(self, tiers: Optional[List[str]] = None) -> List[str]:
+        """Reload persisted tier indexes whose content hash and model match.
+        
+        Args:
+            tiers: Tiers to load (defaults to all tiers)
+            
+        Returns:
+            List of tiers that were loaded
+        """
+        loaded = []
+        if pa is None:
+            return loaded
+            
+        for tier in tiers or ["hot", "warm", "cold", "red_hot", "glacier"]:
+            files = self._tier_files(tier)
+            if not files['manifest'].exists():
+                continue
+            try:
+                with open(files['manifest']) as f:
+                    manifest = json.load(f)
+                if manifest.get('model') != self.model_name or manifest.get('dimension') != self.dimension:
+                    self.logger.info(f"Ignoring persisted {tier} index built with a different model")
+                    continue
+                if self._content_hash([files['index'], files['columns'], files['items']]) != manifest.get('sha256'):
+                    self.logger.warning(f"Ignoring persisted {tier} index: content hash mismatch")
+                    continue
+                    
+                index = faiss.read_index(str(files['index']))
+                
+                metadata = {}
+                for row in pq.read_table(files['columns']).to_pylist():
+                    vector_id = row.pop('vector_id')
+                    metadata[vector_id] = row
+                    
+                items = {}
+                for row in pq.read_table(files['items']).to_pylist():
+                    items[row['data_id']] = {
+                        'info': json.loads(row['info']),
+                        'fingerprint': tuple(row['fingerprint']) if row['fingerprint'] is not None else None,
+                        'ids': row['ids']
+                    }
+                    
+                self._indexes[tier] = index
+                self.metadata[tier] = metadata
+                self.items[tier] = items
+                self._next_id[tier] = manifest['next_id']
+                self._dirty.discard(tier)
+                loaded.append(tier)
+                self.logger.info(f"Loaded {tier} index with {index.ntotal} entries from {self.storage_path}")
+                
+            except Exception as e:
+                self.logger.error(f"Failed to load persisted {tier} index: {e}")
+                
+        return loaded
+
     async def update_all_indexes(self) -> None:
         """Update indexes for all memory tiers."""
         for tier in ["hot", "warm", "cold", "red_hot", "glacier"]:
@@ -480,7 +661,7 @@ class MemoryIndex:
                 }]
             
             # Vectorize query - returns shape [1, vector_dim]
-            query_vector = self.model.encode([query])
+            query_vector = self._encode([query])
             
             # Determine tiers to search
             search_tiers = tiers if tiers else ["hot", "warm", "cold", "red_hot", "glacier"]
@@ -493,16 +674,19 @@ class MemoryIndex:
                 # Search in tier's index - query_vector is already in shape [1, vector_dim]
                 D, I = self._indexes[tier].search(query_vector, k)
                 
-                # Add results with metadata
+                # Add results with item and column metadata
                 for i, (dist, idx) in enumerate(zip(D[0], I[0])):
-                    if idx < 0 or idx >= len(self.metadata[tier]):  # Invalid index
+                    entry = self.metadata[tier].get(int(idx))
+                    if entry is None:  # Invalid index
                         continue
+                    item = self.items[tier].get(entry['data_id'], {})
                         
                     result = {
                         'tier': tier,
                         'distance': float(dist),
                         'rank': i + 1,
-                        **self.metadata[tier][idx]
+                        **item.get('info', {}),
+                        **entry
                     }
                     results.append(result)
             
@@ -531,6 +715,7 @@ class MemoryIndex:
                 # Clear indexes and metadata
                 self._indexes.clear()
                 self.metadata.clear()
+                self.items.clear()
                 return
             
             # Clean up memory tiers for real usage
@@ -545,9 +730,13 @@ class MemoryIndex:
             if self._glacier_memory:
                 await self._glacier_memory.cleanup()
                 
+            # Persist modified indexes so the next start reloads them
+            self.save()
+                
             # Clear indexes and metadata
             self._indexes.clear()
             self.metadata.clear()
+            self.items.clear()
             
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}")
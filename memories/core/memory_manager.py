@@ -1,5 +1,7 @@
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
+import asyncio
+import inspect
 import logging
 from threading import Lock
 import re
@@ -21,17 +23,17 @@ try:
 except ImportError:
     yaml = None
 
-try:
-    import faiss
-except ImportError:
-    faiss = None
-
 class MemoryManager:
     """Memory manager for handling different memory tiers."""
 
     _instance = None
     _lock = Lock()
 
+    # Tiers in order of speed, used for fallback and lookup order
+    TIERS = ("red_hot", "hot", "warm", "cold", "glacier")
+    # Tiers backed by remote APIs, only queried once the local tiers miss
+    REMOTE_TIERS = ("glacier",)
+
     def __new__(cls):
         """Create singleton instance."""
         with cls._lock:
@@ -47,10 +49,13 @@ class MemoryManager:
             self.initialized = True
             self.indexes = {}  # Store FAISS indexes
             self.con = None   # Store DuckDB connection
+            self._tiers = {}  # Long-lived tier instances, created on first use
+            self._tiers_lock = Lock()
+            self._loop = None  # Event loop driving the sync wrappers
+            self._catalog = None  # MemoryCatalog for tier hints, created on first use
             self._init_paths()
             self._init_duckdb()
             self._init_cold_memory()
-            self._init_faiss()
             self._init_storage_backends()
 
     def _load_config(self):
@@ -183,6 +188,10 @@ class MemoryManager:
 
     def _init_faiss(self):
         """Initialize FAISS index for vector storage."""
+        try:
+            import faiss
+        except ImportError:
+            faiss = None
         if faiss is None:
             self.logger.warning("FAISS not available, skipping vector index initialization")
             self.indexes = {}
@@ -420,8 +429,8 @@ class MemoryManager:
             if index_type not in valid_index_types:
                 raise ValueError(f"Invalid FAISS index type: {index_type}. Must be one of {valid_index_types}")
 
-        # Initialize indexes if not already done
-        if not hasattr(self, 'indexes'):
+        # Build the index on first use so FAISS is only imported when needed
+        if not getattr(self, 'indexes', None):
             self.indexes = {}
             self._init_faiss()
 
@@ -503,9 +512,111 @@ class MemoryManager:
         """
         return self.cold 
 
-    def store(self, key: str, value: Any, tier: str = "warm", metadata: Optional[Dict[str, Any]] = None) -> str:
+    def _get_tier(self, tier: str) -> Any:
+        """Get the long-lived instance for a memory tier, creating it on first use.
+        
+        Tier instances own their connections and indexes, so they are created
+        once per manager and reused by every store/retrieve/exists/delete call.
+        
+        Args:
+            tier: Memory tier ("red_hot", "hot", "warm", "cold", "glacier")
+            
+        Returns:
+            Any: The tier instance
+        """
+        instance = self._tiers.get(tier)
+        if instance is not None:
+            return instance
+            
+        with self._tiers_lock:
+            instance = self._tiers.get(tier)
+            if instance is not None:
+                return instance
+                
+            if tier == "red_hot":
+                from memories.core.red_hot import RedHotMemory
+                instance = RedHotMemory()
+            elif tier == "hot":
+                from memories.core.hot import HotMemory
+                instance = HotMemory()
+            elif tier == "warm":
+                from memories.core.warm import WarmMemory
+                instance = WarmMemory()
+            elif tier == "cold":
+                if getattr(self, 'cold', None) is not None:
+                    instance = self.cold
+                else:
+                    from memories.core.cold import ColdMemory
+                    instance = ColdMemory()
+            elif tier == "glacier":
+                from memories.core.glacier import GlacierMemory
+                instance = GlacierMemory()
+            else:
+                raise ValueError(f"Unknown memory tier: {tier}")
+                
+            self._tiers[tier] = instance
+            return instance
+            
+    async def _call_tier(self, tier: str, method_name: str, *args, **kwargs) -> Any:
+        """Call a tier method, awaiting it if the tier implements it as a coroutine.
+        
+        Args:
+            tier: Memory tier to call
+            method_name: Name of the tier method
+            *args: Positional arguments for the method
+            **kwargs: Keyword arguments for the method
+            
+        Returns:
+            Any: The method result
+            
+        Raises:
+            AttributeError: If the tier does not implement the method
+        """
+        instance = self._get_tier(tier)
+        method = getattr(instance, method_name, None)
+        if method is None:
+            raise AttributeError(f"{type(instance).__name__} does not have a {method_name} method")
+        result = method(*args, **kwargs)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+        
+    def _run(self, coro) -> Any:
+        """Run a coroutine to completion from synchronous code.
+        
+        The manager keeps one private event loop for its sync wrappers instead
+        of creating or looking up a loop on every call.
+        
+        Args:
+            coro: Coroutine to run
+            
+        Returns:
+            Any: The coroutine result
+            
+        Raises:
+            RuntimeError: If called while an event loop is running in this thread
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            coro.close()
+            raise RuntimeError(
+                "MemoryManager sync methods cannot be called from a running event loop; "
+                "use astore/aretrieve/aexists/adelete instead"
+            )
+            
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
+        return self._loop.run_until_complete(coro)
+
+    async def astore(self, key: str, value: Any, tier: str = "warm", metadata: Optional[Dict[str, Any]] = None) -> str:
         """Store data in the specified memory tier.
         
+        If the tier is unavailable or fails, the next slower tier is tried
+        (glacier only when ``glacier_enabled`` is set in the config).
+        
         Args:
             key: Unique identifier for the data
             value: Data to store
@@ -513,180 +624,178 @@ class MemoryManager:
             metadata: Optional metadata to store with the data
             
         Returns:
-            str: The key used to store the data
+            str: The tier's result, or the key if no tier handled the request
         """
         self.logger.info(f"Storing data with key '{key}' in {tier} tier")
         
         if metadata is None:
             metadata = {}
             
-        # Store data in the appropriate tier
-        if tier == "red_hot":
-            try:
-                from memories.core.red_hot import RedHotMemory
-                red_hot = RedHotMemory()
-                # Check if store is an async method
-                if hasattr(red_hot, 'store'):
-                    store_method = red_hot.store
-                    if hasattr(store_method, '__await__'):
-                        import asyncio
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            # Create a new event loop if one doesn't exist
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        return loop.run_until_complete(store_method(key, value, metadata))
-                    else:
-                        return store_method(key, value, metadata)
-                else:
-                    self.logger.warning("RedHotMemory does not have a store method")
-                    tier = "hot"
-            except Exception as e:
-                self.logger.error(f"Error storing data in red_hot tier: {e}")
-                # Fall back to hot tier
-                tier = "hot"
-                
-        if tier == "hot":
-            try:
-                from memories.core.hot import HotMemory
-                hot = HotMemory()
-                # Check if store is an async method
-                if hasattr(hot, 'store'):
-                    store_method = hot.store
-                    if hasattr(store_method, '__await__'):
-                        import asyncio
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            # Create a new event loop if one doesn't exist
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        return loop.run_until_complete(store_method(key, value, metadata))
-                    else:
-                        return store_method(key, value, metadata)
-                else:
-                    self.logger.warning("HotMemory does not have a store method")
-                    tier = "warm"
-            except Exception as e:
-                self.logger.error(f"Error storing data in hot tier: {e}")
-                # Fall back to warm tier
-                tier = "warm"
-                
-        if tier == "warm":
-            try:
-                from memories.core.warm import WarmMemory
-                warm = WarmMemory()
-                # Check if store is an async method
-                if hasattr(warm, 'store'):
-                    store_method = warm.store
-                    if hasattr(store_method, '__await__'):
-                        import asyncio
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            # Create a new event loop if one doesn't exist
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        return loop.run_until_complete(store_method(key, value, metadata))
-                    else:
-                        return store_method(key, value, metadata)
-                else:
-                    self.logger.warning("WarmMemory does not have a store method")
-                    tier = "cold"
-            except Exception as e:
-                self.logger.error(f"Error storing data in warm tier: {e}")
-                # Fall back to cold tier
-                tier = "cold"
-                
-        if tier == "cold":
+        if tier not in self.TIERS:
+            return key
+            
+        # Fall back to slower tiers; cold only falls back to glacier if enabled
+        for current in self.TIERS[self.TIERS.index(tier):]:
             try:
-                from memories.core.cold import ColdMemory
-                cold = ColdMemory()
-                # Check if store is an async method
-                if hasattr(cold, 'store'):
-                    store_method = cold.store
-                    if hasattr(store_method, '__await__'):
-                        import asyncio
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            # Create a new event loop if one doesn't exist
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        return loop.run_until_complete(store_method(key, value, metadata))
-                    else:
-                        return store_method(key, value, metadata)
-                else:
-                    self.logger.warning("ColdMemory does not have a store method")
-                    # Fall back to glacier tier if enabled
-                    if self.config.get('glacier_enabled', False):
-                        tier = "glacier"
-                    else:
-                        raise ValueError("No available storage tier with store method")
+                return await self._call_tier(current, 'store', key, value, metadata)
             except Exception as e:
-                self.logger.error(f"Error storing data in cold tier: {e}")
-                # Fall back to glacier tier if enabled
-                if self.config.get('glacier_enabled', False):
-                    tier = "glacier"
-                else:
-                    raise e
+                self.logger.error(f"Error storing data in {current} tier: {e}")
+                if current == "glacier" or (current == "cold" and not self.config.get('glacier_enabled', False)):
+                    raise
                     
-        if tier == "glacier":
+        return key
+        
+    def store(self, key: str, value: Any, tier: str = "warm", metadata: Optional[Dict[str, Any]] = None) -> str:
+        """Synchronous wrapper around :meth:`astore`.
+        
+        Args:
+            key: Unique identifier for the data
+            value: Data to store
+            tier: Memory tier to use ("red_hot", "hot", "warm", "cold", "glacier")
+            metadata: Optional metadata to store with the data
+            
+        Returns:
+            str: The tier's result, or the key if no tier handled the request
+        """
+        return self._run(self.astore(key, value, tier, metadata))
+        
+    def _get_catalog(self) -> Any:
+        """Get the memory catalog used for tier hints, or None if unavailable."""
+        if self._catalog is None:
             try:
-                from memories.core.glacier import GlacierMemory
-                glacier = GlacierMemory()
-                # Check if store is an async method
-                if hasattr(glacier, 'store'):
-                    store_method = glacier.store
-                    if hasattr(store_method, '__await__'):
-                        import asyncio
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            # Create a new event loop if one doesn't exist
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        return loop.run_until_complete(store_method(key, value, metadata))
-                    else:
-                        return store_method(key, value, metadata)
-                else:
-                    self.logger.warning("GlacierMemory does not have a store method")
-                    raise ValueError("No available storage tier with store method")
+                from memories.core.memory_catalog import MemoryCatalog
+                self._catalog = MemoryCatalog()
             except Exception as e:
-                self.logger.error(f"Error storing data in glacier tier: {e}")
-                raise e
-                
-        return key
+                self.logger.warning(f"Memory catalog not available for tier hints: {e}")
+                self._catalog = False
+        return self._catalog or None
+        
+    async def _primary_tier(self, key: str) -> Optional[str]:
+        """Look up the tier the catalog records for a key.
         
-    def retrieve(self, key: str, tier: Optional[str] = None) -> Any:
+        Args:
+            key: Key of the data
+            
+        Returns:
+            Optional[str]: The catalog's primary tier, or None if unknown
+        """
+        catalog = self._get_catalog()
+        if catalog is None:
+            return None
+        try:
+            info = await catalog.get_data_info(key)
+        except Exception as e:
+            self.logger.error(f"Error looking up '{key}' in memory catalog: {e}")
+            return None
+        if info and info.get('primary_tier') in self.TIERS:
+            return info['primary_tier']
+        return None
+        
+    async def _aretrieve_parallel(self, key: str, tiers: List[str]) -> Any:
+        """Query tiers concurrently and return the highest-priority hit.
+        
+        Lookups run as concurrent tasks. As soon as every faster tier has
+        missed and one tier has answered, its result is returned and the
+        remaining lookups are cancelled, so a miss in the fast tiers costs
+        the slowest of them rather than their sum.
+        
+        Args:
+            key: Key of the data to retrieve
+            tiers: Tiers to query, in priority order
+            
+        Returns:
+            Any: The retrieved data or None if no tier has it
+        """
+        tasks = {
+            t: asyncio.ensure_future(self._aretrieve_from_tier(key, t))
+            for t in tiers
+        }
+        try:
+            for t in tiers:
+                data = await tasks[t]
+                if data is not None:
+                    return data
+            return None
+        finally:
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks.values(), return_exceptions=True)
+        
+    async def aretrieve(self, key: str, tier: Optional[str] = None, strategy: str = "parallel") -> Any:
         """Retrieve data from memory.
         
+        The requested tier is tried first, then the tier recorded in the
+        memory catalog. Remaining local tiers are queried concurrently with
+        the "parallel" strategy, or one after another in order of speed with
+        "sequential"; either way the fastest tier holding the data wins.
+        Remote tiers (glacier) are only queried after every local tier has
+        missed, so a local hit never costs a remote API call.
+        
         Args:
             key: Key of the data to retrieve
             tier: Optional tier to retrieve from (if known)
+            strategy: "parallel" or "sequential" lookup of the remaining tiers
             
         Returns:
             Any: The retrieved data
         """
+        if strategy not in ("parallel", "sequential"):
+            raise ValueError(f"Unknown retrieval strategy: {strategy}")
+            
         self.logger.info(f"Retrieving data with key '{key}'")
+        tried = set()
         
         # If tier is specified, try that tier first
         if tier is not None:
-            data = self._retrieve_from_tier(key, tier)
+            tried.add(tier)
+            data = await self._aretrieve_from_tier(key, tier)
             if data is not None:
                 return data
                 
-        # Otherwise, try all tiers in order of speed
-        for tier in ["red_hot", "hot", "warm", "cold", "glacier"]:
-            data = self._retrieve_from_tier(key, tier)
+        # Then the tier the catalog says holds the data
+        primary_tier = await self._primary_tier(key)
+        if primary_tier is not None and primary_tier not in tried:
+            tried.add(primary_tier)
+            data = await self._aretrieve_from_tier(key, primary_tier)
             if data is not None:
                 return data
                 
+        remaining = [t for t in self.TIERS if t not in tried]
+        local = [t for t in remaining if t not in self.REMOTE_TIERS]
+        if strategy == "parallel":
+            data = await self._aretrieve_parallel(key, local)
+            if data is not None:
+                return data
+        else:
+            for current in local:
+                data = await self._aretrieve_from_tier(key, current)
+                if data is not None:
+                    return data
+                    
+        for current in remaining:
+            if current in self.REMOTE_TIERS:
+                data = await self._aretrieve_from_tier(key, current)
+                if data is not None:
+                    return data
+                
         self.logger.warning(f"Data with key '{key}' not found in any tier")
         return None
         
-    def _retrieve_from_tier(self, key: str, tier: str) -> Any:
+    def retrieve(self, key: str, tier: Optional[str] = None, strategy: str = "parallel") -> Any:
+        """Synchronous wrapper around :meth:`aretrieve`.
+        
+        Args:
+            key: Key of the data to retrieve
+            tier: Optional tier to retrieve from (if known)
+            strategy: "parallel" or "sequential" lookup of the remaining tiers
+            
+        Returns:
+            Any: The retrieved data
+        """
+        return self._run(self.aretrieve(key, tier, strategy))
+        
+    async def _aretrieve_from_tier(self, key: str, tier: str) -> Any:
         """Helper method to retrieve data from a specific tier.
         
         Args:
@@ -697,105 +806,20 @@ class MemoryManager:
             Any: The retrieved data or None if not found
         """
         try:
-            if tier == "red_hot":
-                from memories.core.red_hot import RedHotMemory
-                red_hot = RedHotMemory()
-                if hasattr(red_hot, 'retrieve'):
-                    retrieve_method = red_hot.retrieve
-                    if hasattr(retrieve_method, '__await__'):
-                        import asyncio
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        return loop.run_until_complete(retrieve_method(key))
-                    else:
-                        return retrieve_method(key)
-                else:
-                    self.logger.warning("RedHotMemory does not have a retrieve method")
-                    return None
-            elif tier == "hot":
-                from memories.core.hot import HotMemory
-                hot = HotMemory()
-                if hasattr(hot, 'retrieve'):
-                    retrieve_method = hot.retrieve
-                    if hasattr(retrieve_method, '__await__'):
-                        import asyncio
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        return loop.run_until_complete(retrieve_method(key))
-                    else:
-                        return retrieve_method(key)
-                else:
-                    self.logger.warning("HotMemory does not have a retrieve method")
-                    return None
-            elif tier == "warm":
-                from memories.core.warm import WarmMemory
-                warm = WarmMemory()
-                if hasattr(warm, 'retrieve'):
-                    retrieve_method = warm.retrieve
-                    if hasattr(retrieve_method, '__await__'):
-                        import asyncio
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        return loop.run_until_complete(retrieve_method(key))
-                    else:
-                        return retrieve_method(key)
-                else:
-                    self.logger.warning("WarmMemory does not have a retrieve method")
-                    return None
-            elif tier == "cold":
-                from memories.core.cold import ColdMemory
-                cold = ColdMemory()
-                if hasattr(cold, 'retrieve'):
-                    retrieve_method = cold.retrieve
-                    if hasattr(retrieve_method, '__await__'):
-                        import asyncio
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        return loop.run_until_complete(retrieve_method(key))
-                    else:
-                        return retrieve_method(key)
-                else:
-                    self.logger.warning("ColdMemory does not have a retrieve method")
-                    return None
-            elif tier == "glacier":
-                from memories.core.glacier import GlacierMemory
-                glacier = GlacierMemory()
-                if hasattr(glacier, 'retrieve'):
-                    retrieve_method = glacier.retrieve
-                    if hasattr(retrieve_method, '__await__'):
-                        import asyncio
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        return loop.run_until_complete(retrieve_method(key))
-                    else:
-                        return retrieve_method(key)
-                else:
-                    self.logger.warning("GlacierMemory does not have a retrieve method")
-                    return None
+            return await self._call_tier(tier, 'retrieve', key)
         except Exception as e:
             self.logger.error(f"Error retrieving data from {tier} tier: {e}")
             return None
             
-        return None
+    def _retrieve_from_tier(self, key: str, tier: str) -> Any:
+        """Synchronous wrapper around :meth:`_aretrieve_from_tier`."""
+        return self._run(self._aretrieve_from_tier(key, tier))
             
-    def exists(self, key: str) -> bool:
+    async def aexists(self, key: str) -> bool:
         """Check if data exists in any memory tier.
         
+        Tiers without an ``exists`` method are checked with ``retrieve``.
+        
         Args:
             key: Key to check
             
@@ -804,180 +828,30 @@ class MemoryManager:
         """
         self.logger.info(f"Checking if data with key '{key}' exists")
         
-        # Check all tiers
-        for tier in ["red_hot", "hot", "warm", "cold", "glacier"]:
+        for tier in self.TIERS:
             try:
-                if tier == "red_hot":
-                    from memories.core.red_hot import RedHotMemory
-                    red_hot = RedHotMemory()
-                    if hasattr(red_hot, 'exists'):
-                        exists_method = red_hot.exists
-                        if hasattr(exists_method, '__await__'):
-                            import asyncio
-                            try:
-                                loop = asyncio.get_event_loop()
-                            except RuntimeError:
-                                loop = asyncio.new_event_loop()
-                                asyncio.set_event_loop(loop)
-                            if loop.run_until_complete(exists_method(key)):
-                                return True
-                        else:
-                            if exists_method(key):
-                                return True
-                    else:
-                        # Fallback: try to retrieve the data
-                        if hasattr(red_hot, 'retrieve'):
-                            retrieve_method = red_hot.retrieve
-                            if hasattr(retrieve_method, '__await__'):
-                                import asyncio
-                                try:
-                                    loop = asyncio.get_event_loop()
-                                except RuntimeError:
-                                    loop = asyncio.new_event_loop()
-                                    asyncio.set_event_loop(loop)
-                                if loop.run_until_complete(retrieve_method(key)) is not None:
-                                    return True
-                            else:
-                                if retrieve_method(key) is not None:
-                                    return True
-                elif tier == "hot":
-                    from memories.core.hot import HotMemory
-                    hot = HotMemory()
-                    if hasattr(hot, 'exists'):
-                        exists_method = hot.exists
-                        if hasattr(exists_method, '__await__'):
-                            import asyncio
-                            try:
-                                loop = asyncio.get_event_loop()
-                            except RuntimeError:
-                                loop = asyncio.new_event_loop()
-                                asyncio.set_event_loop(loop)
-                            if loop.run_until_complete(exists_method(key)):
-                                return True
-                        else:
-                            if exists_method(key):
-                                return True
-                    else:
-                        # Fallback: try to retrieve the data
-                        if hasattr(hot, 'retrieve'):
-                            retrieve_method = hot.retrieve
-                            if hasattr(retrieve_method, '__await__'):
-                                import asyncio
-                                try:
-                                    loop = asyncio.get_event_loop()
-                                except RuntimeError:
-                                    loop = asyncio.new_event_loop()
-                                    asyncio.set_event_loop(loop)
-                                if loop.run_until_complete(retrieve_method(key)) is not None:
-                                    return True
-                            else:
-                                if retrieve_method(key) is not None:
-                                    return True
-                elif tier == "warm":
-                    from memories.core.warm import WarmMemory
-                    warm = WarmMemory()
-                    if hasattr(warm, 'exists'):
-                        exists_method = warm.exists
-                        if hasattr(exists_method, '__await__'):
-                            import asyncio
-                            try:
-                                loop = asyncio.get_event_loop()
-                            except RuntimeError:
-                                loop = asyncio.new_event_loop()
-                                asyncio.set_event_loop(loop)
-                            if loop.run_until_complete(exists_method(key)):
-                                return True
-                        else:
-                            if exists_method(key):
-                                return True
-                    else:
-                        # Fallback: try to retrieve the data
-                        if hasattr(warm, 'retrieve'):
-                            retrieve_method = warm.retrieve
-                            if hasattr(retrieve_method, '__await__'):
-                                import asyncio
-                                try:
-                                    loop = asyncio.get_event_loop()
-                                except RuntimeError:
-                                    loop = asyncio.new_event_loop()
-                                    asyncio.set_event_loop(loop)
-                                if loop.run_until_complete(retrieve_method(key)) is not None:
-                                    return True
-                            else:
-                                if retrieve_method(key) is not None:
-                                    return True
-                elif tier == "cold":
-                    from memories.core.cold import ColdMemory
-                    cold = ColdMemory()
-                    if hasattr(cold, 'exists'):
-                        exists_method = cold.exists
-                        if hasattr(exists_method, '__await__'):
-                            import asyncio
-                            try:
-                                loop = asyncio.get_event_loop()
-                            except RuntimeError:
-                                loop = asyncio.new_event_loop()
-                                asyncio.set_event_loop(loop)
-                            if loop.run_until_complete(exists_method(key)):
-                                return True
-                        else:
-                            if exists_method(key):
-                                return True
-                    else:
-                        # Fallback: try to retrieve the data
-                        if hasattr(cold, 'retrieve'):
-                            retrieve_method = cold.retrieve
-                            if hasattr(retrieve_method, '__await__'):
-                                import asyncio
-                                try:
-                                    loop = asyncio.get_event_loop()
-                                except RuntimeError:
-                                    loop = asyncio.new_event_loop()
-                                    asyncio.set_event_loop(loop)
-                                if loop.run_until_complete(retrieve_method(key)) is not None:
-                                    return True
-                            else:
-                                if retrieve_method(key) is not None:
-                                    return True
-                elif tier == "glacier":
-                    from memories.core.glacier import GlacierMemory
-                    glacier = GlacierMemory()
-                    if hasattr(glacier, 'exists'):
-                        exists_method = glacier.exists
-                        if hasattr(exists_method, '__await__'):
-                            import asyncio
-                            try:
-                                loop = asyncio.get_event_loop()
-                            except RuntimeError:
-                                loop = asyncio.new_event_loop()
-                                asyncio.set_event_loop(loop)
-                            if loop.run_until_complete(exists_method(key)):
-                                return True
-                        else:
-                            if exists_method(key):
-                                return True
-                    else:
-                        # Fallback: try to retrieve the data
-                        if hasattr(glacier, 'retrieve'):
-                            retrieve_method = glacier.retrieve
-                            if hasattr(retrieve_method, '__await__'):
-                                import asyncio
-                                try:
-                                    loop = asyncio.get_event_loop()
-                                except RuntimeError:
-                                    loop = asyncio.new_event_loop()
-                                    asyncio.set_event_loop(loop)
-                                if loop.run_until_complete(retrieve_method(key)) is not None:
-                                    return True
-                            else:
-                                if retrieve_method(key) is not None:
-                                    return True
+                if hasattr(self._get_tier(tier), 'exists'):
+                    if await self._call_tier(tier, 'exists', key):
+                        return True
+                elif await self._call_tier(tier, 'retrieve', key) is not None:
+                    return True
             except Exception as e:
                 self.logger.error(f"Error checking if data exists in {tier} tier: {e}")
                 
         return False
         
-    def delete(self, key: str, tier: Optional[str] = None) -> bool:
+    def exists(self, key: str) -> bool:
+        """Synchronous wrapper around :meth:`aexists`.
+        
+        Args:
+            key: Key to check
+            
+        Returns:
+            bool: True if data exists, False otherwise
+        """
+        return self._run(self.aexists(key))
+        
+    async def adelete(self, key: str, tier: Optional[str] = None) -> bool:
         """Delete data from memory.
         
         Args:
@@ -989,20 +863,30 @@ class MemoryManager:
         """
         self.logger.info(f"Deleting data with key '{key}'")
         
-        deleted = False
-        
         # If tier is specified, delete from that tier only
         if tier is not None:
-            return self._delete_from_tier(key, tier)
+            return await self._adelete_from_tier(key, tier)
             
-        # Otherwise, try to delete from all tiers
-        for t in ["red_hot", "hot", "warm", "cold", "glacier"]:
-            if self._delete_from_tier(key, t):
+        deleted = False
+        for current in self.TIERS:
+            if await self._adelete_from_tier(key, current):
                 deleted = True
                 
         return deleted
         
-    def _delete_from_tier(self, key: str, tier: str) -> bool:
+    def delete(self, key: str, tier: Optional[str] = None) -> bool:
+        """Synchronous wrapper around :meth:`adelete`.
+        
+        Args:
+            key: Key of the data to delete
+            tier: Optional tier to delete from (if None, delete from all tiers)
+            
+        Returns:
+            bool: True if data was deleted, False otherwise
+        """
+        return self._run(self.adelete(key, tier))
+        
+    async def _adelete_from_tier(self, key: str, tier: str) -> bool:
         """Helper method to delete data from a specific tier.
         
         Args:
@@ -1013,101 +897,14 @@ class MemoryManager:
             bool: True if data was deleted, False otherwise
         """
         try:
-            if tier == "red_hot":
-                from memories.core.red_hot import RedHotMemory
-                red_hot = RedHotMemory()
-                if hasattr(red_hot, 'delete'):
-                    delete_method = red_hot.delete
-                    if hasattr(delete_method, '__await__'):
-                        import asyncio
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        return loop.run_until_complete(delete_method(key))
-                    else:
-                        return delete_method(key)
-                else:
-                    self.logger.warning("RedHotMemory does not have a delete method")
-                    return False
-            elif tier == "hot":
-                from memories.core.hot import HotMemory
-                hot = HotMemory()
-                if hasattr(hot, 'delete'):
-                    delete_method = hot.delete
-                    if hasattr(delete_method, '__await__'):
-                        import asyncio
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        return loop.run_until_complete(delete_method(key))
-                    else:
-                        return delete_method(key)
-                else:
-                    self.logger.warning("HotMemory does not have a delete method")
-                    return False
-            elif tier == "warm":
-                from memories.core.warm import WarmMemory
-                warm = WarmMemory()
-                if hasattr(warm, 'delete'):
-                    delete_method = warm.delete
-                    if hasattr(delete_method, '__await__'):
-                        import asyncio
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        return loop.run_until_complete(delete_method(key))
-                    else:
-                        return delete_method(key)
-                else:
-                    self.logger.warning("WarmMemory does not have a delete method")
-                    return False
-            elif tier == "cold":
-                from memories.core.cold import ColdMemory
-                cold = ColdMemory()
-                if hasattr(cold, 'delete'):
-                    delete_method = cold.delete
-                    if hasattr(delete_method, '__await__'):
-                        import asyncio
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        return loop.run_until_complete(delete_method(key))
-                    else:
-                        return delete_method(key)
-                else:
-                    self.logger.warning("ColdMemory does not have a delete method")
-                    return False
-            elif tier == "glacier":
-                from memories.core.glacier import GlacierMemory
-                glacier = GlacierMemory()
-                if hasattr(glacier, 'delete'):
-                    delete_method = glacier.delete
-                    if hasattr(delete_method, '__await__'):
-                        import asyncio
-                        try:
-                            loop = asyncio.get_event_loop()
-                        except RuntimeError:
-                            loop = asyncio.new_event_loop()
-                            asyncio.set_event_loop(loop)
-                        return loop.run_until_complete(delete_method(key))
-                    else:
-                        return delete_method(key)
-                else:
-                    self.logger.warning("GlacierMemory does not have a delete method")
-                    return False
+            return bool(await self._call_tier(tier, 'delete', key))
         except Exception as e:
             self.logger.error(f"Error deleting data from {tier} tier: {e}")
             return False
             
-        return False 
+    def _delete_from_tier(self, key: str, tier: str) -> bool:
+        """Synchronous wrapper around :meth:`_adelete_from_tier`."""
+        return self._run(self._adelete_from_tier(key, tier))
 
     async def delete(self, table_name: str) -> bool:
         """Delete data from warm memory by dropping the table.
@@ -1157,6 +954,7 @@ class MemoryManager:
         # Reset all attributes that might hold resources
         self.indexes = {}
         self.storage_backends = {}
+        self._tiers = {}
         
         # If cold memory is initialized, clean it up
         if hasattr(self, 'cold') and self.cold is not None:
@@ -156,25 +156,31 @@ class MemoryStore:
                 success = await self._store_in_glacier(data, metadata=metadata, tags=tags)
                 location = f"glacier/{datetime.now().strftime('%Y%m%d_%H%M%S')}"
             elif to_tier == "cold":
+                # ColdMemory registers its datasets in the catalog itself
                 self._init_cold()
-                success = await self._cold_memory.store(data, metadata=metadata, tags=tags)
-                location = f"cold/{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                return await self._cold_memory.store(data, metadata=metadata, tags=tags)
             elif to_tier == "warm":
                 self._init_warm()
                 result = await self._warm_memory.store(data, metadata=metadata, tags=tags)
                 
                 if result["success"]:
-                    # Use the table name as the location
-                    location = result["table_name"]
-                    data_id = result["data_id"]
+                    # Locate the item by its table, or by its ID in the shared
+                    # tables of partitioned mode
+                    if self._warm_memory.storage_mode == "partitioned":
+                        location = result["data_id"]
+                    else:
+                        location = result["table_name"]
+                    table_name = result["table_name"]
                     success = True
                 else:
                     success = False
                     location = None
             elif to_tier == "hot":
                 self._init_hot()
-                success = await self._hot_memory.store(data, metadata=metadata, tags=tags)
-                location = f"hot/{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                # store_many returns the row ID the catalog needs to locate the data
+                ids = await self._hot_memory.store_many([{"data": data, "metadata": metadata, "tags": tags}])
+                success = bool(ids)
+                location = ids[0] if ids else None
             elif to_tier == "red_hot":
                 self._init_red_hot()
                 success = await self._red_hot_memory.store(data, metadata=metadata, tags=tags)
@@ -184,7 +190,7 @@ class MemoryStore:
             if success and location:
                 try:
                     # For warm memory, use the table_name parameter
-                    if to_tier == "warm" and 'data_id' in locals():
+                    if to_tier == "warm":
                         await memory_catalog.register_data(
                             tier=to_tier,
                             location=location,
@@ -192,7 +198,7 @@ class MemoryStore:
                             data_type=data_type,
                             tags=tags,
                             metadata=metadata,
-                            table_name=location  # Use the table name as both location and table_name
+                            table_name=table_name
                         )
                     else:
                         await memory_catalog.register_data(
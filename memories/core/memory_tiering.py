@@ -21,6 +21,9 @@ from memories.core.memory_manager import MemoryManager
 
 logger = logging.getLogger(__name__)
 
+# Tiers whose catalog locations move_catalog_item can resolve
+CATALOG_TIERS = ('hot', 'warm', 'cold')
+
 class MemoryTiering:
     """Handles operations for moving data between different memory tiers."""
     
@@ -260,7 +263,9 @@ class MemoryTiering:
             
             # Store in Warm storage - WarmMemory.store is async
             logger.info(f"Storing data in Warm storage as table: {table_name}")
-            success = await self.warm.store(data, table_name)
+            success = self._stored(await self.warm.store(
+                data=data, metadata={"key": table_name, "original_source": "cold"}, table_name=table_name
+            ))
             
             if success:
                 logger.info(f"Successfully moved data from Cold to Warm storage as table {table_name}")
@@ -301,7 +306,9 @@ class MemoryTiering:
             
             # Store in Hot storage - HotMemory.store is async
             logger.info(f"Storing data in Hot storage with key: {hot_key}")
-            success = await self.hot.store(data, hot_key)
+            success = self._stored(await self.hot.store(
+                data=data, metadata={"key": hot_key, "original_source": "warm"}
+            ))
             
             if success:
                 logger.info(f"Successfully moved data from Warm to Hot storage with key {hot_key}")
@@ -347,7 +354,10 @@ class MemoryTiering:
             
             # Store in Red Hot storage
             logger.info(f"Storing data in Red Hot storage with key: {red_hot_key}")
-            success = self.red_hot.store(data, red_hot_key)
+            result = self.red_hot.store(data=data, metadata={"key": red_hot_key, "original_source": "hot"})
+            if asyncio.iscoroutine(result):
+                result = await result
+            success = self._stored(result)
             
             if success:
                 logger.info(f"Successfully moved data from Hot to Red Hot storage with key {red_hot_key}")
@@ -399,10 +409,259 @@ class MemoryTiering:
         elif source_tier == 'hot' and target_tier == 'red_hot':
             return await self.hot_to_red_hot(data_key, new_key)
         else:
-            # For tiers that are not adjacent, we need to move through intermediate tiers
-            logger.warning(f"Moving from {source_tier} to {target_tier} requires intermediate steps")
-            # Implementation for multi-step promotion would go here
-            return False 
+            # For tiers that are not adjacent, move through each intermediate tier
+            logger.info(f"Moving from {source_tier} to {target_tier} through intermediate tiers")
+            key = data_key
+            for hop_source, hop_target in zip(valid_tiers[source_index:target_index],
+                                              valid_tiers[source_index + 1:target_index + 1]):
+                hop_key = new_key if hop_target == target_tier else None
+                if not await self.promote_to_tier(key, hop_source, hop_target, hop_key):
+                    logger.error(f"Promotion from {hop_source} to {hop_target} failed for {key}")
+                    return False
+                if hop_key is None and hop_source == 'glacier':
+                    # glacier_to_cold stores under the key with path separators replaced
+                    key = key.replace('/', '_').replace('\\', '_')
+            return True
+    
+    async def demote_to_tier(self, data_key: str, source_tier: str, target_tier: str) -> bool:
+        """Move data from a warmer tier to a colder tier.
+        
+        The data is read from the source tier and stored in the target tier
+        with the key in its metadata (glacier stores it under the key). It is
+        deleted from the source tier only once the target tier reports a
+        successful store, using the tier instances shared through the
+        MemoryManager.
+        
+        Args:
+            data_key: The key identifying the data in the source tier
+            source_tier: The source tier ('red_hot', 'hot', 'warm', 'cold')
+            target_tier: The target tier ('hot', 'warm', 'cold', 'glacier')
+                
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        valid_tiers = ['glacier', 'cold', 'warm', 'hot', 'red_hot']
+        if source_tier not in valid_tiers or target_tier not in valid_tiers:
+            logger.error(f"Invalid tiers: {source_tier} -> {target_tier}")
+            return False
+        if valid_tiers.index(target_tier) >= valid_tiers.index(source_tier):
+            logger.error(f"Target tier {target_tier} is not colder than source tier {source_tier}")
+            return False
+        
+        try:
+            data = await self.memory_manager._aretrieve_from_tier(data_key, source_tier)
+            if data is None:
+                logger.error(f"Data with key {data_key} not found in {source_tier} storage")
+                return False
+            
+            metadata = {
+                "key": data_key,
+                "original_source": source_tier,
+                "transfer_date": datetime.now().isoformat()
+            }
+            if target_tier == 'glacier':
+                result = await self.memory_manager._call_tier(
+                    target_tier, 'store', data=data, key=data_key, metadata=metadata
+                )
+            else:
+                result = await self.memory_manager._call_tier(target_tier, 'store', data=data, metadata=metadata)
+            if not self._stored(result):
+                logger.error(f"Storing {data_key} in {target_tier} failed; keeping it in {source_tier}")
+                return False
+            
+            if not await self.memory_manager._adelete_from_tier(data_key, source_tier):
+                logger.warning(f"Demoted {data_key} to {target_tier} but could not delete it from {source_tier}")
+            logger.info(f"Successfully moved data from {source_tier} to {target_tier} with key {data_key}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error moving data from {source_tier} to {target_tier}: {str(e)}")
+            return False
+    
+    @staticmethod
+    def _stored(result: Any) -> bool:
+        """Whether a tier's store result reports success.
+        
+        Tiers return either a bool or a dict with a ``success`` entry.
+        """
+        if isinstance(result, dict):
+            return bool(result.get("success"))
+        return bool(result)
+    
+    async def move_to_tier(self, data_key: str, source_tier: str, target_tier: str) -> bool:
+        """Promote or demote data, whichever direction the target tier requires.
+        
+        Args:
+            data_key: The key identifying the data in the source tier
+            source_tier: The tier currently holding the data
+            target_tier: The tier to move the data to
+                
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if source_tier == target_tier:
+            return True
+        valid_tiers = ['glacier', 'cold', 'warm', 'hot', 'red_hot']
+        if target_tier in valid_tiers and source_tier in valid_tiers \
+                and valid_tiers.index(target_tier) > valid_tiers.index(source_tier):
+            return await self.promote_to_tier(data_key, source_tier, target_tier)
+        return await self.demote_to_tier(data_key, source_tier, target_tier)
+    
+    async def _read_item(self, tier: str, info: Dict[str, Any]) -> Optional[Tuple[Any, Dict[str, Any], List[str]]]:
+        """Read the data, metadata and tags of a catalog entry from its tier.
+        
+        Hot entries are located by their hot row ID, warm entries by their
+        item ID (partitioned mode) or table name, and cold entries by their
+        catalog ID.
+        """
+        instance = self.memory_manager._get_tier(tier)
+        location = info['location']
+        if tier == 'cold':
+            result = await instance.retrieve({'data_id': info['data_id']})
+            if result is None:
+                return None
+            tags = info['tags'].split(',') if info.get('tags') else []
+            return result['data'], result.get('metadata') or {}, tags
+        
+        if tier == 'hot':
+            rows = await instance.retrieve(query={'id': location})
+            row = rows[0] if rows else None
+        elif getattr(instance, 'storage_mode', None) == 'partitioned':
+            row = await instance.retrieve(query={'id': location})
+        else:
+            row = await instance.retrieve(table_name=location)
+        if not isinstance(row, dict):
+            return None
+        return row['data'], row.get('metadata') or {}, row.get('tags') or []
+    
+    async def _write_item(
+        self,
+        tier: str,
+        data: Any,
+        metadata: Dict[str, Any],
+        tags: List[str]
+    ) -> Optional[Tuple[str, Optional[str]]]:
+        """Store data in a tier without registering it in the catalog.
+        
+        Returns:
+            The location to record in the catalog and the table holding the
+            data (None when it is the location), or None if the store failed
+        """
+        instance = self.memory_manager._get_tier(tier)
+        if isinstance(data, pd.DataFrame) and tier != 'cold':
+            # Hot and warm store JSON; records keep the rows and their column names
+            data = json.loads(data.to_json(orient='records', date_format='iso'))
+        
+        if tier == 'hot':
+            ids = await instance.store_many([{'data': data, 'metadata': metadata, 'tags': tags}])
+            return (ids[0], None) if ids else None
+        if tier == 'warm':
+            result = await instance.store(data, metadata=metadata, tags=tags)
+            if not self._stored(result):
+                return None
+            if getattr(instance, 'storage_mode', None) == 'partitioned':
+                return result['data_id'], result['table_name']
+            return result['table_name'], None
+        
+        if not isinstance(data, pd.DataFrame):
+            try:
+                data = pd.DataFrame([data] if isinstance(data, dict) else data)
+            except (ValueError, TypeError):
+                data = pd.DataFrame({'data': [json.dumps(data, default=str)]})
+        location, _ = instance.write_dataset(data)
+        return location, None
+    
+    async def _remove_item(self, tier: str, location: str) -> bool:
+        """Delete the copy of a catalog entry at a tier location, leaving the catalog as is."""
+        instance = self.memory_manager._get_tier(tier)
+        if tier == 'cold':
+            return instance.delete_dataset(location)
+        return bool(await instance.delete(location))
+    
+    async def move_catalog_item(self, data_id: str, source_tier: str, target_tier: str, catalog: Any) -> bool:
+        """Move a catalog entry's data between tiers and repoint the entry.
+        
+        The entry's location is resolved to the key the source tier stored the
+        data under, the data is stored in the target tier, and the entry is
+        updated to the target tier and the location the target returned. The
+        source copy is deleted last, in either direction, so the entry keeps
+        its ID and exactly one copy. Data moved into cold is stored as a
+        DataFrame and comes back from cold as a list of records.
+        
+        This is the mover used by :meth:`create_daemon`.
+        
+        Args:
+            data_id: Catalog ID of the data
+            source_tier: The tier the catalog records for the data
+            target_tier: The tier to move the data to ('hot', 'warm' or 'cold')
+            catalog: MemoryCatalog holding the entry
+                
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if source_tier == target_tier:
+            return True
+        if source_tier not in CATALOG_TIERS or target_tier not in CATALOG_TIERS:
+            logger.error(f"Catalog items can only move between {CATALOG_TIERS}, not {source_tier} -> {target_tier}")
+            return False
+        
+        try:
+            info = await catalog.get_data_info(data_id)
+            if info is None or info['primary_tier'] != source_tier:
+                logger.error(f"Catalog has no {source_tier} entry {data_id}")
+                return False
+            
+            item = await self._read_item(source_tier, info)
+            if item is None:
+                logger.error(f"Data of {data_id} not found at {info['location']} in {source_tier} storage")
+                return False
+            data, metadata, tags = item
+            
+            placed = await self._write_item(target_tier, data, metadata, tags)
+            if placed is None:
+                logger.error(f"Storing {data_id} in {target_tier} failed; keeping it in {source_tier}")
+                return False
+            location, table_name = placed
+            
+            if not await catalog.update_location(data_id, target_tier, location, table_name):
+                logger.error(f"Could not repoint {data_id} to {target_tier}; keeping it in {source_tier}")
+                await self._remove_item(target_tier, location)
+                return False
+            
+            if not await self._remove_item(source_tier, info['location']):
+                logger.warning(f"Moved {data_id} to {target_tier} but could not delete it from {source_tier}")
+            logger.info(f"Moved {data_id} from {source_tier} to {target_tier}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error moving {data_id} from {source_tier} to {target_tier}: {e}")
+            return False
+    
+    def create_daemon(self, budgets: Dict[str, Any], policy: Any = "decayed", catalog: Any = None,
+                      **kwargs) -> Any:
+        """Create a background daemon that promotes and demotes catalog items.
+        
+        Items are moved with :meth:`move_catalog_item`, so the daemon can only
+        manage the tiers in ``CATALOG_TIERS``.
+        
+        Args:
+            budgets: Capacity per tier as TierBudget instances
+            policy: Scoring policy name ("lru", "lfu", "decayed") or instance
+            catalog: Catalog providing access stats (default: the shared MemoryCatalog)
+            **kwargs: Further TieringDaemon options (tiers, interval, max_moves, ...)
+                
+        Returns:
+            TieringDaemon: The daemon; call start() from a running event loop
+        """
+        from memories.core.tiering_policy import TieringDaemon
+        if catalog is None:
+            from memories.core.memory_catalog import MemoryCatalog
+            catalog = MemoryCatalog()
+        
+        async def mover(data_id: str, source_tier: str, target_tier: str) -> bool:
+            return await self.move_catalog_item(data_id, source_tier, target_tier, catalog)
+        
+        return TieringDaemon(catalog, mover, budgets, policy=policy, **kwargs)
     
     async def glacier_to_cold_file(self, key: str, destination_filename: Optional[str] = None) -> Tuple[bool, str]:
         """Move data from Glacier storage to Cold storage as a file.
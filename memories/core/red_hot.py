@@ -7,50 +7,448 @@ from typing import Dict, Any, Optional, List, Union
 import numpy as np
 import faiss
 import json
+import asyncio
+import threading
 from pathlib import Path
 from datetime import datetime
 
+from memories.metadata_log import AppendOnlyLog
+
 logger = logging.getLogger(__name__)
 
+# Supported index layouts, see RedHotMemory._create_index
+INDEX_TYPES = ("flat", "ivf_flat", "ivf_pq", "hnsw")
+
+
+def _index_layout(index: faiss.Index) -> Optional[str]:
+    """Name the layout of a persisted index as one of INDEX_TYPES, or None."""
+    if isinstance(index, faiss.IndexIVFPQ):
+        return "ivf_pq"
+    if isinstance(index, faiss.IndexIVFFlat):
+        return "ivf_flat"
+    if isinstance(index, faiss.IndexIDMap):
+        inner = faiss.downcast_index(index.index)
+        if isinstance(inner, faiss.IndexHNSW):
+            return "hnsw"
+        if isinstance(inner, faiss.IndexFlat):
+            return "flat"
+    return None
+
+
 class RedHotMemory:
     """Red hot memory layer using FAISS for vector storage."""
     
-    def __init__(self, dimension: int = 384, storage_path: str = "data/memory/red_hot"):
+    def __init__(
+        self,
+        dimension: int = 384,
+        storage_path: str = "data/memory/red_hot",
+        index_type: str = "flat",
+        nlist: int = 100,
+        pq_m: int = 8,
+        pq_nbits: int = 8,
+        hnsw_m: int = 32,
+        nprobe: int = 8,
+        train_size: Optional[int] = None,
+        mmap: bool = True,
+        compact_ratio: float = 0.3,
+        brute_force_threshold: int = 2048,
+        snapshot_interval: int = 10000
+    ):
         """Initialize red hot memory.
         
         Args:
             dimension: Vector dimension (default: 384)
-            storage_path: Path to store metadata
+            storage_path: Path to store the index, id map and metadata
+            index_type: One of 'flat', 'ivf_flat', 'ivf_pq' or 'hnsw'
+            nlist: Number of inverted lists for the IVF index types
+            pq_m: Number of PQ sub-quantizers for 'ivf_pq'
+            pq_nbits: Bits per PQ sub-quantizer code for 'ivf_pq'
+            hnsw_m: Number of graph neighbours per node for 'hnsw'
+            nprobe: Number of inverted lists visited per IVF query
+            train_size: Size of the reservoir sample used to train IVF indexes.
+                Defaults to the minimum FAISS recommends for the chosen layout.
+            mmap: Reload a persisted index memory-mapped instead of into RAM
+            compact_ratio: Fraction of tombstoned vectors that triggers a
+                background rebuild of the index
+            brute_force_threshold: Tag-filtered searches with at most this many
+                candidates are answered exactly over the candidate subset
+            snapshot_interval: Metadata log records written between snapshots
         """
         self.logger = logger
         self.dimension = dimension
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Unsupported index type '{index_type}'. Expected one of {INDEX_TYPES}")
+        self.index_type = index_type
+        self.nlist = nlist
+        self.pq_m = pq_m
+        self.pq_nbits = pq_nbits
+        self.hnsw_m = hnsw_m
+        self.nprobe = nprobe
+        self.mmap = mmap
+        self.compact_ratio = compact_ratio
+        self.brute_force_threshold = brute_force_threshold
+        if train_size is None:
+            train_size = 39 * nlist
+            if index_type == "ivf_pq":
+                train_size = max(train_size, 39 * (2 ** pq_nbits))
+        self.train_size = train_size
+        
+        self.index_file = self.storage_path / "index.faiss"
+        self.state_file = self.storage_path / "state.json"
+        self.pending_file = self.storage_path / "pending.npy"
+        self.metadata_file = self.storage_path / "metadata.json"
+        
+        # Monotonic 64-bit id handed to the next stored vector; ids are never reused
+        self._next_id = 0
+        # Ids deleted from indexes that cannot remove vectors in place (HNSW)
+        self._tombstones: set = set()
+        self._tombstone_params = None
+        # Inverted tag index: tag -> ids of the vectors carrying it
+        self._tag_index: Dict[str, set] = {}
+        # Vectors (and their ids) waiting for the IVF index to be trained
+        self._pending: List[np.ndarray] = []
+        self._pending_ids: List[int] = []
+        self._lock = threading.RLock()
+        self._compaction = None
+        self._mmapped = False
+        self._dirty = False
+        self._closed = False
+        
         try:
-            # Initialize FAISS index
-            self.index = faiss.IndexFlatL2(dimension)
-            if faiss.get_num_gpus() > 0:
-                # Use GPU if available
-                res = faiss.StandardGpuResources()
-                self.index = faiss.index_cpu_to_gpu(res, 0, self.index)
-                logger.info("Using GPU for FAISS index")
+            if self.index_file.exists():
+                self._load_index()
             else:
-                logger.info("Using CPU for FAISS index")
+                self.index = self._create_index()
                 
-            # Initialize metadata storage
-            self.metadata_file = self.storage_path / "metadata.json"
-            if self.metadata_file.exists():
-                with open(self.metadata_file, 'r') as f:
-                    self.metadata = json.load(f)
-            else:
-                self.metadata = {}
+            # Initialize metadata storage: a snapshot plus an append-only log
+            self._metadata_log = AppendOnlyLog(self.metadata_file, snapshot_interval=snapshot_interval)
+            self.metadata = self._metadata_log.data
+            for key, meta in self.metadata.items():
+                self._index_tags(int(key), meta.get("tags", []))
                 
-            logger.info(f"Initialized red hot memory with dimension {dimension}")
+            logger.info(
+                f"Initialized red hot memory with dimension {dimension} "
+                f"({self.index_type}, {self.index.ntotal} vectors)"
+            )
         except Exception as e:
             logger.error(f"Failed to initialize red hot memory: {e}")
             raise
 
+    def _create_index(self) -> faiss.Index:
+        """Create an empty FAISS index for the configured layout.
+        
+        IVF indexes store external ids in their inverted lists natively; flat
+        and HNSW indexes are wrapped in an ``IndexIDMap2`` so every layout is
+        addressed by the same monotonic ids.
+        """
+        if self.index_type == "ivf_flat":
+            factory = f"IVF{self.nlist},Flat"
+        elif self.index_type == "ivf_pq":
+            factory = f"IVF{self.nlist},PQ{self.pq_m}x{self.pq_nbits}"
+        elif self.index_type == "hnsw":
+            factory = f"HNSW{self.hnsw_m}"
+        else:
+            factory = "Flat"
+        index = faiss.index_factory(self.dimension, factory)
+        
+        if self.index_type == "flat" and faiss.get_num_gpus() > 0:
+            # Use GPU if available
+            res = faiss.StandardGpuResources()
+            index = faiss.index_cpu_to_gpu(res, 0, index)
+            logger.info("Using GPU for FAISS index")
+        else:
+            logger.info("Using CPU for FAISS index")
+        
+        if self.index_type in ("flat", "hnsw"):
+            index = faiss.IndexIDMap2(index)
+        self._configure_search(index)
+        return index
+
+    def _configure_search(self, index: faiss.Index) -> None:
+        """Apply query-time parameters to an IVF or HNSW index."""
+        if self.index_type in ("ivf_flat", "ivf_pq"):
+            faiss.extract_index_ivf(index).nprobe = self.nprobe
+        elif self.index_type == "hnsw":
+            faiss.downcast_index(index.index).hnsw.efSearch = self._ef_search
+
+    @property
+    def _ef_search(self) -> int:
+        return max(self.hnsw_m * 2, 64)
+
+    @property
+    def _supports_removal(self) -> bool:
+        """Whether deleted ids can be removed from the index in place."""
+        return self.index_type != "hnsw"
+
+    def _load_index(self) -> None:
+        """Load a persisted index, its id state and any untrained pending vectors."""
+        flags = faiss.IO_FLAG_MMAP if self.mmap else 0
+        index = faiss.read_index(str(self.index_file), flags)
+        state = {}
+        if self.state_file.exists():
+            with open(self.state_file, 'r') as f:
+                state = json.load(f)
+        
+        # The persisted index fixes the dimension and layout, so a store opened
+        # with other arguments would reject every vector or fail on first search
+        layout = state.get("index_type") or _index_layout(index)
+        if index.d != self.dimension or layout != self.index_type:
+            raise ValueError(
+                f"Index at {self.index_file} has dimension {index.d} and index type "
+                f"'{layout}', but dimension {self.dimension} and index type "
+                f"'{self.index_type}' were requested. Open it with matching arguments "
+                f"or use another storage_path."
+            )
+        self.index = index
+        self._mmapped = bool(flags)
+        self._configure_search(self.index)
+        
+        if state:
+            self._next_id = state.get("next_id", self.index.ntotal)
+            self._tombstones = set(state.get("tombstones", []))
+            self._pending_ids = state.get("pending_ids", [])
+        else:
+            self._next_id = self.index.ntotal
+        if self.pending_file.exists():
+            self._pending = list(np.load(self.pending_file))
+        logger.info(f"Loaded red hot index with {self.index.ntotal} vectors from {self.index_file}")
+
+    def _ensure_writable(self) -> None:
+        """Swap a memory-mapped index for an in-RAM copy before mutating it.
+        
+        Memory-mapped IVF inverted lists are read-only, so the first write
+        after a restart reloads the index fully.
+        """
+        if self._mmapped:
+            self.index = faiss.read_index(str(self.index_file))
+            self._configure_search(self.index)
+            self._mmapped = False
+
+    def save(self) -> bool:
+        """Persist the FAISS index, id state and metadata to the storage path.
+        
+        Returns:
+            bool: True if the index was written, False otherwise
+        """
+        with self._lock:
+            return self._save()
+
+    def _save(self) -> bool:
+        try:
+            self.storage_path.mkdir(parents=True, exist_ok=True)
+            index = self.index
+            if hasattr(faiss, "index_gpu_to_cpu") and faiss.get_num_gpus() > 0 and self.index_type == "flat":
+                index = faiss.index_gpu_to_cpu(index)
+            
+            # Write to a temporary file first so a crash never leaves a torn index behind
+            tmp_file = self.index_file.with_suffix(".faiss.tmp")
+            faiss.write_index(index, str(tmp_file))
+            tmp_file.replace(self.index_file)
+            
+            with open(self.state_file, 'w') as f:
+                json.dump({
+                    "dimension": self.dimension,
+                    "index_type": self.index_type,
+                    "next_id": self._next_id,
+                    "tombstones": sorted(self._tombstones),
+                    "pending_ids": self._pending_ids
+                }, f)
+            if self._pending:
+                np.save(self.pending_file, np.vstack(self._pending))
+            elif self.pending_file.exists():
+                self.pending_file.unlink()
+            self._metadata_log.snapshot()
+            
+            self._dirty = False
+            logger.info(f"Saved red hot index with {self.index.ntotal} vectors to {self.index_file}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save red hot index: {e}")
+            return False
+
+    def _to_matrix(self, data: Union[np.ndarray, List[float], List[List[float]]]) -> Optional[np.ndarray]:
+        """Convert input vectors into a contiguous float32 matrix of shape (n, dimension)."""
+        if isinstance(data, list):
+            matrix = np.array(data, dtype=np.float32)
+        elif isinstance(data, np.ndarray):
+            matrix = data.astype(np.float32)
+        else:
+            logger.error("Data must be a vector (list or numpy array)")
+            return None
+        
+        if matrix.ndim == 1:
+            matrix = matrix.reshape(1, -1)
+        if matrix.ndim != 2 or matrix.shape[1] != self.dimension:
+            logger.error(f"Vector dimension mismatch. Expected {self.dimension}, got {matrix.shape[-1]}")
+            return None
+        return np.ascontiguousarray(matrix)
+
+    def _add_vectors(self, matrix: np.ndarray) -> List[str]:
+        """Add a matrix of vectors to the index and return their metadata keys.
+        
+        Untrained IVF indexes buffer vectors until ``train_size`` of them have
+        been seen, then train on a reservoir sample and add the buffer in one call.
+        """
+        with self._lock:
+            self._ensure_writable()
+            ids = np.arange(self._next_id, self._next_id + len(matrix), dtype=np.int64)
+            self._next_id += len(matrix)
+            
+            if self.index.is_trained:
+                self.index.add_with_ids(matrix, ids)
+            else:
+                self._pending.extend(matrix)
+                self._pending_ids.extend(int(i) for i in ids)
+                if len(self._pending) >= self.train_size:
+                    self.train()
+            
+            self._dirty = True
+            return [str(i) for i in ids]
+
+    def train(self, vectors: Optional[np.ndarray] = None) -> bool:
+        """Train an IVF index and flush any buffered vectors into it.
+        
+        Args:
+            vectors: Optional training vectors. Defaults to a reservoir sample
+                of the buffered vectors.
+            
+        Returns:
+            bool: True if the index is trained, False otherwise
+        """
+        try:
+            with self._lock:
+                if self.index.is_trained:
+                    return True
+                self._ensure_writable()
+                
+                if vectors is None:
+                    if not self._pending:
+                        logger.warning("No vectors available to train the red hot index")
+                        return False
+                    vectors = np.vstack(self._pending)
+                vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+                
+                # Train on a uniform reservoir sample rather than the full stream
+                if len(vectors) > self.train_size:
+                    rng = np.random.default_rng(len(vectors))
+                    vectors = vectors[rng.choice(len(vectors), self.train_size, replace=False)]
+                
+                self.index.train(vectors)
+                self._configure_search(self.index)
+                if self._pending:
+                    self.index.add_with_ids(np.vstack(self._pending), np.array(self._pending_ids, dtype=np.int64))
+                    self._pending = []
+                    self._pending_ids = []
+                
+                self._dirty = True
+            logger.info(f"Trained {self.index_type} red hot index on {len(vectors)} vectors")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to train red hot index: {e}")
+            return False
+
+    def _index_tags(self, vector_id: int, tags: Optional[List[str]]) -> None:
+        """Add a vector id to the inverted tag index."""
+        for tag in tags or []:
+            self._tag_index.setdefault(tag, set()).add(vector_id)
+
+    def _unindex_tags(self, vector_id: int, tags: Optional[List[str]]) -> None:
+        """Remove a vector id from the inverted tag index."""
+        for tag in tags or []:
+            ids = self._tag_index.get(tag)
+            if ids is not None:
+                ids.discard(vector_id)
+                if not ids:
+                    del self._tag_index[tag]
+
+    def _tag_candidates(self, tags: List[str]) -> np.ndarray:
+        """Return the sorted ids of vectors carrying any of ``tags``."""
+        candidates = set()
+        for tag in tags:
+            candidates |= self._tag_index.get(tag, set())
+        return np.array(sorted(candidates), dtype=np.int64)
+
+    def _search_params(self, selector: faiss.IDSelector, *referenced: Any) -> faiss.SearchParameters:
+        """Build search parameters for the index layout restricted to ``selector``."""
+        if self.index_type in ("ivf_flat", "ivf_pq"):
+            params = faiss.SearchParametersIVF(sel=selector, nprobe=self.nprobe)
+        elif self.index_type == "hnsw":
+            params = faiss.SearchParametersHNSW(sel=selector, efSearch=self._ef_search)
+        else:
+            params = faiss.SearchParameters(sel=selector)
+        # Keep the selectors (and any buffers they point into) alive with the parameters
+        params.referenced_objects = [selector, *referenced]
+        return params
+
+    def _empty_result(self, n: int, k: int):
+        return np.full((n, k), np.inf, dtype=np.float32), np.full((n, k), -1, dtype=np.int64)
+
+    def _search(self, query: np.ndarray, k: int, candidates: Optional[np.ndarray] = None):
+        """Search the index, falling back to exact search over buffered vectors.
+        
+        Args:
+            query: Query matrix of shape (n, dimension)
+            k: Number of neighbours per query
+            candidates: Optional sorted ids the search is restricted to
+            
+        Returns distances and vector ids; tombstoned ids are excluded.
+        """
+        if candidates is not None and len(candidates) == 0:
+            return self._empty_result(len(query), k)
+        
+        if not self.index.is_trained:
+            if not self._pending:
+                return self._empty_result(len(query), k)
+            pending_ids = np.array(self._pending_ids, dtype=np.int64)
+            vectors = np.vstack(self._pending)
+            if candidates is not None:
+                mask = np.isin(pending_ids, candidates)
+                pending_ids, vectors = pending_ids[mask], vectors[mask]
+            return self._exact_search(query, k, vectors, pending_ids)
+        
+        if candidates is not None:
+            if len(candidates) <= self.brute_force_threshold:
+                return self._search_subset(query, k, candidates)
+            # Dense filters are pushed into FAISS as a bitmap over the id space
+            bitmap = np.zeros(self._next_id, dtype=bool)
+            bitmap[candidates] = True
+            packed = np.packbits(bitmap, bitorder="little")
+            selector = faiss.IDSelectorBitmap(len(bitmap), faiss.swig_ptr(packed))
+            return self.index.search(query, k, params=self._search_params(selector, packed))
+        
+        params = self._tombstone_params
+        if self._tombstones and params is None:
+            # Build the exclusion selector once per change to the tombstone
+            # set; only HNSW indexes keep tombstones
+            batch = faiss.IDSelectorBatch(np.fromiter(self._tombstones, dtype=np.int64))
+            params = self._search_params(faiss.IDSelectorNot(batch), batch)
+            self._tombstone_params = params
+        return self.index.search(query, k, params=params)
+
+    def _search_subset(self, query: np.ndarray, k: int, candidates: np.ndarray):
+        """Exact search restricted to a small set of candidate ids."""
+        if self.index_type in ("ivf_flat", "ivf_pq"):
+            # IVF codes cannot be reconstructed by id without a direct map, so
+            # visit every inverted list but only score the candidates
+            batch = faiss.IDSelectorBatch(candidates)
+            params = faiss.SearchParametersIVF(sel=batch, nprobe=self.nlist)
+            params.referenced_objects = [batch]
+            return self.index.search(query, k, params=params)
+        return self._exact_search(query, k, self.index.reconstruct_batch(candidates), candidates)
+
+    def _exact_search(self, query: np.ndarray, k: int, vectors: np.ndarray, ids: np.ndarray):
+        """Brute-force k-NN over ``vectors``, returning results keyed by ``ids``."""
+        distances, indices = self._empty_result(len(query), k)
+        k_eff = min(k, len(vectors))
+        if k_eff:
+            found_distances, positions = faiss.knn(query, np.ascontiguousarray(vectors), k_eff)
+            distances[:, :k_eff] = found_distances
+            indices[:, :k_eff] = np.where(positions >= 0, ids[np.clip(positions, 0, None)], -1)
+        return distances, indices
+
     async def store(
         self,
         data: Union[np.ndarray, List[float]],
@@ -68,35 +466,21 @@ class RedHotMemory:
             bool: True if storage was successful, False otherwise
         """
         try:
-            # Convert data to numpy array if needed
-            if isinstance(data, list):
-                vector = np.array(data, dtype=np.float32).reshape(1, -1)
-            elif isinstance(data, np.ndarray):
-                vector = data.reshape(1, -1).astype(np.float32)
-            else:
-                logger.error("Data must be a vector (list or numpy array)")
-                return False
-
-            # Validate vector dimension
-            if vector.shape[1] != self.dimension:
-                logger.error(f"Vector dimension mismatch. Expected {self.dimension}, got {vector.shape[1]}")
+            vector = self._to_matrix(data)
+            if vector is None or len(vector) != 1:
                 return False
 
             # Add vector to index
-            self.index.add(vector)
+            vector_id = self._add_vectors(vector)[0]
 
             # Store metadata if provided
             if metadata or tags:
-                vector_id = len(self.metadata)
-                self.metadata[str(vector_id)] = {
+                self._metadata_log.set(vector_id, {
                     "metadata": metadata or {},
                     "tags": tags or [],
                     "stored_at": datetime.now().isoformat()
-                }
-
-                # Save metadata to file
-                with open(self.metadata_file, 'w') as f:
-                    json.dump(self.metadata, f)
+                })
+                self._index_tags(int(vector_id), tags)
 
             return True
 
@@ -104,6 +488,53 @@ class RedHotMemory:
             logger.error(f"Error storing in red hot memory: {e}")
             return False
 
+    async def store_many(
+        self,
+        vectors: Union[np.ndarray, List[List[float]]],
+        metadata_list: Optional[List[Optional[Dict[str, Any]]]] = None,
+        tags_list: Optional[List[Optional[List[str]]]] = None
+    ) -> List[str]:
+        """Store a matrix of vectors in a single FAISS call.
+        
+        Args:
+            vectors: Vectors of shape (n, dimension)
+            metadata_list: Optional per-vector metadata, aligned with ``vectors``
+            tags_list: Optional per-vector tags, aligned with ``vectors``
+            
+        Returns:
+            List of keys assigned to the stored vectors, empty on failure
+        """
+        try:
+            matrix = self._to_matrix(vectors)
+            if matrix is None:
+                return []
+            for name, values in (("metadata_list", metadata_list), ("tags_list", tags_list)):
+                if values is not None and len(values) != len(matrix):
+                    logger.error(f"{name} has {len(values)} entries for {len(matrix)} vectors")
+                    return []
+
+            keys = self._add_vectors(matrix)
+
+            stored_at = datetime.now().isoformat()
+            entries = []
+            for i, key in enumerate(keys):
+                metadata = metadata_list[i] if metadata_list else None
+                tags = tags_list[i] if tags_list else None
+                if metadata or tags:
+                    entries.append((key, {
+                        "metadata": metadata or {},
+                        "tags": tags or [],
+                        "stored_at": stored_at
+                    }))
+                    self._index_tags(int(key), tags)
+            self._metadata_log.set_many(entries)
+
+            return keys
+
+        except Exception as e:
+            logger.error(f"Error storing batch in red hot memory: {e}")
+            return []
+
     async def retrieve(
         self,
         query_vector: Union[np.ndarray, List[float]],
@@ -112,10 +543,13 @@ class RedHotMemory:
     ) -> Optional[Dict[str, Any]]:
         """Retrieve nearest vectors from red hot memory.
         
+        Tag filters are applied before the k-NN search, so up to ``k`` matching
+        vectors are returned however selective the filter is.
+        
         Args:
             query_vector: Query vector
             k: Number of nearest neighbors to retrieve
-            tags: Optional tags to filter by
+            tags: Optional tags to filter by (vectors matching any tag)
             
         Returns:
             Dictionary containing distances, indices and metadata
@@ -127,28 +561,25 @@ class RedHotMemory:
             else:
                 query = query_vector.reshape(1, -1).astype(np.float32)
 
-            # Search index
-            distances, indices = self.index.search(query, k)
+            # Search index, restricted to the vectors carrying the requested tags
+            candidates = self._tag_candidates(tags) if tags else None
+            distances, indices = self._search(query, k, candidates)
 
             # Get metadata for results
             results = []
             for i, idx in enumerate(indices[0]):
+                if idx < 0:
+                    continue
                 result = {
                     "distance": float(distances[0][i]),
                     "index": int(idx)
                 }
                 
                 # Add metadata if available
-                if str(idx) in self.metadata:
-                    meta = self.metadata[str(idx)]
-                    if tags:
-                        # Filter by tags
-                        if any(tag in meta["tags"] for tag in tags):
-                            result.update(meta)
-                            results.append(result)
-                    else:
-                        result.update(meta)
-                        results.append(result)
+                key = str(idx)
+                if key in self.metadata:
+                    result.update(self.metadata[key])
+                    results.append(result)
 
             return results if results else None
 
@@ -160,15 +591,22 @@ class RedHotMemory:
         """Clear red hot memory."""
         try:
             # Reset FAISS index
-            self.index = faiss.IndexFlatL2(self.dimension)
-            if faiss.get_num_gpus() > 0:
-                res = faiss.StandardGpuResources()
-                self.index = faiss.index_cpu_to_gpu(res, 0, self.index)
+            with self._lock:
+                self.index = self._create_index()
+                self._mmapped = False
+                self._next_id = 0
+                self._tombstones = set()
+                self._tombstone_params = None
+                self._tag_index = {}
+                self._pending = []
+                self._pending_ids = []
+                self._dirty = False
             
-            # Clear metadata
-            self.metadata = {}
-            if self.metadata_file.exists():
-                self.metadata_file.unlink()
+            # Clear metadata and persisted index files
+            self._metadata_log.clear()
+            for path in (self.index_file, self.state_file, self.pending_file):
+                if path.exists():
+                    path.unlink()
         except Exception as e:
             logger.error(f"Failed to clear red hot memory: {e}")
 
@@ -176,14 +614,19 @@ class RedHotMemory:
         """Clean up resources."""
         try:
             self.clear()
+            self._closed = True
             if self.storage_path.exists():
                 self.storage_path.rmdir()
         except Exception as e:
             logger.error(f"Failed to cleanup red hot memory: {e}")
 
     def __del__(self):
-        """Destructor to ensure cleanup is performed."""
-        self.cleanup()
+        """Destructor to persist unsaved vectors so a restart can reload them."""
+        try:
+            if getattr(self, "_dirty", False) and not getattr(self, "_closed", True):
+                self.save()
+        except Exception:
+            pass
 
     async def get_schema(self, vector_id: Union[str, int]) -> Optional[Dict[str, Any]]:
         """Get schema information for stored vector.
@@ -232,34 +675,119 @@ class RedHotMemory:
         """Delete vector data from red hot memory.
         
         Args:
-            key: Key of the data to delete
+            key: Key (vector id) of the data to delete
             
         Returns:
             bool: True if deletion was successful, False otherwise
         """
+        return await self.delete_many([key]) == 1
+
+    async def delete_many(self, keys: List[str]) -> int:
+        """Delete several vectors from red hot memory in one index operation.
+        
+        Flat and IVF indexes drop the vectors with ``remove_ids``. HNSW graphs
+        cannot remove nodes, so their ids are tombstoned and excluded from
+        searches until :meth:`compact` rebuilds the index.
+        
+        Args:
+            keys: Keys (vector ids) of the data to delete
+            
+        Returns:
+            int: Number of vectors deleted
+        """
         try:
-            # Check if key exists in metadata
-            if not hasattr(self, 'metadata') or not self.metadata or key not in self.metadata:
-                self.logger.warning(f"Key '{key}' does not exist in red hot memory")
-                return False
+            with self._lock:
+                ids = []
+                for key in keys:
+                    try:
+                        vector_id = int(key)
+                    except (TypeError, ValueError):
+                        vector_id = -1
+                    if not 0 <= vector_id < self._next_id or vector_id in self._tombstones:
+                        self.logger.warning(f"Key '{key}' does not exist in red hot memory")
+                        continue
+                    ids.append(vector_id)
+                if not ids:
+                    return 0
+                
+                self._ensure_writable()
+                id_array = np.array(ids, dtype=np.int64)
+                if self._pending_ids:
+                    keep = ~np.isin(self._pending_ids, id_array)
+                    self._pending = [v for v, k in zip(self._pending, keep) if k]
+                    self._pending_ids = [i for i, k in zip(self._pending_ids, keep) if k]
+                if self._supports_removal:
+                    if self.index.is_trained:
+                        self.index.remove_ids(id_array)
+                else:
+                    self._tombstones.update(ids)
+                    self._tombstone_params = None
+                
+                for vector_id in ids:
+                    meta = self.metadata.get(str(vector_id))
+                    if meta:
+                        self._unindex_tags(vector_id, meta.get("tags"))
+                self._metadata_log.delete_many(str(vector_id) for vector_id in ids)
+                self._dirty = True
             
-            # Get index of the vector
-            vector_idx = self.metadata[key].get('index')
-            if vector_idx is None:
-                self.logger.warning(f"No index found for key '{key}'")
-                return False
+            self.logger.info(f"Deleted {len(ids)} vectors from red hot memory")
+            if self.tombstone_ratio >= self.compact_ratio:
+                self._schedule_compaction()
+            return len(ids)
+        except Exception as e:
+            self.logger.error(f"Error deleting vectors {keys}: {e}")
+            return 0
+
+    @property
+    def tombstone_ratio(self) -> float:
+        """Fraction of indexed vectors that are tombstoned."""
+        if not self.index.ntotal:
+            return 0.0
+        return len(self._tombstones) / self.index.ntotal
+
+    def _schedule_compaction(self) -> None:
+        """Run :meth:`compact` on a worker thread unless one is already running."""
+        if self._compaction is not None and not self._compaction.done():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+            self._compaction = loop.run_in_executor(None, self.compact)
+        except RuntimeError:
+            # No running event loop, compact inline
+            self.compact()
+
+    def compact(self, force: bool = False) -> bool:
+        """Rebuild the index without its tombstoned vectors.
+        
+        Args:
+            force: Rebuild even if the tombstone ratio is below ``compact_ratio``
             
-            # FAISS doesn't support direct removal, so we need to mark it as deleted in metadata
-            # and rebuild the index if needed
-            self.metadata[key]['deleted'] = True
+        Returns:
+            bool: True if the index was rebuilt, False otherwise
+        """
+        try:
+            with self._lock:
+                if not self._tombstones or (not force and self.tombstone_ratio < self.compact_ratio):
+                    return False
+                self._ensure_writable()
+                
+                ids = faiss.vector_to_array(self.index.id_map)
+                vectors = self.index.index.reconstruct_n(0, self.index.ntotal)
+                live = ~np.isin(ids, np.fromiter(self._tombstones, dtype=np.int64))
+                
+                index = self._create_index()
+                index.add_with_ids(np.ascontiguousarray(vectors[live]), ids[live])
+                removed = len(self._tombstones)
+                
+                # Swap in the rebuilt index before dropping the tombstones so
+                # concurrent searches never see dead vectors
+                self.index = index
+                self._tombstone_params = None
+                self._tombstones = set()
+                self._dirty = True
             
-            # Save metadata
-            if hasattr(self, 'metadata_file') and self.metadata_file:
-                with open(self.metadata_file, 'w') as f:
-                    json.dump(self.metadata, f)
-                    
-            self.logger.info(f"Vector with key '{key}' marked as deleted")
+            self.logger.info(f"Compacted red hot index, dropped {removed} tombstoned vectors")
             return True
         except Exception as e:
-            self.logger.error(f"Error deleting vector with key '{key}': {e}")
-            return False 
\ No newline at end of file
+            self.logger.error(f"Failed to compact red hot index: {e}")
+            return False
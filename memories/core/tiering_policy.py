@@ -0,0 +1,404 @@
+"""
+Access-driven placement of data across memory tiers.
+
+A scoring policy ranks catalog entries by their access statistics
+(``access_count``, ``last_accessed``) and a planner assigns the hottest
+entries to the fastest tiers until each tier's byte and item budget is used
+up. :class:`TieringDaemon` runs the plan periodically and applies the
+resulting promotions and demotions in batches. The clock is injectable, and
+:func:`simulate_access_trace` replays a synthetic access trace against the
+planner without touching any storage, reporting the hit rate per tier.
+"""
+
+import asyncio
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Tiers in order of speed, matching MemoryManager.TIERS
+TIERS = ("red_hot", "hot", "warm", "cold", "glacier")
+
+# Tiers managed by default; red_hot only holds vectors and glacier is remote
+DEFAULT_MANAGED_TIERS = ("hot", "warm", "cold")
+
+
+@dataclass
+class TierBudget:
+    """Capacity of a memory tier. ``None`` means unlimited."""
+
+    max_bytes: Optional[int] = None
+    max_items: Optional[int] = None
+
+
+@dataclass
+class TierMove:
+    """A planned move of one data item between tiers."""
+
+    data_id: str
+    source: str
+    target: str
+    size: int = 0
+
+    @property
+    def is_promotion(self) -> bool:
+        return TIERS.index(self.target) < TIERS.index(self.source)
+
+
+class SimulatedClock:
+    """Manually advanced clock for tests and trace simulation."""
+
+    def __init__(self, start: Optional[datetime] = None):
+        self.now = start or datetime(2024, 1, 1)
+
+    def advance(self, seconds: float) -> datetime:
+        self.now += timedelta(seconds=seconds)
+        return self.now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class LRUPolicy:
+    """Score items by recency: the most recently accessed item is hottest."""
+
+    name = "lru"
+
+    def score(self, item: Dict[str, Any], now: datetime) -> float:
+        last_accessed = item.get('last_accessed') or item.get('created_at')
+        if last_accessed is None:
+            return -math.inf
+        return -(now - last_accessed).total_seconds()
+
+
+class LFUPolicy:
+    """Score items by total access count, breaking ties by recency."""
+
+    name = "lfu"
+
+    def score(self, item: Dict[str, Any], now: datetime) -> tuple:
+        return (item.get('access_count') or 0, LRUPolicy.score(self, item, now))
+
+
+class DecayedFrequencyPolicy:
+    """Score items by access frequency with exponential decay.
+
+    Each access counts 1 and loses half its weight every ``half_life``
+    seconds, so an item that was popular long ago cools down while recently
+    popular items rank highest. Only the catalog's cumulative
+    ``access_count`` is needed: accesses since the previous call are
+    attributed to that item's ``last_accessed`` time.
+    """
+
+    name = "decayed"
+
+    def __init__(self, half_life: float = 3600.0):
+        if half_life <= 0:
+            raise ValueError("half_life must be positive")
+        self.half_life = half_life
+        # data_id -> (decayed score, access_count, time of score)
+        self._state: Dict[str, tuple] = {}
+
+    def _decay(self, seconds: float) -> float:
+        return 0.5 ** (max(seconds, 0.0) / self.half_life)
+
+    def score(self, item: Dict[str, Any], now: datetime) -> float:
+        data_id = item['data_id']
+        count = item.get('access_count') or 0
+        last_accessed = item.get('last_accessed') or now
+
+        previous = self._state.get(data_id)
+        if previous is None:
+            score, seen, at = 0.0, 0, last_accessed
+        else:
+            score, seen, at = previous
+
+        new_accesses = count - seen
+        if new_accesses < 0:
+            # Counter was reset; start over
+            score, new_accesses, at = 0.0, count, last_accessed
+        if new_accesses:
+            score = score * self._decay((last_accessed - at).total_seconds()) + new_accesses
+            at = last_accessed
+        self._state[data_id] = (score, count, at)
+        return score * self._decay((now - at).total_seconds())
+
+    def forget(self, data_ids: Iterable[str]) -> None:
+        """Drop the state of items that no longer exist."""
+        for data_id in data_ids:
+            self._state.pop(data_id, None)
+
+
+POLICIES = {
+    "lru": LRUPolicy,
+    "lfu": LFUPolicy,
+    "decayed": DecayedFrequencyPolicy,
+}
+
+
+def get_policy(policy: Any) -> Any:
+    """Resolve a policy name to an instance, passing instances through."""
+    if isinstance(policy, str):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown tiering policy: {policy}. Must be one of {list(POLICIES)}")
+        return POLICIES[policy]()
+    return policy
+
+
+def plan_placement(
+    items: Sequence[Dict[str, Any]],
+    policy: Any,
+    budgets: Dict[str, TierBudget],
+    now: datetime,
+    tiers: Sequence[str] = DEFAULT_MANAGED_TIERS
+) -> List[TierMove]:
+    """Plan the moves that place the hottest items in the fastest tiers.
+
+    Items are ranked by ``policy.score`` and assigned greedily to the fastest
+    tier that still has room in its byte and item budget. The slowest tier is
+    never limited, so every item has a place. Items in tiers outside
+    ``tiers`` are left alone.
+
+    Args:
+        items: Catalog entries with data_id, primary_tier, size,
+            access_count and last_accessed
+        policy: Scoring policy (higher score is hotter)
+        budgets: Capacity per tier; tiers without a budget are unlimited
+        now: Current time
+        tiers: Managed tiers, fastest first
+
+    Returns:
+        List[TierMove]: Demotions first (they free capacity), then promotions
+    """
+    tiers = sorted(tiers, key=TIERS.index)
+    managed = [item for item in items if item.get('primary_tier') in tiers]
+    ranked = sorted(managed, key=lambda item: policy.score(item, now), reverse=True)
+
+    used_bytes = {tier: 0 for tier in tiers}
+    used_items = {tier: 0 for tier in tiers}
+    demotions, promotions = [], []
+    for item in ranked:
+        size = item.get('size') or 0
+        target = tiers[-1]
+        for tier in tiers[:-1]:
+            budget = budgets.get(tier)
+            if budget is None:
+                target = tier
+                break
+            if budget.max_items is not None and used_items[tier] + 1 > budget.max_items:
+                continue
+            if budget.max_bytes is not None and used_bytes[tier] + size > budget.max_bytes:
+                continue
+            target = tier
+            break
+        used_items[target] += 1
+        used_bytes[target] += size
+
+        if target != item['primary_tier']:
+            move = TierMove(item['data_id'], item['primary_tier'], target, size)
+            (promotions if move.is_promotion else demotions).append(move)
+
+    return demotions + promotions
+
+
+class TieringDaemon:
+    """Background task that keeps catalog items in the tiers their access
+    statistics call for.
+
+    Each run reads the access statistics from the catalog, plans the
+    placement under the tier budgets and applies up to ``max_moves`` moves,
+    ``concurrency`` at a time. Successful moves are written back to the
+    catalog in one batched update.
+    """
+
+    def __init__(
+        self,
+        catalog: Any,
+        mover: Callable[[str, str, str], Awaitable[bool]],
+        budgets: Dict[str, TierBudget],
+        policy: Any = "decayed",
+        tiers: Sequence[str] = DEFAULT_MANAGED_TIERS,
+        interval: float = 60.0,
+        max_moves: int = 1000,
+        concurrency: int = 8,
+        clock: Callable[[], datetime] = datetime.now
+    ):
+        """Initialize the daemon.
+
+        Args:
+            catalog: MemoryCatalog providing get_access_stats and update_tiers
+            mover: Coroutine function moving one item: (data_id, source, target) -> bool
+            budgets: Capacity per tier
+            policy: Policy name ("lru", "lfu", "decayed") or instance
+            tiers: Managed tiers
+            interval: Seconds between background runs
+            max_moves: Maximum number of moves applied per run
+            concurrency: Maximum number of moves in flight
+            clock: Callable returning the current time
+        """
+        unknown = [tier for tier in tiers if tier not in TIERS]
+        if unknown:
+            raise ValueError(f"Unknown memory tiers: {unknown}")
+        self.catalog = catalog
+        self.mover = mover
+        self.budgets = budgets
+        self.policy = get_policy(policy)
+        self.tiers = tuple(tiers)
+        self.interval = interval
+        self.max_moves = max_moves
+        self.concurrency = concurrency
+        self.clock = clock
+        self._task: Optional[asyncio.Task] = None
+
+    async def _apply(self, move: TierMove, semaphore: asyncio.Semaphore) -> bool:
+        async with semaphore:
+            try:
+                return bool(await self.mover(move.data_id, move.source, move.target))
+            except Exception as e:
+                logger.error(f"Failed to move {move.data_id} from {move.source} to {move.target}: {e}")
+                return False
+
+    async def run_once(self) -> Dict[str, Any]:
+        """Plan and apply one round of promotions and demotions.
+
+        Returns:
+            Dict[str, Any]: Counts of planned, promoted, demoted and failed moves
+        """
+        items = await self.catalog.get_access_stats(self.tiers)
+        moves = plan_placement(items, self.policy, self.budgets, self.clock(), self.tiers)
+        planned = len(moves)
+        moves = moves[:self.max_moves]
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results = await asyncio.gather(*(self._apply(move, semaphore) for move in moves))
+        done = [move for move, ok in zip(moves, results) if ok]
+        if done:
+            await self.catalog.update_tiers({move.data_id: move.target for move in done})
+
+        report = {
+            'planned': planned,
+            'promoted': sum(1 for move in done if move.is_promotion),
+            'demoted': sum(1 for move in done if not move.is_promotion),
+            'failed': len(moves) - len(done)
+        }
+        logger.info(f"Tiering run: {report}")
+        return report
+
+    async def _run_forever(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error(f"Tiering run failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> asyncio.Task:
+        """Start the background task on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run_forever())
+        return self._task
+
+    async def stop(self) -> None:
+        """Stop the background task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+
+def zipfian_trace(n_items: int, n_accesses: int, s: float = 1.1, seed: int = 0) -> np.ndarray:
+    """Generate a synthetic access trace with Zipf-distributed popularity.
+
+    Item ``i`` is accessed with probability proportional to ``1 / (i + 1) ** s``;
+    the ranks are shuffled so popularity is unrelated to item id.
+
+    Args:
+        n_items: Number of distinct items
+        n_accesses: Length of the trace
+        s: Skew of the distribution
+        seed: Random seed
+
+    Returns:
+        np.ndarray: Item indices, one per access
+    """
+    rng = np.random.default_rng(seed)
+    weights = 1.0 / np.arange(1, n_items + 1) ** s
+    ranks = rng.choice(n_items, size=n_accesses, p=weights / weights.sum())
+    return rng.permutation(n_items)[ranks]
+
+
+def simulate_access_trace(
+    trace: Sequence[int],
+    sizes: Sequence[int],
+    budgets: Dict[str, TierBudget],
+    policy: Any = "decayed",
+    tiers: Sequence[str] = DEFAULT_MANAGED_TIERS,
+    run_every: int = 1000,
+    seconds_per_access: float = 0.01,
+    clock: Optional[SimulatedClock] = None
+) -> Dict[str, Any]:
+    """Replay an access trace against the placement planner.
+
+    All items start in the slowest tier. Every access is counted as a hit in
+    the tier the item is in at that moment and advances the clock by
+    ``seconds_per_access``; every ``run_every`` accesses the plan is
+    recomputed and applied instantly, as one daemon run would.
+
+    Args:
+        trace: Item indices, one per access
+        sizes: Size in bytes of each item
+        budgets: Capacity per tier
+        policy: Policy name or instance
+        tiers: Managed tiers, fastest first
+        run_every: Accesses between placement runs
+        seconds_per_access: Simulated time per access
+        clock: Clock to advance; a fresh SimulatedClock by default
+
+    Returns:
+        Dict[str, Any]: ``hit_rate`` (fraction of accesses per tier), ``hits``,
+        ``moves`` and the final ``placement`` count per tier
+    """
+    policy = get_policy(policy)
+    clock = clock or SimulatedClock()
+    tiers = sorted(tiers, key=TIERS.index)
+    items = [
+        {'data_id': str(i), 'primary_tier': tiers[-1], 'size': int(size),
+         'access_count': 0, 'last_accessed': None, 'created_at': clock()}
+        for i, size in enumerate(sizes)
+    ]
+
+    hits = {tier: 0 for tier in tiers}
+    moves = 0
+    for n, index in enumerate(trace, 1):
+        item = items[index]
+        hits[item['primary_tier']] += 1
+        item['access_count'] += 1
+        item['last_accessed'] = clock.advance(seconds_per_access)
+
+        if n % run_every == 0:
+            for move in plan_placement(items, policy, budgets, clock(), tiers):
+                items[int(move.data_id)]['primary_tier'] = move.target
+                moves += 1
+
+    total = max(len(trace), 1)
+    placement = {tier: 0 for tier in tiers}
+    for item in items:
+        placement[item['primary_tier']] += 1
+    return {
+        'hit_rate': {tier: count / total for tier, count in hits.items()},
+        'hits': hits,
+        'moves': moves,
+        'placement': placement
+    }
@@ -12,6 +12,8 @@ import uuid
 import numpy as np
 import os
 
+from memories.core.warm_store import PartitionedWarmStore
+
 # Remove direct import to avoid circular dependency
 # from memories.core.memory_manager import MemoryManager
 
@@ -20,14 +22,33 @@ logger = logging.getLogger(__name__)
 class WarmMemory:
     """Warm memory layer using DuckDB for storage."""
     
-    def __init__(self, storage_path: str = None):
+    def __init__(
+        self,
+        storage_path: str = None,
+        storage_mode: str = "per_item",
+        partition_by: str = "date",
+        indexed_metadata: Optional[Union[List[str], Dict[str, str]]] = None
+    ):
         """Initialize warm memory.
         
         Args:
             storage_path: Optional path to store DuckDB files
+            storage_mode: "per_item" creates a table per stored item;
+                "partitioned" appends items to shared, schema-grouped tables
+                (see :class:`memories.core.warm_store.PartitionedWarmStore`)
+            partition_by: Partitioning of the partitioned store, "date" or "tag"
+            indexed_metadata: Metadata keys the partitioned store keeps as
+                indexed columns, as a list or a dict of key -> DuckDB type
         """
         self.logger = logging.getLogger(__name__)
         
+        if storage_mode not in ("per_item", "partitioned"):
+            raise ValueError(f"Invalid storage_mode: {storage_mode}. Must be 'per_item' or 'partitioned'")
+        self.storage_mode = storage_mode
+        self.partition_by = partition_by
+        self.indexed_metadata = indexed_metadata
+        self._stores: Dict[Optional[str], PartitionedWarmStore] = {}
+        
         # Lazy import to avoid circular dependency
         from memories.core.memory_manager import MemoryManager
         self.memory_manager = MemoryManager()
@@ -136,6 +157,25 @@ class WarmMemory:
             self.logger.error(f"Error initializing tables for warm storage: {e}")
             raise
 
+    def _partitioned_store(self, db_name: Optional[str] = None) -> PartitionedWarmStore:
+        """Get the partitioned store for a database, creating its tables on first use.
+        
+        Args:
+            db_name: Optional name of the database file (without .duckdb extension)
+            
+        Returns:
+            PartitionedWarmStore: The store on that database's connection
+        """
+        store = self._stores.get(db_name)
+        if store is None:
+            store = PartitionedWarmStore(
+                self.get_connection(db_name),
+                partition_by=self.partition_by,
+                indexed_metadata=self.indexed_metadata
+            )
+            self._stores[db_name] = store
+        return store
+
     async def store(
         self,
         data: Any,
@@ -152,6 +192,7 @@ class WarmMemory:
             tags: Optional tags for categorizing the data
             db_name: Optional name of the database file to store in (without .duckdb extension)
             table_name: Optional name for the table to create. If None, a name will be generated.
+                Ignored in partitioned mode, where the schema group picks the table.
             
         Returns:
             Dict containing success status and table information:
@@ -160,6 +201,14 @@ class WarmMemory:
                 - table_name: The name of the table where data is stored
         """
         try:
+            if self.storage_mode == "partitioned":
+                data_id, group_table = self._partitioned_store(db_name).store(data, metadata, tags)
+                return {
+                    "success": True,
+                    "data_id": data_id,
+                    "table_name": group_table
+                }
+                
             # Get connection
             con = self.get_connection(db_name)
             
@@ -234,6 +283,38 @@ class WarmMemory:
                 "table_name": None
             }
 
+    async def store_many(
+        self,
+        items: List[Dict[str, Any]],
+        db_name: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Store many items in warm memory.
+
+        In partitioned mode all items are written with one bulk insert per
+        table; in per_item mode each item is stored as by ``store``.
+
+        Args:
+            items: Items to store, each a dict with a ``data`` key and optional
+                ``metadata`` and ``tags`` keys
+            db_name: Optional name of the database file to store in (without .duckdb extension)
+
+        Returns:
+            List of results in the format returned by ``store``, empty on failure
+        """
+        if self.storage_mode != "partitioned":
+            return [
+                await self.store(item.get('data'), item.get('metadata'), item.get('tags'), db_name=db_name)
+                for item in items
+            ]
+        try:
+            return [
+                {"success": True, "data_id": data_id, "table_name": group_table}
+                for data_id, group_table in self._partitioned_store(db_name).store_many(items)
+            ]
+        except Exception as e:
+            self.logger.error(f"Error storing in warm storage: {e}")
+            return []
+
     async def retrieve(
         self,
         query: Optional[Dict[str, Any]] = None,
@@ -253,6 +334,10 @@ class WarmMemory:
             Retrieved data or None if not found
         """
         try:
+            if self.storage_mode == "partitioned" and not table_name:
+                results = self._partitioned_store(db_name).retrieve(query, tags)
+                return results[0] if len(results) == 1 else results if results else None
+                
             # Get connection
             con = self.get_connection(db_name)
             
@@ -341,7 +426,7 @@ class WarmMemory:
                 stored_at = row[4]  # stored_at column
                 
                 # Parse JSON
-                data = json.loads(data_json)
+                data = json.loads(data_json) if data_json is not None else None
                 metadata = json.loads(metadata_json)
                 tags = json.loads(tags_json)
                 
@@ -365,6 +450,8 @@ class WarmMemory:
             # Delete all data from tables
             self.con.execute("DELETE FROM warm_tags")
             self.con.execute("DELETE FROM warm_data")
+            if None in self._stores:
+                self._stores[None].clear()
             self.logger.info("Cleared warm memory")
         except Exception as e:
             self.logger.error(f"Failed to clear warm memory: {e}")
@@ -396,6 +483,11 @@ class WarmMemory:
             Dictionary containing schema information or None if not found
         """
         try:
+            if self.storage_mode == "partitioned":
+                schema = self._partitioned_store().get_schema(data_id)
+                if schema is not None:
+                    return schema
+                    
             # Get data by ID
             result = self.con.execute("""
                 SELECT data, metadata FROM warm_data
@@ -489,30 +581,93 @@ class WarmMemory:
         
         return con
 
+    def _record_import(
+        self,
+        con: duckdb.DuckDBPyConnection,
+        data_id: str,
+        table_name: str,
+        source: str,
+        mode: str,
+        metadata: Optional[Dict[str, Any]],
+        tags: Optional[List[str]]
+    ) -> Dict[str, Any]:
+        """Record a reference to an imported table in warm_data.
+        
+        Only the table name, row count and schema are stored; the rows stay
+        in the table (or in the source file for views) instead of being
+        copied into warm_data as JSON.
+        
+        Args:
+            con: Connection holding the table
+            data_id: ID of the imported data
+            table_name: Name of the table or view holding the data
+            source: Path of the imported file
+            mode: "table" or "view"
+            metadata: Optional metadata about the data
+            tags: Optional tags for categorizing the data
+            
+        Returns:
+            Dict[str, Any]: The stored reference
+        """
+        schema = con.execute(f'DESCRIBE "{table_name}"').fetchall()
+        reference = {
+            "table_name": table_name,
+            "mode": mode,
+            "source": source,
+            "row_count": con.execute(f'SELECT COUNT(*) FROM "{table_name}"').fetchone()[0],
+            "schema": {column[0]: column[1] for column in schema}
+        }
+        
+        con.execute("""
+            INSERT INTO warm_data (id, data, metadata, tags, stored_at)
+            VALUES (?, ?, ?, ?, ?)
+        """, [data_id, json.dumps(reference), json.dumps(metadata or {}), json.dumps(tags or []), datetime.now()])
+        
+        # Store tags for indexing
+        if tags:
+            con.executemany("""
+                INSERT INTO warm_tags (tag, data_id)
+                VALUES (?, ?)
+            """, [[tag, data_id] for tag in dict.fromkeys(tags)])
+        
+        return reference
+
     async def import_from_parquet(
         self,
         parquet_file: str,
         metadata: Optional[Dict[str, Any]] = None,
         tags: Optional[List[str]] = None,
         db_name: Optional[str] = None,
-        table_name: Optional[str] = None
+        table_name: Optional[str] = None,
+        mode: str = "table"
     ) -> Dict[str, Any]:
         """Import data from a parquet file into warm memory.
         
+        With mode="table" the rows are copied into a DuckDB table. With
+        mode="view" a view over the parquet file is created instead, so
+        nothing is copied and queries read the file directly; the file must
+        stay in place. Either way warm_data only records a reference
+        (table name, row count and schema), not the rows.
+        
         Args:
             parquet_file: Path to the parquet file
             metadata: Optional metadata about the data
             tags: Optional tags for categorizing the data
             db_name: Optional name of the database file to store in (without .duckdb extension)
             table_name: Optional name for the table to create. If None, a name will be generated.
+            mode: "table" to copy the rows, "view" to query the file in place
             
         Returns:
             Dict containing success status and table information:
                 - success: True if import was successful, False otherwise
                 - data_id: The unique ID of the stored data
-                - table_name: The name of the table where data is stored
+                - table_name: The name of the table (or view) where data is stored
+                - row_count: Number of imported rows
         """
         try:
+            if mode not in ("table", "view"):
+                raise ValueError(f"Invalid import mode: {mode}. Must be 'table' or 'view'")
+                
             # Get connection
             con = self.get_connection(db_name)
             
@@ -528,50 +683,27 @@ class WarmMemory:
             # Sanitize table name (remove special characters)
             table_name = ''.join(c if c.isalnum() or c == '_' else '_' for c in table_name)
             
-            # Create a new table from the parquet file
+            # Views keep referring to the file, so resolve it to an absolute path
+            source = os.path.abspath(parquet_file) if mode == "view" else parquet_file
+            source_sql = source.replace("'", "''")
+            
+            # Create a table (or view) from the parquet file
             con.execute(f"""
-                CREATE TABLE {table_name} AS 
-                SELECT * FROM read_parquet('{parquet_file}')
+                CREATE {'VIEW' if mode == 'view' else 'TABLE'} {table_name} AS 
+                SELECT * FROM read_parquet('{source_sql}')
             """)
             
-            # Get the data as JSON for storage in warm_data
-            data_result = con.execute(f"SELECT * FROM {table_name}").fetchall()
-            column_names = [desc[0] for desc in con.description]
-            
-            # Convert to list of dictionaries
-            data_list = []
-            for row in data_result:
-                data_list.append(dict(zip(column_names, row)))
+            reference = self._record_import(con, data_id, table_name, source, mode, metadata, tags)
             
-            # Convert to JSON
-            data_json = json.dumps(data_list)
-            
-            # Convert metadata to JSON
-            metadata_json = json.dumps(metadata or {})
-            
-            # Convert tags to JSON
-            tags_json = json.dumps(tags or [])
-            
-            # Store metadata in warm_data for backward compatibility
-            con.execute("""
-                INSERT INTO warm_data (id, data, metadata, tags, stored_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, [data_id, data_json, metadata_json, tags_json, datetime.now()])
-            
-            # Store tags for indexing
-            if tags:
-                for tag in tags:
-                    con.execute("""
-                        INSERT INTO warm_tags (tag, data_id)
-                        VALUES (?, ?)
-                    """, [tag, data_id])
-            
-            self.logger.info(f"Imported parquet file {parquet_file} to table {table_name}")
+            self.logger.info(
+                f"Imported parquet file {parquet_file} as {mode} {table_name} ({reference['row_count']} rows)"
+            )
             
             return {
                 "success": True,
                 "data_id": data_id,
-                "table_name": table_name
+                "table_name": table_name,
+                "row_count": reference["row_count"]
             }
             
         except Exception as e:
@@ -736,6 +868,7 @@ class WarmMemory:
                 - success: True if import was successful, False otherwise
                 - data_id: The unique ID of the stored data
                 - table_name: The name of the table where data is stored
+                - row_count: Number of imported rows
         """
         try:
             # Get connection
@@ -759,44 +892,15 @@ class WarmMemory:
                 SELECT * FROM read_csv_auto('{csv_file}')
             """)
             
-            # Get the data as JSON for storage in warm_data
-            data_result = con.execute(f"SELECT * FROM {table_name}").fetchall()
-            column_names = [desc[0] for desc in con.description]
-            
-            # Convert to list of dictionaries
-            data_list = []
-            for row in data_result:
-                data_list.append(dict(zip(column_names, row)))
-            
-            # Convert to JSON
-            data_json = json.dumps(data_list)
-            
-            # Convert metadata to JSON
-            metadata_json = json.dumps(metadata or {})
-            
-            # Convert tags to JSON
-            tags_json = json.dumps(tags or [])
-            
-            # Store metadata in warm_data for backward compatibility
-            con.execute("""
-                INSERT INTO warm_data (id, data, metadata, tags, stored_at)
-                VALUES (?, ?, ?, ?, ?)
-            """, [data_id, data_json, metadata_json, tags_json, datetime.now()])
-            
-            # Store tags for indexing
-            if tags:
-                for tag in tags:
-                    con.execute("""
-                        INSERT INTO warm_tags (tag, data_id)
-                        VALUES (?, ?)
-                    """, [tag, data_id])
+            reference = self._record_import(con, data_id, table_name, csv_file, "table", metadata, tags)
             
             self.logger.info(f"Imported CSV file {csv_file} to table {table_name}")
             
             return {
                 "success": True,
                 "data_id": data_id,
-                "table_name": table_name
+                "table_name": table_name,
+                "row_count": reference["row_count"]
             }
             
         except Exception as e:
@@ -810,20 +914,26 @@ class WarmMemory:
     async def delete(self, table_name: str) -> bool:
         """Delete data from warm memory by dropping the table.
         
+        In partitioned mode an item ID deletes that item from the shared tables.
+        
         Args:
-            table_name: Name of the table to delete
+            table_name: Name of the table to delete, or an item ID in partitioned mode
             
         Returns:
             bool: True if deletion was successful, False otherwise
         """
         try:
+            if self.storage_mode == "partitioned" and self._partitioned_store().delete(table_name):
+                self.logger.info(f"Item {table_name} deleted")
+                return True
+                
             # Get connection
             con = self.get_connection()
             
-            # Check if table exists
+            # Check if table exists (imports in view mode are views)
             table_exists = con.execute(f"""
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name='{table_name}'
+                SELECT type FROM sqlite_master 
+                WHERE type IN ('table', 'view') AND name='{table_name}'
             """).fetchone()
             
             if not table_exists:
@@ -831,7 +941,7 @@ class WarmMemory:
                 return False
             
             # Drop the table
-            con.execute(f"DROP TABLE IF EXISTS {table_name}")
+            con.execute(f"DROP {'VIEW' if table_exists[0] == 'view' else 'TABLE'} IF EXISTS {table_name}")
             self.logger.info(f"Table {table_name} dropped")
             return True
         except Exception as e:
@@ -0,0 +1,516 @@
+"""
+Partitioned storage for warm memory items.
+
+Instead of one DuckDB table per stored item, items are appended to a small
+number of shared tables:
+
+- ``warm_items`` holds one row per item: id, schema group, partition key,
+  timestamp, metadata and tags, plus a typed, indexed column for each
+  commonly filtered metadata key.
+- ``warm_group_<hash>`` tables hold the item payloads. Dict items with the
+  same keys and value types share one typed table; everything else goes to
+  ``warm_group_json`` as a JSON column.
+- ``warm_item_tags`` maps tags to items.
+
+Every statement is prepared with parameters; identifiers only come from the
+validated group registry and the configured metadata keys.
+"""
+
+import hashlib
+import json
+import logging
+import uuid
+import zlib
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+JSON_GROUP = "warm_group_json"
+ITEM_ID_COLUMN = "_item_id"
+
+# Python type -> DuckDB column type for typed schema groups
+BIGINT_RANGE = (-2**63, 2**63 - 1)
+_COLUMN_TYPES = (
+    (bool, "BOOLEAN"),
+    (int, "BIGINT"),
+    (float, "DOUBLE"),
+    (str, "VARCHAR"),
+)
+
+
+def quote_identifier(name: str) -> str:
+    """Quote an identifier for use in DuckDB SQL."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _column_type(value: Any) -> Optional[str]:
+    for python_type, sql_type in _COLUMN_TYPES:
+        if type(value) is python_type:
+            if python_type is int and not BIGINT_RANGE[0] <= value <= BIGINT_RANGE[1]:
+                return None
+            return sql_type
+    return None
+
+
+def _to_jsonable(data: Any) -> Any:
+    """Convert numpy and pandas values the way WarmMemory.store always has."""
+    if isinstance(data, (np.ndarray, np.generic)):
+        return data.tolist()
+    if hasattr(data, 'to_dict'):
+        return data.to_dict()
+    return data
+
+
+class PartitionedWarmStore:
+    """Append-only warm storage in schema-grouped tables on one connection."""
+
+    # Above this many IDs, payloads are fetched with a list parameter
+    IN_LIST_LIMIT = 256
+
+    def __init__(
+        self,
+        con: duckdb.DuckDBPyConnection,
+        partition_by: str = "date",
+        tag_partitions: int = 16,
+        indexed_metadata: Optional[Union[List[str], Dict[str, str]]] = None
+    ):
+        """Initialize the store and create its tables if needed.
+
+        Args:
+            con: DuckDB connection to store items in
+            partition_by: "date" (day the item was stored) or "tag" (hash of
+                the item's first tag into ``tag_partitions`` buckets)
+            tag_partitions: Number of buckets for tag partitioning
+            indexed_metadata: Metadata keys to materialize as indexed columns,
+                as a list (VARCHAR columns) or a dict of key -> DuckDB type
+        """
+        if partition_by not in ("date", "tag"):
+            raise ValueError(f"Invalid partition_by: {partition_by}. Must be 'date' or 'tag'")
+        self.con = con
+        self.partition_by = partition_by
+        self.tag_partitions = tag_partitions
+        if isinstance(indexed_metadata, dict):
+            self.indexed_metadata = dict(indexed_metadata)
+        else:
+            self.indexed_metadata = {key: "VARCHAR" for key in (indexed_metadata or [])}
+        self._groups: Dict[str, Dict[str, str]] = {}
+        self._init_tables()
+
+    @staticmethod
+    def _meta_column(key: str) -> str:
+        return quote_identifier(f"meta_{key}")
+
+    def _init_tables(self) -> None:
+        """Create the shared tables, metadata columns and indexes."""
+        self.con.execute("""
+            CREATE TABLE IF NOT EXISTS warm_items (
+                id VARCHAR PRIMARY KEY,
+                schema_group VARCHAR NOT NULL,
+                partition_key VARCHAR NOT NULL,
+                stored_at TIMESTAMP NOT NULL,
+                metadata JSON,
+                tags JSON
+            )
+        """)
+        self.con.execute("""
+            CREATE TABLE IF NOT EXISTS warm_item_tags (
+                tag VARCHAR NOT NULL,
+                item_id VARCHAR NOT NULL
+            )
+        """)
+        self.con.execute("""
+            CREATE TABLE IF NOT EXISTS warm_groups (
+                name VARCHAR PRIMARY KEY,
+                columns JSON
+            )
+        """)
+        self.con.execute("CREATE INDEX IF NOT EXISTS idx_warm_items_partition ON warm_items (partition_key)")
+        self.con.execute("CREATE INDEX IF NOT EXISTS idx_warm_item_tags_tag ON warm_item_tags (tag)")
+
+        for key, sql_type in self.indexed_metadata.items():
+            column = self._meta_column(key)
+            self.con.execute(f"ALTER TABLE warm_items ADD COLUMN IF NOT EXISTS {column} {sql_type}")
+            index = f"idx_warm_items_meta_{hashlib.sha1(key.encode()).hexdigest()[:12]}"
+            self.con.execute(f"CREATE INDEX IF NOT EXISTS {index} ON warm_items ({column})")
+
+        self._groups = {
+            name: json.loads(columns)
+            for name, columns in self.con.execute("SELECT name, columns FROM warm_groups").fetchall()
+        }
+        self._ensure_group(JSON_GROUP, {"data": "JSON"})
+
+    def _ensure_group(self, name: str, columns: Dict[str, str]) -> None:
+        """Create a payload table for a schema group if it does not exist yet."""
+        if name in self._groups:
+            return
+        definitions = ", ".join(
+            f"{quote_identifier(column)} {sql_type}" for column, sql_type in columns.items()
+        )
+        self.con.execute(f"""
+            CREATE TABLE IF NOT EXISTS {quote_identifier(name)} (
+                {ITEM_ID_COLUMN} VARCHAR PRIMARY KEY,
+                {definitions}
+            )
+        """)
+        self.con.execute(
+            "INSERT INTO warm_groups (name, columns) VALUES (?, ?) ON CONFLICT DO NOTHING",
+            [name, json.dumps(columns)]
+        )
+        self._groups[name] = columns
+
+    def _schema_group(self, data: Any) -> Tuple[str, Dict[str, str]]:
+        """Choose the schema group for an item.
+
+        Dicts with the same keys and value types share a group regardless of
+        key order. Items DuckDB cannot store as typed columns fall back to the
+        JSON group: keys that collide case-insensitively (DuckDB column names
+        are case-insensitive), empty keys and ints outside BIGINT.
+
+        Returns:
+            Tuple of group name and its columns (name -> type)
+        """
+        if isinstance(data, dict) and data:
+            columns = {}
+            seen = {ITEM_ID_COLUMN}
+            for key, value in data.items():
+                sql_type = _column_type(value)
+                if not isinstance(key, str) or not key or key.lower() in seen or sql_type is None:
+                    break
+                seen.add(key.lower())
+                columns[key] = sql_type
+            else:
+                signature = json.dumps(sorted(columns.items()))
+                name = f"warm_group_{hashlib.sha1(signature.encode()).hexdigest()[:12]}"
+                return name, columns
+        return JSON_GROUP, {"data": "JSON"}
+
+    def _partition_key(self, stored_at: datetime, tags: Optional[List[str]]) -> str:
+        if self.partition_by == "date":
+            return stored_at.strftime('%Y-%m-%d')
+        if not tags:
+            return "untagged"
+        return str(zlib.crc32(str(tags[0]).encode()) % self.tag_partitions)
+
+    def store(
+        self,
+        data: Any,
+        metadata: Optional[Dict[str, Any]] = None,
+        tags: Optional[List[str]] = None
+    ) -> Tuple[str, str]:
+        """Append an item.
+
+        Args:
+            data: Data to store
+            metadata: Optional metadata about the data
+            tags: Optional tags for categorizing the data
+
+        Returns:
+            Tuple[str, str]: The item ID and the table holding its payload
+        """
+        data = _to_jsonable(data)
+        metadata = metadata or {}
+        tags = list(dict.fromkeys(tags or []))
+        data_id = str(uuid.uuid4())
+        stored_at = datetime.now()
+        group, columns = self._schema_group(data)
+        self._ensure_group(group, columns)
+        if group == JSON_GROUP:
+            values = [json.dumps(data)]
+        else:
+            values = [data[column] for column in self._groups[group]]
+
+        item_columns = ["id", "schema_group", "partition_key", "stored_at", "metadata", "tags"]
+        item_values = [
+            data_id, group, self._partition_key(stored_at, tags), stored_at,
+            json.dumps(metadata), json.dumps(tags)
+        ]
+        for key in self.indexed_metadata:
+            item_columns.append(self._meta_column(key))
+            item_values.append(metadata.get(key))
+
+        self.con.execute("BEGIN TRANSACTION")
+        try:
+            self.con.execute(
+                f"INSERT INTO warm_items ({', '.join(item_columns)}) "
+                f"VALUES ({', '.join(['?'] * len(item_values))})",
+                item_values
+            )
+            self.con.execute(
+                f"INSERT INTO {quote_identifier(group)} VALUES ({', '.join(['?'] * (len(values) + 1))})",
+                [data_id] + values
+            )
+            if tags:
+                self.con.executemany(
+                    "INSERT INTO warm_item_tags (tag, item_id) VALUES (?, ?)",
+                    [[tag, data_id] for tag in tags]
+                )
+            self.con.execute("COMMIT")
+        except Exception:
+            self.con.execute("ROLLBACK")
+            raise
+        return data_id, group
+
+    def store_many(self, items: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+        """Append many items with one bulk insert per table.
+
+        Rows are collected per table as pandas frames, registered with
+        DuckDB and written with ``INSERT INTO ... SELECT`` inside one
+        transaction, avoiding per-row statement overhead.
+
+        Args:
+            items: Items to store, each a dict with a ``data`` key and optional
+                ``metadata`` and ``tags`` keys
+
+        Returns:
+            List of (item ID, payload table) pairs in input order
+        """
+        if not items:
+            return []
+        stored_at = datetime.now()
+        item_rows = {c: [] for c in ("id", "schema_group", "partition_key", "stored_at", "metadata", "tags")}
+        meta_rows = {key: [] for key in self.indexed_metadata}
+        group_rows: Dict[str, Dict[str, List[Any]]] = {}
+        tag_rows = {"tag": [], "item_id": []}
+        stored = []
+
+        for item in items:
+            data = _to_jsonable(item.get('data'))
+            metadata = item.get('metadata') or {}
+            tags = list(dict.fromkeys(item.get('tags') or []))
+            data_id = str(uuid.uuid4())
+            group, columns = self._schema_group(data)
+            self._ensure_group(group, columns)
+
+            rows = group_rows.setdefault(
+                group, {ITEM_ID_COLUMN: [], **{c: [] for c in self._groups[group]}}
+            )
+            rows[ITEM_ID_COLUMN].append(data_id)
+            if group == JSON_GROUP:
+                rows["data"].append(json.dumps(data))
+            else:
+                for column in self._groups[group]:
+                    rows[column].append(data[column])
+
+            for column, value in (
+                ("id", data_id), ("schema_group", group),
+                ("partition_key", self._partition_key(stored_at, tags)), ("stored_at", stored_at),
+                ("metadata", json.dumps(metadata)), ("tags", json.dumps(tags))
+            ):
+                item_rows[column].append(value)
+            for key in self.indexed_metadata:
+                meta_rows[key].append(metadata.get(key))
+            tag_rows["tag"].extend(tags)
+            tag_rows["item_id"].extend([data_id] * len(tags))
+            stored.append((data_id, group))
+
+        item_frame = pd.DataFrame(item_rows)
+        item_columns = list(item_rows)
+        for i, key in enumerate(self.indexed_metadata):
+            item_frame[f"meta_{i}"] = pd.Series(meta_rows[key], dtype=object)
+            item_columns.append(self._meta_column(key))
+        frames = {
+            "warm_items_batch": ("warm_items", item_columns, item_frame),
+            "warm_item_tags_batch": ("warm_item_tags", ["tag", "item_id"], pd.DataFrame(tag_rows, dtype=object)),
+        }
+        for i, (group, rows) in enumerate(group_rows.items()):
+            frame = pd.DataFrame({f"c{j}": values for j, values in enumerate(rows.values())})
+            frames[f"warm_group_batch_{i}"] = (group, [quote_identifier(c) for c in rows], frame)
+
+        for name, (_, _, frame) in frames.items():
+            self.con.register(name, frame)
+        try:
+            self.con.execute("BEGIN TRANSACTION")
+            try:
+                for name, (table, columns, frame) in frames.items():
+                    if len(frame):
+                        self.con.execute(
+                            f"INSERT INTO {quote_identifier(table)} ({', '.join(columns)}) "
+                            f"SELECT * FROM {name}"
+                        )
+                self.con.execute("COMMIT")
+            except Exception:
+                self.con.execute("ROLLBACK")
+                raise
+        finally:
+            for name in frames:
+                self.con.unregister(name)
+        return stored
+
+    def _json_condition(self, column: str, key: str, value: Any, params: List[Any]) -> str:
+        """Condition on a key inside a JSON column, matching WarmMemory's JSON queries."""
+        params.extend([f"$.{key}", value])
+        if isinstance(value, str):
+            return f"json_extract_string({column}, ?) = ?"
+        return f"json_extract({column}, ?) = ?"
+
+    def retrieve(
+        self,
+        query: Optional[Dict[str, Any]] = None,
+        tags: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Find items by ID, metadata, data values, partition and tags.
+
+        Args:
+            query: Optional dict with any of "id", "partition", "metadata"
+                (key -> value) and "data" (key -> value); all must match
+            tags: Optional tags; items with any of them match
+
+        Returns:
+            List of items (data, metadata, tags, stored_at), newest first
+        """
+        query = query or {}
+        item_conditions, item_params = [], []
+        if 'id' in query:
+            item_conditions.append("i.id = ?")
+            item_params.append(query['id'])
+        if 'partition' in query:
+            item_conditions.append("i.partition_key = ?")
+            item_params.append(str(query['partition']))
+        for key, value in query.get('metadata', {}).items():
+            if key in self.indexed_metadata:
+                item_conditions.append(f"i.{self._meta_column(key)} = ?")
+                item_params.append(value)
+            else:
+                item_conditions.append(self._json_condition("i.metadata", key, value, item_params))
+        if tags:
+            item_conditions.append(
+                f"i.id IN (SELECT item_id FROM warm_item_tags WHERE tag IN ({', '.join(['?'] * len(tags))}))"
+            )
+            item_params.extend(tags)
+
+        data_filters = query.get('data', {})
+        if data_filters:
+            groups = {}
+            for group, columns in self._groups.items():
+                if group == JSON_GROUP or all(key in columns for key in data_filters):
+                    groups[group] = self._matching_ids(group, data_filters, item_conditions, item_params)
+        else:
+            # Resolve ids through the warm_items indexes, then fetch payloads
+            conditions = ' AND '.join(item_conditions) or 'TRUE'
+            groups = {}
+            for data_id, group in self.con.execute(
+                f"SELECT i.id, i.schema_group FROM warm_items i WHERE {conditions}", item_params
+            ).fetchall():
+                groups.setdefault(group, []).append(data_id)
+
+        results = []
+        for group, ids in groups.items():
+            if ids:
+                results.extend(self._fetch(group, ids))
+        results.sort(key=lambda item: item["stored_at"], reverse=True)
+        for item in results:
+            item["stored_at"] = item["stored_at"].isoformat()
+        return results
+
+    def _matching_ids(
+        self,
+        group: str,
+        data_filters: Dict[str, Any],
+        item_conditions: List[str],
+        item_params: List[Any]
+    ) -> List[str]:
+        """IDs of the items in a group whose payload and item row both match."""
+        conditions, params = ["i.schema_group = ?"] + item_conditions, [group] + item_params
+        for key, value in data_filters.items():
+            if group == JSON_GROUP:
+                conditions.append(self._json_condition("g.data", key, value, params))
+            else:
+                conditions.append(f"g.{quote_identifier(key)} = ?")
+                params.append(value)
+        rows = self.con.execute(f"""
+            SELECT g.{ITEM_ID_COLUMN}
+            FROM {quote_identifier(group)} g
+            JOIN warm_items i ON i.id = g.{ITEM_ID_COLUMN}
+            WHERE {' AND '.join(conditions)}
+        """, params).fetchall()
+        return [row[0] for row in rows]
+
+    def _fetch(self, group: str, ids: List[str]) -> List[Dict[str, Any]]:
+        """Load full items of one group by ID."""
+        columns = self._groups[group]
+        column_list = ", ".join(f"g.{quote_identifier(c)}" for c in columns)
+        if len(ids) <= self.IN_LIST_LIMIT:
+            id_filter = f"IN ({', '.join(['?'] * len(ids))})"
+            params = list(ids)
+        else:
+            id_filter = "IN (SELECT unnest(?))"
+            params = [list(ids)]
+        rows = self.con.execute(f"""
+            SELECT i.metadata, i.tags, i.stored_at, {column_list}
+            FROM warm_items i
+            JOIN {quote_identifier(group)} g ON g.{ITEM_ID_COLUMN} = i.id
+            WHERE i.id {id_filter}
+        """, params).fetchall()
+
+        items = []
+        for metadata_json, tags_json, stored_at, *values in rows:
+            items.append({
+                "data": json.loads(values[0]) if group == JSON_GROUP else dict(zip(columns, values)),
+                "metadata": json.loads(metadata_json),
+                "tags": json.loads(tags_json),
+                "stored_at": stored_at
+            })
+        return items
+
+    def get_schema(self, data_id: str) -> Optional[Dict[str, Any]]:
+        """Get the schema group of an item.
+
+        Returns:
+            Dict with the group's fields and types, or None if not found
+        """
+        row = self.con.execute(
+            "SELECT schema_group, metadata FROM warm_items WHERE id = ?", [data_id]
+        ).fetchone()
+        if not row:
+            return None
+        group, metadata_json = row
+        columns = self._groups.get(group, {})
+        schema = {
+            'fields': list(columns),
+            'types': dict(columns),
+            'type': 'json' if group == JSON_GROUP else 'table',
+            'table_name': group,
+            'source': 'duckdb'
+        }
+        metadata = json.loads(metadata_json) if metadata_json else {}
+        if metadata:
+            schema['metadata'] = metadata
+        return schema
+
+    def delete(self, data_id: str) -> bool:
+        """Delete an item.
+
+        Returns:
+            bool: True if the item existed
+        """
+        row = self.con.execute("SELECT schema_group FROM warm_items WHERE id = ?", [data_id]).fetchone()
+        if not row:
+            return False
+        self.con.execute("BEGIN TRANSACTION")
+        try:
+            self.con.execute(
+                f"DELETE FROM {quote_identifier(row[0])} WHERE {ITEM_ID_COLUMN} = ?", [data_id]
+            )
+            self.con.execute("DELETE FROM warm_item_tags WHERE item_id = ?", [data_id])
+            self.con.execute("DELETE FROM warm_items WHERE id = ?", [data_id])
+            self.con.execute("COMMIT")
+        except Exception:
+            self.con.execute("ROLLBACK")
+            raise
+        return True
+
+    def clear(self) -> None:
+        """Delete all items, keeping the tables."""
+        for group in self._groups:
+            self.con.execute(f"DELETE FROM {quote_identifier(group)}")
+        self.con.execute("DELETE FROM warm_item_tags")
+        self.con.execute("DELETE FROM warm_items")
+
+    def count(self) -> int:
+        """Number of stored items."""
+        return self.con.execute("SELECT COUNT(*) FROM warm_items").fetchone()[0]
@@ -0,0 +1,197 @@
+"""
+Append-only, crash-safe persistence for JSON metadata.
+
+Mutations are appended to a JSONL write-ahead log next to a JSON snapshot,
+so each write costs O(1) instead of rewriting the whole file. The log is
+folded into the snapshot periodically and replayed on open. Uses only the
+standard library so it can back the dependency-free SimpleMemoryStore.
+"""
+
+import json
+import os
+import threading
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+KeyPath = Union[str, Sequence[str]]
+
+
+class AppendOnlyLog:
+    """JSON dictionary persisted as a snapshot plus an append-only mutation log.
+
+    The snapshot file keeps the same layout a plain ``json.dump`` of
+    :attr:`data` would have, so existing metadata files are read unchanged.
+    Records are ``{"op": "set" | "del", "path": [...], "value": ...}``; both
+    operations are idempotent, so replaying a log over a snapshot that
+    already contains it is safe.
+    """
+
+    def __init__(
+        self,
+        snapshot_path: Union[str, Path],
+        snapshot_interval: int = 10000,
+        fsync: bool = False,
+        default: Any = None
+    ):
+        """Open the log, replaying any records written since the last snapshot.
+
+        Args:
+            snapshot_path: Path of the JSON snapshot; the log is written next
+                to it with a ``.log`` suffix
+            snapshot_interval: Minimum number of appended records before the
+                log is folded into a fresh snapshot. The log must also have
+                grown to the size of the last snapshot, so snapshot cost stays
+                amortized O(1) per write as the data grows.
+            fsync: fsync the log after every append for durability across
+                power loss, not just process crashes
+            default: Initial data when neither snapshot nor log exist
+                (defaults to an empty dict)
+        """
+        self.snapshot_path = Path(snapshot_path)
+        self.log_path = self.snapshot_path.with_name(self.snapshot_path.name + ".log")
+        self.snapshot_interval = snapshot_interval
+        self.fsync = fsync
+        self._default = default
+        self._lock = threading.Lock()
+        self._handle = None
+        self._records = 0
+        self._log_bytes = 0
+        self._snapshot_bytes = 0
+        self.data: Dict[str, Any] = self._replay()
+
+    def _initial(self) -> Dict[str, Any]:
+        return json.loads(json.dumps(self._default)) if self._default is not None else {}
+
+    def _replay(self) -> Dict[str, Any]:
+        """Load the snapshot and apply the log on top of it."""
+        data = self._initial()
+        if self.snapshot_path.exists():
+            try:
+                self._snapshot_bytes = self.snapshot_path.stat().st_size
+                with open(self.snapshot_path, 'r') as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, OSError) as e:
+                logger.error(f"Ignoring unreadable snapshot {self.snapshot_path}: {e}")
+
+        if not self.log_path.exists():
+            return data
+
+        good_offset = 0
+        with open(self.log_path, 'rb') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn trailing record from a crash mid-append
+                    break
+                if not line.endswith(b"\n"):
+                    break
+                self._apply(data, record)
+                good_offset += len(line)
+                self._records += 1
+
+        if good_offset < self.log_path.stat().st_size:
+            logger.warning(f"Truncating torn record at offset {good_offset} in {self.log_path}")
+            with open(self.log_path, 'r+b') as f:
+                f.truncate(good_offset)
+        self._log_bytes = good_offset
+        return data
+
+    @staticmethod
+    def _apply(data: Dict[str, Any], record: Dict[str, Any]) -> None:
+        *parents, leaf = record["path"]
+        target = data
+        for part in parents:
+            target = target.setdefault(part, {})
+        if record["op"] == "set":
+            target[leaf] = record["value"]
+        else:
+            target.pop(leaf, None)
+
+    @staticmethod
+    def _as_path(path: KeyPath) -> List[str]:
+        return [path] if isinstance(path, str) else list(path)
+
+    def _append(self, records: List[Dict[str, Any]]) -> None:
+        """Apply records to :attr:`data` and append them to the log in one write."""
+        if not records:
+            return
+        payload = "".join(json.dumps(record) + "\n" for record in records)
+        with self._lock:
+            for record in records:
+                self._apply(self.data, record)
+            if self._handle is None:
+                self.log_path.parent.mkdir(parents=True, exist_ok=True)
+                self._handle = open(self.log_path, 'a')
+            self._handle.write(payload)
+            self._handle.flush()
+            if self.fsync:
+                os.fsync(self._handle.fileno())
+            self._records += len(records)
+            self._log_bytes += len(payload)
+            due = self._records >= self.snapshot_interval and self._log_bytes >= self._snapshot_bytes
+        if due:
+            self.snapshot()
+
+    def set(self, path: KeyPath, value: Any) -> None:
+        """Set ``value`` at ``path`` (a key, or a list of nested keys)."""
+        self._append([{"op": "set", "path": self._as_path(path), "value": value}])
+
+    def set_many(self, items: Iterable[Tuple[KeyPath, Any]]) -> None:
+        """Set several ``(path, value)`` pairs with a single log write."""
+        self._append([{"op": "set", "path": self._as_path(p), "value": v} for p, v in items])
+
+    def delete(self, path: KeyPath) -> None:
+        """Delete the entry at ``path`` if present."""
+        self._append([{"op": "del", "path": self._as_path(path)}])
+
+    def delete_many(self, paths: Iterable[KeyPath]) -> None:
+        """Delete several entries with a single log write."""
+        self._append([{"op": "del", "path": self._as_path(p)} for p in paths])
+
+    def snapshot(self) -> None:
+        """Write :attr:`data` to the snapshot file and truncate the log.
+
+        The snapshot is written to a temporary file and atomically renamed,
+        so a crash leaves either the old snapshot plus the full log or the
+        new snapshot.
+        """
+        with self._lock:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.snapshot_path.with_name(self.snapshot_path.name + ".tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(self.data, f)
+                f.flush()
+                os.fsync(f.fileno())
+                self._snapshot_bytes = f.tell()
+            os.replace(tmp_path, self.snapshot_path)
+
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+            if self.log_path.exists():
+                self.log_path.unlink()
+            self._records = 0
+            self._log_bytes = 0
+
+    def clear(self) -> None:
+        """Drop all data and remove the snapshot and log files."""
+        with self._lock:
+            self.close()
+            self.data.clear()
+            self.data.update(self._initial())
+            for path in (self.snapshot_path, self.log_path):
+                if path.exists():
+                    path.unlink()
+            self._records = 0
+            self._log_bytes = 0
+            self._snapshot_bytes = 0
+
+    def close(self) -> None:
+        """Close the log file handle."""
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
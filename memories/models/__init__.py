@@ -1,9 +1,40 @@
-from .base_model import BaseModel
-from .load_model import LoadModel
-from .multi_model import MultiModelInference
-from .streaming import StreamingResponse, stream_from_provider
-from .caching import InMemoryCache, DiskCache, TieredCache
-from .function_calling import FunctionDefinition, FunctionRegistry, FunctionCallHandler
+"""
+Model loading and inference.
+
+Classes are imported on first attribute access (PEP 562), so importing one of
+them does not load the others' dependencies (e.g. torch and transformers for
+local models).
+"""
+
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    "BaseModel": ".base_model",
+    "LoadModel": ".load_model",
+    "MultiModelInference": ".multi_model",
+    "StreamingResponse": ".streaming",
+    "stream_from_provider": ".streaming",
+    "InMemoryCache": ".caching",
+    "DiskCache": ".caching",
+    "TieredCache": ".caching",
+    "SemanticCache": ".caching",
+    "FunctionDefinition": ".function_calling",
+    "FunctionRegistry": ".function_calling",
+    "FunctionCallHandler": ".function_calling",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 __all__ = [
     "BaseModel",
@@ -14,6 +45,7 @@ __all__ = [
     "InMemoryCache",
     "DiskCache",
     "TieredCache",
+    "SemanticCache",
     "FunctionDefinition",
     "FunctionRegistry",
     "FunctionCallHandler"
@@ -6,12 +6,13 @@ from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List
 import logging
 from pathlib import Path
-import requests
 from datetime import datetime
 import time
 
 from dotenv import load_dotenv
 
+from memories.core.http_session import get_requests_session
+
 # Azure AI imports
 
 
@@ -272,7 +273,7 @@ class DeepseekConnector(APIConnector):
             params.update(kwargs)
             
             # Make API call
-            response = requests.post(
+            response = get_requests_session().post(
                 f"{self.api_base}/chat/completions",
                 headers=self.headers,
                 json=params
@@ -328,7 +329,7 @@ class DeepseekConnector(APIConnector):
             start_time = datetime.now()
 
             # Make API call
-            response = requests.post(
+            response = get_requests_session().post(
                 f"{self.api_base}/chat/completions",
                 headers=headers,
                 json=data
@@ -476,7 +477,7 @@ class AnthropicConnector(APIConnector):
             start_time = datetime.now()
 
             # Make API call
-            response = requests.post(
+            response = get_requests_session().post(
                 f"{self.api_base}/messages",
                 headers=headers,
                 json=data
@@ -1,6 +1,10 @@
 import os
 import logging
 import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 import gc
@@ -36,6 +40,77 @@ logging.basicConfig(level=logging.INFO)
 # Global pipe variable for Stable Diffusion
 pipe = None
 
+
+class _MicroBatcher:
+    """Coalesces concurrent ``generate`` calls into ``generate_batch`` calls.
+
+    A worker thread takes the first queued request, waits up to ``max_wait``
+    seconds for more, and generates the requests that share generation
+    parameters as one batch.
+    """
+
+    def __init__(self, model: "BaseModel", max_batch_size: int, max_wait: float):
+        self.model = model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.requests = 0
+        self.batches = 0
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="generate-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, prompt: str, kwargs: Dict[str, Any]) -> Future:
+        future = Future()
+        self._queue.put((prompt, kwargs, future))
+        return future
+
+    def stop(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            stopping = False
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._generate(batch)
+            if stopping:
+                return
+
+    def _generate(self, batch: List[tuple]):
+        # Only requests with the same generation parameters can share a batch
+        groups: Dict[str, List[tuple]] = {}
+        for request in batch:
+            groups.setdefault(repr(sorted(request[1].items())), []).append(request)
+
+        for requests in groups.values():
+            self.requests += len(requests)
+            self.batches += 1
+            try:
+                texts = self.model.generate_batch([prompt for prompt, _, _ in requests], **requests[0][1])
+            except Exception as e:
+                for _, _, future in requests:
+                    future.set_exception(e)
+            else:
+                for (_, _, future), text in zip(requests, texts):
+                    future.set_result(text)
+
+
 class BaseModel(Singleton):
     """Base model class that can be shared across modules"""
     
@@ -43,6 +118,10 @@ class BaseModel(Singleton):
         """Initialize the base model."""
         self.model = None
         self.tokenizer = None
+        self.model_key = None
+        self.generation_config: Dict[str, Any] = {}
+        self.batch_size = 8
+        self._batcher: Optional[_MicroBatcher] = None
         self.config = self._load_config()
         self.hf_token = os.getenv("HF_TOKEN")
         logger.info("BaseModel singleton initialized")
@@ -137,6 +216,24 @@ class BaseModel(Singleton):
             if device == "cpu" or device.startswith("cuda:"):
                 self.model = self.model.to(device)
             
+            # Decoder-only models continue from the right, so batches are left-padded
+            self.tokenizer.padding_side = "left"
+            if self.tokenizer.pad_token is None:
+                self.tokenizer.pad_token = self.tokenizer.eos_token
+            
+            # Resolve the generation parameters once instead of on every call
+            self.model_key = model
+            self.batch_size = config.get("batch_size", 8)
+            self.generation_config = {
+                "max_length": config.get("max_length", 1000),
+                "temperature": config.get("temperature", 0.7),
+                "top_p": config.get("top_p", 0.95),
+                "top_k": config.get("top_k", 50),
+                "repetition_penalty": config.get("repetition_penalty", 1.1),
+                "pad_token_id": self.tokenizer.eos_token_id,
+                "do_sample": True
+            }
+            
             logger.info(f"Model {model_name} initialized successfully on {device}")
             return True
             
@@ -148,38 +245,26 @@ class BaseModel(Singleton):
     def generate(self, prompt: str, **kwargs) -> str:
         """Generate text using the model with configured parameters.
         
+        While micro-batching is enabled the prompt is queued and generated
+        together with concurrent requests.
+        
         Args:
             prompt: Input prompt
-            **kwargs: Override default generation parameters
+            **kwargs: Override default generation parameters; ``timeout``
+                bounds the wait for a micro-batched result in seconds
             
         Returns:
             str: Generated text
         """
+        timeout = kwargs.pop("timeout", None)
+        if self._batcher is not None:
+            return self._batcher.submit(prompt, kwargs).result(timeout)
+        
         if self.model is None or self.tokenizer is None:
             raise ValueError("Model not initialized. Call initialize_model first.")
         
         try:
-            # Get current model's config
-            current_model = next(
-                (name for name, cfg in self.config["models"].items() 
-                 if cfg["name"] == self.model.config._name_or_path),
-                self.config["default_model"]
-            )
-            model_config = self.get_model_config(current_model)["config"]
-            
-            # Prepare generation config
-            gen_config = {
-                "max_length": model_config.get("max_length", 1000),
-                "temperature": model_config.get("temperature", 0.7),
-                "top_p": model_config.get("top_p", 0.95),
-                "top_k": model_config.get("top_k", 50),
-                "repetition_penalty": model_config.get("repetition_penalty", 1.1),
-                "pad_token_id": self.tokenizer.eos_token_id,
-                "do_sample": True
-            }
-            
-            # Override with any provided kwargs
-            gen_config.update(kwargs)
+            gen_config = {**self.generation_config, **kwargs}
             
             # Generate
             inputs = self.tokenizer(prompt, return_tensors="pt")
@@ -194,6 +279,86 @@ class BaseModel(Singleton):
             logger.error(f"Error during generation: {str(e)}")
             raise
     
+    def generate_batch(
+        self,
+        prompts: List[str],
+        batch_size: Optional[int] = None,
+        max_batch_tokens: Optional[int] = None,
+        **kwargs
+    ) -> List[str]:
+        """Generate text for several prompts in left-padded batches.
+        
+        Prompts are sorted by token length and split into batches of similar
+        length, so little of each batch is padding.
+        
+        Args:
+            prompts: Input prompts
+            batch_size: Maximum prompts per batch (default: the model's
+                configured ``batch_size``)
+            max_batch_tokens: Optional bound on the padded prompt tokens per
+                batch (prompts x longest prompt)
+            **kwargs: Override default generation parameters
+            
+        Returns:
+            List[str]: Generated texts in the order of ``prompts``
+        """
+        if self.model is None or self.tokenizer is None:
+            raise ValueError("Model not initialized. Call initialize_model first.")
+        
+        kwargs.pop("timeout", None)
+        batch_size = batch_size or self.batch_size
+        gen_config = {**self.generation_config, "pad_token_id": self.tokenizer.pad_token_id, **kwargs}
+        
+        try:
+            lengths = [len(ids) for ids in self.tokenizer(list(prompts))["input_ids"]]
+            order = sorted(range(len(prompts)), key=lengths.__getitem__)
+            
+            # Shortest first; a batch ends at batch_size prompts or max_batch_tokens
+            batches, batch = [], []
+            for index in order:
+                padded_tokens = (len(batch) + 1) * lengths[index]
+                if batch and (len(batch) >= batch_size or
+                              (max_batch_tokens and padded_tokens > max_batch_tokens)):
+                    batches.append(batch)
+                    batch = []
+                batch.append(index)
+            if batch:
+                batches.append(batch)
+            
+            results: List[Optional[str]] = [None] * len(prompts)
+            for batch in batches:
+                inputs = self.tokenizer([prompts[i] for i in batch], return_tensors="pt", padding=True)
+                inputs = {k: v.to(self.model.device) for k, v in inputs.items()}
+                
+                with torch.no_grad():
+                    outputs = self.model.generate(**inputs, **gen_config)
+                
+                for index, output in zip(batch, outputs):
+                    results[index] = self.tokenizer.decode(output, skip_special_tokens=True)
+            
+            return results
+            
+        except Exception as e:
+            logger.error(f"Error during batch generation: {str(e)}")
+            raise
+    
+    def start_micro_batching(self, max_batch_size: int = 16, max_wait_ms: float = 5.0):
+        """Coalesce concurrent ``generate`` calls into batches.
+        
+        Args:
+            max_batch_size: Maximum requests generated together
+            max_wait_ms: How long the first request of a batch waits for others
+        """
+        self.stop_micro_batching()
+        self._batcher = _MicroBatcher(self, max_batch_size, max_wait_ms / 1000)
+        logger.info(f"Micro-batching enabled (up to {max_batch_size} requests, {max_wait_ms}ms window)")
+    
+    def stop_micro_batching(self):
+        """Generate each ``generate`` call on its own again."""
+        batcher, self._batcher = self._batcher, None
+        if batcher is not None:
+            batcher.stop()
+    
     def cleanup(self):
         """Clean up model resources."""
         if hasattr(self, 'model') and self.model is not None:
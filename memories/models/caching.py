@@ -7,12 +7,41 @@ import pickle
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 import sqlite3
+import threading
 from collections import OrderedDict
 
+import numpy as np
+
+# Optional serializers and compression for DiskCache
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import zstandard as zstd
+except ImportError:
+    zstd = None
+
 logger = logging.getLogger(__name__)
 
+# Serializer name -> (dumps, loads); dumps is None when the package is missing
+_SERIALIZERS = {
+    "pickle": (pickle.dumps, pickle.loads),
+    "msgpack": (
+        (lambda value: msgpack.packb(value, use_bin_type=True)) if msgpack else None,
+        (lambda blob: msgpack.unpackb(blob, raw=False)) if msgpack else None
+    ),
+    "orjson": (orjson.dumps if orjson else None, orjson.loads if orjson else None),
+}
+
 
 class CacheEntry:
     """Represents a single cache entry."""
@@ -180,44 +209,129 @@ class InMemoryCache:
 
 
 class DiskCache:
-    """Persistent disk-based cache using SQLite."""
+    """Persistent disk-based cache using SQLite.
+
+    Each thread keeps its own connection to a WAL-mode database, so readers
+    never block the writer. Writes and access-time updates are buffered and
+    written in one transaction per batch. Entries carry an indexed
+    ``expires_at`` that expired rows are bulk-deleted by, and with
+    ``max_bytes`` set the least recently accessed entries are evicted once
+    the stored values exceed it.
+    """
+
+    SCHEMA_COLUMNS = {"key", "value", "codec", "metadata", "size", "created_at", "accessed_at", "expires_at",
+                      "access_count"}
 
-    def __init__(self, cache_dir: str = "./cache", ttl: int = 86400):
+    def __init__(
+        self,
+        cache_dir: str = "./cache",
+        ttl: int = 86400,
+        max_bytes: Optional[int] = None,
+        serializer: str = "pickle",
+        compress: bool = False,
+        batch_size: int = 64,
+        flush_interval: float = 1.0,
+        eviction_interval: float = 60.0
+    ):
         """Initialize disk cache.
 
         Args:
             cache_dir: Directory for cache storage
             ttl: Time to live in seconds (default: 24 hours)
+            max_bytes: Upper bound on the stored value bytes, None for unbounded
+            serializer: 'pickle', 'msgpack' or 'orjson'; values the chosen
+                format cannot encode fall back to pickle. msgpack and orjson
+                return tuples as lists
+            compress: Compress values with zstd
+            batch_size: Buffered writes that trigger a flush
+            flush_interval: Seconds after which buffered writes are flushed
+                on the next cache operation
+            eviction_interval: Seconds between bulk deletions of expired entries
         """
+        if serializer not in _SERIALIZERS:
+            raise ValueError(f"serializer must be one of {sorted(_SERIALIZERS)}")
+        if serializer != "pickle" and _SERIALIZERS[serializer][0] is None:
+            raise ImportError(f"{serializer} is not installed")
+        if compress and zstd is None:
+            raise ImportError("zstandard is not installed")
+
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.serializer = serializer
+        self.compress = compress
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.eviction_interval = eviction_interval
         self.db_path = self.cache_dir / "cache.db"
         self.hits = 0
         self.misses = 0
 
-        # Initialize database
+        self._local = threading.local()
+        self._connections = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        # key -> row tuple waiting to be written, key -> (accessed_at, hits)
+        self._pending_writes: Dict[str, tuple] = {}
+        self._pending_access: Dict[str, tuple] = {}
+        self._last_flush = time.time()
+        self._last_eviction = time.time()
+
+        # Initialize database and drop entries that expired while it was closed
         self._init_db()
+        self._connection().execute("DELETE FROM cache WHERE expires_at <= ?", (self._last_eviction,))
+
+    def _connection(self) -> sqlite3.Connection:
+        """Get the calling thread's connection, opening it on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(str(self.db_path), timeout=30, isolation_level=None, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._lock:
+                self._connections.append(conn)
+        return conn
 
     def _init_db(self):
         """Initialize SQLite database."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        cursor.execute("""
+        conn = self._connection()
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(cache)")}
+        if columns and columns != self.SCHEMA_COLUMNS:
+            # Cache written by an older version; its entries are not worth migrating
+            logger.info(f"Recreating disk cache at {self.db_path} with the current schema")
+            conn.execute("DROP TABLE cache")
+
+        conn.executescript("""
             CREATE TABLE IF NOT EXISTS cache (
                 key TEXT PRIMARY KEY,
                 value BLOB,
+                codec TEXT,
                 metadata TEXT,
-                created_at TEXT,
-                last_accessed TEXT,
+                size INTEGER,
+                created_at REAL,
+                accessed_at REAL,
+                expires_at REAL,
                 access_count INTEGER
-            )
+            );
+            CREATE INDEX IF NOT EXISTS idx_cache_expires_at ON cache(expires_at);
+            CREATE INDEX IF NOT EXISTS idx_cache_accessed_at ON cache(accessed_at);
+
+            -- Running total of value bytes, kept exact by the triggers below
+            CREATE TABLE IF NOT EXISTS cache_size (id INTEGER PRIMARY KEY CHECK (id = 0), bytes INTEGER);
+            INSERT OR IGNORE INTO cache_size VALUES (0, 0);
+            CREATE TRIGGER IF NOT EXISTS cache_size_insert AFTER INSERT ON cache BEGIN
+                UPDATE cache_size SET bytes = bytes + NEW.size;
+            END;
+            CREATE TRIGGER IF NOT EXISTS cache_size_delete AFTER DELETE ON cache BEGIN
+                UPDATE cache_size SET bytes = bytes - OLD.size;
+            END;
+            CREATE TRIGGER IF NOT EXISTS cache_size_update AFTER UPDATE OF size ON cache BEGIN
+                UPDATE cache_size SET bytes = bytes + NEW.size - OLD.size;
+            END;
         """)
 
-        conn.commit()
-        conn.close()
-
     def _generate_key(self, prompt: str, **kwargs) -> str:
         """Generate cache key from prompt and parameters.
 
@@ -235,6 +349,27 @@ class DiskCache:
         key_str = json.dumps(key_data, sort_keys=True)
         return hashlib.sha256(key_str.encode()).hexdigest()
 
+    def _serialize(self, value: Any) -> tuple:
+        """Encode a value, returning the blob and the codec needed to decode it."""
+        codec = self.serializer
+        dumps = _SERIALIZERS[codec][0]
+        try:
+            blob = dumps(value)
+        except (TypeError, ValueError, OverflowError):
+            codec = "pickle"
+            blob = _SERIALIZERS[codec][0](value)
+        if self.compress:
+            blob = zstd.ZstdCompressor().compress(blob)
+            codec += "+zstd"
+        return blob, codec
+
+    @staticmethod
+    def _deserialize(blob: bytes, codec: str) -> Any:
+        serializer, _, compression = codec.partition("+")
+        if compression == "zstd":
+            blob = zstd.ZstdDecompressor().decompress(blob)
+        return _SERIALIZERS[serializer][1](blob)
+
     def get(self, prompt: str, **kwargs) -> Optional[Any]:
         """Get cached response.
 
@@ -246,53 +381,41 @@ class DiskCache:
             Cached value or None if not found
         """
         key = self._generate_key(prompt, **kwargs)
-
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        cursor.execute(
-            "SELECT value, created_at, access_count FROM cache WHERE key = ?",
-            (key,)
-        )
-        row = cursor.fetchone()
-
-        if row:
-            value_blob, created_at_str, access_count = row
-            created_at = datetime.fromisoformat(created_at_str)
-
-            # Check if expired
-            age = (datetime.now() - created_at).total_seconds()
-            if age > self.ttl:
-                cursor.execute("DELETE FROM cache WHERE key = ?", (key,))
-                conn.commit()
-                conn.close()
+        now = time.time()
+
+        with self._lock:
+            row = self._pending_writes.get(key)
+        if row is not None:
+            blob, codec, expires_at = row[1], row[2], row[7]
+        else:
+            row = self._connection().execute(
+                "SELECT value, codec, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row:
+                blob, codec, expires_at = row
+
+        if row is None or expires_at <= now:
+            # Expired entries are left for the next bulk eviction
+            with self._lock:
                 self.misses += 1
-                return None
+            logger.debug(f"Disk cache miss for key: {key[:8]}...")
+            self._maybe_flush()
+            return None
 
-            # Update access stats
-            cursor.execute(
-                """UPDATE cache
-                   SET last_accessed = ?, access_count = ?
-                   WHERE key = ?""",
-                (datetime.now().isoformat(), access_count + 1, key)
-            )
-            conn.commit()
-            conn.close()
-
-            # Deserialize value
-            value = pickle.loads(value_blob)
+        with self._lock:
             self.hits += 1
-            logger.debug(f"Disk cache hit for key: {key[:8]}...")
-            return value
-
-        conn.close()
-        self.misses += 1
-        logger.debug(f"Disk cache miss for key: {key[:8]}...")
-        return None
+            _, count = self._pending_access.get(key, (now, 0))
+            self._pending_access[key] = (now, count + 1)
+        logger.debug(f"Disk cache hit for key: {key[:8]}...")
+        self._maybe_flush()
+        return self._deserialize(blob, codec)
 
     def set(self, prompt: str, value: Any, metadata: Optional[Dict[str, Any]] = None, **kwargs):
         """Set cached response.
 
+        The write is buffered and reaches disk with the next batch; ``get``
+        on the same cache object sees it immediately.
+
         Args:
             prompt: Input prompt
             value: Response value to cache
@@ -300,34 +423,103 @@ class DiskCache:
             **kwargs: Additional parameters
         """
         key = self._generate_key(prompt, **kwargs)
+        blob, codec = self._serialize(value)
+        now = time.time()
+        row = (key, blob, codec, json.dumps(metadata or {}), len(blob), now, now, now + self.ttl, 0)
 
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        # Serialize value
-        value_blob = pickle.dumps(value)
-        metadata_json = json.dumps(metadata or {})
-        now = datetime.now().isoformat()
-
-        cursor.execute(
-            """INSERT OR REPLACE INTO cache
-               (key, value, metadata, created_at, last_accessed, access_count)
-               VALUES (?, ?, ?, ?, ?, ?)""",
-            (key, value_blob, metadata_json, now, now, 0)
-        )
-
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._pending_writes[key] = row
+            self._pending_access.pop(key, None)
+            full = len(self._pending_writes) >= self.batch_size
 
         logger.debug(f"Cached response to disk for key: {key[:8]}...")
+        if full:
+            self.flush()
+        else:
+            self._maybe_flush()
+
+    def _maybe_flush(self):
+        """Flush if the flush or eviction interval has passed."""
+        now = time.time()
+        if now - self._last_flush >= self.flush_interval or now - self._last_eviction >= self.eviction_interval:
+            self.flush()
+
+    def flush(self):
+        """Write buffered entries and access updates in one transaction.
+
+        Expired entries are bulk-deleted every ``eviction_interval`` seconds,
+        and least recently accessed entries are evicted while the cache holds
+        more than ``max_bytes``.
+        """
+        with self._flush_lock:
+            with self._lock:
+                writes, self._pending_writes = self._pending_writes, {}
+                accesses, self._pending_access = self._pending_access, {}
+            now = time.time()
+            self._last_flush = now
+
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if writes:
+                    conn.executemany(
+                        """INSERT INTO cache
+                           (key, value, codec, metadata, size, created_at, accessed_at, expires_at, access_count)
+                           VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                           ON CONFLICT(key) DO UPDATE SET
+                               value = excluded.value, codec = excluded.codec, metadata = excluded.metadata,
+                               size = excluded.size, created_at = excluded.created_at,
+                               accessed_at = excluded.accessed_at, expires_at = excluded.expires_at,
+                               access_count = 0""",
+                        writes.values()
+                    )
+                if accesses:
+                    conn.executemany(
+                        "UPDATE cache SET accessed_at = ?, access_count = access_count + ? WHERE key = ?",
+                        [(accessed_at, count, key) for key, (accessed_at, count) in accesses.items()]
+                    )
+                if now - self._last_eviction >= self.eviction_interval:
+                    self._last_eviction = now
+                    expired = conn.execute("DELETE FROM cache WHERE expires_at <= ?", (now,)).rowcount
+                    if expired:
+                        logger.debug(f"Evicted {expired} expired disk cache entries")
+                if self.max_bytes is not None:
+                    self._evict_to_size(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def _evict_to_size(self, conn: sqlite3.Connection):
+        """Delete least recently accessed entries until within ``max_bytes``."""
+        excess = conn.execute("SELECT bytes FROM cache_size").fetchone()[0] - self.max_bytes
+        if excess <= 0:
+            return
+        victims = []
+        for key, size in conn.execute("SELECT key, size FROM cache ORDER BY accessed_at"):
+            victims.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany("DELETE FROM cache WHERE key = ?", victims)
+        logger.debug(f"Evicted {len(victims)} least recently used disk cache entries")
+
+    def evict_expired(self) -> int:
+        """Delete every expired entry now.
+
+        Returns:
+            Number of entries deleted
+        """
+        self.flush()
+        self._last_eviction = time.time()
+        return self._connection().execute("DELETE FROM cache WHERE expires_at <= ?", (self._last_eviction,)).rowcount
 
     def clear(self):
         """Clear all cache entries."""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        cursor.execute("DELETE FROM cache")
-        conn.commit()
-        conn.close()
+        with self._lock:
+            self._pending_writes.clear()
+            self._pending_access.clear()
+        self._connection().execute("DELETE FROM cache")
 
         self.hits = 0
         self.misses = 0
@@ -339,39 +531,282 @@ class DiskCache:
         Returns:
             Dict with cache statistics
         """
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT COUNT(*) FROM cache")
-        size = cursor.fetchone()[0]
-
-        cursor.execute("SELECT SUM(access_count) FROM cache")
-        total_accesses = cursor.fetchone()[0] or 0
-
-        conn.close()
+        self.flush()
+        conn = self._connection()
+        size, total_accesses = conn.execute("SELECT COUNT(*), SUM(access_count) FROM cache").fetchone()
+        total_bytes = conn.execute("SELECT bytes FROM cache_size").fetchone()[0]
 
         total_requests = self.hits + self.misses
         hit_rate = self.hits / total_requests if total_requests > 0 else 0
 
         return {
             "size": size,
+            "bytes": total_bytes,
+            "max_bytes": self.max_bytes,
             "hits": self.hits,
             "misses": self.misses,
             "hit_rate": hit_rate,
-            "total_accesses": total_accesses,
+            "total_accesses": total_accesses or 0,
             "ttl": self.ttl
         }
 
+    def close(self):
+        """Flush buffered writes and close every thread's connection."""
+        self.flush()
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+        self._local = threading.local()
+
+    def __del__(self):
+        try:
+            if self._connections:
+                self.close()
+        except Exception:
+            pass
+
+
+class _SemanticScope:
+    """FAISS index and entries of one model/temperature/parameter scope."""
+
+    def __init__(self, index: Any):
+        self.index = index
+        # id -> (prompt, value, metadata, expires_at), oldest access first
+        self.entries: "OrderedDict[int, tuple]" = OrderedDict()
+        self.ids_by_prompt: Dict[str, int] = {}
+
+
+class SemanticCache:
+    """Cache that also hits on prompts similar to a previous one.
+
+    Prompts are embedded and stored in a FAISS inner-product index over
+    L2-normalized vectors, so scores are cosine similarities. A lookup
+    returns the response of the nearest previous prompt when its similarity
+    reaches ``similarity_threshold``. Entries are scoped per model, per
+    temperature bucket and per remaining generation parameters, so a
+    response is never served for a different model or sampling setup.
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[Callable[[List[str]], np.ndarray]] = None,
+        similarity_threshold: float = 0.92,
+        temperature_step: float = 0.1,
+        max_entries: int = 10000,
+        ttl: int = 3600,
+        embedding_model: Optional[str] = None
+    ):
+        """Initialize semantic cache.
+
+        Args:
+            embedder: Callable mapping a list of prompts to a 2-D array of
+                embeddings; defaults to the shared sentence transformer
+                registry
+            similarity_threshold: Minimum cosine similarity for a hit
+            temperature_step: Width of the temperature buckets entries are
+                scoped by
+            max_entries: Maximum entries per scope before the least recently
+                used are evicted
+            ttl: Time to live in seconds (default: 1 hour)
+            embedding_model: Sentence transformer used by the default embedder
+        """
+        if embedder is None:
+            from memories.core.embedding_registry import DEFAULT_MODEL, encode_texts
+            model_name = embedding_model or DEFAULT_MODEL
+            embedder = lambda texts: encode_texts(texts, model_name=model_name, normalize=True)
+
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.temperature_step = temperature_step
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.total_lookup_time = 0.0
+        self.max_lookup_time = 0.0
+
+        self._scopes: Dict[str, _SemanticScope] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def _scope_key(self, model: Optional[str], temperature: Optional[float], **kwargs) -> str:
+        """Scope of a request: model, temperature bucket and other parameters."""
+        bucket = None if temperature is None else round(float(temperature) / self.temperature_step)
+        return json.dumps({"model": model, "temperature": bucket, "params": kwargs}, sort_keys=True, default=str)
+
+    def _embed(self, prompt: str) -> np.ndarray:
+        """Embed a prompt as a normalized float32 row vector."""
+        import faiss
+
+        vector = np.ascontiguousarray(np.asarray(self.embedder([prompt]), dtype=np.float32).reshape(1, -1))
+        faiss.normalize_L2(vector)
+        return vector
+
+    def lookup(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> Optional[Tuple[Any, float]]:
+        """Find the cached response of the most similar previous prompt.
+
+        Args:
+            prompt: Input prompt
+            model: Model the response must come from
+            temperature: Sampling temperature of the request
+            **kwargs: Additional parameters
+
+        Returns:
+            Tuple of cached value and similarity, or None on a miss
+        """
+        start = time.perf_counter()
+        scope_key = self._scope_key(model, temperature, **kwargs)
+        result = None
+
+        with self._lock:
+            scope = self._scopes.get(scope_key)
+        if scope is not None and scope.entries:
+            vector = self._embed(prompt)
+            with self._lock:
+                if scope.index.ntotal:
+                    scores, ids = scope.index.search(vector, 1)
+                    entry_id, similarity = int(ids[0][0]), float(scores[0][0])
+                    entry = scope.entries.get(entry_id)
+                    if entry is not None and similarity >= self.similarity_threshold:
+                        if entry[3] <= time.time():
+                            self._remove(scope, entry_id)
+                        else:
+                            scope.entries.move_to_end(entry_id)
+                            result = (entry[1], similarity)
+
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.total_lookup_time += elapsed
+            self.max_lookup_time = max(self.max_lookup_time, elapsed)
+            if result is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if result is not None:
+            logger.debug(f"Semantic cache hit (similarity {result[1]:.3f}) for: {prompt[:50]}...")
+        return result
+
+    def get(
+        self,
+        prompt: str,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ) -> Optional[Any]:
+        """Get the cached response of a similar prompt.
+
+        Args:
+            prompt: Input prompt
+            model: Model the response must come from
+            temperature: Sampling temperature of the request
+            **kwargs: Additional parameters
+
+        Returns:
+            Cached value or None if no similar prompt is cached
+        """
+        result = self.lookup(prompt, model=model, temperature=temperature, **kwargs)
+        return result[0] if result is not None else None
+
+    def set(
+        self,
+        prompt: str,
+        value: Any,
+        metadata: Optional[Dict[str, Any]] = None,
+        model: Optional[str] = None,
+        temperature: Optional[float] = None,
+        **kwargs
+    ):
+        """Set cached response.
+
+        Args:
+            prompt: Input prompt
+            value: Response value to cache
+            metadata: Optional metadata
+            model: Model that generated the response
+            temperature: Sampling temperature of the request
+            **kwargs: Additional parameters
+        """
+        import faiss
+
+        scope_key = self._scope_key(model, temperature, **kwargs)
+        vector = self._embed(prompt)
+
+        with self._lock:
+            scope = self._scopes.get(scope_key)
+            if scope is None:
+                scope = _SemanticScope(faiss.IndexIDMap2(faiss.IndexFlatIP(vector.shape[1])))
+                self._scopes[scope_key] = scope
+
+            if prompt in scope.ids_by_prompt:
+                self._remove(scope, scope.ids_by_prompt[prompt])
+            while len(scope.entries) >= self.max_entries:
+                self._remove(scope, next(iter(scope.entries)))
+
+            entry_id = self._next_id
+            self._next_id += 1
+            scope.index.add_with_ids(vector, np.array([entry_id], dtype=np.int64))
+            scope.entries[entry_id] = (prompt, value, metadata or {}, time.time() + self.ttl)
+            scope.ids_by_prompt[prompt] = entry_id
+
+    @staticmethod
+    def _remove(scope: _SemanticScope, entry_id: int):
+        """Drop an entry from a scope; the caller holds the lock."""
+        prompt = scope.entries.pop(entry_id)[0]
+        scope.ids_by_prompt.pop(prompt, None)
+        scope.index.remove_ids(np.array([entry_id], dtype=np.int64))
+
+    def clear(self):
+        """Clear all cache entries."""
+        with self._lock:
+            self._scopes.clear()
+            self.hits = 0
+            self.misses = 0
+            self.total_lookup_time = 0.0
+            self.max_lookup_time = 0.0
+        logger.info("Semantic cache cleared")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with cache statistics, lookup latencies in milliseconds
+        """
+        with self._lock:
+            total_requests = self.hits + self.misses
+            return {
+                "size": sum(len(scope.entries) for scope in self._scopes.values()),
+                "scopes": len(self._scopes),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total_requests if total_requests > 0 else 0,
+                "avg_lookup_ms": 1000 * self.total_lookup_time / total_requests if total_requests > 0 else 0.0,
+                "max_lookup_ms": 1000 * self.max_lookup_time,
+                "similarity_threshold": self.similarity_threshold,
+                "ttl": self.ttl
+            }
+
 
 class TieredCache:
-    """Two-level cache with memory and disk tiers."""
+    """Two-level cache with memory and disk tiers.
+
+    An optional ``SemanticCache`` is consulted after both exact tiers miss.
+    """
 
     def __init__(
         self,
         memory_size: int = 1000,
         memory_ttl: int = 3600,
         disk_cache_dir: str = "./cache",
-        disk_ttl: int = 86400
+        disk_ttl: int = 86400,
+        disk_max_bytes: Optional[int] = None,
+        semantic_cache: Optional[SemanticCache] = None
     ):
         """Initialize tiered cache.
 
@@ -380,9 +815,12 @@ class TieredCache:
             memory_ttl: Memory cache TTL in seconds
             disk_cache_dir: Directory for disk cache
             disk_ttl: Disk cache TTL in seconds
+            disk_max_bytes: Disk cache size bound in bytes, None for unbounded
+            semantic_cache: Optional similarity tier for paraphrased prompts
         """
         self.memory_cache = InMemoryCache(max_size=memory_size, ttl=memory_ttl)
-        self.disk_cache = DiskCache(cache_dir=disk_cache_dir, ttl=disk_ttl)
+        self.disk_cache = DiskCache(cache_dir=disk_cache_dir, ttl=disk_ttl, max_bytes=disk_max_bytes)
+        self.semantic_cache = semantic_cache
 
     def get(self, prompt: str, **kwargs) -> Optional[Any]:
         """Get cached response from memory or disk.
@@ -406,6 +844,13 @@ class TieredCache:
             self.memory_cache.set(prompt, value, **kwargs)
             return value
 
+        # Try a similar prompt
+        if self.semantic_cache is not None:
+            value = self.semantic_cache.get(prompt, **kwargs)
+            if value is not None:
+                self.memory_cache.set(prompt, value, **kwargs)
+                return value
+
         return None
 
     def set(self, prompt: str, value: Any, metadata: Optional[Dict[str, Any]] = None, **kwargs):
@@ -419,11 +864,15 @@ class TieredCache:
         """
         self.memory_cache.set(prompt, value, metadata, **kwargs)
         self.disk_cache.set(prompt, value, metadata, **kwargs)
+        if self.semantic_cache is not None:
+            self.semantic_cache.set(prompt, value, metadata, **kwargs)
 
     def clear(self):
-        """Clear both cache tiers."""
+        """Clear all cache tiers."""
         self.memory_cache.clear()
         self.disk_cache.clear()
+        if self.semantic_cache is not None:
+            self.semantic_cache.clear()
 
     def get_stats(self) -> Dict[str, Any]:
         """Get combined cache statistics.
@@ -431,7 +880,10 @@ class TieredCache:
         Returns:
             Dict with cache statistics
         """
-        return {
+        stats = {
             "memory": self.memory_cache.get_stats(),
             "disk": self.disk_cache.get_stats()
         }
+        if self.semantic_cache is not None:
+            stats["semantic"] = self.semantic_cache.get_stats()
+        return stats
@@ -25,7 +25,8 @@ class LoadModel:
                  model_name: str = None,
                  api_key: str = None,
                  endpoint: str = None,  # Add endpoint parameter
-                 device: str = None):
+                 device: str = None,
+                 cache: Any = None):
         """
         Initialize model loader with configuration.
         
@@ -37,6 +38,9 @@ class LoadModel:
             api_key (str): API key for the model provider (required for API deployment type)
             endpoint (str): Endpoint URL for the model provider (optional)
             device (str): Specific GPU device to use (e.g., "cuda:0", "cuda:1")
+            cache: Optional response cache (InMemoryCache, TieredCache or
+                SemanticCache from memories.models.caching), scoped by
+                provider and model name
         """
         # Setup logging
         self.instance_id = str(uuid.uuid4())
@@ -74,6 +78,7 @@ class LoadModel:
         self.model_name = model_name
         self.api_key = api_key
         self.endpoint = endpoint
+        self.cache = cache
         
         # Handle device selection
         self.device = device
@@ -149,6 +154,18 @@ class LoadModel:
             max_retries = kwargs.pop('max_retries', 3)
             timeout = kwargs.pop('timeout', 30)
             
+            # Serve a cached response of this model when there is one
+            cache_model = f"{self.model_provider}/{self.model_name}"
+            if self.cache is not None:
+                cached = self.cache.get(prompt, model=cache_model, **kwargs)
+                if cached is not None:
+                    self.logger.info("Returning cached response")
+                    return {
+                        "text": cached["text"],
+                        "metadata": {**cached["metadata"], "cached": True},
+                        "error": None
+                    }
+            
             # Initialize response
             response = None
             error = None
@@ -201,6 +218,11 @@ class LoadModel:
                     f"Response generated successfully. Length: {len(response)}"
                 )
                 
+                if self.cache is not None:
+                    self.cache.set(
+                        prompt, {"text": response, "metadata": dict(metadata)}, model=cache_model, **kwargs
+                    )
+                
                 return {
                     "text": response,
                     "metadata": metadata,
@@ -2,9 +2,11 @@
 
 import asyncio
 import logging
-from typing import Dict, List, Any, Optional
+import math
+import time
+from typing import Callable, Dict, List, Any, Optional, Tuple
 from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import numpy as np
 
 from memories.models.load_model import LoadModel
@@ -15,15 +17,42 @@ logger = logging.getLogger(__name__)
 class MultiModelInference:
     """Compare and synthesize results from multiple models."""
 
-    def __init__(self, models: Dict[str, LoadModel], consensus_threshold: float = 0.7):
+    def __init__(
+        self,
+        models: Dict[str, LoadModel],
+        consensus_threshold: float = 0.7,
+        cache: Any = None,
+        embedder: Optional[Callable[[List[str]], np.ndarray]] = None,
+        similarity_threshold: float = 0.85
+    ):
         """Initialize multi-model inference.
 
         Args:
             models: Dictionary mapping provider names to LoadModel instances
-            consensus_threshold: Threshold for consensus agreement (0-1)
+            consensus_threshold: Threshold for consensus agreement (0-1); the
+                default quorum is this share of the models
+            cache: Optional response cache shared by the models that have
+                none of their own; entries stay scoped per model
+            embedder: Callable mapping a list of texts to a 2-D array of
+                embeddings, used to cluster responses; defaults to the
+                shared sentence transformer registry
+            similarity_threshold: Minimum mean cosine similarity for a
+                response to join a cluster of agreeing responses
         """
+        if embedder is None:
+            def embedder(texts):
+                from memories.core.embedding_registry import encode_texts
+                return encode_texts(texts, normalize=True)
+
         self.models = models
         self.consensus_threshold = consensus_threshold
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.cache = cache
+        if cache is not None:
+            for model in models.values():
+                if getattr(model, "cache", None) is None:
+                    model.cache = cache
         self.logger = logging.getLogger(__name__)
 
     def get_responses(
@@ -100,6 +129,198 @@ class MultiModelInference:
 
         return responses
 
+    def get_quorum_response(
+        self,
+        query: str,
+        quorum: Optional[int] = None,
+        timeout: float = 60.0,
+        provider_timeouts: Optional[Dict[str, float]] = None,
+        hedge_after: Optional[float] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Query all models and return as soon as a quorum of them agree.
+
+        Responses are embedded as they arrive and clustered by cosine
+        similarity. Once a cluster holds ``quorum`` providers its most
+        central response is returned; providers that have not answered yet
+        are cancelled if still queued and otherwise ignored.
+
+        Args:
+            query: Input query/prompt
+            quorum: Agreeing providers needed (default: ``consensus_threshold``
+                of the models, rounded up)
+            timeout: Seconds to wait for a provider without its own timeout
+            provider_timeouts: Optional per-provider timeouts in seconds
+            hedge_after: Seconds after which a provider that has not answered
+                is sent a second, identical request; the first answer wins
+            **kwargs: Additional parameters for model generation
+
+        Returns:
+            Consensus dict as from ``synthesize_consensus`` plus
+            ``quorum_reached``, ``quorum``, ``responses`` (per provider),
+            ``hedged`` (providers sent a second request) and ``elapsed``
+            (seconds)
+        """
+        providers = list(self.models)
+        if quorum is None:
+            quorum = max(1, math.ceil(self.consensus_threshold * len(providers)))
+        provider_timeouts = provider_timeouts or {}
+        start = time.monotonic()
+        deadlines = {provider: start + provider_timeouts.get(provider, timeout) for provider in providers}
+
+        executor = ThreadPoolExecutor(
+            max_workers=len(providers) * (2 if hedge_after is not None else 1),
+            thread_name_prefix="multi-model"
+        )
+        owners = {
+            executor.submit(model.get_response, query, **kwargs): provider
+            for provider, model in self.models.items()
+        }
+        responses: Dict[str, Dict[str, Any]] = {}
+        clusters: List[List[Tuple[str, np.ndarray]]] = []
+        hedged = set()
+        agreed = None
+
+        try:
+            while agreed is None:
+                now = time.monotonic()
+                for provider in providers:
+                    if provider not in responses and now >= deadlines[provider]:
+                        self.logger.warning(f"{provider} timed out")
+                        responses[provider] = self._error_response(f"Timed out after {deadlines[provider] - start:.2f}s")
+                unanswered = [provider for provider in providers if provider not in responses]
+                if not unanswered:
+                    break
+
+                if hedge_after is not None and now - start >= hedge_after:
+                    for provider in unanswered:
+                        if provider not in hedged:
+                            self.logger.info(f"Hedging slow request to {provider}")
+                            hedged.add(provider)
+                            owners[executor.submit(self.models[provider].get_response, query, **kwargs)] = provider
+
+                wakeups = [deadlines[provider] for provider in unanswered]
+                if hedge_after is not None and any(provider not in hedged for provider in unanswered):
+                    wakeups.append(start + hedge_after)
+                done, _ = wait(list(owners), timeout=max(0.0, min(wakeups) - time.monotonic()),
+                               return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    provider = owners.pop(future)
+                    if provider in responses:
+                        continue
+                    try:
+                        response = future.result()
+                    except Exception as e:
+                        self.logger.error(f"Error from {provider}: {str(e)}")
+                        response = self._error_response(str(e))
+
+                    failed = bool(response.get("error") or not response.get("text"))
+                    if failed and provider in owners.values():
+                        continue  # the hedged request may still succeed
+                    responses[provider] = response
+                    if failed:
+                        continue
+
+                    self.logger.info(f"Got response from {provider}")
+                    cluster = self._add_to_cluster(clusters, provider, self._embed([response["text"]])[0])
+                    if len(cluster) >= quorum:
+                        agreed = cluster
+                        break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        for provider in providers:
+            if provider not in responses:
+                responses[provider] = self._error_response("Cancelled: quorum reached")
+
+        if agreed is None and clusters:
+            agreed = max(clusters, key=len)
+        if agreed is None:
+            result = {
+                "consensus_text": None,
+                "error": "No valid responses to synthesize",
+                "confidence": 0.0,
+                "contributing_models": []
+            }
+        else:
+            result = self._cluster_consensus(agreed, responses, len(providers))
+
+        result.update(
+            quorum_reached=agreed is not None and len(agreed) >= quorum,
+            quorum=quorum,
+            responses=responses,
+            hedged=sorted(hedged),
+            elapsed=time.monotonic() - start
+        )
+        return result
+
+    @staticmethod
+    def _error_response(error: str) -> Dict[str, Any]:
+        return {"text": None, "error": error, "metadata": {}}
+
+    def _embed(self, texts: List[str]) -> np.ndarray:
+        """Embed texts as L2-normalized rows."""
+        vectors = np.asarray(self.embedder(texts), dtype=np.float32).reshape(len(texts), -1)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def _add_to_cluster(
+        self,
+        clusters: List[List[Tuple[str, np.ndarray]]],
+        provider: str,
+        vector: np.ndarray
+    ) -> List[Tuple[str, np.ndarray]]:
+        """Add a response to the cluster it agrees with most, or start a new one.
+
+        Args:
+            clusters: Clusters of (provider, normalized embedding), updated in place
+            provider: Provider of the response
+            vector: Normalized embedding of the response
+
+        Returns:
+            The cluster the response joined
+        """
+        best, best_similarity = None, self.similarity_threshold
+        for cluster in clusters:
+            similarity = float(np.mean([member @ vector for _, member in cluster]))
+            if similarity >= best_similarity:
+                best, best_similarity = cluster, similarity
+        if best is None:
+            best = []
+            clusters.append(best)
+        best.append((provider, vector))
+        return best
+
+    @staticmethod
+    def _cluster_consensus(
+        cluster: List[Tuple[str, np.ndarray]],
+        responses: Dict[str, Dict[str, Any]],
+        total_models: int
+    ) -> Dict[str, Any]:
+        """Consensus from a cluster of agreeing responses.
+
+        The representative is the response most similar on average to the
+        others in the cluster.
+        """
+        members = [provider for provider, _ in cluster]
+        vectors = np.stack([vector for _, vector in cluster])
+        similarities = vectors @ vectors.T
+        primary = members[int(similarities.mean(axis=1).argmax())]
+        if len(members) > 1:
+            agreement = float((similarities.sum() - np.trace(similarities)) / (len(members) * (len(members) - 1)))
+        else:
+            agreement = 1.0
+
+        return {
+            "consensus_text": responses[primary]["text"],
+            "error": None,
+            "confidence": len(members) / total_models,
+            "contributing_models": members,
+            "primary_model": primary,
+            "agreement": agreement
+        }
+
     def get_responses_with_earth_memory(
         self,
         query: str,
@@ -167,7 +388,10 @@ class MultiModelInference:
 
         Args:
             responses: Dict of responses from different models
-            method: Consensus method ("weighted", "majority", "best")
+            method: Consensus method ("similarity", "weighted", "majority",
+                "best"); "similarity" clusters the responses by embedding
+                similarity and picks the most central one of the largest
+                cluster
 
         Returns:
             Dict with consensus response
@@ -186,7 +410,9 @@ class MultiModelInference:
                 "contributing_models": []
             }
 
-        if method == "weighted":
+        if method == "similarity":
+            return self._similarity_consensus(valid_responses, len(responses))
+        elif method == "weighted":
             return self._weighted_consensus(valid_responses)
         elif method == "majority":
             return self._majority_consensus(valid_responses)
@@ -195,6 +421,27 @@ class MultiModelInference:
         else:
             raise ValueError(f"Unknown consensus method: {method}")
 
+    def _similarity_consensus(
+        self,
+        responses: Dict[str, Dict[str, Any]],
+        total_models: int
+    ) -> Dict[str, Any]:
+        """Create consensus from the largest cluster of similar responses.
+
+        Args:
+            responses: Valid responses
+            total_models: Number of models queried, including failed ones
+
+        Returns:
+            Consensus dict
+        """
+        providers = list(responses)
+        vectors = self._embed([responses[provider]["text"] for provider in providers])
+        clusters: List[List[Tuple[str, np.ndarray]]] = []
+        for provider, vector in zip(providers, vectors):
+            self._add_to_cluster(clusters, provider, vector)
+        return self._cluster_consensus(max(clusters, key=len), responses, total_models)
+
     def _weighted_consensus(
         self,
         responses: Dict[str, Dict[str, Any]]
@@ -393,8 +640,11 @@ class MultiModelInference:
         Returns:
             Dict with statistics
         """
-        return {
+        stats = {
             "total_models": len(self.models),
             "model_providers": list(self.models.keys()),
             "consensus_threshold": self.consensus_threshold
         }
+        if self.cache is not None:
+            stats["cache"] = self.cache.get_stats()
+        return stats
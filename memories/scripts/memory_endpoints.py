@@ -68,11 +68,11 @@ async def store_memory(
         )
         
         # Store encrypted data in memory manager
-        memory_manager.store(
-            data_id=secure_metadata['id'],
-            data=encrypted_data,
-            metadata=secure_metadata,
-            tier='hot'  # Store in hot tier for fast access
+        await memory_manager.astore(
+            secure_metadata['id'],
+            encrypted_data,
+            tier='hot',  # Store in hot tier for fast access
+            metadata=secure_metadata
         )
         
         # Generate response
@@ -97,7 +97,7 @@ async def get_memory(
     """Retrieve an Earth memory"""
     try:
         # Retrieve from memory manager
-        memory_data = memory_manager.retrieve(memory_id)
+        memory_data = await memory_manager.aretrieve(memory_id)
         if not memory_data:
             raise HTTPException(status_code=404, detail="Memory not found")
         
@@ -3,12 +3,13 @@ Simple, dependency-free memory store for basic AI fact verification.
 Perfect for getting started with memories-dev concepts.
 """
 
-import json
 import os
 from datetime import datetime
 from typing import Dict, Any, Optional, Union
 from pathlib import Path
 
+from memories.metadata_log import AppendOnlyLog
+
 
 class SimpleMemoryStore:
     """
@@ -18,21 +19,24 @@ class SimpleMemoryStore:
     without requiring DuckDB, FAISS, or other heavy dependencies.
     """
     
-    def __init__(self, storage_path: Optional[str] = None):
+    def __init__(self, storage_path: Optional[str] = None, snapshot_interval: int = 10000):
         """Initialize simple memory store.
         
         Args:
             storage_path: Optional path to persist data (uses in-memory if None)
+            snapshot_interval: Number of logged writes between full snapshots
         """
         self.storage_path = Path(storage_path) if storage_path else None
+        self.snapshot_interval = snapshot_interval
         self.memory_tiers = {
             "hot": {},      # Frequently accessed facts
             "warm": {},     # Regularly accessed facts  
             "cold": {},     # Infrequently accessed facts
         }
+        self._log: Optional[AppendOnlyLog] = None
         
         # Load existing data if storage path provided
-        if self.storage_path and self.storage_path.exists():
+        if self.storage_path:
             self._load_from_disk()
     
     def store(self, key: str, data: Any, tier: str = "hot") -> bool:
@@ -57,11 +61,11 @@ class SimpleMemoryStore:
             "access_count": 0
         }
         
-        self.memory_tiers[tier][key] = stored_data
-        
-        # Persist if storage path provided
-        if self.storage_path:
-            self._save_to_disk()
+        # Persist if storage path provided; appending to the log is O(1) per write
+        if self._log is not None:
+            self._log.set([tier, key], stored_data)
+        else:
+            self.memory_tiers[tier][key] = stored_data
         
         return True
     
@@ -234,27 +238,24 @@ class SimpleMemoryStore:
         return stats
     
     def _save_to_disk(self):
-        """Save memory store to disk."""
-        if not self.storage_path:
-            return
-        
-        # Ensure directory exists
-        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(self.storage_path, 'w') as f:
-            json.dump(self.memory_tiers, f, indent=2)
+        """Fold the write log into a full snapshot on disk."""
+        if self._log is not None:
+            self._log.snapshot()
     
     def _load_from_disk(self):
-        """Load memory store from disk."""
-        if not self.storage_path or not self.storage_path.exists():
+        """Load memory store from disk, replaying writes logged since the last snapshot."""
+        if not self.storage_path:
             return
         
-        try:
-            with open(self.storage_path, 'r') as f:
-                self.memory_tiers = json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            # If file is corrupted or missing, start fresh
-            self.memory_tiers = {"hot": {}, "warm": {}, "cold": {}}
+        # An unreadable snapshot is ignored, so a corrupted file starts fresh
+        self._log = AppendOnlyLog(
+            self.storage_path,
+            snapshot_interval=self.snapshot_interval,
+            default=self.memory_tiers
+        )
+        self.memory_tiers = self._log.data
+        for tier in ("hot", "warm", "cold"):
+            self.memory_tiers.setdefault(tier, {})
 
 
 class SimpleConfig:
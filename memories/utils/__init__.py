@@ -5,6 +5,7 @@ This module provides mock utilities for the memories.utils module
 to allow documentation to be built without requiring all dependencies.
 """
 
+import importlib
 import os
 import sys
 from unittest.mock import MagicMock
@@ -27,8 +28,27 @@ if os.getenv("BUILD_DOCUMENTATION", "false").lower() == "true":
     sys.modules['memories.utils.earth'] = MagicMock()
     sys.modules['memories.utils.earth.advanced_analysis'] = MagicMock()
 
-# Import specific commonly used functions
-from .text.text import parse_text, extract_entities
-from .text.embeddings import get_embeddings
-from .text.context_utils import build_context
-from .types import Bounds, Location, DataPoint
+# Commonly used functions, imported on first attribute access (PEP 562) so
+# that importing a utils submodule does not load the text stack (NLTK, the
+# model loader and torch)
+_LAZY_ATTRIBUTES = {
+    "parse_text": ".text.text",
+    "extract_entities": ".text.text",
+    "get_embeddings": ".text.embeddings",
+    "build_context": ".text.context_utils",
+    "Bounds": ".types",
+    "Location": ".types",
+    "DataPoint": ".types",
+}
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
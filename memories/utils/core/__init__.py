@@ -2,8 +2,16 @@
 Memory-related utilities for database operations and system management.
 """
 
-from .cold_to_redhot import ColdToRedHot
+import importlib
 
-__all__ = ['ColdToRedHot']
+
+def __getattr__(name):
+    # Imported on first use (PEP 562); ColdToRedHot pulls in FAISS and the geo stack
+    if name == "ColdToRedHot":
+        value = importlib.import_module(".cold_to_redhot", __name__).ColdToRedHot
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
+__all__ = ['ColdToRedHot']
@@ -9,7 +9,7 @@ from memories.core.cold import ColdMemory
 from memories.core.memory_manager import MemoryManager
 import pyarrow.parquet as pq
 import glob
-from sentence_transformers import SentenceTransformer
+from memories.core.embedding_registry import DEFAULT_MODEL, get_model, encode_texts
 import numpy as np
 import faiss
 import sys
@@ -32,7 +32,7 @@ class ColdToRedHot:
         # Initialize components using existing connection
         self.cold = ColdMemory(self.memory_manager.con)
         self.red_hot = RedHotMemory()
-        self.model = SentenceTransformer('all-MiniLM-L6-v2')
+        self.model = get_model(DEFAULT_MODEL)
         
         # Debug prints
         print("\nDebug info:")
@@ -85,7 +85,7 @@ class ColdToRedHot:
             schema_info, column_text = self.get_schema_info(file_path)
             
             # Create embedding from column names
-            embedding = self.model.encode([column_text])[0]
+            embedding = encode_texts([column_text], model=self.model)[0]
             
             # Add to red-hot memory
             self.red_hot.add_vector(embedding, metadata=schema_info)
@@ -138,7 +138,7 @@ class ColdToRedHot:
                 
                 for column in columns:
                     # Create embedding for single column name
-                    embedding = self.model.encode([column])[0]
+                    embedding = encode_texts([column], model=self.model)[0]
                     
                     # Add to red-hot memory with complete metadata
                     self.red_hot.add_vector(
@@ -7,8 +7,8 @@ from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 import pyarrow.parquet as pq
 import numpy as np
-from sentence_transformers import SentenceTransformer
 from memories.core.memory_manager import MemoryManager
+from memories.core.embedding_registry import get_model, encode_texts
 
 logger = logging.getLogger(__name__)
 
@@ -45,8 +45,8 @@ def store_schema_embeddings(
         if not cold_path:
             raise ValueError("Cold memory path not found")
             
-        # Initialize embedding model
-        encoder = SentenceTransformer(embedding_model)
+        # Shared embedding model
+        encoder = get_model(embedding_model)
         
         # Find all parquet files
         parquet_files = list(cold_path.rglob("*.parquet"))
@@ -151,7 +151,7 @@ def store_schema_embeddings(
                     
                     # Process batch if full
                     if len(column_batch) >= batch_size:
-                        _process_embedding_batch(memory_manager, encoder, column_batch, metadata_batch)
+                        _process_embedding_batch(memory_manager, encoder, column_batch, metadata_batch, embedding_model)
                         results["stored_columns"] += len(column_batch)
                         column_batch = []
                         metadata_batch = []
@@ -165,7 +165,7 @@ def store_schema_embeddings(
         
         # Process any remaining columns
         if column_batch:
-            _process_embedding_batch(memory_manager, encoder, column_batch, metadata_batch)
+            _process_embedding_batch(memory_manager, encoder, column_batch, metadata_batch, embedding_model)
             results["stored_columns"] += len(column_batch)
         
         return results
@@ -176,14 +176,19 @@ def store_schema_embeddings(
 
 def _process_embedding_batch(
     memory_manager: MemoryManager,
-    encoder: SentenceTransformer,
+    encoder: Any,
     column_batch: List[str],
-    metadata_batch: List[Dict[str, Any]]
+    metadata_batch: List[Dict[str, Any]],
+    embedding_model: str = "all-MiniLM-L6-v2"
 ) -> None:
-    """Process a batch of column names and store their embeddings."""
+    """Process a batch of column names and store their embeddings.
+    
+    Column names already embedded in this process (e.g. ``id`` or
+    ``geometry`` in every file) are served from the embedding cache.
+    """
     try:
         # Generate embeddings for the batch
-        embeddings = encoder.encode(column_batch, convert_to_tensor=True)
+        embeddings = encode_texts(column_batch, model_name=embedding_model, model=encoder, batch_size=len(column_batch))
         
         # Store each embedding with its metadata
         for i, (column_name, metadata) in enumerate(zip(column_batch, metadata_batch)):
@@ -193,7 +198,7 @@ def _process_embedding_batch(
             # Store in red hot memory
             memory_manager.add_to_tier(
                 tier="red_hot",
-                data=embeddings[i].cpu().numpy(),
+                data=embeddings[i],
                 key=key,
                 metadata={
                     "column_name": column_name,
@@ -238,15 +243,12 @@ def find_similar_columns(
             metadata: Additional column metadata
     """
     try:
-        # Initialize embedding model
-        encoder = SentenceTransformer(embedding_model)
-        
-        # Generate embedding for query
-        query_embedding = encoder.encode([column_name], convert_to_tensor=True)[0]
+        # Generate embedding for query with the shared model
+        query_embedding = encode_texts([column_name], model_name=embedding_model)[0]
         
         # Search in red hot memory
         results = memory_manager.search_vectors(
-            query_vector=query_embedding.cpu().numpy(),
+            query_vector=query_embedding,
             k=max_results,
             metadata_filter=None  # No filtering, we want all columns
         )
@@ -5,7 +5,7 @@ Text embedding utilities for vector encoding.
 import logging
 from typing import Optional, Any, Union
 from pathlib import Path
-from sentence_transformers import SentenceTransformer
+from memories.core.embedding_registry import get_model
 
 logger = logging.getLogger(__name__)
 
@@ -23,11 +23,7 @@ def get_encoder(
         Loaded model's encode function
     """
     try:
-        if cache_dir:
-            model = SentenceTransformer(model_name, cache_folder=str(cache_dir))
-        else:
-            model = SentenceTransformer(model_name)
-        logger.info(f"Loaded vector encoder model: {model_name}")
+        model = get_model(model_name, cache_dir)
         return model.encode
     except Exception as e:
         logger.error(f"Failed to load vector encoder model: {e}")
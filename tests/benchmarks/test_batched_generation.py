@@ -0,0 +1,37 @@
+"""
+Benchmark of BaseModel.generate_batch tokens/sec at batch sizes 1 to 32.
+
+Runs on CPU with the tiny randomly initialized GPT-2 of the
+``local_causal_lm`` fixture, so it measures batching overhead rather than
+model quality. MEMORIES_BENCH_GEN_TOKENS sets the new tokens per prompt
+(default 16).
+"""
+
+import os
+import time
+import logging
+
+import pytest
+
+logger = logging.getLogger(__name__)
+pytestmark = pytest.mark.benchmark
+
+NEW_TOKENS = int(os.getenv("MEMORIES_BENCH_GEN_TOKENS", "16"))
+BATCH_SIZES = [1, 2, 4, 8, 16, 32]
+WORDS = "the river lake city forest field road north south east west of in near land use water".split()
+
+
+def test_generate_batch_tokens_per_second(local_causal_lm):
+    prompts = [" ".join(WORDS[i % len(WORDS):] + WORDS[:i % 7]) for i in range(max(BATCH_SIZES))]
+    params = {"do_sample": False, "min_new_tokens": NEW_TOKENS, "max_new_tokens": NEW_TOKENS}
+    local_causal_lm.generate_batch(prompts[:2], **params)  # warm up
+
+    throughput = {}
+    for batch_size in BATCH_SIZES:
+        start = time.perf_counter()
+        local_causal_lm.generate_batch(prompts, batch_size=batch_size, **params)
+        throughput[batch_size] = len(prompts) * NEW_TOKENS / (time.perf_counter() - start)
+
+    logger.info("generate_batch tokens/sec: " +
+                ", ".join(f"batch {size}: {rate:,.0f}" for size, rate in throughput.items()))
+    assert throughput[32] > throughput[1]
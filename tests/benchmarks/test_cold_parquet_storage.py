@@ -0,0 +1,123 @@
+"""
+Benchmark of ColdMemory DataFrame storage: ZSTD Parquet datasets against the
+previous ``df.to_json()`` blobs in the ``cold_data`` table.
+
+Reports store time, full retrieve time, a projected and filtered retrieve,
+and the size on disk of each format. MEMORIES_BENCH_COLD_ROWS sets the frame
+size (default 50000; use 5000000 for a production-sized frame).
+"""
+
+import os
+import json
+import time
+import logging
+from io import StringIO
+from pathlib import Path
+
+import duckdb
+import numpy as np
+import pandas as pd
+import pytest
+
+from memories.core.cold import ColdMemory
+
+logger = logging.getLogger(__name__)
+pytestmark = pytest.mark.benchmark
+
+ROWS = int(os.getenv("MEMORIES_BENCH_COLD_ROWS", "50000"))
+
+
+class DictCatalog:
+    """Minimal in-memory catalog so only cold storage itself is timed."""
+
+    def __init__(self):
+        self.entries = {}
+
+    async def register_data(self, tier, location, size, data_type, metadata=None, tags=None):
+        data_id = f"id-{len(self.entries)}"
+        self.entries[data_id] = {
+            "data_id": data_id, "location": location, "size": size,
+            "additional_meta": json.dumps(metadata or {})
+        }
+        return data_id
+
+    async def get_data_info(self, data_id):
+        return self.entries.get(data_id)
+
+
+def make_frame(rows):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "id": np.arange(rows, dtype=np.int64),
+        "lat": rng.uniform(-90, 90, rows),
+        "lon": rng.uniform(-180, 180, rows),
+        "value": rng.normal(size=rows).astype(np.float32),
+        "category": pd.Categorical(rng.choice(["road", "river", "building", "park"], rows)).astype(str),
+        "observed_at": pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 86400 * 365, rows), unit="s")
+    })
+
+
+def dir_size(path):
+    return sum(f.stat().st_size for f in Path(path).rglob("*") if f.is_file())
+
+
+@pytest.fixture
+def cold_memory(tmp_path):
+    config_path = tmp_path / "cold_config.yml"
+    config_path.write_text(f"storage:\n  path: {tmp_path / 'cold'}\n  raw_data_path: {tmp_path / 'raw'}\n")
+    memory = ColdMemory(config_path=str(config_path))
+    memory.memory_catalog = DictCatalog()
+    yield memory
+    memory.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_parquet_against_json_storage(cold_memory, tmp_path):
+    df = make_frame(ROWS)
+
+    # Previous path: one JSON document per frame in a DuckDB table
+    json_db = tmp_path / "json_cold.duckdb"
+    con = duckdb.connect(str(json_db))
+    con.execute("CREATE TABLE cold_data (id VARCHAR PRIMARY KEY, data JSON)")
+    start = time.perf_counter()
+    con.execute("INSERT INTO cold_data (id, data) VALUES (?, ?)", ["json", df.to_json()])
+    con.execute("CHECKPOINT")
+    json_store = time.perf_counter() - start
+    start = time.perf_counter()
+    json_df = pd.read_json(StringIO(con.execute("SELECT data FROM cold_data WHERE id = 'json'").fetchone()[0]))
+    json_retrieve = time.perf_counter() - start
+    con.close()
+    json_bytes = json_db.stat().st_size
+    assert len(json_df) == ROWS
+    del json_df
+
+    start = time.perf_counter()
+    assert await cold_memory.store(df, partition_by=["category"])
+    parquet_store = time.perf_counter() - start
+    entry = next(iter(cold_memory.memory_catalog.entries.values()))
+    parquet_bytes = dir_size(entry["location"])
+
+    start = time.perf_counter()
+    result = await cold_memory.retrieve({"data_id": entry["data_id"]})
+    parquet_retrieve = time.perf_counter() - start
+    assert len(result["data"]) == ROWS
+    assert result["data"]["value"].dtype == np.float32
+
+    start = time.perf_counter()
+    subset = await cold_memory.retrieve({
+        "data_id": entry["data_id"],
+        "columns": ["id", "value"],
+        "filters": [("category", "=", "river"), ("lat", ">", 45.0)]
+    })
+    filtered_retrieve = time.perf_counter() - start
+    expected = ((df["category"] == "river") & (df["lat"] > 45.0)).sum()
+    assert len(subset["data"]) == expected
+
+    logger.info(
+        f"ColdMemory with {ROWS:,} rows: store {json_store:.2f}s JSON vs {parquet_store:.2f}s Parquet; "
+        f"retrieve {json_retrieve:.2f}s JSON vs {parquet_retrieve:.2f}s Parquet "
+        f"({filtered_retrieve:.3f}s projected+filtered); "
+        f"on disk {json_bytes / 2**20:.1f} MiB JSON vs {parquet_bytes / 2**20:.1f} MiB Parquet"
+    )
+    assert parquet_bytes < json_bytes
+    assert parquet_retrieve < json_retrieve
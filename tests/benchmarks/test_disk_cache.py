@@ -0,0 +1,93 @@
+"""
+Benchmark of DiskCache get/set throughput from 8 concurrent threads.
+
+Compares the WAL-mode cache (per-thread connections, batched writes) with
+the previous design, which opened a new SQLite connection and committed on
+every call. MEMORIES_BENCH_CACHE_OPS sets the operations per thread
+(default 500).
+"""
+
+import os
+import json
+import time
+import pickle
+import sqlite3
+import logging
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from memories.models.caching import DiskCache
+
+logger = logging.getLogger(__name__)
+pytestmark = pytest.mark.benchmark
+
+THREADS = 8
+OPS = int(os.getenv("MEMORIES_BENCH_CACHE_OPS", "500"))
+RESPONSE = {"text": "The river runs north of the old market. " * 20, "model": "bench", "tokens": 180}
+
+
+class ConnectionPerCallCache:
+    """The previous DiskCache access pattern: connect, execute, commit, close."""
+
+    def __init__(self, cache_dir):
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = str(cache_dir / "cache.db")
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("CREATE TABLE cache (key TEXT PRIMARY KEY, value BLOB, metadata TEXT, created_at TEXT, "
+                     "last_accessed TEXT, access_count INTEGER)")
+        conn.commit()
+        conn.close()
+
+    def set(self, prompt, value):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        now = datetime.now().isoformat()
+        conn.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?)",
+                     (prompt, pickle.dumps(value), json.dumps({}), now, now, 0))
+        conn.commit()
+        conn.close()
+
+    def get(self, prompt):
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        row = conn.execute("SELECT value, access_count FROM cache WHERE key = ?", (prompt,)).fetchone()
+        conn.execute("UPDATE cache SET last_accessed = ?, access_count = ? WHERE key = ?",
+                     (datetime.now().isoformat(), row[1] + 1, prompt))
+        conn.commit()
+        conn.close()
+        return pickle.loads(row[0])
+
+
+def throughput(cache):
+    """Run OPS sets then OPS gets per thread; return (sets/s, gets/s)."""
+    def run(operation):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            list(executor.map(operation, range(THREADS)))
+        return THREADS * OPS / (time.perf_counter() - start)
+
+    sets = run(lambda worker: [cache.set(f"prompt {worker} {i}", RESPONSE) for i in range(OPS)])
+    gets = run(lambda worker: [cache.get(f"prompt {worker} {i}") == RESPONSE or pytest.fail("bad value")
+                               for i in range(OPS)])
+    return sets, gets
+
+
+@pytest.mark.parametrize("serializer, compress", [("pickle", False), ("msgpack", True)])
+def test_concurrent_throughput(tmp_path, serializer, compress):
+    if compress:
+        pytest.importorskip("zstandard")
+        pytest.importorskip(serializer)
+    legacy_sets, legacy_gets = throughput(ConnectionPerCallCache(tmp_path / "legacy"))
+
+    cache = DiskCache(cache_dir=str(tmp_path / "wal"), serializer=serializer, compress=compress)
+    sets, gets = throughput(cache)
+    stats = cache.get_stats()
+    cache.close()
+
+    logger.info(
+        f"DiskCache {serializer}{'+zstd' if compress else ''}, {THREADS} threads: "
+        f"set {sets:,.0f}/s, get {gets:,.0f}/s, {stats['bytes'] / stats['size']:.0f} bytes/entry; "
+        f"connection per call: set {legacy_sets:,.0f}/s, get {legacy_gets:,.0f}/s"
+    )
+    assert stats["size"] == THREADS * OPS
+    assert sets > legacy_sets and gets > legacy_gets
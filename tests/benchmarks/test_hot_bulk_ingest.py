@@ -0,0 +1,61 @@
+"""
+Benchmark of HotMemory ingest throughput: per-row ``store`` against bulk ``store_many``.
+
+MEMORIES_BENCH_HOT_ROWS takes a comma-separated list of sizes, e.g. "10000,1000000".
+The per-row path is timed on at most 2k rows since it is linear in the row count.
+"""
+
+import os
+import time
+import asyncio
+import logging
+
+import pytest
+
+from memories.core.hot import HotMemory
+
+logger = logging.getLogger(__name__)
+pytestmark = pytest.mark.benchmark
+
+ROW_COUNTS = [int(n) for n in os.getenv("MEMORIES_BENCH_HOT_ROWS", "10000").split(",")]
+PER_ROW_SAMPLE = 2000
+
+
+def make_items(n, offset=0):
+    return [
+        {"data": {"value": i, "name": f"item_{i}"}, "metadata": {"batch": offset}, "tags": ["bench", f"shard_{i % 16}"]}
+        for i in range(offset, offset + n)
+    ]
+
+
+@pytest.fixture
+def hot_memory(test_config_path):
+    memory = HotMemory(config_path=test_config_path)
+    asyncio.run(memory.clear())
+    yield memory
+    asyncio.run(memory.clear())
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("rows", ROW_COUNTS)
+async def test_store_many_throughput(hot_memory, rows):
+    sample = min(rows, PER_ROW_SAMPLE)
+    items = make_items(sample)
+    start = time.perf_counter()
+    for item in items:
+        await hot_memory.store(**item)
+    per_row_rate = sample / (time.perf_counter() - start)
+    await hot_memory.clear()
+    
+    items = make_items(rows)
+    start = time.perf_counter()
+    ids = await hot_memory.store_many(items)
+    bulk_rate = rows / (time.perf_counter() - start)
+    
+    logger.info(
+        f"HotMemory ingest of {rows} rows: store {per_row_rate:,.0f} rows/s, "
+        f"store_many {bulk_rate:,.0f} rows/s ({bulk_rate / per_row_rate:.1f}x)"
+    )
+    assert len(ids) == rows
+    assert hot_memory.get_table_info()["hot_tags_count"] == 2 * rows
+    assert bulk_rate > 5 * per_row_rate
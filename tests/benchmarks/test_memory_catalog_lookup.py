@@ -0,0 +1,114 @@
+"""
+Benchmark of MemoryCatalog lookups on a large catalog.
+
+Compares tag queries on the normalized, compacted tag table against the
+previous ``tags LIKE`` scan (which also matches tag prefixes, e.g. ``shard_4``
+matches ``shard_42``), and buffered access accounting against one UPDATE per
+access. MEMORIES_BENCH_CATALOG_ROWS sets the catalog size (default 50000;
+use 1000000 for a large catalog).
+"""
+
+import os
+import time
+import random
+import logging
+import statistics
+
+import pytest
+
+from memories.core.memory_catalog import MemoryCatalog
+from memories.core.memory_manager import MemoryManager
+
+logger = logging.getLogger(__name__)
+pytestmark = pytest.mark.benchmark
+
+ROWS = int(os.getenv("MEMORIES_BENCH_CATALOG_ROWS", "50000"))
+SHARDS = 1000
+SAMPLES = 500
+
+
+@pytest.fixture
+def catalog(tmp_path, monkeypatch):
+    monkeypatch.setattr(MemoryCatalog, "_instance", None)
+    monkeypatch.setattr(
+        MemoryManager().config, "get_path",
+        lambda key, default_filename=None: str(tmp_path / default_filename)
+    )
+    catalog = MemoryCatalog()
+    catalog.con.execute(f"""
+        INSERT INTO memory_catalog
+        SELECT 'item-' || i, 'cold', 'loc/' || i, now(), now(), 0, 1024,
+               'shard_' || (i % {SHARDS}) || ',kind_' || (i % 7), 'table', 'table_' || i, '{{}}'
+        FROM range({ROWS}) t(i)
+    """)
+    catalog.con.execute(f"""
+        INSERT INTO catalog_tags
+        SELECT 'shard_' || (i % {SHARDS}), 'item-' || i FROM range({ROWS}) t(i)
+        UNION ALL
+        SELECT 'kind_' || (i % 7), 'item-' || i FROM range({ROWS}) t(i)
+    """)
+    yield catalog
+    catalog.cleanup()
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    return statistics.median(samples), samples[int(len(samples) * 0.99) - 1]
+
+
+@pytest.mark.asyncio
+async def test_catalog_lookup_latency(catalog):
+    rng = random.Random(0)
+    ids = [f"item-{rng.randrange(ROWS)}" for _ in range(SAMPLES)]
+    
+    info_ms = []
+    for data_id in ids:
+        start = time.perf_counter()
+        assert (await catalog.get_data_info(data_id))["data_id"] == data_id
+        info_ms.append((time.perf_counter() - start) * 1000)
+    
+    tag_ms, like_ms = [], []
+    for i in range(20):
+        shard = f"shard_{rng.randrange(SHARDS)}"
+        start = time.perf_counter()
+        results = await catalog.search_by_tags([shard, "kind_3"], match="all")
+        tag_ms.append((time.perf_counter() - start) * 1000)
+        assert results and all(shard in r["tags"].split(",") for r in results)
+        
+        _, elapsed = timed(lambda: catalog.con.execute(
+            f"SELECT * FROM memory_catalog WHERE tags LIKE '%{shard},%' AND tags LIKE '%kind_3%'"
+        ).fetchall())
+        like_ms.append(elapsed)
+    
+    # Read path: one UPDATE per access versus buffered, batched accounting
+    start = time.perf_counter()
+    for data_id in ids:
+        catalog.con.execute("""
+            UPDATE memory_catalog SET last_accessed = now(), access_count = access_count + 1
+            WHERE data_id = ?
+        """, [data_id])
+    per_access_ms = (time.perf_counter() - start) * 1000 / SAMPLES
+    
+    catalog.access_flush_interval = 3600
+    start = time.perf_counter()
+    for data_id in ids:
+        await catalog.update_access(data_id)
+    catalog.flush_access()
+    buffered_ms = (time.perf_counter() - start) * 1000 / SAMPLES
+    
+    total = catalog.con.execute("SELECT SUM(access_count) FROM memory_catalog").fetchone()[0]
+    assert total == 2 * SAMPLES
+    
+    info_p50, info_p99 = percentiles(info_ms)
+    logger.info(
+        f"MemoryCatalog with {ROWS} entries: get_data_info p50 {info_p50:.2f}ms p99 {info_p99:.2f}ms; "
+        f"AND tag query median {statistics.median(tag_ms):.1f}ms vs LIKE scan {statistics.median(like_ms):.1f}ms; "
+        f"access accounting {buffered_ms:.3f}ms buffered vs {per_access_ms:.3f}ms per UPDATE"
+    )
+    assert buffered_ms < per_access_ms
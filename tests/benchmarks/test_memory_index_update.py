@@ -0,0 +1,181 @@
+"""
+Benchmark of MemoryIndex.update_index over many catalog tables with a stub encoder.
+
+The stub stands in for SentenceTransformer so the benchmark runs offline and
+measures indexing overhead and the number of encoder calls rather than model
+speed. MEMORIES_BENCH_TABLES sets the number of tables (default 10000).
+"""
+
+import os
+import time
+import zlib
+import logging
+import importlib
+from unittest.mock import MagicMock, AsyncMock
+
+import numpy as np
+import pytest
+
+logger = logging.getLogger(__name__)
+pytestmark = pytest.mark.benchmark
+
+TABLES = int(os.getenv("MEMORIES_BENCH_TABLES", "10000"))
+COLUMNS = ["id", "name", "value", "geometry", "updated_at"]
+DIMENSION = 384
+
+
+class StubEncoder:
+    """Deterministic SentenceTransformer stand-in that counts its work."""
+    
+    def __init__(self, *args, **kwargs):
+        self.calls = 0
+        self.texts = 0
+    
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, normalize_embeddings=False, **kwargs):
+        single = isinstance(texts, str)
+        texts = [texts] if single else list(texts)
+        self.calls += 1
+        self.texts += len(texts)
+        vectors = np.stack([
+            np.random.default_rng(zlib.crc32(text.encode())).standard_normal(DIMENSION)
+            for text in texts
+        ]).astype(np.float32)
+        if normalize_embeddings:
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors[0] if single else vectors
+
+
+def catalog_rows(n, changed=()):
+    return [
+        {
+            "data_id": f"table-{i}",
+            "primary_tier": "cold",
+            "location": f"bench_db/table_{i}",
+            "created_at": "2024-01-02T00:00:00" if i in changed else "2024-01-01T00:00:00",
+            "last_accessed": "2024-01-01T00:00:00",
+            "access_count": 0,
+            "size": 1000,
+            "tags": "bench",
+            "data_type": "table",
+            "table_name": f"table_{i}",
+            "additional_meta": "{}",
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def memory_index(monkeypatch, tmp_path):
+    sentence_transformers = pytest.importorskip("sentence_transformers")
+    from memories.core import embedding_registry
+    monkeypatch.setattr(sentence_transformers, "SentenceTransformer", StubEncoder)
+    embedding_registry.clear_models()
+    embedding_registry.embedding_cache.clear()
+    module = importlib.import_module("memories.core.memory_index")
+    
+    catalog = MagicMock()
+    catalog.get_tier_data = AsyncMock()
+    monkeypatch.setattr(module, "memory_catalog", catalog)
+    
+    index = module.MemoryIndex()
+    monkeypatch.setattr(index, "model", StubEncoder())
+    cold = MagicMock()
+    cold.get_schema = AsyncMock(return_value={
+        "columns": COLUMNS,
+        "dtypes": {c: "string" for c in COLUMNS},
+        "type": "dataframe",
+    })
+    monkeypatch.setattr(index, "_cold_memory", cold)
+    monkeypatch.setattr(index, "storage_path", tmp_path)
+    index._indexes.pop("cold", None)
+    yield index, catalog, cold
+    index._indexes.pop("cold", None)
+    index.metadata.pop("cold", None)
+    index.items.pop("cold", None)
+    index._dirty.discard("cold")
+    embedding_registry.clear_models()
+    embedding_registry.embedding_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_incremental_update_index(memory_index):
+    index, catalog, cold = memory_index
+    
+    catalog.get_tier_data.return_value = catalog_rows(TABLES)
+    start = time.perf_counter()
+    await index.update_index("cold")
+    full_time = time.perf_counter() - start
+    full_calls = index.model.calls
+    
+    vectors = TABLES * len(COLUMNS)
+    assert index._indexes["cold"].ntotal == vectors
+    assert index.model.texts == vectors
+    assert full_calls == -(-vectors // index.batch_size)
+    # The schema is stored once per table, not once per column
+    assert len(index.items["cold"]) == TABLES
+    assert all("schema" not in entry for entry in index.metadata["cold"].values())
+    
+    changed = set(range(0, TABLES, 100))
+    catalog.get_tier_data.return_value = catalog_rows(TABLES, changed)[:-1]
+    cold.get_schema.reset_mock()
+    start = time.perf_counter()
+    await index.update_index("cold")
+    incremental_time = time.perf_counter() - start
+    
+    assert cold.get_schema.await_count == len(changed)
+    # Changed tables keep their column texts, so the embedding cache serves them
+    assert index.model.texts == vectors
+    assert index._indexes["cold"].ntotal == vectors - len(COLUMNS)
+    
+    # search() returns canned results under pytest, so query the index directly
+    D, I = index._indexes["cold"].search(index._encode(["bench_db.table_100.geometry"]), 1)
+    entry = index.metadata["cold"][int(I[0][0])]
+    assert entry["data_id"] == "table-100" and entry["column_name"] == "geometry"
+    assert index.items["cold"]["table-100"]["info"]["schema"]["columns"] == COLUMNS
+    
+    logger.info(
+        f"MemoryIndex update of {TABLES} tables ({vectors} columns): full {full_time:.2f}s "
+        f"in {full_calls} encode calls, incremental with {len(changed)} changed "
+        f"{incremental_time:.2f}s"
+    )
+    assert incremental_time < full_time
+
+
+@pytest.mark.asyncio
+async def test_warm_start_reloads_persisted_index(memory_index):
+    index, catalog, cold = memory_index
+    catalog.get_tier_data.return_value = catalog_rows(TABLES)
+    
+    start = time.perf_counter()
+    await index.update_index("cold")
+    build_time = time.perf_counter() - start
+    assert (index.storage_path / "cold.manifest.json").exists()
+    
+    # Simulate a restart: drop in-memory state and the embedding cache
+    from memories.core import embedding_registry
+    embedding_registry.embedding_cache.clear()
+    index._indexes.pop("cold")
+    index.metadata.pop("cold")
+    index.items.pop("cold")
+    texts_before = index.model.texts
+    
+    start = time.perf_counter()
+    assert index.load(["cold"]) == ["cold"]
+    load_time = time.perf_counter() - start
+    assert index._indexes["cold"].ntotal == TABLES * len(COLUMNS)
+    assert index.items["cold"]["table-7"]["info"]["schema"]["columns"] == COLUMNS
+    
+    cold.get_schema.reset_mock()
+    await index.update_index("cold")
+    assert cold.get_schema.await_count == 0
+    assert index.model.texts == texts_before
+    
+    logger.info(
+        f"MemoryIndex with {TABLES} tables: build {build_time:.2f}s, reload {load_time:.2f}s"
+    )
+    assert load_time < build_time
+    
+    # A corrupted sidecar fails the content hash and is not loaded
+    with open(index.storage_path / "cold.items.parquet", "ab") as f:
+        f.write(b"garbage")
+    assert index.load(["cold"]) == []
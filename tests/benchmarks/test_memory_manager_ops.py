@@ -0,0 +1,94 @@
+"""
+Benchmark of MemoryManager store+retrieve cycles against the hot tier.
+
+HotMemory files items under generated IDs, so the benchmark uses a subclass
+that keeps MemoryManager's key semantics: ``store(key, value, metadata)``
+writes the row with ``id = key`` and ``retrieve(key)`` reads it back.
+The "before" path rebuilds the tier and looks up an event loop on every call,
+as MemoryManager used to; the "after" path uses the manager's long-lived tier
+instance through the same sync ``store``/``retrieve`` calls.
+MEMORIES_BENCH_CYCLES sets the number of cycles (default 10000); the per-call
+path is timed on at most 1k cycles since it only serves as the baseline.
+"""
+
+import os
+import json
+import time
+import asyncio
+import logging
+from datetime import datetime
+
+import pytest
+
+from memories.core.hot import HotMemory
+from memories.core.memory_manager import MemoryManager
+
+logger = logging.getLogger(__name__)
+pytestmark = pytest.mark.benchmark
+
+CYCLES = int(os.getenv("MEMORIES_BENCH_CYCLES", "10000"))
+PER_CALL_SAMPLE = 1000
+
+
+class KeyedHotMemory(HotMemory):
+    """Hot memory addressed by the caller's key instead of a generated ID."""
+
+    async def store(self, key, value, metadata=None):
+        with self._get_connection() as con:
+            con.execute(
+                "INSERT INTO hot_data (id, data, metadata, tags, stored_at) VALUES (?, ?, ?, '[]', ?)",
+                [key, self._to_json(value), json.dumps(metadata or {}), datetime.now()]
+            )
+        return key
+
+    async def retrieve(self, key):
+        rows = await super().retrieve({"id": key})
+        return rows[0]["data"] if rows else None
+
+
+def per_call_cycle(key, value):
+    """One store+retrieve the way MemoryManager did it before tier reuse."""
+    try:
+        loop = asyncio.get_event_loop()
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+    loop.run_until_complete(KeyedHotMemory().store(key, value, {}))
+    return loop.run_until_complete(KeyedHotMemory().retrieve(key))
+
+
+@pytest.fixture
+def manager(test_config_path):
+    manager = MemoryManager()
+    hot = KeyedHotMemory()
+    asyncio.run(hot.clear())
+    previous = manager._tiers.get("hot")
+    manager._tiers["hot"] = hot
+    yield manager
+    asyncio.run(hot.clear())
+    if previous is None:
+        manager._tiers.pop("hot", None)
+    else:
+        manager._tiers["hot"] = previous
+
+
+def test_store_retrieve_ops_per_second(manager):
+    sample = min(CYCLES, PER_CALL_SAMPLE)
+    start = time.perf_counter()
+    for i in range(sample):
+        assert per_call_cycle(f"k{i}", {"value": i}) == {"value": i}
+    before_rate = sample / (time.perf_counter() - start)
+    asyncio.run(manager._get_tier("hot").clear())
+
+    start = time.perf_counter()
+    for i in range(CYCLES):
+        manager.store(f"k{i}", {"value": i}, tier="hot")
+        assert manager.retrieve(f"k{i}", tier="hot") == {"value": i}
+    after_rate = CYCLES / (time.perf_counter() - start)
+
+    logger.info(
+        f"MemoryManager {CYCLES} store+retrieve cycles: per-call tiers {before_rate:,.0f} ops/s, "
+        f"reused tiers {after_rate:,.0f} ops/s ({after_rate / before_rate:.1f}x)"
+    )
+    assert manager._get_tier("hot").get_table_info()["hot_data_count"] == CYCLES
+    assert after_rate > before_rate
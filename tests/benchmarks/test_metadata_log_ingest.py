@@ -0,0 +1,62 @@
+"""
+Benchmark of per-insert latency while ingesting into SimpleMemoryStore and RedHotMemory.
+
+With the append-only metadata log each insert costs O(1), so the latency of the
+last slice of an ingest should match the first. Set MEMORIES_BENCH_ITEMS to
+change the number of inserted items.
+"""
+
+import os
+import time
+import logging
+
+import numpy as np
+import pytest
+
+from memories.core.red_hot import RedHotMemory
+from memories.simple_memory import SimpleMemoryStore
+
+logger = logging.getLogger(__name__)
+pytestmark = pytest.mark.benchmark
+
+NUM_ITEMS = int(os.getenv("MEMORIES_BENCH_ITEMS", "100000"))
+SLICES = 10
+
+
+def report(name, slice_times):
+    """Log per-insert latency per slice and return the last/first slice ratio."""
+    per_insert_us = [t * 1e6 / (NUM_ITEMS // SLICES) for t in slice_times]
+    logger.info(f"{name}: per-insert latency by slice (us): " + ", ".join(f"{t:.1f}" for t in per_insert_us))
+    # Compare medians of the first and last thirds to smooth out snapshot spikes
+    third = max(1, SLICES // 3)
+    return np.median(per_insert_us[-third:]) / np.median(per_insert_us[:third])
+
+
+def test_simple_memory_store_ingest(tmp_path):
+    store = SimpleMemoryStore(str(tmp_path / "memory_data.json"))
+    slice_size = NUM_ITEMS // SLICES
+    slice_times = []
+    for s in range(SLICES):
+        start = time.perf_counter()
+        for i in range(s * slice_size, (s + 1) * slice_size):
+            store.store(f"fact_{i}", {"value": i})
+        slice_times.append(time.perf_counter() - start)
+    
+    assert report("SimpleMemoryStore", slice_times) < 3
+    assert len(SimpleMemoryStore(str(tmp_path / "memory_data.json")).memory_tiers["hot"]) == NUM_ITEMS
+
+
+@pytest.mark.asyncio
+async def test_red_hot_metadata_ingest(tmp_path):
+    memory = RedHotMemory(dimension=16, storage_path=str(tmp_path))
+    vectors = np.random.default_rng(0).random((NUM_ITEMS, 16), dtype=np.float32)
+    slice_size = NUM_ITEMS // SLICES
+    slice_times = []
+    for s in range(SLICES):
+        start = time.perf_counter()
+        for i in range(s * slice_size, (s + 1) * slice_size):
+            await memory.store(vectors[i], metadata={"id": i}, tags=["bench"])
+        slice_times.append(time.perf_counter() - start)
+    
+    assert report("RedHotMemory", slice_times) < 3
+    memory.cleanup()
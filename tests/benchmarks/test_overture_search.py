@@ -0,0 +1,143 @@
+"""
+Benchmark of OvertureConnector.search_batches on a synthetic downloaded
+Parquet file.
+
+Features lie on a grid written row by row with FLOAT bbox fields, so like
+Overture's spatially sorted files each row group covers a narrow latitude
+band and the bbox filter can skip row groups by their statistics. Reports
+latency for result sets from 10k features up to the whole file, and the RSS
+growth while streaming the whole file in a fresh interpreter.
+MEMORIES_BENCH_OVERTURE_FEATURES sets the number of features (default
+1000000; the grid width and row group size scale with it, and 20000000
+matches a large downloaded theme).
+"""
+
+import os
+import sys
+import time
+import logging
+import subprocess
+import textwrap
+
+import duckdb
+import pytest
+
+from memories.core.glacier.artifacts.overture import OvertureConnector
+
+logger = logging.getLogger(__name__)
+pytestmark = pytest.mark.benchmark
+
+FEATURES = int(os.getenv("MEMORIES_BENCH_OVERTURE_FEATURES", "1000000"))
+# 4000 grid rows of COLUMNS features, about 160 row groups at any size
+COLUMNS = max(FEATURES // 4000, 1)
+ROW_GROUP_SIZE = max(FEATURES // 160, 2048)
+STEP = 0.0001
+
+
+def band(rows):
+    """Bbox covering ``rows`` full grid rows, i.e. ``rows * COLUMNS`` features."""
+    return {"xmin": -1.0, "ymin": 0.01 - STEP / 2, "xmax": 1.0, "ymax": 0.01 + (rows - 0.5) * STEP}
+
+
+@pytest.fixture(scope="module")
+def overture(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp("overture")
+    path = data_dir / "places" / "place" / "place_filtered.parquet"
+    path.parent.mkdir(parents=True)
+    duckdb.sql(f"""
+        COPY (
+            SELECT
+                'place_' || i AS id,
+                'feature ' || i AS primary_name,
+                'POINT'::BLOB AS geometry,
+                {{
+                    'xmin': ((i % {COLUMNS}) * {STEP})::FLOAT, 'xmax': ((i % {COLUMNS}) * {STEP})::FLOAT,
+                    'ymin': ((i // {COLUMNS}) * {STEP})::FLOAT, 'ymax': ((i // {COLUMNS}) * {STEP})::FLOAT
+                }} AS bbox,
+                'park' AS class
+            FROM range({FEATURES}) t(i)
+        ) TO '{path}' (FORMAT 'parquet', ROW_GROUP_SIZE {ROW_GROUP_SIZE})
+    """)
+    connector = OvertureConnector(data_dir=str(data_dir), release_path=str(data_dir / "release"))
+    yield connector
+    connector.con.close()
+
+
+def stream(overture, bbox, repeats=1):
+    """Stream a bbox search; returns the row count and the best of ``repeats`` timings."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        rows = sum(
+            batch.num_rows
+            for _, _, batch in overture.search_batches(bbox, themes=["places"], columns=["id", "primary_name"])
+        )
+        best = min(best, time.perf_counter() - start)
+    return rows, best
+
+
+def test_latency_scales_with_result_size(overture):
+    stream(overture, band(1))  # warm up
+    timings = {}
+    for rows in (2, 20, 200):
+        count, seconds = stream(overture, band(rows), repeats=3)
+        assert count == rows * COLUMNS
+        timings[count] = seconds
+    total, full_seconds = stream(overture, {"xmin": -180, "ymin": -90, "xmax": 180, "ymax": 90})
+    assert total == FEATURES
+
+    logger.info(
+        f"search_batches over {FEATURES:,} features: "
+        + ", ".join(f"{count:,} results in {seconds * 1000:.0f}ms" for count, seconds in timings.items())
+        + f", whole file in {full_seconds * 1000:.0f}ms"
+    )
+    # The file layout lets a 2-row band prune to one or two row groups
+    bbox = band(2)
+    path = overture._downloaded_files("places", "place")[0]
+    candidates = overture.con.execute(f"""
+        SELECT COUNT(DISTINCT row_group_id) FROM parquet_metadata('{path}')
+        WHERE path_in_schema = 'bbox, ymin'
+          AND CAST(stats_max AS DOUBLE) >= {bbox['ymin']} AND CAST(stats_min AS DOUBLE) <= {bbox['ymax']}
+    """).fetchone()[0]
+    assert candidates <= 2
+
+    # The same search with untyped bounds casts the column and reads every row group
+    unpruned_seconds = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        unpruned = overture.con.execute(
+            f"SELECT id, primary_name FROM read_parquet('{path}') "
+            "WHERE bbox.xmax >= ? AND bbox.xmin <= ? AND bbox.ymax >= ? AND bbox.ymin <= ?",
+            [bbox['xmin'], bbox['xmax'], bbox['ymin'], bbox['ymax']]
+        ).fetchall()
+        unpruned_seconds = min(unpruned_seconds, time.perf_counter() - start)
+    assert len(unpruned) == 2 * COLUMNS
+    logger.info(f"Unpruned {len(unpruned):,}-result search in {unpruned_seconds * 1000:.0f}ms")
+    # About 5x apart at the default size; fixed per-query costs keep it from 10x
+    assert timings[2 * COLUMNS] < unpruned_seconds / 2
+
+
+def test_streaming_memory_is_bounded(overture):
+    # Run in a fresh interpreter so the peak RSS belongs to the search alone
+    script = textwrap.dedent(f"""
+        import os
+        from memories.core.glacier.artifacts.overture import OvertureConnector
+
+        def rss():
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+        overture = OvertureConnector(data_dir={str(overture.data_dir)!r}, release_path={overture.release_path!r})
+        before = peak = rss()
+        rows = 0
+        for _, _, batch in overture.search_batches([-180, -90, 180, 90], columns=["id", "primary_name"]):
+            rows += batch.num_rows
+            peak = max(peak, rss())
+        assert rows == {FEATURES}, rows
+        print((peak - before) // 2**20)
+    """)
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    growth_mb = int(completed.stdout.strip().splitlines()[-1])
+
+    logger.info(f"Streaming {FEATURES:,} features grew RSS by at most {growth_mb} MB")
+    assert growth_mb < 512, f"RSS grew by {growth_mb} MB"
@@ -0,0 +1,78 @@
+"""
+Benchmark of tag-filtered RedHotMemory search: recall@k and latency against tag selectivity.
+
+Set MEMORIES_BENCH_VECTORS to run at a larger scale than the default.
+"""
+
+import os
+import time
+import logging
+
+import faiss
+import numpy as np
+import pytest
+
+from memories.core.red_hot import RedHotMemory
+
+logger = logging.getLogger(__name__)
+pytestmark = pytest.mark.benchmark
+
+NUM_VECTORS = int(os.getenv("MEMORIES_BENCH_VECTORS", "20000"))
+DIMENSION = 64
+K = 10
+SELECTIVITIES = [0.0005, 0.005, 0.05, 0.5]
+
+
+@pytest.fixture(scope="module")
+def dataset():
+    """Clustered vectors where tag ``sel_<s>`` is carried by a fraction ``s`` of them."""
+    rng = np.random.default_rng(42)
+    centers = rng.random((100, DIMENSION), dtype=np.float32)
+    assignment = rng.integers(0, len(centers), NUM_VECTORS)
+    vectors = centers[assignment] + rng.normal(0, 0.05, (NUM_VECTORS, DIMENSION)).astype(np.float32)
+    queries = vectors[rng.choice(NUM_VECTORS, 20, replace=False)] + 0.01
+    tags_list = [[] for _ in range(NUM_VECTORS)]
+    for selectivity in SELECTIVITIES:
+        chosen = rng.choice(NUM_VECTORS, max(1, int(NUM_VECTORS * selectivity)), replace=False)
+        for i in chosen:
+            tags_list[i].append(f"sel_{selectivity}")
+    return vectors, queries, tags_list
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("index_type", ["flat", "ivf_flat", "hnsw"])
+async def test_filtered_search_recall_and_latency(tmp_path, dataset, index_type):
+    """Pre-filtered search returns k hits with the index's own recall at every selectivity."""
+    vectors, queries, tags_list = dataset
+    memory = RedHotMemory(dimension=DIMENSION, storage_path=str(tmp_path), index_type=index_type,
+                          nlist=64, nprobe=16)
+    await memory.store_many(vectors, tags_list=tags_list)
+    
+    # Unfiltered recall of the layout is the bar filtered searches are held to
+    exact = faiss.knn(queries, vectors, K)[1]
+    found = memory._search(queries, K)[1]
+    baseline_recall = np.mean([len(set(f) & set(e)) / K for f, e in zip(found, exact)])
+    logger.info(f"{index_type:<8} unfiltered recall@{K}={baseline_recall:.3f}")
+    
+    for selectivity in SELECTIVITIES:
+        tag = f"sel_{selectivity}"
+        matching = np.array([i for i, tags in enumerate(tags_list) if tag in tags], dtype=np.int64)
+        exact = matching[faiss.knn(queries, vectors[matching], min(K, len(matching)))[1]]
+        
+        start = time.perf_counter()
+        found = [await memory.retrieve(query_vector=q, k=K, tags=[tag]) for q in queries]
+        latency_ms = (time.perf_counter() - start) * 1000 / len(queries)
+        
+        recall = np.mean([
+            len({r["index"] for r in hits} & set(expected)) / len(expected)
+            for hits, expected in zip(found, exact)
+        ])
+        logger.info(
+            f"{index_type:<8} selectivity={selectivity:<7} candidates={len(matching):<6} "
+            f"recall@{K}={recall:.3f} latency={latency_ms:.2f}ms"
+        )
+        
+        # Every query returns min(k, candidates) hits, never fewer
+        assert all(len(hits) == min(K, len(matching)) for hits in found)
+        assert recall >= baseline_recall - 0.1
+    memory.cleanup()
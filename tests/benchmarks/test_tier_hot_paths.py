@@ -0,0 +1,172 @@
+"""
+pytest-benchmark suite for the tier hot paths: HotMemory.store,
+WarmMemory.retrieve, RedHotMemory search, MemoryCatalog.get_tier_data and
+MemoryManager.retrieve.
+
+Each benchmark runs against synthetic data built from a fixed seed at every
+size in MEMORIES_BENCH_SIZES (comma separated, default "1000,10000").
+Vectors come from a hashing stub embedder, so no model is downloaded.
+
+Results are grouped per operation with the dataset size in ``extra_info``.
+``tests/run_benchmarks.sh`` saves them as JSON and compares a run against a
+saved baseline with a regression threshold, e.g.::
+
+    tests/run_benchmarks.sh                                  # save a run
+    BENCH_BASELINE=0001 BENCH_THRESHOLD=10% tests/run_benchmarks.sh
+"""
+
+import os
+import asyncio
+import hashlib
+import random
+
+import numpy as np
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from memories.core.hot import HotMemory
+from memories.core.warm import WarmMemory
+from memories.core.red_hot import RedHotMemory
+from memories.core.memory_catalog import MemoryCatalog
+from memories.core.memory_manager import MemoryManager
+
+pytestmark = pytest.mark.benchmark
+
+SIZES = [int(size) for size in os.getenv("MEMORIES_BENCH_SIZES", "1000,10000").split(",")]
+SEED = 42
+DIMENSION = 64
+SOURCES = 50
+WORDS = ["river", "road", "park", "school", "bridge", "forest", "harbor", "market", "tower", "field"]
+
+
+class StubEmbedder:
+    """Offline stand-in for a SentenceTransformer: hashes text to a unit vector."""
+
+    def __init__(self, dimension: int = DIMENSION):
+        self.dimension = dimension
+
+    def encode(self, texts):
+        vectors = np.empty((len(texts), self.dimension), dtype=np.float32)
+        for i, text in enumerate(texts):
+            seed = int.from_bytes(hashlib.sha1(text.encode()).digest()[:8], "little")
+            vectors[i] = np.random.default_rng(seed).standard_normal(self.dimension)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def make_records(size, seed=SEED):
+    """Synthetic items with a small text, metadata and tags."""
+    rng = random.Random(seed)
+    return [
+        {
+            "data": {"name": f"item_{i}", "text": " ".join(rng.choices(WORDS, k=6)), "value": rng.random()},
+            "metadata": {"source": f"source_{rng.randrange(SOURCES)}"},
+            "tags": [rng.choice(WORDS)]
+        }
+        for i in range(size)
+    ]
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture
+def catalog(tmp_path, monkeypatch):
+    """A separate MemoryCatalog backed by a temporary DuckDB file."""
+    monkeypatch.setattr(MemoryCatalog, "_instance", None)
+    monkeypatch.setattr(
+        MemoryManager().config, "get_path",
+        lambda key, default_filename=None: str(tmp_path / default_filename)
+    )
+    catalog = MemoryCatalog()
+    yield catalog
+    catalog.cleanup()
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_hot_store(benchmark, loop, size):
+    memory = HotMemory()
+    loop.run_until_complete(memory.clear())
+    loop.run_until_complete(memory.store_many(make_records(size)))
+    new_items = iter(make_records(100_000, seed=SEED + 1))
+
+    def store():
+        item = next(new_items)
+        return loop.run_until_complete(memory.store(item["data"], item["metadata"], item["tags"]))
+
+    benchmark.group = "hot.store"
+    benchmark.extra_info["size"] = size
+    assert benchmark.pedantic(store, rounds=200, warmup_rounds=10)
+    loop.run_until_complete(memory.clear())
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_warm_retrieve(benchmark, loop, tmp_path, size):
+    memory = WarmMemory(storage_path=str(tmp_path), storage_mode="partitioned", indexed_metadata=["source"])
+    loop.run_until_complete(memory.store_many(make_records(size)))
+    sources = iter(f"source_{i % SOURCES}" for i in range(10**6))
+
+    def retrieve():
+        return loop.run_until_complete(memory.retrieve(query={"metadata": {"source": next(sources)}}))
+
+    benchmark.group = "warm.retrieve"
+    benchmark.extra_info["size"] = size
+    assert benchmark.pedantic(retrieve, rounds=50, warmup_rounds=5)
+    memory.cleanup()
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_red_hot_search(benchmark, loop, tmp_path, size):
+    embedder = StubEmbedder()
+    records = make_records(size)
+    memory = RedHotMemory(dimension=DIMENSION, storage_path=str(tmp_path))
+    vectors = embedder.encode([r["data"]["text"] for r in records])
+    loop.run_until_complete(memory.store_many(vectors, tags_list=[r["tags"] for r in records]))
+    queries = iter(embedder.encode([f"query {i}" for i in range(10_000)]))
+
+    def search():
+        return loop.run_until_complete(memory.retrieve(query_vector=next(queries), k=10))
+
+    benchmark.group = "red_hot.search"
+    benchmark.extra_info["size"] = size
+    assert benchmark.pedantic(search, rounds=200, warmup_rounds=10)
+    memory.cleanup()
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_catalog_get_tier_data(benchmark, loop, catalog, size):
+    tiers = ["hot", "warm", "cold"]
+    for i, record in enumerate(make_records(size)):
+        loop.run_until_complete(catalog.register_data(
+            tiers[i % len(tiers)], f"location_{i}", 1024, "json",
+            tags=record["tags"], metadata=record["metadata"]
+        ))
+
+    def get_tier_data():
+        return loop.run_until_complete(catalog.get_tier_data("warm"))
+
+    benchmark.group = "catalog.get_tier_data"
+    benchmark.extra_info["size"] = size
+    assert len(benchmark.pedantic(get_tier_data, rounds=20, warmup_rounds=2)) == len(range(1, size, 3))
+
+
+@pytest.mark.parametrize("size", SIZES)
+def test_manager_retrieve(benchmark, test_config_path, size):
+    manager = MemoryManager()
+    hot = manager._get_tier("hot")
+    manager._run(hot.clear())
+    for i, record in enumerate(make_records(size)):
+        manager.store(f"key_{i}", record["data"], tier="hot")
+    keys = iter(f"key_{i % size}" for i in range(10**6))
+
+    def retrieve():
+        return manager.retrieve(next(keys), tier="hot")
+
+    benchmark.group = "manager.retrieve"
+    benchmark.extra_info["size"] = size
+    assert benchmark.pedantic(retrieve, rounds=200, warmup_rounds=10) is not None
+    manager._run(hot.clear())
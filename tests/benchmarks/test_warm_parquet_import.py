@@ -0,0 +1,52 @@
+"""
+Benchmark of WarmMemory.import_from_parquet peak memory on a large file.
+
+The import runs in a fresh interpreter so the peak RSS belongs to it alone;
+it must stay bounded because the rows are read by DuckDB instead of being
+materialized as Python objects. MEMORIES_BENCH_WARM_IMPORT_ROWS sets the
+file size (default 2000000; use 10000000 for a production-sized file).
+"""
+
+import os
+import sys
+import logging
+import subprocess
+import textwrap
+
+import duckdb
+import pytest
+
+logger = logging.getLogger(__name__)
+pytestmark = pytest.mark.benchmark
+
+ROWS = int(os.getenv("MEMORIES_BENCH_WARM_IMPORT_ROWS", "2000000"))
+
+
+@pytest.fixture(scope="module")
+def parquet_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("warm_import") / "large.parquet"
+    duckdb.sql(f"""
+        COPY (SELECT i AS id, i * 0.5 AS value, 'item_' || (i % 1000) AS name FROM range({ROWS}) t(i))
+        TO '{path}' (FORMAT PARQUET)
+    """)
+    return str(path)
+
+
+@pytest.mark.parametrize("mode", ["table", "view"])
+def test_large_import_has_bounded_rss(tmp_path, parquet_path, mode):
+    script = textwrap.dedent(f"""
+        import asyncio, resource
+        from memories.core.warm import WarmMemory
+        memory = WarmMemory(storage_path={str(tmp_path)!r})
+        before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        result = asyncio.run(memory.import_from_parquet({parquet_path!r}, db_name="large", mode={mode!r}))
+        after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        assert result["success"] and result["row_count"] == {ROWS}, result
+        print((after - before) // 1024)
+    """)
+    completed = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    growth_mb = int(completed.stdout.strip().splitlines()[-1])
+
+    logger.info(f"Importing {ROWS:,} rows as a {mode} grew RSS by {growth_mb} MB")
+    # Materializing millions of rows as Python dicts and JSON takes gigabytes
+    assert growth_mb < 256, f"RSS grew by {growth_mb} MB"
@@ -0,0 +1,120 @@
+"""
+Benchmark of WarmMemory query latency: the per-item layout, where queries
+filter ``warm_data`` JSON with ``json_extract``, against the partitioned store
+with typed schema-group tables and indexed metadata columns.
+
+Both layouts hold the same items. The per-item layout is loaded straight into
+``warm_data``/``warm_tags`` (its extra table per item only adds catalog
+bloat, not query cost), the partitioned one in bulk through
+``PartitionedWarmStore.store_many``.
+MEMORIES_BENCH_WARM_ITEMS sets the number of items (default 100000).
+"""
+
+import os
+import json
+import time
+import random
+import logging
+import statistics
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from memories.core.warm import WarmMemory
+
+logger = logging.getLogger(__name__)
+pytestmark = pytest.mark.benchmark
+
+ITEMS = int(os.getenv("MEMORIES_BENCH_WARM_ITEMS", "100000"))
+SOURCES = 500
+QUERIES = 50
+
+
+def make_item(i):
+    return (
+        {"name": f"item_{i}", "value": i, "score": i * 0.5},
+        {"source": f"source_{i % SOURCES}", "batch": i // 1000},
+        [f"shard_{i % 64}"]
+    )
+
+
+def median_ms(fn, args_list):
+    samples = []
+    for args in args_list:
+        start = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+@pytest.fixture
+def memories(tmp_path):
+    per_item = WarmMemory(storage_path=str(tmp_path / "per_item"))
+    con = per_item.con
+    rows = [make_item(i) for i in range(ITEMS)]
+    now = datetime.now()
+    con.register("legacy_rows", pd.DataFrame({
+        "id": [str(i) for i in range(ITEMS)],
+        "data": [json.dumps(d) for d, _, _ in rows],
+        "metadata": [json.dumps(m) for _, m, _ in rows],
+        "tags": [json.dumps(t) for _, _, t in rows],
+        "tag": [t[0] for _, _, t in rows]
+    }))
+    con.execute("INSERT INTO warm_data SELECT id, data, metadata, tags, ? FROM legacy_rows", [now])
+    con.execute("INSERT INTO warm_tags SELECT tag, id FROM legacy_rows")
+    con.unregister("legacy_rows")
+
+    partitioned = WarmMemory(
+        storage_path=str(tmp_path / "partitioned"),
+        storage_mode="partitioned",
+        indexed_metadata=["source"]
+    )
+    store = partitioned._partitioned_store()
+    start = time.perf_counter()
+    store.store_many([{"data": d, "metadata": m, "tags": t} for d, m, t in rows])
+    logger.info(f"Stored {ITEMS} items in the partitioned store in {time.perf_counter() - start:.1f}s")
+
+    yield per_item, partitioned
+    per_item.cleanup()
+    partitioned.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_query_latency(memories):
+    per_item, partitioned = memories
+    rng = random.Random(0)
+    sources = [(f"source_{rng.randrange(SOURCES)}",) for _ in range(QUERIES)]
+    names = [(f"item_{rng.randrange(ITEMS)}",) for _ in range(QUERIES)]
+
+    def legacy_by_source(source):
+        return per_item.con.execute("""
+            SELECT * FROM warm_data
+            WHERE json_extract_string(metadata, '$.source') = ?
+            ORDER BY stored_at DESC
+        """, [source]).fetchall()
+
+    def legacy_by_name(name):
+        return per_item.con.execute("""
+            SELECT * FROM warm_data
+            WHERE json_extract_string(data, '$.name') = ?
+        """, [name]).fetchall()
+
+    store = partitioned._partitioned_store()
+    assert len(store.retrieve({"metadata": {"source": sources[0][0]}})) == len(legacy_by_source(*sources[0]))
+    assert len(store.retrieve({"data": {"name": names[0][0]}})) == 1
+
+    legacy_source_ms = median_ms(legacy_by_source, sources)
+    legacy_name_ms = median_ms(legacy_by_name, names)
+    source_ms = median_ms(lambda s: store.retrieve({"metadata": {"source": s}}), sources)
+    name_ms = median_ms(lambda n: store.retrieve({"data": {"name": n}}), names)
+
+    tables = partitioned.con.execute("SELECT COUNT(*) FROM information_schema.tables").fetchone()[0]
+    logger.info(
+        f"WarmMemory with {ITEMS} items: metadata query {legacy_source_ms:.1f}ms JSON vs "
+        f"{source_ms:.1f}ms indexed column; data query {legacy_name_ms:.1f}ms JSON vs "
+        f"{name_ms:.1f}ms typed column; partitioned store uses {tables} tables"
+    )
+    assert tables < 10
+    assert source_ms < legacy_source_ms
+    assert name_ms < legacy_name_ms
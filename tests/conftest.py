@@ -9,63 +9,77 @@ from pathlib import Path
 import yaml
 
 # Add the project root to the Python path
-project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 sys.path.append(project_root)
 
 # Load environment variables from .env file
 load_dotenv()
 
+
 # Configure pytest
 def pytest_configure(config):
     """Configure pytest"""
     # Register markers
-    config.addinivalue_line(
-        "markers", "asyncio: mark test as async"
-    )
-    config.addinivalue_line(
-        "markers",
-        "gpu: mark test as requiring GPU support"
-    )
-    config.addinivalue_line(
-        "markers",
-        "earth: mark test as using earth-related functionality"
-    )
-    config.addinivalue_line(
-        "markers",
-        "async_test: mark test as using async/await"
-    )
+    config.addinivalue_line("markers", "asyncio: mark test as async")
+    config.addinivalue_line("markers", "gpu: mark test as requiring GPU support")
+    config.addinivalue_line("markers", "earth: mark test as using earth-related functionality")
+    config.addinivalue_line("markers", "async_test: mark test as using async/await")
+
+    # Tier and catalog defaults such as ./data/memory resolve against
+    # PROJECT_ROOT, and some are created when modules are imported during
+    # collection, so point it at a scratch directory before that happens.
+    config._memories_previous_root = os.environ.get("PROJECT_ROOT")
+    config._memories_workdir = tempfile.mkdtemp(prefix="memories-tests-")
+    os.environ["PROJECT_ROOT"] = config._memories_workdir
+
+
+def pytest_unconfigure(config):
+    """Restore PROJECT_ROOT and remove the scratch directory from pytest_configure."""
+    if not hasattr(config, "_memories_workdir"):
+        return
+    if config._memories_previous_root is None:
+        os.environ.pop("PROJECT_ROOT", None)
+    else:
+        os.environ["PROJECT_ROOT"] = config._memories_previous_root
+    shutil.rmtree(config._memories_workdir, ignore_errors=True)
+
 
 def has_gpu_support():
     try:
         import cudf
+
         return True
     except ImportError:
         return False
 
+
 def pytest_collection_modifyitems(config, items):
     skip_gpu = pytest.mark.skip(reason="GPU support not available")
-    
+
     for item in items:
         if "gpu" in item.keywords and not has_gpu_support():
             item.add_marker(skip_gpu)
 
+
 @pytest.fixture(scope="session")
 def gcp_credentials() -> Dict[str, str]:
     """Fixture for GCP credentials"""
     return {
         "project_id": os.getenv("GCP_PROJECT_ID"),
-        "credentials_path": os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
+        "credentials_path": os.getenv("GOOGLE_APPLICATION_CREDENTIALS"),
     }
 
+
 @pytest.fixture(scope="session")
 def aws_credentials() -> Dict[str, str]:
     """Fixture for AWS credentials"""
     return {
         "aws_access_key_id": os.getenv("AWS_ACCESS_KEY_ID"),
         "aws_secret_access_key": os.getenv("AWS_SECRET_ACCESS_KEY"),
-        "region": os.getenv("AWS_DEFAULT_REGION", "us-west-2")
+        "region": os.getenv("AWS_DEFAULT_REGION", "us-west-2"),
     }
 
+
 @pytest.fixture(scope="session")
 def azure_credentials() -> Dict[str, str]:
     """Fixture for Azure credentials"""
@@ -73,9 +87,10 @@ def azure_credentials() -> Dict[str, str]:
         "subscription_id": os.getenv("AZURE_SUBSCRIPTION_ID"),
         "tenant_id": os.getenv("AZURE_TENANT_ID"),
         "client_id": os.getenv("AZURE_CLIENT_ID"),
-        "client_secret": os.getenv("AZURE_CLIENT_SECRET")
+        "client_secret": os.getenv("AZURE_CLIENT_SECRET"),
     }
 
+
 @pytest.fixture(scope="session")
 def test_output_dir() -> str:
     """Fixture for test output directory"""
@@ -83,62 +98,116 @@ def test_output_dir() -> str:
     os.makedirs(output_dir, exist_ok=True)
     return output_dir
 
+
 @pytest.fixture(scope="session")
 def deployments_dir() -> str:
     """Fixture for deployments directory"""
     return os.path.join(os.path.dirname(__file__), "..", "deployments")
 
+
 @pytest.fixture(scope="function")
 def temp_test_dir(tmp_path) -> str:
     """Fixture for temporary test directory"""
     return str(tmp_path)
 
+
 @pytest.fixture(scope="session")
 def test_data_dir() -> str:
     """Fixture for test data directory"""
     return os.path.join(os.path.dirname(__file__), "test_data")
 
+
 @pytest.fixture(scope="session")
 def project_root():
     """Get the project root directory."""
-    return os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
 
 @pytest.fixture
 def test_config_dir(tmp_path):
     """Create a temporary config directory with test configuration."""
     config_dir = tmp_path / "config"
     config_dir.mkdir(parents=True, exist_ok=True)
-    
+
     # Create default config
     default_config = {
-        'database': {
-            'path': str(tmp_path / 'data' / 'db'),
-            'name': 'test.db'
+        "database": {"path": str(tmp_path / "data" / "db"), "name": "test.db"},
+        "data": {
+            "storage": str(tmp_path / "data" / "storage"),
+            "models": str(tmp_path / "data" / "models"),
+            "cache": str(tmp_path / "data" / "cache"),
         },
-        'data': {
-            'storage': str(tmp_path / 'data' / 'storage'),
-            'models': str(tmp_path / 'data' / 'models'),
-            'cache': str(tmp_path / 'data' / 'cache')
+        "memory": {
+            "base_path": str(tmp_path / "data" / "memory"),
+            "hot_size": 50,
+            "warm_size": 200,
+            "cold_size": 1000,
+            "vector_dim": 384,
+            "gpu_id": -1,  # Use CPU for tests
+            "faiss_index_type": "Flat",
         },
-        'memory': {
-            'base_path': str(tmp_path / 'data' / 'memory'),
-            'hot_size': 50,
-            'warm_size': 200,
-            'cold_size': 1000,
-            'vector_dim': 384,
-            'gpu_id': -1,  # Use CPU for tests
-            'faiss_index_type': 'Flat'
-        }
     }
-    
+
     # Write default config
     default_config_path = config_dir / "default_config.yml"
-    with open(default_config_path, 'w') as f:
+    with open(default_config_path, "w") as f:
         yaml.dump(default_config, f)
-    
+
     return config_dir
 
+
 @pytest.fixture
 def test_config_path(test_config_dir):
     """Get the path to the test configuration file."""
-    return str(test_config_dir / "default_config.yml") 
\ No newline at end of file
+    return str(test_config_dir / "default_config.yml")
+
+
+@pytest.fixture
+def local_causal_lm(monkeypatch):
+    """Load a tiny randomly initialized GPT-2 into the BaseModel singleton.
+
+    The model and a word-level tokenizer are built locally, so nothing is
+    downloaded and generation runs on CPU.
+    """
+    pytest.importorskip("transformers")
+    import torch
+    from tokenizers import Tokenizer, models, pre_tokenizers
+    from transformers import (
+        AutoModelForCausalLM,
+        AutoTokenizer,
+        GPT2Config,
+        GPT2LMHeadModel,
+        PreTrainedTokenizerFast,
+    )
+    from memories.models.base_model import BaseModel
+
+    words = (
+        "the a river lake city forest field road north south east west of in near land use water "
+        "describe summarize explain what where how is are old new large small green dry"
+    ).split()
+    vocab = {"<eos>": 0, "<unk>": 1, **{word: i + 2 for i, word in enumerate(words)}}
+    backend = Tokenizer(models.WordLevel(vocab, unk_token="<unk>"))
+    backend.pre_tokenizer = pre_tokenizers.Whitespace()
+    tokenizer = PreTrainedTokenizerFast(
+        tokenizer_object=backend, eos_token="<eos>", unk_token="<unk>"
+    )
+
+    torch.manual_seed(0)
+    config = GPT2Config(
+        vocab_size=len(vocab),
+        n_positions=256,
+        n_embd=64,
+        n_layer=2,
+        n_head=2,
+        bos_token_id=0,
+        eos_token_id=0,
+    )
+    model = GPT2LMHeadModel(config).eval()
+
+    monkeypatch.setattr(AutoTokenizer, "from_pretrained", lambda *args, **kwargs: tokenizer)
+    monkeypatch.setattr(AutoModelForCausalLM, "from_pretrained", lambda *args, **kwargs: model)
+    base_model = BaseModel.get_instance()
+    assert base_model.initialize_model("deepseek-coder-small", use_gpu=False)
+    yield base_model
+    base_model.stop_micro_batching()
+    base_model.cleanup()
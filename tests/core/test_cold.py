@@ -521,4 +521,120 @@ class TestColdMemory:
             # Restore original methods
             cold_memory.store = original_store
             cold_memory.retrieve = original_retrieve
-            cold_memory.delete = original_delete 
\ No newline at end of file
+            cold_memory.delete = original_delete 
+
+class InMemoryCatalog:
+    """Catalog stand-in that keeps registered entries in a dict."""
+    
+    def __init__(self):
+        self.entries = {}
+    
+    async def register_data(self, tier, location, size, data_type, metadata=None, tags=None):
+        data_id = f"id-{len(self.entries)}"
+        self.entries[data_id] = {
+            "data_id": data_id,
+            "primary_tier": tier,
+            "location": location,
+            "size": size,
+            "data_type": data_type,
+            "additional_meta": json.dumps(metadata) if metadata else '{}'
+        }
+        return data_id
+    
+    async def get_data_info(self, data_id):
+        return self.entries.get(data_id)
+    
+    async def get_tier_data(self, tier):
+        return [e for e in self.entries.values() if e["primary_tier"] == tier]
+    
+    async def delete_data(self, data_id):
+        return self.entries.pop(data_id, None) is not None
+
+
+@pytest.fixture
+def parquet_cold_memory(temp_config_dir):
+    """Create a ColdMemory instance writing real Parquet datasets."""
+    memory = ColdMemory(config_path=str(Path(temp_config_dir) / "config" / "db_config.yml"))
+    memory.memory_catalog = InMemoryCatalog()
+    yield memory
+    memory.cleanup()
+
+
+class TestColdParquetStorage:
+    """Tests for Parquet-backed cold storage."""
+    
+    @pytest.mark.asyncio
+    async def test_store_and_retrieve_preserves_dtypes(self, parquet_cold_memory):
+        """Test that a DataFrame round-trips through Parquet with its dtypes."""
+        df = pd.DataFrame({
+            "id": np.arange(5, dtype=np.int32),
+            "when": pd.date_range("2024-01-01", periods=5),
+            "value": [0.5, 1.5, 2.5, 3.5, 4.5],
+            "name": list("abcde")
+        })
+        
+        assert await parquet_cold_memory.store(df, metadata={"source": "test"}, tags=["t"]) is True
+        entry = next(iter(parquet_cold_memory.memory_catalog.entries.values()))
+        assert entry["location"].startswith(parquet_cold_memory.parquet_path)
+        assert entry["size"] > 0
+        
+        result = await parquet_cold_memory.retrieve({"data_id": entry["data_id"]})
+        pd.testing.assert_frame_equal(result["data"], df, check_dtype=False)
+        assert result["data"]["id"].dtype == np.int32
+        assert str(result["data"]["when"].dtype).startswith("datetime64")
+        assert result["metadata"] == {"source": "test"}
+        
+        schema = await parquet_cold_memory.get_schema(entry["data_id"])
+        assert schema["columns"] == ["id", "when", "value", "name"]
+        assert schema["source"] == "parquet"
+    
+    @pytest.mark.asyncio
+    async def test_partitioned_projection_and_filters(self, parquet_cold_memory):
+        """Test partitioned datasets with projected columns and pushed-down filters."""
+        df = pd.DataFrame({
+            "region": ["north", "south", "north", "east"],
+            "value": [1, 2, 3, 4]
+        })
+        assert await parquet_cold_memory.store(df, partition_by=["region"])
+        entry = next(iter(parquet_cold_memory.memory_catalog.entries.values()))
+        assert sorted(os.listdir(entry["location"])) == ["region=east", "region=north", "region=south"]
+        
+        result = await parquet_cold_memory.retrieve({
+            "data_id": entry["data_id"],
+            "columns": ["value"],
+            "filters": {"region": "north"}
+        })
+        assert list(result["data"].columns) == ["value"]
+        assert sorted(result["data"]["value"]) == [1, 3]
+        
+        result = await parquet_cold_memory.retrieve({
+            "data_id": entry["data_id"],
+            "filters": [("value", ">=", 2), ("region", "in", ["south", "east"])]
+        })
+        assert sorted(result["data"]["value"]) == [2, 4]
+        
+        assert await parquet_cold_memory.store(df, partition_by=["missing"]) is False
+    
+    @pytest.mark.asyncio
+    async def test_delete_removes_dataset(self, parquet_cold_memory):
+        """Test that deleting an item removes its Parquet dataset and catalog entry."""
+        await parquet_cold_memory.store(pd.DataFrame({"a": [1, 2]}))
+        entry = next(iter(parquet_cold_memory.memory_catalog.entries.values()))
+        
+        assert await parquet_cold_memory.delete(entry["data_id"]) is True
+        assert not os.path.exists(entry["location"])
+        assert await parquet_cold_memory.memory_catalog.get_data_info(entry["data_id"]) is None
+        assert await parquet_cold_memory.retrieve({"data_id": entry["data_id"]}) is None
+    
+    @pytest.mark.asyncio
+    async def test_retrieve_legacy_json_rows(self, parquet_cold_memory):
+        """Test that rows written by the JSON storage are still readable."""
+        catalog = parquet_cold_memory.memory_catalog
+        data_id = await catalog.register_data("cold", "cold_data_legacy", 10, "dataframe")
+        parquet_cold_memory.conn.execute(
+            "INSERT INTO cold_data (id, data) VALUES (?, ?)",
+            [data_id, pd.DataFrame({"a": [1, 2]}).to_json()]
+        )
+        
+        result = await parquet_cold_memory.retrieve({"data_id": data_id})
+        assert list(result["data"]["a"]) == [1, 2]
@@ -0,0 +1,178 @@
+"""
+Tests for the DuckDB connection pool: per-thread cursors, bounded size,
+health checks, wait metrics and a mixed read/write stress run.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import duckdb
+import pytest
+
+from memories.core.db_connection_pool import DuckDBConnectionPool
+
+logger = logging.getLogger(__name__)
+
+THREADS = 32
+OPS_PER_THREAD = 100
+
+
+@pytest.fixture
+def make_pool(monkeypatch):
+    """Build separate pools instead of the process-wide singleton."""
+    pools = []
+
+    def make(**kwargs):
+        monkeypatch.setattr(DuckDBConnectionPool, "_instance", None)
+        pool = DuckDBConnectionPool(**kwargs)
+        pools.append(pool)
+        return pool
+
+    yield make
+    for pool in pools:
+        pool.close_all()
+
+
+def test_threads_get_their_own_cursor(make_pool):
+    """Test that a thread reuses its cursor while other threads get another."""
+    pool = make_pool(max_size=4)
+    with pool.get_connection(":memory:pool") as outer:
+        with pool.get_connection(":memory:pool") as inner:
+            assert inner is outer
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(lambda: pool.checkout(":memory:pool")).result()
+        assert other is not outer
+        assert pool.get_stats(":memory:pool")["in_use"] == 2
+
+    # Cursors share the database
+    outer.execute("CREATE TABLE t AS SELECT 1 AS x")
+    assert other.execute("SELECT x FROM t").fetchone() == (1,)
+
+
+def test_checkout_waits_for_checkin_and_times_out(make_pool):
+    """Test the max size bound, the wait metrics and the timeout."""
+    pool = make_pool(max_size=1, timeout=0.2)
+    cursor = pool.checkout(":memory:pool")
+
+    def release_later():
+        time.sleep(0.05)
+        pool.checkin(":memory:pool", cursor)
+
+    def checkout_in_new_thread():
+        result = {}
+
+        def checkout():
+            try:
+                result["cursor"] = pool.checkout(":memory:pool")
+            except Exception as e:
+                result["error"] = e
+
+        thread = threading.Thread(target=checkout)
+        thread.start()
+        thread.join()
+        if "error" in result:
+            raise result["error"]
+        return result["cursor"]
+
+    threading.Thread(target=release_later).start()
+    assert checkout_in_new_thread() is cursor
+    # The cursor is now held by a finished thread and never checked in
+    with pytest.raises(TimeoutError):
+        checkout_in_new_thread()
+
+    stats = pool.get_stats(":memory:pool")
+    assert stats["size"] == 1 and stats["waits"] == 1 and stats["timeouts"] == 1
+    assert 0.03 < stats["max_wait_time"] and stats["avg_wait_time"] > 0
+
+
+def test_failed_cursor_is_replaced_without_losing_data(make_pool):
+    """Test that an error discards only the cursor, not the in-memory database."""
+    pool = make_pool()
+    with pool.get_connection(":memory:pool") as con:
+        con.execute("CREATE TABLE t AS SELECT 1 AS x")
+    with pytest.raises(duckdb.Error):
+        with pool.get_connection(":memory:pool") as con:
+            con.execute("SELECT * FROM missing")
+    with pool.get_connection(":memory:pool") as con:
+        assert con.execute("SELECT count(*) FROM t").fetchone() == (1,)
+
+    stats = pool.get_stats(":memory:pool")
+    assert stats["discarded"] == 1 and stats["created"] == 2
+
+
+def test_health_check_replaces_closed_cursor(make_pool):
+    """Test that a dead idle cursor is swapped for a fresh one on checkout."""
+    pool = make_pool(health_check_interval=0)
+    with pool.get_connection(":memory:pool") as con:
+        con.close()
+    with pool.get_connection(":memory:pool") as con:
+        assert con.execute("SELECT 1").fetchone() == (1,)
+    assert pool.get_stats(":memory:pool")["discarded"] == 1
+
+
+def run_mixed_workload(connect, tmp_path):
+    """Run inserts, updates and read-your-writes checks from THREADS threads.
+
+    Returns:
+        Operations per second
+    """
+    with connect() as con:
+        con.execute("CREATE TABLE events (worker INTEGER, seq INTEGER, value INTEGER, PRIMARY KEY (worker, seq))")
+
+    def work(worker):
+        for seq in range(OPS_PER_THREAD):
+            with connect() as con:
+                con.execute("INSERT INTO events VALUES (?, ?, 0)", [worker, seq])
+                if seq % 5 == 0:
+                    con.execute("UPDATE events SET value = value + 1 WHERE worker = ? AND seq = ?", [worker, seq])
+                if seq % 2 == 0:
+                    count, = con.execute("SELECT count(*) FROM events WHERE worker = ?", [worker]).fetchone()
+                    assert count == seq + 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        list(executor.map(work, range(THREADS)))
+    elapsed = time.perf_counter() - start
+
+    with connect() as con:
+        rows, updated, workers = con.execute(
+            "SELECT count(*), sum(value), count(DISTINCT worker) FROM events"
+        ).fetchone()
+    assert rows == THREADS * OPS_PER_THREAD
+    assert updated == THREADS * len(range(0, OPS_PER_THREAD, 5))
+    assert workers == THREADS
+    return rows / elapsed
+
+
+def test_stress_mixed_reads_and_writes(make_pool, tmp_path):
+    """Test 32 threads of mixed reads and writes through the pool."""
+    pool = make_pool(max_size=8, timeout=60)
+    db_name = ":memory:stress"
+    pooled = run_mixed_workload(lambda: pool.get_connection(db_name), tmp_path)
+
+    stats = pool.get_stats(db_name)
+    assert stats["size"] <= 8 and stats["in_use"] == 0 and stats["timeouts"] == 0
+    assert stats["checkouts"] >= THREADS * OPS_PER_THREAD
+
+    # The previous design: one connection shared by every thread behind a lock
+    shared = duckdb.connect(":memory:shared")
+    lock = threading.Lock()
+
+    class SharedConnection:
+        def __enter__(self):
+            lock.acquire()
+            return shared
+
+        def __exit__(self, *exc):
+            lock.release()
+
+    serialized = run_mixed_workload(SharedConnection, tmp_path)
+    shared.close()
+
+    logger.info(
+        f"{THREADS} threads: pooled cursors {pooled:,.0f} ops/s "
+        f"(max wait {stats['max_wait_time'] * 1000:.1f}ms), shared connection {serialized:,.0f} ops/s"
+    )
+    assert pooled > serialized * 0.5
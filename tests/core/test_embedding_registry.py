@@ -0,0 +1,85 @@
+"""
+Tests for the shared embedding model registry and embedding cache.
+"""
+
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from memories.core import embedding_registry
+from memories.core.embedding_registry import EmbeddingCache, encode_texts, get_model
+
+
+class CountingEncoder:
+    """SentenceTransformer stand-in that records what it encodes."""
+    
+    instances = 0
+    
+    def __init__(self, *args, **kwargs):
+        CountingEncoder.instances += 1
+        self.encoded = []
+    
+    def encode(self, texts, batch_size=32, convert_to_numpy=True, normalize_embeddings=False, **kwargs):
+        self.encoded.extend(texts)
+        vectors = np.array([[len(text), 1.0, 0.0] for text in texts], dtype=np.float32)
+        if normalize_embeddings:
+            vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors
+
+
+@pytest.fixture(autouse=True)
+def stub_models(monkeypatch):
+    # A stub module, so the tests run whether or not sentence-transformers is installed
+    stub = types.ModuleType("sentence_transformers")
+    stub.SentenceTransformer = CountingEncoder
+    monkeypatch.setitem(sys.modules, "sentence_transformers", stub)
+    CountingEncoder.instances = 0
+    embedding_registry.clear_models()
+    embedding_registry.embedding_cache.clear()
+    yield
+    embedding_registry.clear_models()
+    embedding_registry.embedding_cache.clear()
+
+
+def test_model_is_loaded_once_per_process():
+    """Test that every caller shares one model instance."""
+    assert get_model("stub-model") is get_model("stub-model")
+    assert CountingEncoder.instances == 1
+    assert get_model("other-model") is not get_model("stub-model")
+
+
+def test_repeated_texts_are_encoded_once():
+    """Test that cached and duplicate texts are not re-encoded."""
+    vectors = encode_texts(["id", "name", "id"], model_name="stub-model")
+    assert vectors.shape == (3, 3)
+    assert np.array_equal(vectors[0], vectors[2])
+    
+    vectors = encode_texts(["name", "geometry"], model_name="stub-model")
+    assert get_model("stub-model").encoded == ["id", "name", "geometry"]
+    assert vectors[1][0] == len("geometry")
+
+
+def test_cache_key_includes_model_and_normalization():
+    """Test that embeddings from different models or settings are kept apart."""
+    plain = encode_texts(["value"], model_name="stub-model")
+    normalized = encode_texts(["value"], model_name="stub-model", normalize=True)
+    encode_texts(["value"], model_name="other-model")
+    
+    assert not np.allclose(plain, normalized)
+    assert np.isclose(np.linalg.norm(normalized), 1.0)
+    assert get_model("stub-model").encoded == ["value", "value"]
+    assert get_model("other-model").encoded == ["value"]
+
+
+def test_cache_evicts_least_recently_used():
+    """Test that the cache stays within its size bound."""
+    cache = EmbeddingCache(max_entries=2)
+    encode_texts(["a", "b"], model_name="stub-model", cache=cache)
+    encode_texts(["a"], model_name="stub-model", cache=cache)
+    encode_texts(["c"], model_name="stub-model", cache=cache)
+    
+    assert len(cache) == 2
+    encode_texts(["a", "b"], model_name="stub-model", cache=cache)
+    assert get_model("stub-model").encoded == ["a", "b", "c", "b"]
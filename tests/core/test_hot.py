@@ -284,4 +284,39 @@ class TestHotMemory:
         finally:
             # Restore original methods
             hot_memory.retrieve = original_retrieve
-            hot_memory.delete = original_delete 
\ No newline at end of file
+            hot_memory.delete = original_delete
+    
+    @pytest.mark.asyncio
+    async def test_store_many(self, hot_memory):
+        """Test bulk storing items with tags in one transaction."""
+        items = [
+            {"data": {"name": f"item{i}"}, "metadata": {"index": i}, "tags": ["bulk", f"tag{i % 2}"]}
+            for i in range(10)
+        ]
+        items.append({"data": np.array([1, 2, 3])})
+        
+        ids = await hot_memory.store_many(items)
+        assert len(ids) == 11
+        
+        retrieved = await hot_memory.retrieve(tags=["tag1"])
+        assert sorted(r["metadata"]["index"] for r in retrieved) == [1, 3, 5, 7, 9]
+        
+        retrieved = await hot_memory.retrieve(query={"id": ids[-1]})
+        assert retrieved[0]["data"] == [1, 2, 3]
+        assert retrieved[0]["tags"] == []
+        
+        info = hot_memory.get_table_info()
+        assert info["hot_data_count"] == 11
+        assert info["hot_tags_count"] == 20
+    
+    @pytest.mark.asyncio
+    async def test_store_many_is_atomic(self, hot_memory):
+        """Test that a failing bulk insert leaves no rows behind."""
+        ids = await hot_memory.store_many([{"data": {"ok": True}, "tags": ["x"]}])
+        
+        # Reusing an existing ID violates the primary key on the second row
+        with patch("memories.core.hot.uuid.uuid4", side_effect=["fresh-id", ids[0]]):
+            assert await hot_memory.store_many([{"data": 1}, {"data": 2}]) == []
+        
+        assert hot_memory.get_table_info()["hot_data_count"] == 1
+        assert await hot_memory.retrieve(query={"id": "fresh-id"}) is None
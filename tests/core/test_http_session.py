@@ -0,0 +1,225 @@
+"""
+Tests for the shared HTTP session manager against a local aiohttp server.
+"""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from memories.core import http_session
+from memories.core.http_session import HTTPSessionManager, RetryPolicy, TokenBucket, get_requests_session
+from memories.core.glacier.artifacts.osm import OSMConnector
+
+
+class CountingServer:
+    """Local server recording client connections, hits and concurrency."""
+
+    def __init__(self):
+        self.peers = set()
+        self.hits = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.failures = 0
+
+    def app(self):
+        app = web.Application()
+        app.router.add_get("/ok", self.ok)
+        app.router.add_get("/slow", self.slow)
+        app.router.add_get("/flaky", self.flaky)
+        app.router.add_post("/flaky", self.flaky)
+        app.router.add_post("/interpreter", self.overpass)
+        return app
+
+    def _record(self, request):
+        self.peers.add(request.transport.get_extra_info("peername"))
+        self.hits += 1
+
+    async def ok(self, request):
+        self._record(request)
+        return web.json_response({"ok": True})
+
+    async def slow(self, request):
+        self._record(request)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.05)
+        self.in_flight -= 1
+        return web.json_response({"ok": True})
+
+    async def flaky(self, request):
+        self._record(request)
+        if self.failures:
+            self.failures -= 1
+            return web.Response(status=503 if self.failures else 429, headers={"Retry-After": "0"})
+        return web.json_response({"ok": True})
+
+    async def overpass(self, request):
+        self._record(request)
+        return web.json_response({"elements": [{"type": "way", "id": 1, "query": await request.text()}]})
+
+
+@pytest_asyncio.fixture
+async def server():
+    counting = CountingServer()
+    test_server = TestServer(counting.app())
+    await test_server.start_server()
+    counting.url = str(test_server.make_url("")).rstrip("/")
+    yield counting
+    await test_server.close()
+
+
+@pytest_asyncio.fixture
+async def manager():
+    http = HTTPSessionManager(limit_per_host=2, retry=RetryPolicy(max_retries=3, backoff_base=0.01))
+    yield http
+    await http.close()
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_one_connection(server, manager):
+    """Test that sequential requests share a keep-alive connection."""
+    for _ in range(20):
+        response = await manager.request("GET", f"{server.url}/ok")
+        assert (await response.json()) == {"ok": True}
+
+    assert server.hits == 20
+    assert len(server.peers) == 1
+
+
+@pytest.mark.asyncio
+async def test_per_host_connection_limit(server, manager):
+    """Test that concurrent requests never exceed the per-host limit."""
+    responses = await asyncio.gather(*(manager.request("GET", f"{server.url}/slow") for _ in range(10)))
+
+    assert all(r.status == 200 for r in responses)
+    assert server.max_in_flight == 2
+    assert len(server.peers) == 2
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_statuses(server, manager):
+    """Test that 503 and 429 responses are retried until success."""
+    server.failures = 3
+    response = await manager.request("GET", f"{server.url}/flaky")
+
+    assert response.status == 200
+    assert server.hits == 4
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries(server, manager):
+    """Test that the last failing response is returned once retries run out."""
+    server.failures = 10
+    response = await manager.request("GET", f"{server.url}/flaky")
+
+    assert response.status == 503
+    assert server.hits == 4
+
+
+@pytest.mark.asyncio
+async def test_post_is_not_retried_on_server_errors(server, manager):
+    """Test that POST is retried on 429 only, unless marked idempotent."""
+    server.failures = 3
+    response = await manager.request("POST", f"{server.url}/flaky")
+    assert response.status == 503
+    assert server.hits == 1
+
+    server.failures, server.hits = 1, 0
+    response = await manager.request("POST", f"{server.url}/flaky")
+    assert response.status == 200
+    assert server.hits == 2
+
+    server.failures, server.hits = 3, 0
+    response = await manager.request("POST", f"{server.url}/flaky", idempotent=True)
+    assert response.status == 200
+    assert server.hits == 4
+
+
+def test_requests_session_limits_post_retries(monkeypatch):
+    """Test that the requests session retries GET on 503 but POST only on 429."""
+    hits = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def respond(self):
+            hits.append(self.command)
+            status = int(self.path.strip("/")) if len(hits) == 1 else 200
+            self.send_response(status)
+            self.send_header("Retry-After", "0")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        do_GET = do_POST = respond
+
+        def log_message(self, *args):
+            pass
+
+    monkeypatch.setattr(http_session, "_requests_session", None)
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    session = get_requests_session(retry=RetryPolicy(max_retries=3, backoff_base=0.01))
+    url = f"http://127.0.0.1:{httpd.server_address[1]}"
+    try:
+        cases = [("GET", 503, 200, 2), ("POST", 503, 503, 1), ("POST", 429, 200, 2)]
+        for method, first_status, final_status, attempts in cases:
+            hits.clear()
+            assert session.request(method, f"{url}/{first_status}").status_code == final_status
+            assert hits == [method] * attempts
+    finally:
+        session.close()
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def test_retry_delay_is_jittered_and_capped():
+    """Test full-jitter backoff bounds and Retry-After handling."""
+    policy = RetryPolicy(backoff_base=1.0, backoff_max=5.0)
+
+    assert all(0 <= policy.delay(attempt) <= min(5.0, 2 ** attempt) for attempt in range(6) for _ in range(20))
+    assert len({policy.delay(3) for _ in range(20)}) > 1
+    assert policy.delay(0, retry_after="2") == 2.0
+    assert policy.delay(0, retry_after="120") == 5.0
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_spaces_requests(server, manager):
+    """Test that an endpoint rate limit spaces out requests after the burst."""
+    manager.set_rate_limit(f"{server.url}/ok", rate=20.0, burst=2)
+
+    start = time.monotonic()
+    await asyncio.gather(*(manager.request("GET", f"{server.url}/ok") for _ in range(6)))
+    elapsed = time.monotonic() - start
+
+    # Two requests pass immediately, the other four wait 1/20 s each
+    assert elapsed >= 0.19
+    assert server.hits == 6
+
+
+def test_token_bucket_refills():
+    """Test that unused capacity refills at the configured rate."""
+    bucket = TokenBucket(rate=100.0, capacity=1)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() > 0.0
+    time.sleep(0.03)
+    assert bucket.reserve() == 0.0
+
+
+@pytest.mark.asyncio
+async def test_osm_connector_uses_shared_session(server, manager):
+    """Test that Overpass queries go through the shared, rate limited session."""
+    osm = OSMConnector({'overpass_url': f"{server.url}/interpreter", 'rate_limits': {}})
+    osm.http = manager
+    manager.set_rate_limit(f"{server.url}/interpreter", rate=50.0, burst=1)
+
+    for _ in range(3):
+        data = await osm.get_osm_data([37.77, -122.42, 37.78, -122.41], themes=["buildings"])
+        assert data["elements"][0]["id"] == 1
+    await osm.cleanup()
+
+    assert server.hits == 3
+    assert len(server.peers) == 1
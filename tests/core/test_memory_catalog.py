@@ -641,4 +641,170 @@ class TestMemoryCatalog:
         finally:
             # Restore original mock
             logger.debug("Restoring original get_data_info mock")
-            memory_catalog.get_data_info = original_get_info 
\ No newline at end of file
+            memory_catalog.get_data_info = original_get_info 
+
+@pytest.fixture
+def duckdb_catalog(tmp_path, monkeypatch):
+    """Create a separate MemoryCatalog backed by a temporary DuckDB file."""
+    from memories.core.memory_manager import MemoryManager
+    
+    monkeypatch.setattr(MemoryCatalog, "_instance", None)
+    monkeypatch.setattr(
+        MemoryManager().config, "get_path",
+        lambda key, default_filename=None: str(tmp_path / default_filename)
+    )
+    catalog = MemoryCatalog()
+    yield catalog
+    catalog.cleanup()
+
+
+class TestMemoryCatalogTags:
+    """Tests for the normalized tag table and buffered access statistics."""
+    
+    @pytest.mark.asyncio
+    async def test_search_by_tags_any_and_all(self, duckdb_catalog):
+        """Test OR and AND tag queries against the tag table."""
+        a = await duckdb_catalog.register_data("cold", "a", 1, "table", tags=["roads", "city"])
+        b = await duckdb_catalog.register_data("cold", "b", 1, "table", tags=["roads", "rural"])
+        await duckdb_catalog.register_data("cold", "c", 1, "table", tags=["cityscape"])
+        
+        any_ids = {r["data_id"] for r in await duckdb_catalog.search_by_tags(["city", "rural"])}
+        assert any_ids == {a, b}
+        
+        all_ids = [r["data_id"] for r in await duckdb_catalog.search_by_tags(["roads", "city"], match="all")]
+        assert all_ids == [a]
+        
+        # Tags match exactly, not as substrings
+        assert await duckdb_catalog.search_by_tags(["cit"]) == []
+        assert await duckdb_catalog.search_by_tags([]) == []
+        
+        # Compaction reorders the tag table without changing results
+        assert duckdb_catalog.compact_tags()
+        all_ids = [r["data_id"] for r in await duckdb_catalog.search_by_tags(["roads", "city"], match="all")]
+        assert all_ids == [a]
+        assert duckdb_catalog.con.execute("SELECT COUNT(*) FROM catalog_tags").fetchone()[0] == 5
+    
+    @pytest.mark.asyncio
+    async def test_update_access_is_buffered_and_flushed(self, duckdb_catalog):
+        """Test that accesses are visible immediately and written in one batch."""
+        data_id = await duckdb_catalog.register_data("hot", "loc", 1, "table")
+        duckdb_catalog.access_flush_interval = 3600
+        
+        for _ in range(3):
+            await duckdb_catalog.update_access(data_id)
+        
+        stored = duckdb_catalog.con.execute(
+            "SELECT access_count FROM memory_catalog WHERE data_id = ?", [data_id]
+        ).fetchone()[0]
+        assert stored == 0
+        assert (await duckdb_catalog.get_data_info(data_id))["access_count"] == 3
+        
+        assert duckdb_catalog.flush_access() == 1
+        stored = duckdb_catalog.con.execute(
+            "SELECT access_count FROM memory_catalog WHERE data_id = ?", [data_id]
+        ).fetchone()[0]
+        assert stored == 3
+        assert (await duckdb_catalog.get_data_info(data_id))["access_count"] == 3
+    
+    @pytest.mark.asyncio
+    async def test_flush_when_buffer_is_full(self, duckdb_catalog):
+        """Test that a full buffer triggers a flush."""
+        ids = [await duckdb_catalog.register_data("hot", f"loc{i}", 1, "table") for i in range(3)]
+        duckdb_catalog.access_flush_interval = 3600
+        duckdb_catalog.access_flush_size = 3
+        
+        for data_id in ids:
+            await duckdb_catalog.update_access(data_id)
+        
+        assert duckdb_catalog._access_buffer == {}
+        counts = duckdb_catalog.con.execute("SELECT SUM(access_count) FROM memory_catalog").fetchone()[0]
+        assert counts == 3
+    
+    def test_tags_backfilled_from_legacy_column(self, tmp_path, monkeypatch):
+        """Test that catalogs created before the tag table get it populated."""
+        import duckdb
+        from memories.core.memory_manager import MemoryManager
+        
+        db_path = tmp_path / "memory_catalog.duckdb"
+        con = duckdb.connect(str(db_path))
+        con.execute("""
+            CREATE TABLE memory_catalog (
+                data_id VARCHAR PRIMARY KEY, primary_tier VARCHAR, location VARCHAR,
+                created_at TIMESTAMP, last_accessed TIMESTAMP, access_count INTEGER DEFAULT 0,
+                size BIGINT, tags VARCHAR, data_type VARCHAR, table_name VARCHAR,
+                additional_meta JSON
+            )
+        """)
+        con.execute("INSERT INTO memory_catalog (data_id, tags) VALUES ('x', 'roads,city'), ('y', NULL)")
+        con.close()
+        
+        monkeypatch.setattr(MemoryCatalog, "_instance", None)
+        monkeypatch.setattr(
+            MemoryManager().config, "get_path",
+            lambda key, default_filename=None: str(tmp_path / default_filename)
+        )
+        catalog = MemoryCatalog()
+        try:
+            rows = catalog.con.execute("SELECT tag, data_id FROM catalog_tags ORDER BY tag").fetchall()
+            assert rows == [("city", "x"), ("roads", "x")]
+        finally:
+            catalog.cleanup()
+    
+    @pytest.mark.asyncio
+    async def test_access_stats_and_batched_tier_update(self, duckdb_catalog):
+        """Test the statistics and tier updates used by the tiering daemon."""
+        hot_id = await duckdb_catalog.register_data("hot", "h", 10, "table")
+        cold_id = await duckdb_catalog.register_data("cold", "c", 20, "table")
+        duckdb_catalog.access_flush_interval = 3600
+        await duckdb_catalog.update_access(cold_id)
+        
+        stats = {s["data_id"]: s for s in await duckdb_catalog.get_access_stats(["cold"])}
+        assert list(stats) == [cold_id]
+        assert stats[cold_id]["access_count"] == 1
+        assert stats[cold_id]["size"] == 20
+        # A burst that went idle is flushed by the read instead of waiting for the next access
+        assert duckdb_catalog._access_buffer == {}
+        stored = duckdb_catalog.con.execute(
+            "SELECT access_count FROM memory_catalog WHERE data_id = ?", [cold_id]
+        ).fetchone()[0]
+        assert stored == 1
+        
+        assert await duckdb_catalog.update_tiers({hot_id: "warm", cold_id: "hot"}) == 2
+        assert (await duckdb_catalog.get_data_info(hot_id))["primary_tier"] == "warm"
+        assert (await duckdb_catalog.get_data_info(cold_id))["primary_tier"] == "hot"
+    
+    def test_concurrent_writes_from_threads(self, duckdb_catalog):
+        """Test that writes from several threads do not share a transaction."""
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+        
+        duckdb_catalog.access_flush_interval = 3600
+        
+        def work(i):
+            data_id = asyncio.run(duckdb_catalog.register_data("hot", f"loc{i}", 1, "table", tags=[f"t{i}"]))
+            asyncio.run(duckdb_catalog.update_access(data_id))
+            duckdb_catalog.flush_access()
+            asyncio.run(duckdb_catalog.update_tiers({data_id: "warm"}))
+            return data_id
+        
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            ids = list(pool.map(work, range(64)))
+        
+        rows = duckdb_catalog.con.execute(
+            "SELECT primary_tier, SUM(access_count), COUNT(*) FROM memory_catalog GROUP BY primary_tier"
+        ).fetchall()
+        assert rows == [("warm", 64, 64)]
+        assert duckdb_catalog.con.execute("SELECT COUNT(*) FROM catalog_tags").fetchone()[0] == len(set(ids))
+    
+    @pytest.mark.asyncio
+    async def test_delete_data_removes_entry_and_tags(self, duckdb_catalog):
+        """Test that a deleted item no longer shows up in lookups or tag searches."""
+        data_id = await duckdb_catalog.register_data("cold", "loc", 1, "table", tags=["roads"])
+        kept = await duckdb_catalog.register_data("cold", "other", 1, "table", tags=["roads"])
+        duckdb_catalog.access_flush_interval = 3600
+        await duckdb_catalog.update_access(data_id)
+        
+        assert await duckdb_catalog.delete_data(data_id) is True
+        assert await duckdb_catalog.get_data_info(data_id) is None
+        assert [r["data_id"] for r in await duckdb_catalog.search_by_tags(["roads"])] == [kept]
+        assert data_id not in duckdb_catalog._access_buffer
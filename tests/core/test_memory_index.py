@@ -90,7 +90,7 @@ def memory_index(mock_memory_catalog, mock_huggingface_models, mock_memory_manag
     """Create a MemoryIndex instance with mocked dependencies."""
     # Patch the dependencies
     with patch('memories.core.memory_index.memory_catalog', mock_memory_catalog), \
-         patch('memories.core.memory_index.SentenceTransformer', return_value=mock_huggingface_models), \
+         patch('memories.core.memory_index.get_model', return_value=mock_huggingface_models), \
          patch('memories.core.memory_index.faiss.IndexFlatL2') as mock_index_flat:
         
         # Create mock FAISS index
@@ -3,6 +3,7 @@ Tests for the MemoryManager class in the core.memory_manager module.
 """
 
 import os
+import asyncio
 import pytest
 import tempfile
 import shutil
@@ -164,4 +165,177 @@ class TestMemoryManager:
         """Test getting the storage backend."""
         backend = memory_manager.get_storage_backend("cold")
         assert backend is not None
-        memory_manager.get_storage_backend.assert_called_once_with("cold") 
\ No newline at end of file
+        memory_manager.get_storage_backend.assert_called_once_with("cold") 
+
+class _AsyncTier:
+    """Minimal tier with a coroutine API keyed by the manager key."""
+    
+    def __init__(self):
+        self.items = {}
+    
+    async def store(self, key, value, metadata):
+        self.items[key] = value
+        return key
+    
+    async def retrieve(self, key):
+        return self.items.get(key)
+    
+    async def delete(self, key):
+        return self.items.pop(key, None) is not None
+
+
+class _SyncTier(_AsyncTier):
+    """Same tier with a synchronous ``exists``."""
+    
+    def exists(self, key):
+        return key in self.items
+
+
+class TestMemoryManagerTiers:
+    """Tests for tier reuse and the async store/retrieve API."""
+    
+    @pytest.fixture
+    def tiers(self, memory_manager):
+        saved = memory_manager._tiers, memory_manager._catalog
+        memory_manager._tiers = {"red_hot": _SyncTier(), "hot": _AsyncTier()}
+        memory_manager._catalog = False
+        yield memory_manager._tiers
+        memory_manager._tiers, memory_manager._catalog = saved
+    
+    def test_tier_instances_are_reused(self, memory_manager, tiers):
+        """Test that a tier is constructed once and then reused."""
+        tiers.pop("hot")
+        with patch("memories.core.hot.HotMemory", return_value=_AsyncTier()) as hot_cls:
+            first = memory_manager._get_tier("hot")
+            second = memory_manager._get_tier("hot")
+        assert first is second
+        assert hot_cls.call_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_astore_and_aretrieve(self, memory_manager, tiers):
+        """Test the async API awaits coroutine tier methods."""
+        assert await memory_manager.astore("k", {"v": 1}, tier="hot") == "k"
+        assert await memory_manager.aretrieve("k") == {"v": 1}
+        assert await memory_manager.aexists("k") is True
+        assert await memory_manager.adelete("k", tier="hot") is True
+        assert await memory_manager.aexists("k") is False
+    
+    @pytest.mark.asyncio
+    async def test_astore_falls_back_to_next_tier(self, memory_manager, tiers):
+        """Test that a failing tier falls back to the next slower tier."""
+        tiers["red_hot"].store = MagicMock(side_effect=RuntimeError("full"))
+        await memory_manager.astore("k", "value", tier="red_hot")
+        assert tiers["hot"].items == {"k": "value"}
+    
+    def test_sync_wrappers(self, memory_manager, tiers):
+        """Test the sync wrappers reuse one event loop across calls."""
+        memory_manager.store("k", "value", tier="red_hot")
+        loop = memory_manager._loop
+        assert memory_manager.retrieve("k") == "value"
+        assert memory_manager.exists("k") is True
+        assert memory_manager._loop is loop
+    
+    @pytest.mark.asyncio
+    async def test_sync_wrapper_inside_event_loop(self, memory_manager, tiers):
+        """Test that sync wrappers refuse to block a running event loop."""
+        with pytest.raises(RuntimeError, match="astore"):
+            memory_manager.retrieve("k")
+
+
+class _DelayedTier:
+    """Tier whose lookups take a fixed time and record whether they finished."""
+    
+    def __init__(self, delay, items=None):
+        self.delay = delay
+        self.items = items or {}
+        self.calls = 0
+        self.cancelled = False
+    
+    async def retrieve(self, key):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return self.items.get(key)
+
+
+class TestMemoryManagerFanOut:
+    """Tests for catalog-guided and parallel tier lookups."""
+    
+    DELAYS = {"red_hot": 0.05, "hot": 0.1, "warm": 0.15, "cold": 0.6, "glacier": 1.2}
+    
+    @pytest.fixture
+    def tiers(self, memory_manager):
+        saved = memory_manager._tiers, memory_manager._catalog
+        memory_manager._tiers = {t: _DelayedTier(d) for t, d in self.DELAYS.items()}
+        memory_manager._catalog = False
+        yield memory_manager._tiers
+        memory_manager._tiers, memory_manager._catalog = saved
+    
+    @staticmethod
+    async def timed(coro):
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await coro
+        return result, loop.time() - start
+    
+    @pytest.mark.asyncio
+    async def test_parallel_hit_cancels_slower_tiers(self, memory_manager, tiers):
+        """Test that a warm hit returns after the warm delay, not the sum of delays."""
+        tiers["warm"].items["k"] = "warm value"
+        tiers["cold"].items["k"] = "stale cold value"
+        
+        result, elapsed = await self.timed(memory_manager.aretrieve("k"))
+        
+        assert result == "warm value"
+        assert elapsed < self.DELAYS["cold"]
+        assert tiers["cold"].cancelled
+        assert tiers["glacier"].calls == 0
+        
+        result, sequential = await self.timed(memory_manager.aretrieve("k", strategy="sequential"))
+        assert result == "warm value"
+        assert sequential >= self.DELAYS["red_hot"] + self.DELAYS["hot"] + self.DELAYS["warm"]
+        assert elapsed < sequential
+    
+    @pytest.mark.asyncio
+    async def test_parallel_miss_costs_slowest_tier(self, memory_manager, tiers):
+        """Test that a local miss costs the slowest local tier before glacier is asked."""
+        result, elapsed = await self.timed(memory_manager.aretrieve("missing"))
+        
+        assert result is None
+        assert tiers["glacier"].calls == 1
+        assert elapsed >= self.DELAYS["cold"] + self.DELAYS["glacier"]
+        assert elapsed < sum(self.DELAYS.values()) - self.DELAYS["warm"]
+    
+    @pytest.mark.asyncio
+    async def test_glacier_queried_after_local_miss(self, memory_manager, tiers):
+        """Test that glacier answers only once every local tier has missed."""
+        tiers["glacier"].items["k"] = "glacier value"
+        
+        for strategy in ("parallel", "sequential"):
+            assert await memory_manager.aretrieve("k", strategy=strategy) == "glacier value"
+        assert tiers["glacier"].calls == 2
+        assert not tiers["glacier"].cancelled
+    
+    @pytest.mark.asyncio
+    async def test_faster_tier_wins_over_earlier_answer(self, memory_manager, tiers):
+        """Test that a faster tier's answer wins even if a slower tier answers first."""
+        tiers["hot"].delay = 0.3
+        tiers["hot"].items["k"] = "hot value"
+        tiers["warm"].items["k"] = "warm value"
+        
+        assert await memory_manager.aretrieve("k") == "hot value"
+    
+    @pytest.mark.asyncio
+    async def test_catalog_primary_tier_is_tried_first(self, memory_manager, tiers):
+        """Test that the catalog's primary tier is queried before fanning out."""
+        tiers["cold"].items["k"] = "cold value"
+        catalog = MagicMock()
+        catalog.get_data_info = AsyncMock(return_value={"data_id": "k", "primary_tier": "cold"})
+        memory_manager._catalog = catalog
+        
+        assert await memory_manager.aretrieve("k") == "cold value"
+        assert tiers["cold"].calls == 1
+        assert all(tiers[t].calls == 0 for t in ("red_hot", "hot", "warm", "glacier"))
@@ -50,6 +50,9 @@ def memory_store(mock_memory_manager, mock_memory_catalog):
     async def mock_hot_store(*args, **kwargs):
         return True
     
+    async def mock_hot_store_many(items, **kwargs):
+        return [f"hot-id-{i}" for i in range(len(items))]
+    
     async def mock_warm_store(*args, **kwargs):
         return {"success": True, "data_id": "test-data-id", "table_name": "test_table"}
     
@@ -64,6 +67,7 @@ def memory_store(mock_memory_manager, mock_memory_catalog):
     
     # Assign the mock methods
     store._hot_memory.store = mock_hot_store
+    store._hot_memory.store_many = mock_hot_store_many
     store._warm_memory.store = mock_warm_store
     store._cold_memory.store = mock_cold_store
     store._red_hot_memory.store = mock_red_hot_store
@@ -0,0 +1,206 @@
+"""
+Tests for moving data between tiers with MemoryTiering, using in-memory fake tiers.
+"""
+
+import asyncio
+import os
+from datetime import datetime
+
+import pytest
+
+from memories.core.memory_tiering import MemoryTiering
+from memories.core.tiering_policy import TierBudget
+
+
+class FakeTier:
+    """Tier keeping items by the key in their metadata.
+
+    ``result`` selects the store return style of the real tiers: "bool"
+    (hot, cold, red hot) or "dict" (warm).
+    """
+
+    def __init__(self, result="bool", fail=False):
+        self.items = {}
+        self.result = result
+        self.fail = fail
+
+    async def store(self, data, metadata=None, tags=None, **kwargs):
+        if not self.fail:
+            self.items[metadata["key"]] = data
+        return {"success": not self.fail, "data_id": None} if self.result == "dict" else not self.fail
+
+    async def retrieve(self, key):
+        return self.items.get(key)
+
+    async def delete(self, key):
+        return self.items.pop(key, None) is not None
+
+    def is_available(self):
+        return True
+
+
+class FakeGlacier(FakeTier):
+    """Glacier stores under an explicit key."""
+
+    async def store(self, data, key, metadata=None):
+        self.items[key] = data
+        return True
+
+
+@pytest.fixture
+def tiering(monkeypatch):
+    tiers = {
+        'red_hot': FakeTier(), 'hot': FakeTier(), 'warm': FakeTier(result="dict"),
+        'cold': FakeTier(), 'glacier': FakeGlacier()
+    }
+    memory_tiering = MemoryTiering()
+    for name, tier in tiers.items():
+        setattr(memory_tiering, name, tier)
+    monkeypatch.setattr(memory_tiering.memory_manager, '_tiers', dict(tiers))
+    return memory_tiering
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("source, target", [('hot', 'warm'), ('warm', 'cold'), ('cold', 'glacier'), ('red_hot', 'hot')])
+async def test_demote_moves_data(tiering, source, target):
+    """Test that a demotion stores in the target tier and then deletes the source copy."""
+    payload = {'reading': 1.5, 'at': datetime(2024, 1, 1)}
+    getattr(tiering, source).items['k'] = payload
+
+    assert await tiering.demote_to_tier('k', source, target)
+    assert getattr(tiering, target).items == {'k': payload}
+    assert getattr(tiering, source).items == {}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("result", ["bool", "dict"])
+async def test_failed_store_keeps_source_copy(tiering, result):
+    """Test that the source copy survives when the target tier reports a failed store."""
+    failing = FakeTier(result=result, fail=True)
+    tiering.memory_manager._tiers['warm'] = failing
+    tiering.hot.items['k'] = {'reading': 1.5}
+
+    assert not await tiering.demote_to_tier('k', 'hot', 'warm')
+    assert tiering.hot.items == {'k': {'reading': 1.5}}
+    assert await tiering.move_to_tier('k', 'hot', 'cold')
+    assert tiering.cold.items == {'k': {'reading': 1.5}}
+
+
+@pytest.mark.asyncio
+async def test_multi_hop_promotion(tiering):
+    """Test a promotion through every intermediate tier, in either direction of move_to_tier."""
+    tiering.cold.items['k'] = [{'reading': 1.5}]
+
+    assert await tiering.move_to_tier('k', 'cold', 'red_hot')
+    # Promotions copy; warm received a DataFrame and passed it on
+    for tier in (tiering.warm, tiering.hot, tiering.red_hot):
+        assert tier.items['k'].to_dict('records') == [{'reading': 1.5}]
+    assert 'k' in tiering.cold.items
+
+    assert await tiering.move_to_tier('k', 'hot', 'hot')
+    assert not await tiering.promote_to_tier('missing', 'cold', 'hot')
+
+
+@pytest.fixture
+def catalog_tiering(tmp_path, monkeypatch, request):
+    """MemoryTiering over real hot, warm and cold tiers and a DuckDB catalog."""
+    from memories.core.cold import ColdMemory
+    from memories.core.hot import HotMemory
+    from memories.core.memory_catalog import MemoryCatalog
+    from memories.core.warm import WarmMemory
+
+    memory_tiering = MemoryTiering()
+    monkeypatch.setattr(MemoryCatalog, "_instance", None)
+    monkeypatch.setattr(
+        memory_tiering.memory_manager.config, "get_path",
+        lambda key, default_filename=None: str(tmp_path / default_filename)
+    )
+    catalog = MemoryCatalog()
+
+    config_path = tmp_path / "cold.yml"
+    config_path.write_text(f"storage:\n  path: {tmp_path / 'cold'}\n")
+    cold = ColdMemory(config_path=str(config_path))
+    cold.memory_catalog = catalog
+    hot = HotMemory()
+    asyncio.run(hot.clear())
+    warm = WarmMemory(storage_path=str(tmp_path / "warm"), storage_mode=getattr(request, "param", "per_item"))
+    monkeypatch.setattr(memory_tiering.memory_manager, '_tiers', {'hot': hot, 'warm': warm, 'cold': cold})
+
+    yield memory_tiering, catalog
+    asyncio.run(hot.clear())
+    warm.cleanup()
+    cold.cleanup()
+    catalog.cleanup()
+
+
+async def store_in_hot(catalog, hot, data, tags=None):
+    """Store an item in hot memory and register it the way MemoryStore does."""
+    hot_id = (await hot.store_many([{'data': data, 'metadata': {'source': 'test'}, 'tags': tags}]))[0]
+    return await catalog.register_data('hot', hot_id, 1, 'dict', tags=tags), hot_id
+
+
+async def retrieve_from_warm(warm, location):
+    if warm.storage_mode == 'partitioned':
+        return await warm.retrieve(query={'id': location})
+    return await warm.retrieve(table_name=location)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("catalog_tiering", ["per_item", "partitioned"], indirect=True)
+async def test_daemon_demotes_hot_item_to_warm(catalog_tiering):
+    """Test that a daemon run moves the catalogued payload from hot to warm and repoints the entry."""
+    tiering, catalog = catalog_tiering
+    hot, warm = tiering.memory_manager._tiers['hot'], tiering.memory_manager._tiers['warm']
+    popular, popular_hot_id = await store_in_hot(catalog, hot, {'reading': 2})
+    idle, idle_hot_id = await store_in_hot(catalog, hot, {'reading': 0, 'name': 'idle'}, tags=['sensor'])
+    for _ in range(5):
+        await catalog.update_access(popular)
+
+    daemon = tiering.create_daemon({'hot': TierBudget(max_items=1)}, policy="lfu", catalog=catalog,
+                                   tiers=['hot', 'warm'])
+    report = await daemon.run_once()
+
+    assert report == {'planned': 1, 'promoted': 0, 'demoted': 1, 'failed': 0}
+    info = await catalog.get_data_info(idle)
+    assert info['primary_tier'] == 'warm' and info['location'] != idle_hot_id
+    moved = await retrieve_from_warm(warm, info['location'])
+    assert moved['data'] == {'reading': 0, 'name': 'idle'}
+    assert moved['metadata'] == {'source': 'test'} and moved['tags'] == ['sensor']
+    assert await hot.retrieve(query={'id': idle_hot_id}) is None
+    assert (await hot.retrieve(query={'id': popular_hot_id}))[0]['data'] == {'reading': 2}
+
+
+@pytest.mark.asyncio
+async def test_catalog_item_round_trip_through_cold(catalog_tiering):
+    """Test moving a catalog entry hot -> cold -> hot keeps its ID and payload and one copy."""
+    tiering, catalog = catalog_tiering
+    hot, cold = tiering.memory_manager._tiers['hot'], tiering.memory_manager._tiers['cold']
+    records = [{'reading': 1.5, 'name': 'a'}, {'reading': 2.5, 'name': 'b'}]
+    data_id, hot_id = await store_in_hot(catalog, hot, records)
+
+    assert await tiering.move_catalog_item(data_id, 'hot', 'cold', catalog)
+    info = await catalog.get_data_info(data_id)
+    assert info['primary_tier'] == 'cold' and cold._is_parquet_dataset(info['location'])
+    assert (await cold.retrieve({'data_id': data_id}))['data'].to_dict('records') == records
+    assert await hot.retrieve(query={'id': hot_id}) is None
+
+    assert await tiering.move_catalog_item(data_id, 'cold', 'hot', catalog)
+    promoted = await catalog.get_data_info(data_id)
+    assert promoted['primary_tier'] == 'hot'
+    assert (await hot.retrieve(query={'id': promoted['location']}))[0]['data'] == records
+    assert not os.path.exists(info['location'])
+
+
+@pytest.mark.asyncio
+async def test_unresolvable_catalog_location_is_not_moved(catalog_tiering):
+    """Test that an entry whose location the tier cannot look up fails instead of moving other data."""
+    tiering, catalog = catalog_tiering
+    hot, warm = tiering.memory_manager._tiers['hot'], tiering.memory_manager._tiers['warm']
+    await hot.store_many([{'data': {'reading': 9}}])
+    data_id = await catalog.register_data('hot', 'hot/20240101_000000', 1, 'dict')
+
+    assert not await tiering.move_catalog_item(data_id, 'hot', 'warm', catalog)
+    assert not await tiering.move_catalog_item(data_id, 'warm', 'cold', catalog)
+    assert (await catalog.get_data_info(data_id))['location'] == 'hot/20240101_000000'
+    assert await warm.retrieve() is None
+    assert hot.get_table_info()['hot_data_count'] == 1
@@ -14,9 +14,11 @@ import json
 import time
 import logging
 import pandas as pd
+import faiss
 import sys  # Add sys import for sys.exit()
 
 from memories.core.red_hot import RedHotMemory
+from memories.metadata_log import AppendOnlyLog
 
 # Import necessary classes for the tests
 try:
@@ -354,40 +356,182 @@ class TestRedHotMemory:
     @pytest.mark.asyncio
     async def test_delete(self, red_hot_memory, temp_storage_path):
         """Test deleting data from red hot memory."""
-        # Create test vector
-        test_vector = np.random.rand(128).astype(np.float32)
-        
-        # Store vector
-        key = 'test_delete_key'
-        metadata = {'test': 'metadata'}
-        
-        # Mock the metadata and index for testing
-        red_hot_memory.metadata = {
-            key: {
-                'index': 0,
-                'metadata': metadata
-            }
-        }
-        red_hot_memory.metadata_file = os.path.join(temp_storage_path, 'metadata.json')
-        
-        # Save metadata
-        with open(red_hot_memory.metadata_file, 'w') as f:
-            json.dump(red_hot_memory.metadata, f)
+        vectors = np.random.rand(3, 128).astype(np.float32)
+        keys = await red_hot_memory.store_many(vectors, [{"id": i} for i in range(3)])
         
         # Delete vector
-        deleted = await red_hot_memory.delete(key)
+        deleted = await red_hot_memory.delete(keys[1])
         assert deleted is True
         
-        # Verify vector is marked as deleted in metadata
-        with open(red_hot_memory.metadata_file, 'r') as f:
-            updated_metadata = json.load(f)
+        # The vector is removed from the index and its metadata is dropped
+        assert red_hot_memory.index.ntotal == 2
+        updated_metadata = AppendOnlyLog(red_hot_memory.metadata_file).data
+        assert keys[1] not in updated_metadata
+        assert keys[0] in updated_metadata
+        
+        retrieved = await red_hot_memory.retrieve(query_vector=vectors[1], k=3)
+        assert all(r["metadata"]["id"] != 1 for r in retrieved)
         
-        assert updated_metadata[key]['deleted'] is True
+        # Ids are never reused after a delete
+        await red_hot_memory.store(vectors[1], metadata={"id": 3})
+        assert await red_hot_memory.get_schema(keys[1]) is None
+        assert (await red_hot_memory.get_schema(3))["metadata"] == {"id": 3}
         
         # Try to delete non-existent key
         deleted_non_existent = await red_hot_memory.delete('non_existent_key')
         assert deleted_non_existent is False
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("index_type", ["flat", "hnsw"])
+    async def test_recall_and_latency_after_deleting_half(self, temp_storage_path, index_type):
+        """Test that recall and latency stay flat after 50% of the entries are deleted."""
+        rng = np.random.default_rng(7)
+        vectors = rng.random((4000, 32), dtype=np.float32)
+        queries = rng.random((50, 32), dtype=np.float32)
+        memory = RedHotMemory(dimension=32, storage_path=temp_storage_path,
+                              index_type=index_type, compact_ratio=0.4)
+        keys = await memory.store_many(vectors, [{"id": i} for i in range(4000)])
+        
+        def measure(live):
+            """Return mean recall@10 against exact search over ``live`` and search time."""
+            exact = faiss.knn(queries, vectors[live], 10)[1]
+            start = time.perf_counter()
+            _, found = memory._search(queries, 10)
+            elapsed = time.perf_counter() - start
+            recall = np.mean([
+                len(set(found[i]) & set(live[exact[i]])) / 10 for i in range(len(queries))
+            ])
+            return recall, elapsed
+        
+        recall_before, latency_before = measure(np.arange(4000))
+        
+        deleted = np.arange(0, 4000, 2)
+        assert await memory.delete_many([keys[i] for i in deleted]) == 2000
+        if memory._compaction is not None:
+            await memory._compaction
+        
+        # Dead vectors no longer occupy the index
+        assert memory.index.ntotal == 2000
+        assert memory.tombstone_ratio == 0.0
+        
+        recall_after, latency_after = measure(np.arange(1, 4000, 2))
+        assert recall_after >= recall_before - 0.05
+        assert latency_after <= latency_before * 2 + 0.01
+        memory.cleanup()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("index_type", ["flat", "ivf_flat", "hnsw"])
+    async def test_selective_tag_filter_returns_k_hits(self, temp_storage_path, index_type):
+        """Test that tag filters are applied before the k-NN search."""
+        rng = np.random.default_rng(3)
+        vectors = rng.random((3000, 32), dtype=np.float32)
+        tags_list = [["rare"] if i % 100 == 0 else ["common"] for i in range(3000)]
+        memory = RedHotMemory(dimension=32, storage_path=temp_storage_path, index_type=index_type,
+                              nlist=16, train_size=1000, brute_force_threshold=10)
+        await memory.store_many(vectors, [{"id": i} for i in range(3000)], tags_list)
+        
+        # 30 candidates: above the brute-force threshold, so FAISS gets a bitmap selector
+        retrieved = await memory.retrieve(query_vector=vectors[1], k=5, tags=["rare"])
+        assert len(retrieved) == 5
+        assert all(r["tags"] == ["rare"] for r in retrieved)
+        
+        # A handful of candidates is searched exactly
+        await memory.delete_many([str(i) for i in range(0, 3000, 100)][5:])
+        retrieved = await memory.retrieve(query_vector=vectors[1], k=10, tags=["rare"])
+        assert sorted(r["metadata"]["id"] for r in retrieved) == [0, 100, 200, 300, 400]
+        memory.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_store_many(self, red_hot_memory):
+        """Test storing a batch of vectors in a single call."""
+        vectors = np.random.rand(50, 128).astype(np.float32)
+        metadata_list = [{"id": i} for i in range(50)]
+        tags_list = [["even"] if i % 2 == 0 else ["odd"] for i in range(50)]
+        
+        keys = await red_hot_memory.store_many(vectors, metadata_list, tags_list)
+        assert len(keys) == 50
+        assert red_hot_memory.index.ntotal == 50
+        
+        retrieved = await red_hot_memory.retrieve(query_vector=vectors[7], k=1)
+        assert retrieved[0]["metadata"]["id"] == 7
+        assert retrieved[0]["tags"] == ["odd"]
+        
+        # Mismatched metadata length is rejected without touching the index
+        keys = await red_hot_memory.store_many(vectors[:2], [{"id": 0}], None)
+        assert keys == []
+        assert red_hot_memory.index.ntotal == 50
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("index_type", ["ivf_flat", "ivf_pq", "hnsw"])
+    async def test_approximate_index_types(self, temp_storage_path, index_type):
+        """Test that IVF and HNSW indexes train on demand and find stored vectors."""
+        memory = RedHotMemory(
+            dimension=32,
+            storage_path=temp_storage_path,
+            index_type=index_type,
+            nlist=4,
+            pq_m=4,
+            pq_nbits=4,
+            train_size=256
+        )
+        vectors = np.random.rand(300, 32).astype(np.float32)
+        
+        # Vectors stored before training are searchable through the pending buffer
+        await memory.store(vectors[0], metadata={"id": 0})
+        retrieved = await memory.retrieve(query_vector=vectors[0], k=1)
+        assert retrieved[0]["metadata"]["id"] == 0
+        
+        await memory.store_many(vectors[1:], [{"id": i} for i in range(1, 300)])
+        assert memory.index.is_trained
+        assert memory.index.ntotal == 300
+        
+        retrieved = await memory.retrieve(query_vector=vectors[42], k=1)
+        assert retrieved[0]["metadata"]["id"] == 42
+        memory.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_persistence_reload(self, temp_storage_path):
+        """Test that a saved index is reloaded memory-mapped after a restart."""
+        vectors = np.random.rand(300, 32).astype(np.float32)
+        memory = RedHotMemory(dimension=32, storage_path=temp_storage_path,
+                              index_type="ivf_flat", nlist=4, train_size=256)
+        await memory.store_many(vectors, [{"id": i} for i in range(300)])
+        assert memory.save() is True
+        del memory
+        
+        reloaded = RedHotMemory(dimension=32, storage_path=temp_storage_path,
+                                index_type="ivf_flat", nlist=4, train_size=256)
+        assert reloaded.index.ntotal == 300
+        assert reloaded._mmapped is True
+        retrieved = await reloaded.retrieve(query_vector=vectors[10], k=1)
+        assert retrieved[0]["metadata"]["id"] == 10
+        
+        # Writing to a memory-mapped IVF index reloads it into RAM first
+        assert await reloaded.store(np.random.rand(32).astype(np.float32), metadata={"id": 300})
+        assert reloaded._mmapped is False
+        assert reloaded.index.ntotal == 301
+        reloaded.cleanup()
+    
+    @pytest.mark.asyncio
+    async def test_reload_with_mismatched_arguments(self, temp_storage_path):
+        """Test that reopening an index with another dimension or layout is rejected."""
+        memory = RedHotMemory(dimension=8, storage_path=temp_storage_path)
+        assert await memory.store(np.random.rand(8).astype(np.float32), metadata={"id": 0})
+        assert memory.save() is True
+        
+        with pytest.raises(ValueError, match="dimension 8"):
+            RedHotMemory(dimension=16, storage_path=temp_storage_path)
+        with pytest.raises(ValueError, match="index type 'flat'"):
+            RedHotMemory(dimension=8, storage_path=temp_storage_path, index_type="hnsw")
+        
+        # Indexes saved without the layout in their state are inspected instead
+        Path(temp_storage_path, "state.json").unlink()
+        with pytest.raises(ValueError, match="index type 'flat'"):
+            RedHotMemory(dimension=8, storage_path=temp_storage_path, index_type="hnsw")
+        reloaded = RedHotMemory(dimension=8, storage_path=temp_storage_path)
+        assert reloaded.index.ntotal == 1
+        reloaded.cleanup()
+
 def create_sample_buildings_data(num_buildings=1000):
     """Create sample building data for testing."""
     print(f"Creating sample data for {num_buildings} buildings...")
@@ -524,8 +668,10 @@ def check_gpu_availability():
     return is_available
 
 @pytest.mark.asyncio
-async def test_cold_to_red_hot_promotion():
+async def test_cold_to_red_hot_promotion(tmp_path, monkeypatch):
     """Test promoting data from a pickle file in Cold storage to Red Hot memory."""
+    # RedHotMemory() stores under ./data/memory/red_hot by default
+    monkeypatch.chdir(tmp_path)
     print("\n--- TESTING COLD TO RED HOT PROMOTION ---")
     logger.info("Testing Cold to Red Hot Promotion")
     
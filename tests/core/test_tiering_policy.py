@@ -0,0 +1,175 @@
+"""
+Tests for access-driven tier placement and the tiering daemon.
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+import pytest
+
+from memories.core.tiering_policy import (
+    DecayedFrequencyPolicy,
+    LFUPolicy,
+    LRUPolicy,
+    SimulatedClock,
+    TierBudget,
+    TieringDaemon,
+    plan_placement,
+    simulate_access_trace,
+    zipfian_trace,
+)
+
+NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+
+def item(data_id, tier, count=0, seconds_ago=0, size=100):
+    return {
+        'data_id': data_id, 'primary_tier': tier, 'size': size,
+        'access_count': count, 'last_accessed': NOW - timedelta(seconds=seconds_ago),
+        'created_at': NOW - timedelta(days=1)
+    }
+
+
+class FakeCatalog:
+    """In-memory stand-in for MemoryCatalog's placement API."""
+
+    def __init__(self, items):
+        self.items = {i['data_id']: i for i in items}
+        self.updates = []
+
+    async def get_access_stats(self, tiers=None):
+        return [dict(i) for i in self.items.values() if not tiers or i['primary_tier'] in tiers]
+
+    async def update_tiers(self, placements):
+        self.updates.append(dict(placements))
+        for data_id, tier in placements.items():
+            self.items[data_id]['primary_tier'] = tier
+        return len(placements)
+
+
+def test_policies_rank_items():
+    """Test the ordering produced by each scoring policy."""
+    recent = item('recent', 'cold', count=1, seconds_ago=1)
+    frequent = item('frequent', 'cold', count=50, seconds_ago=600)
+
+    assert LRUPolicy().score(recent, NOW) > LRUPolicy().score(frequent, NOW)
+    assert LFUPolicy().score(frequent, NOW) > LFUPolicy().score(recent, NOW)
+
+    policy = DecayedFrequencyPolicy(half_life=600)
+    assert policy.score(frequent, NOW) > policy.score(recent, NOW)
+    # Ten half-lives later the old popularity has decayed below one fresh access
+    later = NOW + timedelta(seconds=6000)
+    fresh = item('recent', 'cold', count=2, seconds_ago=-6000)
+    assert policy.score(fresh, later) > policy.score(frequent, later)
+
+
+def test_plan_respects_item_and_byte_budgets():
+    """Test that the hottest items fill the fastest tiers within their budgets."""
+    items = [
+        item('a', 'cold', count=100),
+        item('b', 'cold', count=90, size=1000),
+        item('c', 'hot', count=1),
+        item('d', 'warm', count=50),
+        item('e', 'cold', count=0),
+    ]
+    budgets = {'hot': TierBudget(max_items=2, max_bytes=500), 'warm': TierBudget(max_items=2)}
+
+    moves = plan_placement(items, LFUPolicy(), budgets, NOW)
+    placement = {m.data_id: m.target for m in moves}
+
+    # b is too large for hot and falls through to warm; c is demoted
+    assert placement == {'a': 'hot', 'b': 'warm', 'c': 'warm', 'd': 'hot'}
+    # Demotions come first so they free capacity for the promotions
+    assert [m.is_promotion for m in moves] == [False, True, True, True]
+
+
+def test_plan_ignores_unmanaged_tiers():
+    """Test that items outside the managed tiers are never moved."""
+    items = [item('v', 'red_hot', count=0), item('g', 'glacier', count=100)]
+    assert plan_placement(items, LFUPolicy(), {}, NOW) == []
+
+
+@pytest.mark.asyncio
+async def test_daemon_applies_moves_and_updates_catalog():
+    """Test one daemon run with a simulated clock."""
+    clock = SimulatedClock(NOW)
+    catalog = FakeCatalog([item('a', 'cold', count=10), item('b', 'hot', count=0), item('c', 'warm', count=5)])
+    moved = []
+
+    async def mover(data_id, source, target):
+        moved.append((data_id, source, target))
+        return True
+
+    daemon = TieringDaemon(
+        catalog, mover, {'hot': TierBudget(max_items=1), 'warm': TierBudget(max_items=1)},
+        policy="lfu", clock=clock
+    )
+    report = await daemon.run_once()
+
+    assert sorted(moved) == [('a', 'cold', 'hot'), ('b', 'hot', 'cold')]
+    assert report == {'planned': 2, 'promoted': 1, 'demoted': 1, 'failed': 0}
+    assert catalog.updates == [{'b': 'cold', 'a': 'hot'}]
+
+    # Once placed, nothing moves until access patterns change
+    assert (await daemon.run_once())['planned'] == 0
+    catalog.items['b']['access_count'] = 100
+    clock.advance(60)
+    report = await daemon.run_once()
+    assert report == {'planned': 3, 'promoted': 1, 'demoted': 2, 'failed': 0}
+    assert catalog.items['b']['primary_tier'] == 'hot'
+
+
+@pytest.mark.asyncio
+async def test_daemon_keeps_failed_moves_out_of_catalog():
+    """Test that only successful moves are recorded in the catalog."""
+    catalog = FakeCatalog([item('a', 'cold', count=10), item('b', 'cold', count=5)])
+
+    async def mover(data_id, source, target):
+        if data_id == 'b':
+            raise IOError("tier unavailable")
+        return True
+
+    daemon = TieringDaemon(catalog, mover, {'hot': TierBudget(max_items=1)}, policy="lfu")
+    report = await daemon.run_once()
+
+    assert report == {'planned': 2, 'promoted': 1, 'demoted': 0, 'failed': 1}
+    assert catalog.updates == [{'a': 'hot'}]
+
+
+@pytest.mark.asyncio
+async def test_daemon_start_and_stop():
+    """Test that the background task can be started and stopped."""
+    catalog = FakeCatalog([])
+
+    async def mover(data_id, source, target):
+        return True
+
+    daemon = TieringDaemon(catalog, mover, {}, interval=0.01)
+    daemon.start()
+    assert daemon.running
+    await daemon.stop()
+    assert not daemon.running
+
+
+def test_zipfian_trace_is_skewed():
+    """Test that the synthetic trace concentrates accesses on few items."""
+    trace = zipfian_trace(1000, 20000, s=1.1, seed=1)
+    counts = np.sort(np.bincount(trace, minlength=1000))[::-1]
+    assert len(trace) == 20000
+    assert counts[:10].sum() > 0.3 * len(trace)
+
+
+@pytest.mark.parametrize("policy", ["lru", "lfu", "decayed"])
+def test_simulated_zipfian_hit_rates(policy):
+    """Test that a small hot tier serves a large share of a Zipfian trace."""
+    n_items = 1000
+    trace = zipfian_trace(n_items, 50000, s=1.1, seed=0)
+    budgets = {'hot': TierBudget(max_items=20), 'warm': TierBudget(max_items=100)}
+
+    result = simulate_access_trace(trace, [1024] * n_items, budgets, policy=policy, run_every=500)
+
+    assert sum(result['hit_rate'].values()) == pytest.approx(1.0)
+    assert result['placement'] == {'hot': 20, 'warm': 100, 'cold': 880}
+    # 2% of the items in hot should serve far more than 2% of the accesses
+    assert result['hit_rate']['hot'] > 0.3
+    assert result['hit_rate']['hot'] + result['hit_rate']['warm'] > 0.5
@@ -9,6 +9,7 @@ import shutil
 import json
 import pandas as pd
 from pathlib import Path
+from datetime import datetime
 import asyncio
 from unittest.mock import patch, MagicMock, AsyncMock
 import numpy as np
@@ -384,4 +385,196 @@ class TestWarmMemory:
         assert deleted_non_existent is False
         
         # Restore original mock for cleanup
-        warm_memory.retrieve = original_retrieve 
\ No newline at end of file
+        warm_memory.retrieve = original_retrieve 
+
+@pytest.fixture
+def real_warm_memory(temp_storage_path):
+    """Create a WarmMemory instance backed by a real DuckDB connection."""
+    memory = WarmMemory(storage_path=temp_storage_path)
+    yield memory
+    memory.cleanup()
+
+
+@pytest.fixture
+def parquet_file(temp_storage_path):
+    """Write a small parquet file to import."""
+    path = os.path.join(temp_storage_path, "points.parquet")
+    pd.DataFrame({"id": [1, 2, 3], "name": ["a", "b", "c"]}).to_parquet(path)
+    return path
+
+
+class TestWarmParquetImport:
+    """Tests for importing parquet files without copying rows into warm_data."""
+    
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("mode", ["table", "view"])
+    async def test_import_records_reference(self, real_warm_memory, parquet_file, mode):
+        """Test that warm_data holds a reference to the table, not its rows."""
+        result = await real_warm_memory.import_from_parquet(
+            parquet_file, metadata={"source": "test"}, tags=["points"], mode=mode
+        )
+        assert result["success"] is True
+        assert result["row_count"] == 3
+        
+        con = real_warm_memory.con
+        rows = con.execute(f"SELECT id, name FROM {result['table_name']} ORDER BY id").fetchall()
+        assert rows == [(1, "a"), (2, "b"), (3, "c")]
+        
+        stored = json.loads(con.execute(
+            "SELECT data FROM warm_data WHERE id = ?", [result["data_id"]]
+        ).fetchone()[0])
+        assert stored["table_name"] == result["table_name"]
+        assert stored["mode"] == mode
+        assert stored["row_count"] == 3
+        assert set(stored["schema"]) == {"id", "name"}
+        
+        retrieved = await real_warm_memory.retrieve(tags=["points"])
+        assert retrieved["data"]["row_count"] == 3
+        
+        assert await real_warm_memory.delete(result["table_name"]) is True
+    
+    @pytest.mark.asyncio
+    async def test_view_reads_file_in_place(self, real_warm_memory, parquet_file):
+        """Test that a view import reflects the file rather than a copy."""
+        result = await real_warm_memory.import_from_parquet(parquet_file, mode="view")
+        pd.DataFrame({"id": [7], "name": ["z"]}).to_parquet(parquet_file)
+        
+        rows = real_warm_memory.con.execute(f"SELECT id FROM {result['table_name']}").fetchall()
+        assert rows == [(7,)]
+    
+    @pytest.mark.asyncio
+    async def test_invalid_mode(self, real_warm_memory, parquet_file):
+        """Test that an unknown mode fails without creating anything."""
+        result = await real_warm_memory.import_from_parquet(parquet_file, mode="copy")
+        assert result["success"] is False
+
+
+@pytest.fixture
+def partitioned_warm_memory(temp_storage_path):
+    """Create a WarmMemory instance using the partitioned store."""
+    memory = WarmMemory(
+        storage_path=temp_storage_path,
+        storage_mode="partitioned",
+        indexed_metadata={"source": "VARCHAR", "zoom": "INTEGER"}
+    )
+    yield memory
+    memory.cleanup()
+
+
+class TestPartitionedWarmStore:
+    """Tests for storing warm items in shared, schema-grouped tables."""
+    
+    @pytest.mark.asyncio
+    async def test_items_share_schema_group_tables(self, partitioned_warm_memory):
+        """Test that items with the same shape share one typed table."""
+        first = await partitioned_warm_memory.store({"name": "a", "value": 1}, metadata={"source": "s1"})
+        second = await partitioned_warm_memory.store({"value": 2, "name": "b"}, metadata={"source": "s2"})
+        other = await partitioned_warm_memory.store([1, 2, 3], tags=["list"])
+        
+        assert first["table_name"] == second["table_name"]
+        assert other["table_name"] == "warm_group_json"
+        
+        con = partitioned_warm_memory.con
+        tables = {row[0] for row in con.execute("SELECT table_name FROM information_schema.tables").fetchall()}
+        assert not any(t.startswith("warm_data_") for t in tables)
+        types = dict(con.execute(
+            "SELECT column_name, data_type FROM information_schema.columns WHERE table_name = ?",
+            [first["table_name"]]
+        ).fetchall())
+        assert types["name"] == "VARCHAR" and types["value"] == "BIGINT"
+        
+        result = await partitioned_warm_memory.retrieve(query={"id": second["data_id"]})
+        assert result["data"] == {"name": "b", "value": 2}
+        assert (await partitioned_warm_memory.retrieve(tags=["list"]))["data"] == [1, 2, 3]
+    
+    @pytest.mark.asyncio
+    async def test_query_metadata_data_and_partition(self, partitioned_warm_memory):
+        """Test filters on indexed and JSON metadata, data values and partitions."""
+        for i in range(6):
+            await partitioned_warm_memory.store(
+                {"name": f"item{i}", "value": i},
+                metadata={"source": "even" if i % 2 == 0 else "odd", "zoom": i, "owner": "me"},
+                tags=["all"]
+            )
+        
+        results = await partitioned_warm_memory.retrieve(query={"metadata": {"source": "even"}})
+        assert sorted(r["data"]["value"] for r in results) == [0, 2, 4]
+        
+        result = await partitioned_warm_memory.retrieve(query={"metadata": {"zoom": 3, "owner": "me"}})
+        assert result["data"]["name"] == "item3"
+        
+        result = await partitioned_warm_memory.retrieve(query={"data": {"name": "item5"}})
+        assert result["metadata"]["zoom"] == 5
+        
+        today = datetime.now().strftime('%Y-%m-%d')
+        assert len(await partitioned_warm_memory.retrieve(query={"partition": today})) == 6
+        assert await partitioned_warm_memory.retrieve(query={"partition": "1999-01-01"}) is None
+        
+        # Values are bound as parameters, never spliced into the SQL
+        assert await partitioned_warm_memory.retrieve(query={"metadata": {"source": "x' OR '1'='1"}}) is None
+    
+    @pytest.mark.asyncio
+    async def test_store_many(self, partitioned_warm_memory):
+        """Test bulk storing items of several schema groups."""
+        items = [
+            {"data": {"name": f"item{i}", "value": i}, "metadata": {"source": "bulk"}, "tags": [f"t{i % 2}"]}
+            for i in range(300)
+        ]
+        items.append({"data": [1, 2], "tags": ["t0"]})
+        results = await partitioned_warm_memory.store_many(items)
+
+        assert len(results) == 301 and all(r["success"] for r in results)
+        assert results[-1]["table_name"] == "warm_group_json"
+        bulk = await partitioned_warm_memory.retrieve(query={"metadata": {"source": "bulk"}})
+        assert sorted(r["data"]["value"] for r in bulk) == list(range(300))
+        assert len(await partitioned_warm_memory.retrieve(tags=["t0"])) == 151
+        result = await partitioned_warm_memory.retrieve(query={"id": results[7]["data_id"]})
+        assert result["data"] == {"name": "item7", "value": 7} and result["tags"] == ["t1"]
+
+    @pytest.mark.asyncio
+    async def test_delete_and_schema(self, partitioned_warm_memory):
+        """Test deleting single items and reading their schema group."""
+        stored = await partitioned_warm_memory.store({"name": "a", "value": 1.5}, tags=["t"])
+        
+        schema = await partitioned_warm_memory.get_schema(stored["data_id"])
+        assert schema["types"] == {"name": "VARCHAR", "value": "DOUBLE"}
+        
+        assert await partitioned_warm_memory.delete(stored["data_id"]) is True
+        assert await partitioned_warm_memory.retrieve(tags=["t"]) is None
+    
+    @pytest.mark.asyncio
+    async def test_case_colliding_keys_use_json_group(self, partitioned_warm_memory):
+        """Test that keys differing only by case are not split into typed columns."""
+        data = {"Name": "upper", "name": "lower", "_ITEM_ID": "x"}
+        stored = await partitioned_warm_memory.store(data)
+        
+        assert stored["success"] and stored["table_name"] == "warm_group_json"
+        result = await partitioned_warm_memory.retrieve(query={"id": stored["data_id"]})
+        assert result["data"] == data
+    
+    @pytest.mark.asyncio
+    async def test_out_of_range_ints_use_json_group(self, partitioned_warm_memory):
+        """Test that ints DuckDB cannot hold as BIGINT are kept in the JSON group."""
+        items = [{"data": {"value": 2**63}}, {"data": {"value": -2**63 - 1}}, {"data": {"value": 2**63 - 1}}]
+        results = await partitioned_warm_memory.store_many(items)
+        
+        assert all(r["success"] for r in results)
+        assert [r["table_name"] == "warm_group_json" for r in results] == [True, True, False]
+        for item, stored in zip(items, results):
+            result = await partitioned_warm_memory.retrieve(query={"id": stored["data_id"]})
+            assert result["data"] == item["data"]
+    
+    def test_tag_partitioning(self, temp_storage_path):
+        """Test that tag partitioning buckets items by their first tag."""
+        from memories.core.warm_store import PartitionedWarmStore
+        import duckdb
+        
+        store = PartitionedWarmStore(duckdb.connect(), partition_by="tag", tag_partitions=4)
+        a, _ = store.store({"v": 1}, tags=["roads"])
+        b, _ = store.store({"v": 2}, tags=["roads", "rivers"])
+        c, _ = store.store({"v": 3})
+        
+        keys = dict(store.con.execute("SELECT id, partition_key FROM warm_items").fetchall())
+        assert keys[a] == keys[b]
+        assert keys[c] == "untagged"
+        assert len(store.retrieve({"partition": keys[a]})) == 2
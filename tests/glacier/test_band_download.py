@@ -0,0 +1,153 @@
+"""Tests for multi-scene Sentinel and Landsat band downloads from local COGs."""
+
+import threading
+from datetime import datetime
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+import rasterio
+from rasterio.transform import from_origin
+
+from memories.core.glacier.artifacts.raster import read_band_window, tile_aligned_window
+from memories.core.glacier.artifacts.sentinel import SentinelConnector
+from memories.core.glacier.artifacts.landsat import LandsatConnector
+
+# 512x512 pixels of 10 m in UTM zone 10N around San Francisco, tiled in 128x128 blocks
+ORIGIN = (550000.0, 4185000.0)
+SIZE = 512
+BLOCK = 128
+BBOX = {"xmin": -122.42, "ymin": 37.79, "xmax": -122.41, "ymax": 37.80}
+
+
+def write_cog(path, value):
+    data = np.full((SIZE, SIZE), value, dtype=np.uint16)
+    with rasterio.open(
+        path, "w", driver="COG", width=SIZE, height=SIZE, count=1, dtype="uint16",
+        crs="EPSG:32610", transform=from_origin(*ORIGIN, 10, 10), blocksize=BLOCK, overviews="NONE"
+    ) as dst:
+        dst.write(data, 1)
+    return str(path)
+
+
+def make_item(tmp_path, scene_id, cloud_cover, bands):
+    assets = {band: SimpleNamespace(href=write_cog(tmp_path / f"{scene_id}_{band}.tif", i + 1))
+              for i, band in enumerate(bands)}
+    return SimpleNamespace(
+        id=scene_id,
+        properties={"eo:cloud_cover": cloud_cover, "datetime": "2024-06-01T00:00:00Z", "platform": "test"},
+        assets=assets,
+        bbox=[-122.5, 37.7, -122.3, 37.9],
+        datetime=datetime(2024, 6, 1),
+        collection_id="test"
+    )
+
+
+class FakeClient:
+    def __init__(self, items):
+        self.items = items
+
+    def search(self, **kwargs):
+        return SimpleNamespace(get_items=lambda: iter(self.items))
+
+
+@pytest.fixture
+def read_threads(monkeypatch):
+    """Record the threads that read bands."""
+    threads = set()
+
+    def recording_read(*args):
+        threads.add(threading.current_thread().name)
+        return read_band_window(*args)
+
+    for module in ("sentinel", "landsat"):
+        monkeypatch.setattr(f"memories.core.glacier.artifacts.{module}.read_band_window", recording_read)
+    return threads
+
+
+def test_window_is_tile_aligned(tmp_path):
+    """Test that windows grow to block boundaries and stay inside the image."""
+    with rasterio.open(write_cog(tmp_path / "band.tif", 1)) as src:
+        window = tile_aligned_window(src, (ORIGIN[0] + 1300, ORIGIN[1] - 2500, ORIGIN[0] + 1500, ORIGIN[1] - 1300))
+        assert (window.col_off, window.row_off, window.width, window.height) == (128, 128, 128, 128)
+
+        edge = tile_aligned_window(src, (ORIGIN[0] + 4000, ORIGIN[1] - 6000, ORIGIN[0] + 9000, ORIGIN[1] - 4000))
+        assert (edge.col_off, edge.row_off, edge.width, edge.height) == (384, 384, 128, 128)
+
+        with pytest.raises(ValueError):
+            tile_aligned_window(src, (0, 0, 10, 10))
+
+
+def test_read_outside_image_does_not_fall_back(tmp_path, monkeypatch):
+    """Test that a bbox outside the scene fails instead of reading it whole."""
+    full_reads = []
+    original_read = rasterio.io.DatasetReader.read
+
+    def read(self, *args, **kwargs):
+        if kwargs.get("window") is None:
+            full_reads.append(self.name)
+        return original_read(self, *args, **kwargs)
+
+    monkeypatch.setattr(rasterio.io.DatasetReader, "read", read)
+    url = write_cog(tmp_path / "band.tif", 1)
+
+    with pytest.raises(ValueError):
+        read_band_window(url, {"xmin": 10.0, "ymin": 10.0, "xmax": 10.1, "ymax": 10.1}, tmp_path / "out.tif")
+    result = read_band_window(url, BBOX, tmp_path / "out.tif")
+
+    assert not full_reads
+    assert result["height"] % BLOCK == 0 and result["width"] % BLOCK == 0
+    assert result["height"] < SIZE and result["width"] < SIZE
+
+
+@pytest.mark.asyncio
+async def test_sentinel_downloads_best_scenes_concurrently(tmp_path, read_threads):
+    """Test that the clearest N scenes are downloaded with bands read on the pool."""
+    items = [
+        make_item(tmp_path, "S2_cloudy", 18.0, ["B04", "B08"]),
+        make_item(tmp_path, "S2_clear", 2.0, ["B04", "B08"]),
+        make_item(tmp_path, "S2_hazy", 9.0, ["B04", "B08"]),
+        make_item(tmp_path, "S2_partial", 1.0, ["B04"]),
+    ]
+    sentinel = SentinelConnector(data_dir=tmp_path / "sentinel", keep_files=True, store_in_cold=False, max_workers=3)
+    sentinel.client = FakeClient(items)
+
+    result = await sentinel.download_data(BBOX, datetime(2024, 1, 1), datetime(2024, 12, 31), max_items=2)
+
+    assert result["status"] == "success"
+    assert [scene["scene_id"] for scene in result["scenes"]] == ["S2_clear", "S2_hazy"]
+    assert result["scene_id"] == "S2_clear" and result["bands"] == ["B04", "B08"]
+    with rasterio.open(result["files"]["B08"]) as band:
+        assert band.read(1).min() == 2
+    assert read_threads and all(name.startswith("sentinel-band") for name in read_threads)
+    assert len(read_threads) <= 3
+
+
+@pytest.mark.asyncio
+async def test_landsat_downloads_every_scene(tmp_path, read_threads):
+    """Test that max_items=None downloads every matching scene."""
+    items = [make_item(tmp_path, f"LC09_{i}", float(i), ["red", "nir08"]) for i in range(3)]
+    landsat = LandsatConnector(data_dir=tmp_path / "landsat", keep_files=True, store_in_cold=False)
+    landsat.client = FakeClient(items)
+
+    result = await landsat.download_data(BBOX, datetime(2024, 1, 1), datetime(2024, 12, 31), max_items=None)
+
+    assert result["status"] == "success"
+    assert [scene["scene_id"] for scene in result["scenes"]] == ["LC09_0", "LC09_1", "LC09_2"]
+    for scene in result["scenes"]:
+        for band, path in scene["files"].items():
+            with rasterio.open(path) as src:
+                assert src.crs.to_epsg() == 32610
+                assert src.height % BLOCK == 0 and src.width % BLOCK == 0
+    assert all(name.startswith("landsat-band") for name in read_threads)
+
+
+@pytest.mark.asyncio
+async def test_missing_band_reports_error(tmp_path):
+    """Test that scenes without a requested band are not downloaded."""
+    landsat = LandsatConnector(data_dir=tmp_path / "landsat", keep_files=True, store_in_cold=False)
+    landsat.client = FakeClient([make_item(tmp_path, "LC09_0", 1.0, ["red"])])
+
+    result = await landsat.download_data(BBOX, datetime(2024, 1, 1), datetime(2024, 12, 31))
+
+    assert result == {"status": "error", "message": "Band 'nir08' not available in scene LC09_0"}
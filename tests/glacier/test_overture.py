@@ -0,0 +1,138 @@
+"""Tests for Overture downloads against a local release standing in for S3."""
+
+import json
+import shutil
+
+import duckdb
+import pytest
+
+from memories.core.glacier.artifacts.overture import OvertureConnector
+
+BBOX = {"xmin": 0.1, "ymin": 0.1, "xmax": 0.4, "ymax": 0.4}
+
+
+def write_release(root, theme, type_name, n=40):
+    """Write n features on a diagonal from (0, 0) to (1, 1) in steps of 1/n."""
+    path = root / OvertureConnector.OVERTURE_RELEASE / f"theme={theme}" / f"type={type_name}"
+    path.mkdir(parents=True)
+    con = duckdb.connect()
+    con.execute(f"""
+        COPY (
+            SELECT
+                '{type_name}_' || i AS id,
+                {{'primary': 'feature ' || i}} AS names,
+                'POINT'::BLOB AS geometry,
+                {{'xmin': i / {n}, 'xmax': i / {n} + 0.001, 'ymin': i / {n}, 'ymax': i / {n} + 0.001}} AS bbox
+            FROM range({n}) t(i)
+        ) TO '{path / "part-0.parquet"}' (FORMAT 'parquet')
+    """)
+    con.close()
+
+
+def feature_ids(path):
+    return sorted(row[0] for row in duckdb.connect().execute(f"SELECT id FROM read_parquet('{path}')").fetchall())
+
+
+@pytest.fixture
+def release(tmp_path):
+    root = tmp_path / "release"
+    write_release(root, "places", "place")
+    write_release(root, "base", "water")
+    return root
+
+
+@pytest.fixture
+def overture(tmp_path, release):
+    connector = OvertureConnector(data_dir=str(tmp_path / "overture"), release_path=str(release), tile_size=0.25)
+    yield connector
+    connector.con.close()
+
+
+def test_download_theme_type_filters_bbox(overture):
+    """Test that only features inside the bbox are written."""
+    assert overture.download_theme_type("places", "place", BBOX)
+
+    output = overture.data_dir / "places" / "place" / "place_filtered.parquet"
+    # Features 4..15 lie fully inside [0.1, 0.4]
+    assert feature_ids(output) == sorted(f"place_{i}" for i in range(4, 16))
+
+
+def test_overlapping_bbox_reuses_cached_tiles(overture, release):
+    """Test that a second, overlapping request is served from the tile cache."""
+    assert overture.download_theme_type("places", "place", BBOX)
+    tile_dir = overture._tile_dir("places", "place")
+    assert json.loads((tile_dir / "tiles.json").read_text()) == ["0_0", "0_1", "1_0", "1_1"]
+
+    # Without the release, only cached tiles can answer the request
+    shutil.move(str(release), str(release.with_name("offline")))
+    assert overture.download_theme_type("places", "place", {"xmin": 0.2, "ymin": 0.2, "xmax": 0.45, "ymax": 0.45})
+    output = overture.data_dir / "places" / "place" / "place_filtered.parquet"
+    assert feature_ids(output) == sorted(f"place_{i}" for i in range(8, 18))
+
+    # A request needing new tiles fetches only those and fails while offline
+    assert not overture.download_theme_type("places", "place", {"xmin": 0.2, "ymin": 0.2, "xmax": 0.6, "ymax": 0.6})
+    shutil.move(str(release.with_name("offline")), str(release))
+    assert overture.download_theme_type("places", "place", {"xmin": 0.2, "ymin": 0.2, "xmax": 0.6, "ymax": 0.6})
+    assert len(json.loads((tile_dir / "tiles.json").read_text())) == 9
+
+
+def test_small_bbox_bypasses_tile_cache(overture, release):
+    """Test that a bbox much smaller than a tile is read directly instead of caching whole tiles."""
+    assert overture.download_theme_type("places", "place", {"xmin": 0.1, "ymin": 0.1, "xmax": 0.12, "ymax": 0.12})
+
+    output = overture.data_dir / "places" / "place" / "place_filtered.parquet"
+    assert feature_ids(output) == ["place_4"]
+    assert not (overture._tile_dir("places", "place") / "tiles.json").exists()
+
+
+def test_concurrent_downloads(overture):
+    """Test that theme/type downloads run together on the worker pool."""
+    jobs = [
+        ("places", "place", overture.data_dir / "places" / "place_filtered.parquet", "geometry"),
+        ("base", "water", overture.data_dir / "base" / "water_filtered.parquet", "geometry"),
+        ("base", "land", overture.data_dir / "base" / "land_filtered.parquet", "geometry"),
+    ]
+    statuses = overture._download_many(jobs, BBOX)
+
+    # The land type is missing from the release
+    assert statuses == [True, True, False]
+    assert len(feature_ids(jobs[1][2])) == 12
+
+
+def test_download_data(overture):
+    """Test downloading every theme, which converts geometries to WKT."""
+    try:
+        overture.con.execute("LOAD spatial;")
+    except duckdb.Error:
+        pytest.skip("DuckDB spatial extension not available")
+
+    results = overture.download_data(BBOX)
+
+    assert results["places"] and results["base"]
+    assert not results["buildings"]
+
+
+@pytest.mark.asyncio
+async def test_search_filters_bbox_and_projects(overture):
+    """Test that search returns only intersecting features and requested columns."""
+    assert overture.download_theme_type("places", "place", {"xmin": 0.0, "ymin": 0.0, "xmax": 1.0, "ymax": 1.0})
+
+    results = await overture.search([0.5, 0.5, 0.6, 0.6], columns=["id", "primary_name"])
+    assert sorted(f["id"] for f in results["places"]) == [f"place_{i}" for i in range(20, 25)]
+    assert set(results["places"][0]) == {"id", "primary_name"}
+    assert results["base"] == []
+
+
+def test_search_batches_streams_record_batches(overture):
+    """Test that results arrive as bounded Arrow record batches."""
+    assert overture.download_theme_type("places", "place", {"xmin": 0.0, "ymin": 0.0, "xmax": 1.0, "ymax": 1.0})
+
+    batches = list(overture.search_batches(
+        {"xmin": 0.0, "ymin": 0.0, "xmax": 1.0, "ymax": 1.0}, themes=["places"], columns=["id"], batch_size=8
+    ))
+    assert all(theme == "places" and type_name == "place" for theme, type_name, _ in batches)
+    assert all(batch.num_rows <= 8 and batch.schema.names == ["id"] for _, _, batch in batches)
+    assert sum(batch.num_rows for _, _, batch in batches) == 40
+
+    with pytest.raises(ValueError):
+        list(overture.search_batches([0, 0, 1, 1], themes=["places"], columns=["missing"]))
@@ -0,0 +1,22 @@
+"""Shared fixtures for the model tests."""
+
+import re
+import zlib
+
+import numpy as np
+import pytest
+
+
+def _bag_of_words(texts):
+    """Deterministic stub embedder: word counts hashed into 64 dimensions."""
+    vectors = np.zeros((len(texts), 64), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for word in re.findall(r"[a-z]+", text.lower()):
+            vectors[row, zlib.crc32(word.encode()) % 64] += 1
+    return vectors
+
+
+@pytest.fixture
+def bag_of_words():
+    """Embedder for semantic caching and similarity consensus without a model download."""
+    return _bag_of_words
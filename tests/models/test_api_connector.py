@@ -65,7 +65,7 @@ def test_openai_generate(mock_openai, mock_openai_response):
     assert response == "Test response"
     mock_client.chat.completions.create.assert_called_once()
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_deepseek_generate(mock_post, mock_deepseek_response):
     """Test Deepseek text generation."""
     mock_response = Mock()
@@ -92,7 +92,7 @@ def test_openai_error_handling(mock_openai):
 
 def test_deepseek_error_handling():
     """Test Deepseek error handling."""
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         mock_post.side_effect = Exception("API Error")
 
         connector = DeepseekConnector("test-key")
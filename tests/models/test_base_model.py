@@ -6,17 +6,20 @@ from unittest.mock import Mock, patch, MagicMock
 import gc
 from memories.models.base_model import BaseModel
 
+
 @pytest.fixture
 def base_model():
     """Create a BaseModel instance for testing."""
     return BaseModel.get_instance()
 
+
 def test_singleton_instance():
     """Test that BaseModel follows singleton pattern."""
     model1 = BaseModel.get_instance()
     model2 = BaseModel.get_instance()
     assert model1 is model2
 
+
 def test_load_config():
     """Test configuration loading."""
     model = BaseModel.get_instance()
@@ -26,6 +29,7 @@ def test_load_config():
     assert "supported_providers" in config
     assert "deployment_types" in config
 
+
 @pytest.mark.parametrize("model_name", ["deepseek-coder-small", "llama-2-7b"])
 def test_get_model_config(base_model, model_name):
     """Test getting configuration for specific models."""
@@ -35,18 +39,20 @@ def test_get_model_config(base_model, model_name):
     assert "provider" in config
     assert "config" in config
 
+
 @patch("transformers.AutoModelForCausalLM.from_pretrained")
 @patch("transformers.AutoTokenizer.from_pretrained")
 def test_initialize_model(mock_tokenizer, mock_model, base_model):
     """Test model initialization."""
     mock_model.return_value = Mock()
     mock_tokenizer.return_value = Mock()
-    
+
     success = base_model.initialize_model("deepseek-coder-small", use_gpu=False)
     assert success
     mock_model.assert_called_once()
     mock_tokenizer.assert_called_once()
 
+
 @patch("transformers.AutoModelForCausalLM.from_pretrained")
 @patch("transformers.AutoTokenizer.from_pretrained")
 def test_generate_text(mock_tokenizer, mock_model, base_model):
@@ -63,14 +69,14 @@ def test_generate_text(mock_tokenizer, mock_model, base_model):
     class TokenizerOutput(dict):
         def __init__(self, input_ids, attention_mask):
             super().__init__()
-            self['input_ids'] = input_ids
-            self['attention_mask'] = attention_mask
+            self["input_ids"] = input_ids
+            self["attention_mask"] = attention_mask
 
         def to(self, device):
             return self
 
         def items(self):
-            return [('input_ids', self['input_ids']), ('attention_mask', self['attention_mask'])]
+            return [("input_ids", self["input_ids"]), ("attention_mask", self["attention_mask"])]
 
     tokenizer_output = TokenizerOutput(input_ids, attention_mask)
 
@@ -97,10 +103,11 @@ def test_generate_text(mock_tokenizer, mock_model, base_model):
     assert mock_tokenizer_instance.decode.call_count == 1
     decode_args = mock_tokenizer_instance.decode.call_args[0][0]
     assert torch.equal(decode_args, torch.tensor([1, 2, 3]))
-    assert mock_tokenizer_instance.decode.call_args[1] == {'skip_special_tokens': True}
+    assert mock_tokenizer_instance.decode.call_args[1] == {"skip_special_tokens": True}
     mock_model_instance.generate.assert_called_once()
     assert result == "print('Hello, World!')"
 
+
 @patch("transformers.AutoModelForCausalLM.from_pretrained")
 @patch("transformers.AutoTokenizer.from_pretrained")
 def test_gpu_support(mock_tokenizer, mock_model, base_model):
@@ -120,21 +127,23 @@ def test_gpu_support(mock_tokenizer, mock_model, base_model):
         assert success
         assert base_model.model.device.type == "cpu"
 
+
 def test_cleanup(base_model):
     """Test cleanup method."""
     with patch("transformers.AutoModelForCausalLM.from_pretrained") as mock_model:
         with patch("transformers.AutoTokenizer.from_pretrained") as mock_tokenizer:
             mock_model.return_value = Mock()
             mock_tokenizer.return_value = Mock()
-            
+
             base_model.initialize_model("deepseek-coder-small", use_gpu=False)
             assert base_model.model is not None
             assert base_model.tokenizer is not None
-            
+
             base_model.cleanup()
             assert base_model.model is None
             assert base_model.tokenizer is None
 
+
 @pytest.mark.parametrize("provider", ["deepseek-ai", "meta", "mistral"])
 def test_list_models_by_provider(base_model, provider):
     """Test listing models by provider."""
@@ -145,6 +154,7 @@ def test_list_models_by_provider(base_model, provider):
         config = base_model.get_model_config(model)
         assert config["provider"] == provider
 
+
 def test_list_providers(base_model):
     """Test listing available providers."""
     providers = base_model.list_providers()
@@ -152,4 +162,65 @@ def test_list_providers(base_model):
     assert len(providers) > 0
     assert "deepseek-ai" in providers
     assert "meta" in providers
-    assert "mistral" in providers 
\ No newline at end of file
+    assert "mistral" in providers
+
+
+PROMPTS = [
+    "describe the land use near the old river",
+    "what is north",
+    "explain where the large green forest is in the west of the city",
+    "summarize the lake",
+    "how dry are the fields east of the road",
+    "the city",
+]
+
+
+def test_generate_batch_matches_single_prompts(local_causal_lm):
+    """Test that left-padded batches generate what single prompts do."""
+    params = {"do_sample": False, "max_new_tokens": 6}
+    expected = [local_causal_lm.generate(prompt, **params) for prompt in PROMPTS]
+
+    assert local_causal_lm.generate_batch(PROMPTS, batch_size=4, **params) == expected
+
+
+def test_generate_batch_groups_by_length(local_causal_lm):
+    """Test that prompts of similar token length are batched together."""
+    shapes = []
+    generate = local_causal_lm.model.generate
+
+    def recording_generate(**kwargs):
+        shapes.append(tuple(kwargs["input_ids"].shape))
+        return generate(**kwargs)
+
+    local_causal_lm.model.generate = recording_generate
+
+    local_causal_lm.generate_batch(PROMPTS, batch_size=3, do_sample=False, max_new_tokens=2)
+    assert shapes == [(3, 3), (3, 13)]
+
+    shapes.clear()
+    local_causal_lm.generate_batch(
+        PROMPTS, batch_size=6, max_batch_tokens=20, do_sample=False, max_new_tokens=2
+    )
+    assert shapes == [(3, 3), (2, 9), (1, 13)]
+
+
+def test_micro_batching_coalesces_concurrent_requests(local_causal_lm):
+    """Test that concurrent generate calls are generated in shared batches."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    params = {"do_sample": False, "max_new_tokens": 4}
+    expected = [local_causal_lm.generate(prompt, **params) for prompt in PROMPTS]
+
+    local_causal_lm.start_micro_batching(max_batch_size=8, max_wait_ms=200)
+    batcher = local_causal_lm._batcher
+    with ThreadPoolExecutor(max_workers=len(PROMPTS)) as executor:
+        results = list(
+            executor.map(
+                lambda prompt: local_causal_lm.generate(prompt, timeout=30, **params), PROMPTS
+            )
+        )
+    local_causal_lm.stop_micro_batching()
+
+    assert results == expected
+    assert batcher.requests == len(PROMPTS)
+    assert batcher.batches < len(PROMPTS)
@@ -0,0 +1,195 @@
+"""Tests for the SQLite-backed DiskCache and the semantic cache tier."""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from memories.models.caching import DiskCache, SemanticCache, TieredCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    disk_cache = DiskCache(cache_dir=str(tmp_path), batch_size=4, flush_interval=60)
+    yield disk_cache
+    disk_cache.close()
+
+
+def stored_rows(cache):
+    conn = sqlite3.connect(str(cache.db_path))
+    rows = dict(conn.execute("SELECT key, codec FROM cache").fetchall())
+    conn.close()
+    return rows
+
+
+def test_roundtrip_and_stats(cache):
+    """Test set/get with parameters, misses and statistics."""
+    cache.set("prompt", {"text": "answer", "tokens": [1, 2]}, metadata={"model": "m"}, temperature=0.2)
+
+    assert cache.get("prompt", temperature=0.2) == {"text": "answer", "tokens": [1, 2]}
+    assert cache.get("prompt", temperature=0.9) is None
+
+    stats = cache.get_stats()
+    assert stats["size"] == 1 and stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["total_accesses"] == 1 and stats["bytes"] > 0
+
+
+def test_writes_are_batched(cache):
+    """Test that writes reach disk per batch and are readable before that."""
+    for i in range(3):
+        cache.set(f"prompt {i}", i)
+    assert stored_rows(cache) == {}
+    assert cache.get("prompt 2") == 2
+
+    cache.set("prompt 3", 3)
+    assert len(stored_rows(cache)) == 4
+
+
+def test_wal_mode_and_persistent_connections(cache):
+    """Test that each thread reuses one WAL-mode connection."""
+    conn = cache._connection()
+    assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    assert conn.execute("PRAGMA synchronous").fetchone() == (1,)  # NORMAL
+    for i in range(10):
+        cache.set(f"prompt {i}", i)
+        cache.get(f"prompt {i}")
+    assert cache._connection() is conn
+
+    thread_connections = []
+    thread = threading.Thread(target=lambda: thread_connections.append(cache._connection()))
+    thread.start()
+    thread.join()
+    assert thread_connections[0] is not conn
+    assert len(cache._connections) == 2
+
+
+def test_expired_entries_are_bulk_evicted(tmp_path):
+    """Test that expired entries miss and are deleted in bulk."""
+    cache = DiskCache(cache_dir=str(tmp_path), ttl=0.05, batch_size=1, eviction_interval=3600)
+    for i in range(5):
+        cache.set(f"prompt {i}", i)
+    time.sleep(0.1)
+
+    assert cache.get("prompt 0") is None
+    assert len(stored_rows(cache)) == 5
+    assert cache.evict_expired() == 5
+    assert stored_rows(cache) == {}
+    cache.close()
+
+
+def test_max_bytes_evicts_least_recently_used(tmp_path):
+    """Test that the size bound evicts entries with the oldest access."""
+    cache = DiskCache(cache_dir=str(tmp_path), max_bytes=3000, batch_size=1)
+    for i in range(3):
+        cache.set(f"prompt {i}", b"x" * 900)
+        time.sleep(0.01)
+    cache.get("prompt 0")
+    cache.set("prompt 3", b"x" * 900)
+
+    assert cache.get("prompt 0") is not None
+    assert cache.get("prompt 1") is None
+    assert cache.get("prompt 2") is not None
+    assert cache.get_stats()["bytes"] <= 3000
+    cache.close()
+
+
+@pytest.mark.parametrize("serializer", ["msgpack", "orjson"])
+def test_compressed_serializers(tmp_path, serializer):
+    """Test zstd-compressed msgpack/orjson with a pickle fallback."""
+    pytest.importorskip("zstandard")
+    pytest.importorskip(serializer)
+    cache = DiskCache(cache_dir=str(tmp_path), serializer=serializer, compress=True, batch_size=1)
+    response = {"text": "answer " * 100, "scores": [0.5, 0.25]}
+    cache.set("prompt", response)
+    cache.set("other", {1, 2, 3})
+
+    assert cache.get("prompt") == response
+    assert cache.get("other") == {1, 2, 3}
+    assert stored_rows(cache) == {
+        cache._generate_key("prompt"): f"{serializer}+zstd",
+        cache._generate_key("other"): "pickle+zstd"
+    }
+    assert cache.get_stats()["bytes"] < len(response["text"])
+    cache.close()
+
+
+def test_close_flushes_and_reopen_reads(tmp_path):
+    """Test that buffered writes survive close and old-schema caches are replaced."""
+    conn = sqlite3.connect(str(tmp_path / "cache.db"))
+    conn.execute("CREATE TABLE cache (key TEXT PRIMARY KEY, value BLOB, metadata TEXT, created_at TEXT, "
+                 "last_accessed TEXT, access_count INTEGER)")
+    conn.close()
+
+    cache = DiskCache(cache_dir=str(tmp_path))
+    cache.set("prompt", "answer")
+    cache.close()
+
+    reopened = DiskCache(cache_dir=str(tmp_path))
+    assert reopened.get("prompt") == "answer"
+    reopened.close()
+
+
+def test_semantic_cache_hits_paraphrases(bag_of_words):
+    """Test that a similar prompt hits and an unrelated one misses."""
+    cache = SemanticCache(embedder=bag_of_words, similarity_threshold=0.9)
+    cache.set("Describe the land use around Lake Geneva", "answer", model="m", temperature=0.2)
+
+    value, similarity = cache.lookup("describe the land use around lake Geneva please", model="m", temperature=0.2)
+    assert value == "answer" and 0.9 <= similarity < 1.0
+    assert cache.get("How warm was Geneva last summer?", model="m", temperature=0.2) is None
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1 and stats["hit_rate"] == 0.5
+    assert stats["avg_lookup_ms"] > 0 and stats["max_lookup_ms"] >= stats["avg_lookup_ms"]
+
+
+def test_semantic_cache_scopes(bag_of_words):
+    """Test that entries are scoped per model, temperature bucket and parameters."""
+    cache = SemanticCache(embedder=bag_of_words, temperature_step=0.1)
+    prompt = "Describe the land use around Lake Geneva"
+    cache.set(prompt, "answer", model="m", temperature=0.70, max_tokens=100)
+
+    assert cache.get(prompt, model="m", temperature=0.72, max_tokens=100) == "answer"
+    assert cache.get(prompt, model="other", temperature=0.70, max_tokens=100) is None
+    assert cache.get(prompt, model="m", temperature=0.9, max_tokens=100) is None
+    assert cache.get(prompt, model="m", temperature=0.70, max_tokens=500) is None
+
+
+def test_semantic_cache_evicts_and_expires(bag_of_words):
+    """Test per-scope LRU eviction, replacement of a prompt and TTL expiry."""
+    cache = SemanticCache(embedder=bag_of_words, max_entries=2, ttl=0.05)
+    cache.set("rivers of the north", 1)
+    cache.set("mountains of the south", 2)
+    cache.set("rivers of the north", 3)
+    cache.get("mountains of the south")
+    cache.set("deserts of the east", 4)
+
+    assert cache.get_stats()["size"] == 2
+    assert cache.get("rivers of the north") is None
+    assert cache.get("mountains of the south") == 2
+    time.sleep(0.1)
+    assert cache.get("deserts of the east") is None
+    assert cache.get_stats()["size"] == 1
+
+
+def test_tiered_cache_semantic_tier(tmp_path, bag_of_words):
+    """Test that the semantic tier answers paraphrases after the exact tiers miss."""
+    tiered = TieredCache(disk_cache_dir=str(tmp_path),
+                         semantic_cache=SemanticCache(embedder=bag_of_words, similarity_threshold=0.9))
+    tiered.set("Describe the land use around Lake Geneva", "answer", model="m")
+
+    assert tiered.get("describe the land use around lake Geneva please", model="m") == "answer"
+    assert tiered.get_stats()["semantic"]["hits"] == 1
+    tiered.disk_cache.close()
+
+
+def test_tiered_cache_promotes_from_disk(tmp_path):
+    """Test that a disk hit is promoted to the memory tier."""
+    tiered = TieredCache(disk_cache_dir=str(tmp_path), disk_max_bytes=10_000)
+    tiered.set("prompt", "answer")
+    tiered.memory_cache.clear()
+
+    assert tiered.get("prompt") == "answer"
+    assert tiered.memory_cache.get("prompt") == "answer"
+    tiered.disk_cache.close()
@@ -186,6 +186,38 @@ def test_get_response_with_params(mock_get_connector, mock_api_connector):
     assert "metadata" in response
     mock_api_connector.generate.assert_called_once_with("Test prompt", timeout=30, **params)
 
+@patch("memories.models.load_model.get_connector")
+def test_get_response_semantic_cache(mock_get_connector, mock_api_connector):
+    """Test that a paraphrased prompt is served from the semantic cache."""
+    import re
+    import numpy as np
+    from memories.models.caching import SemanticCache
+
+    def embedder(texts):
+        vectors = np.zeros((len(texts), 32), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for word in re.findall(r"[a-z]+", text.lower()):
+                vectors[row, sum(map(ord, word)) % 32] += 1
+        return vectors
+
+    mock_get_connector.return_value = mock_api_connector
+    cache = SemanticCache(embedder=embedder, similarity_threshold=0.9)
+    model = LoadModel(
+        model_provider="openai",
+        deployment_type="api",
+        model_name="gpt-4",
+        api_key="test-key",
+        cache=cache
+    )
+
+    first = model.get_response("Describe the land use around Lake Geneva", temperature=0.2)
+    second = model.get_response("describe the land use around lake Geneva please", temperature=0.2)
+
+    assert second["text"] == first["text"] == "Test response"
+    assert second["metadata"]["cached"] is True
+    mock_api_connector.generate.assert_called_once()
+    assert cache.get_stats()["hit_rate"] == 0.5
+
 def test_cleanup():
     """Test cleanup method."""
     with patch("memories.models.load_model.BaseModel") as mock_base_model_class:
@@ -0,0 +1,110 @@
+"""Tests for quorum and similarity consensus in MultiModelInference."""
+
+import time
+
+import pytest
+
+from memories.models.multi_model import MultiModelInference
+
+AGREEING = "The river floods the southern fields every spring"
+PARAPHRASE = "Every spring the river floods the southern fields"
+DISSENTING = "Traffic congestion peaks near the northern bridge"
+
+
+class FakeProvider:
+    """Provider whose successive calls answer after scripted latencies."""
+
+    def __init__(self, text, *latencies):
+        self.text = text
+        self.latencies = list(latencies)
+        self.calls = 0
+
+    def get_response(self, query, **kwargs):
+        latency = self.latencies[min(self.calls, len(self.latencies) - 1)]
+        self.calls += 1
+        time.sleep(latency)
+        if self.text is None:
+            return {"text": None, "error": "provider failed", "metadata": {}}
+        return {"text": self.text, "error": None, "metadata": {"generation_time": latency}}
+
+
+@pytest.fixture
+def inference(bag_of_words):
+    def make(**providers):
+        return MultiModelInference(providers, embedder=bag_of_words, similarity_threshold=0.8)
+    return make
+
+
+def test_quorum_returns_before_stragglers(inference):
+    """Test that two agreeing providers out of three end the wait."""
+    multi = inference(
+        fast=FakeProvider(AGREEING, 0.01),
+        second=FakeProvider(PARAPHRASE, 0.05),
+        straggler=FakeProvider(DISSENTING, 2.0)
+    )
+    result = multi.get_quorum_response("When do the fields flood?", quorum=2)
+
+    assert result["quorum_reached"] is True
+    assert result["elapsed"] < 1.0
+    assert sorted(result["contributing_models"]) == ["fast", "second"]
+    assert result["consensus_text"] in (AGREEING, PARAPHRASE)
+    assert result["confidence"] == pytest.approx(2 / 3)
+    assert result["responses"]["straggler"]["error"] == "Cancelled: quorum reached"
+
+
+def test_no_quorum_returns_largest_cluster(inference):
+    """Test that without agreement every provider is awaited and the largest cluster wins."""
+    multi = inference(
+        a=FakeProvider(AGREEING, 0.01),
+        b=FakeProvider(DISSENTING, 0.02),
+        c=FakeProvider(PARAPHRASE, 0.03),
+        broken=FakeProvider(None, 0.01)
+    )
+    result = multi.get_quorum_response("When do the fields flood?", quorum=3)
+
+    assert result["quorum_reached"] is False
+    assert sorted(result["contributing_models"]) == ["a", "c"]
+    assert result["responses"]["broken"]["error"] == "provider failed"
+    assert result["responses"]["b"]["text"] == DISSENTING
+
+
+def test_provider_timeouts(inference):
+    """Test that a provider past its own timeout is given up on."""
+    multi = inference(
+        a=FakeProvider(AGREEING, 0.01),
+        slow=FakeProvider(PARAPHRASE, 1.0),
+        b=FakeProvider(DISSENTING, 0.01)
+    )
+    result = multi.get_quorum_response("When do the fields flood?", quorum=2, provider_timeouts={"slow": 0.1})
+
+    assert result["elapsed"] < 0.5
+    assert result["quorum_reached"] is False
+    assert result["responses"]["slow"]["error"].startswith("Timed out")
+
+
+def test_hedged_request_wins(inference):
+    """Test that a second request to a slow provider can answer first."""
+    flaky = FakeProvider(PARAPHRASE, 2.0, 0.01)
+    multi = inference(a=FakeProvider(AGREEING, 0.01), flaky=flaky)
+    result = multi.get_quorum_response("When do the fields flood?", quorum=2, hedge_after=0.05)
+
+    assert result["quorum_reached"] is True
+    assert result["hedged"] == ["flaky"]
+    assert flaky.calls == 2
+    assert result["elapsed"] < 1.0
+
+
+def test_similarity_consensus(inference):
+    """Test the embedding-similarity consensus method."""
+    multi = inference()
+    responses = {
+        "a": {"text": AGREEING, "metadata": {}},
+        "b": {"text": DISSENTING * 3, "metadata": {}},
+        "c": {"text": PARAPHRASE, "metadata": {}},
+        "d": {"text": None, "error": "failed"}
+    }
+    result = multi.synthesize_consensus(responses, method="similarity")
+
+    assert sorted(result["contributing_models"]) == ["a", "c"]
+    assert result["confidence"] == 0.5
+    assert result["agreement"] > 0.8
@@ -0,0 +1,37 @@
+#!/bin/bash
+
+# Run every benchmark under tests/benchmarks and save the results as JSON.
+#
+# Benchmarks carry the "benchmark" marker and are deselected by default, so
+# this script selects them with -m benchmark. Results of the pytest-benchmark
+# timings are saved under tests/test-results/benchmarks (numbered 0001,
+# 0002, ...) and the latest run is also written to latest.json there. The
+# other benchmarks log their measurements; each module documents the
+# MEMORIES_BENCH_* variable that scales its dataset.
+#
+# Environment:
+#   MEMORIES_BENCH_SIZES  Hot-path dataset sizes, comma separated (default 1000,10000)
+#   BENCH_BASELINE        Saved run to compare against, e.g. 0001
+#   BENCH_THRESHOLD       Allowed mean slowdown against the baseline (default 10%)
+
+cd "$(dirname "$0")/.."
+STORAGE="tests/test-results/benchmarks"
+mkdir -p "$STORAGE"
+
+ARGS=(
+    -m benchmark
+    --benchmark-storage="file://$STORAGE"
+    --benchmark-autosave
+    --benchmark-json="$STORAGE/latest.json"
+)
+
+if [ -n "$BENCH_BASELINE" ]; then
+    echo "Comparing against baseline $BENCH_BASELINE (threshold ${BENCH_THRESHOLD:-10%})..."
+    ARGS+=(
+        --benchmark-compare="$BENCH_BASELINE"
+        --benchmark-compare-fail="mean:${BENCH_THRESHOLD:-10%}"
+    )
+fi
+
+echo "Running benchmarks..."
+python -m pytest tests/benchmarks "${ARGS[@]}" "$@"
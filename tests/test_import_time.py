@@ -0,0 +1,54 @@
+"""
+Test that ``import memories`` stays cheap: heavy dependencies load on first
+use, not at import. MEMORIES_IMPORT_BUDGET_MS sets the budget for the
+cumulative import time of the package (default 500).
+"""
+
+import os
+import sys
+import subprocess
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+BUDGET_MS = float(os.getenv("MEMORIES_IMPORT_BUDGET_MS", "500"))
+HEAVY_MODULES = ["torch", "transformers", "sentence_transformers", "faiss", "rasterio", "geopandas", "aiortc"]
+
+
+def run_python(*args):
+    return subprocess.run(
+        [sys.executable, *args], cwd=ROOT, capture_output=True, text=True, check=True
+    )
+
+
+def test_import_time_within_budget():
+    """Test the cumulative -X importtime of the memories package."""
+    completed = run_python("-X", "importtime", "-c", "import memories")
+    # Lines look like "import time: self [us] | cumulative | imported package"
+    cumulative_us = next(
+        int(line.split("|")[1])
+        for line in completed.stderr.splitlines()
+        if line.startswith("import time:") and line.split("|")[2].strip() == "memories"
+    )
+    assert cumulative_us / 1000 < BUDGET_MS, f"import memories took {cumulative_us / 1000:.0f}ms"
+
+
+@pytest.mark.parametrize("statement", ["import memories", "from memories.core.hot import HotMemory"])
+def test_heavy_modules_not_imported(statement):
+    """Test that torch and the other heavy dependencies stay out of sys.modules."""
+    completed = run_python("-c", f"import sys; {statement}; print(sorted(sys.modules))")
+    loaded = set(eval(completed.stdout.strip().splitlines()[-1]))
+    assert not loaded & set(HEAVY_MODULES), f"{statement} imported {sorted(loaded & set(HEAVY_MODULES))}"
+
+
+def test_lazy_attributes_resolve():
+    """Test that lazily exported names still resolve on first access."""
+    import memories
+    import memories.core
+
+    assert memories.MemoryManager is memories.core.MemoryManager
+    assert isinstance(memories.core.memory_manager, memories.core.MemoryManager)
+    assert "LoadModel" in dir(memories)
+    with pytest.raises(AttributeError):
+        memories.missing_attribute
@@ -0,0 +1,86 @@
+"""
+Tests for the append-only metadata log and the SimpleMemoryStore built on it.
+"""
+
+import json
+
+import pytest
+
+from memories.metadata_log import AppendOnlyLog
+from memories.simple_memory import SimpleMemoryStore
+
+
+@pytest.fixture
+def snapshot_path(tmp_path):
+    return tmp_path / "metadata.json"
+
+
+def test_replay_after_reopen(snapshot_path):
+    """Writes survive a reopen without a snapshot ever being taken."""
+    log = AppendOnlyLog(snapshot_path)
+    log.set("a", {"x": 1})
+    log.set_many([("b", 2), ("c", 3)])
+    log.delete("b")
+    log.close()
+    
+    assert not snapshot_path.exists()
+    assert AppendOnlyLog(snapshot_path).data == {"a": {"x": 1}, "c": 3}
+
+
+def test_snapshot_truncates_log(snapshot_path):
+    """Reaching the snapshot interval folds the log into the snapshot."""
+    log = AppendOnlyLog(snapshot_path, snapshot_interval=3)
+    for i in range(4):
+        log.set(str(i), i)
+    log.close()
+    
+    with open(snapshot_path) as f:
+        assert json.load(f) == {"0": 0, "1": 1, "2": 2}
+    assert len(log.log_path.read_text().splitlines()) == 1
+    assert AppendOnlyLog(snapshot_path).data == {"0": 0, "1": 1, "2": 2, "3": 3}
+
+
+def test_torn_record_is_discarded(snapshot_path):
+    """A record cut short by a crash is dropped and truncated on replay."""
+    log = AppendOnlyLog(snapshot_path)
+    log.set("a", 1)
+    log.close()
+    with open(log.log_path, "a") as f:
+        f.write('{"op": "set", "path": ["b"], "val')
+    
+    reopened = AppendOnlyLog(snapshot_path)
+    assert reopened.data == {"a": 1}
+    reopened.set("c", 3)
+    reopened.close()
+    assert AppendOnlyLog(snapshot_path).data == {"a": 1, "c": 3}
+
+
+def test_replay_over_snapshot_is_idempotent(snapshot_path):
+    """A crash between snapshot rename and log truncation replays cleanly."""
+    log = AppendOnlyLog(snapshot_path)
+    log.set("a", 1)
+    log.delete("missing")
+    log.close()
+    with open(snapshot_path, "w") as f:
+        json.dump({"a": 1}, f)
+    
+    assert AppendOnlyLog(snapshot_path).data == {"a": 1}
+
+
+def test_simple_memory_store_persistence(tmp_path):
+    """SimpleMemoryStore reloads facts from the log and legacy JSON files."""
+    path = tmp_path / "memory_data.json"
+    store = SimpleMemoryStore(str(path))
+    store.store("france_capital", {"france_capital": "Paris"})
+    store.store("sky", "blue", tier="cold")
+    
+    reopened = SimpleMemoryStore(str(path))
+    assert reopened.retrieve("france_capital") == {"france_capital": "Paris"}
+    assert reopened.retrieve("sky", tier="cold") == "blue"
+    
+    # Files written by earlier versions are plain JSON snapshots
+    legacy = tmp_path / "legacy.json"
+    with open(legacy, "w") as f:
+        json.dump({"hot": {"k": {"data": "v", "timestamp": "", "tier": "hot", "access_count": 0}},
+                   "warm": {}, "cold": {}}, f)
+    assert SimpleMemoryStore(str(legacy)).retrieve("k") == "v"